@@ -9,6 +9,17 @@ class Settings(BaseSettings):
     MONGODB_DB_NAME: str = "velocity_new"
     ERROR_COLLECTION_NAME: str = "error_logs"
     LLM_USAGE_COLLECTION_NAME: str = "llm_usage_logs"
+    # Error and LLM usage documents are written in batches in the background
+    TELEMETRY_BATCH_SIZE: int = 100
+    TELEMETRY_FLUSH_INTERVAL_SECONDS: float = 2.0
+    TELEMETRY_MAX_QUEUE_SIZE: int = 10000
+
+    # Logging settings; with LOG_LEVEL=DEBUG only one in LOG_DEBUG_SAMPLE_RATE
+    # debug records is written
+    LOG_LEVEL: str = "INFO"
+    LOG_DEBUG_SAMPLE_RATE: int = 1
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
     ANTHROPIC_API_KEY: str
     ANTHROPIC_DEFAULT_MODEL: str = "claude-sonnet-4-20250514"
     OPENAI_API_KEY: str = "dummy_key"
@@ -16,6 +27,44 @@ class Settings(BaseSettings):
 
     # Tools API settings for IDE agent
     TOOLS_API_BASE_URL: str = "http://localhost:8001/api/v1"
+    # Files written by code generation are recorded here so the tools server
+    # can refresh its search index
+    FILE_CHANGE_JOURNAL_PATH: str = "artifacts/.file_changes.log"
+
+    # Stage V checks the imports of generated React code before building; its
+    # findings are reported with the build errors when the build fails
+    STAGE_V_IMPORT_CHECK_ENABLED: bool = True
+    # Reuse the last result of a validation command while the source tree
+    # it ran on is unchanged
+    STAGE_V_VALIDATION_CACHE_ENABLED: bool = True
+    # Optionally keep a `vite build --watch` process per session so repeated
+    # validations rebuild incrementally instead of cold-starting the build
+    STAGE_V_BUILD_DAEMON_ENABLED: bool = False
+    STAGE_V_BUILD_DAEMON_COMMAND: str = "npx vite build --watch"
+    STAGE_V_BUILD_DAEMON_MAX: int = 4
+    STAGE_V_BUILD_DAEMON_IDLE_SECONDS: int = 900
+    # Stop a validation command as soon as it prints one of its fatal
+    # patterns, after reading its output for a few more seconds to collect
+    # the related errors
+    STAGE_V_EARLY_ABORT_ENABLED: bool = True
+    STAGE_V_EARLY_ABORT_GRACE_SECONDS: float = 2.0
+    # When validation fails, fix the screens and component clusters that own
+    # the failing files and validate again, up to the iteration budget
+    STAGE_V_AUTO_REPAIR_ENABLED: bool = True
+    STAGE_V_AUTO_REPAIR_MAX_ITERATIONS: int = 2
+    STAGE_V_AUTO_REPAIR_MAX_UNITS: int = 6
+    # Check the syntax of each screen's files as soon as they are written
+    # and regenerate screens whose output is truncated or malformed
+    SYNTAX_CHECK_ENABLED: bool = True
+    SYNTAX_CHECK_WORKERS: int = 4
+    SYNTAX_CHECK_MAX_RETRIES: int = 1
+    # Generated files are written by a thread pool, skipping files whose
+    # content is unchanged
+    FILE_WRITER_WORKERS: int = 8
+    # The global scratchpad keeps the latest entry per key and is rendered
+    # per consumer within a token budget
+    SCRATCHPAD_TOKEN_BUDGET: int = 24000
+    SCRATCHPAD_MAX_AGENT_SUMMARIES: int = 5
 
     class Config:
         backend_dir = Path(__file__).parent.parent.parent
@@ -1,10 +1,17 @@
+import sys
 import traceback
 
 from fastapi import Depends
 
-from system.backend.agentic_workflow.app.config.database import mongodb_database
+from system.backend.agentic_workflow.app.config.database import (
+    error_sink,
+    mongodb_database,
+)
 from system.backend.agentic_workflow.app.models.domain.error import Error
 
+# Innermost frames kept in the captured stack trace
+STACK_TRACE_DEPTH = 30
+
 
 class ErrorRepo:
     def __init__(
@@ -16,13 +23,20 @@ class ErrorRepo:
         try:
             # Automatically capture stack trace if not already provided
             if error.stack_trace is None:
-                # Get the current stack trace, excluding this method call
-                stack_frames = traceback.extract_stack()[:-1]
-                error.stack_trace = "".join(traceback.format_list(stack_frames))
+                # Walk the caller's frames without loading the whole stack
+                stack = traceback.StackSummary.extract(
+                    traceback.walk_stack(sys._getframe(1)),
+                    limit=STACK_TRACE_DEPTH,
+                )
+                stack.reverse()
+                error.stack_trace = "".join(stack.format())
+
+            # Written in the background; directly if the sink is not running
+            if error_sink.submit(error.to_dict()):
+                return
 
             insert_result = await self.collection.insert_one(error.to_dict())
             if not insert_result.inserted_id:
                 print(f"Error while inserting error: {error}")
         except Exception as e:
             print(f"Error while inserting error: {e}")
-        return insert_result
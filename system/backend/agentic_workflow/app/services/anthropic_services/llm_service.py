@@ -145,25 +145,20 @@ class AnthropicService:
                         }
                         tool_calls.append(tool_call_data)
 
-                        # Print tool call details
-                        print(f"🔧 TOOL CALL DETECTED:")
-                        print(f"  ID: {content_block.id}")
-                        print(f"  Name: {content_block.name}")
-                        print(f"  Arguments: {content_block.input}")
-                        print("-" * 30)
-
-                # Print summary
-                print(f"📊 RESPONSE SUMMARY:")
-                print(f"  Content Length: {len(collected_text)} characters")
-                print(f"  Tool Calls: {len(tool_calls)}")
-                print(f"  Stop Reason: {final_message.stop_reason}")
-                print(
-                    f"  Usage: Input={final_message.usage.input_tokens}, Output={final_message.usage.output_tokens}"
-                )
-                print("=" * 50)
+                        # Log tool call details
+                        loggers["anthropic"].debug(
+                            "Tool call detected: id=%s name=%s arguments=%s",
+                            content_block.id,
+                            content_block.name,
+                            content_block.input,
+                        )
 
                 loggers["anthropic"].info(
-                    f"Anthropic usage: {final_message.usage}"
+                    "Response summary: content_length=%d tool_calls=%d stop_reason=%s usage=%s",
+                    len(collected_text),
+                    len(tool_calls),
+                    final_message.stop_reason,
+                    final_message.usage,
                 )
                 await self.llm_usage_repo.add_llm_usage(final_message.usage)
 
@@ -198,7 +193,13 @@ class AnthropicService:
         }
 
         if system_prompt:
-            payload["system"] = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            payload["system"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
 
         if web_search:
             payload["tools"] = [
@@ -257,7 +258,9 @@ class AnthropicService:
                         base_url, headers=headers, json=payload
                     )
                 except Exception as e:
-                    print(f"{str(e)}")
+                    loggers["anthropic"].error(
+                        "Anthropic request failed: %s", e
+                    )
                 response.raise_for_status()
 
                 response_data = response.json()
@@ -331,7 +334,13 @@ class AnthropicService:
 
         # Add system prompt with caching if provided
         if system_prompt:
-            stream_params["system"] = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            stream_params["system"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
 
         async with client.messages.stream(**stream_params) as stream:
 
@@ -6,6 +6,10 @@ from typing import Any, Dict
 from system.backend.agentic_workflow.app.utils.file_structure import (
     generate_directory_structure,
 )
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    THEME,
+    record_scratchpad_entries,
+)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -169,60 +173,19 @@ class StageIHelper:
 
         self.logger.info(f"Updated file_structure.txt at {file_structure_path}")
 
-        # Parse XML response to get structured output
+        # Record the generated design system files in the scratchpad
         try:
             file_data = parse_xml_to_dict(llm_output)
-
-            # Format parsed output for scratchpad
-            formatted_output = f"""
-<STAGE_I_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
-<GENERATED_FILES>
-"""
-
-            for file_info in file_data:
-                formatted_output += f"""
-<FILE>
-<FILE_PATH>{file_info['file_path']}</FILE_PATH>
-<CODE_CONTENT>
-{file_info['code_snippet']}
-</CODE_CONTENT>
-</FILE>
-"""
-
-            formatted_output += """
-</GENERATED_FILES>
-</STAGE_I_CODE_GENERATION>
-
-"""
-
+            entries = {
+                file_info["file_path"]: file_info["code_snippet"]
+                for file_info in file_data
+            }
         except Exception as e:
             # Fallback to raw output if parsing fails
             self.logger.warning(f"Failed to parse XML output: {e}")
-            formatted_output = f"""
-<STAGE_I_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
-<RAW_LLM_OUTPUT>
-{llm_output}
-</RAW_LLM_OUTPUT>
-</STAGE_I_CODE_GENERATION>
-
-"""
-
-        # Append to global scratchpad
-        global_scratchpad_path = os.path.join(
-            scratchpads_dir, "global_scratchpad.txt"
-        )
-
-        with open(global_scratchpad_path, "a", encoding="utf-8") as f:
-            f.write(formatted_output)
+            entries = {"raw_output": llm_output}
 
+        record_scratchpad_entries(session_id, THEME, entries)
         self.logger.info(
-            f"Updated global_scratchpad.txt at {global_scratchpad_path}"
+            f"Recorded {len(entries)} design system entries in the scratchpad"
         )
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp as string"""
-        from datetime import datetime
-
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
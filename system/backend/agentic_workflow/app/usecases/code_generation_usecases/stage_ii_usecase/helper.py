@@ -1,7 +1,6 @@
 import asyncio
 import json
 import os
-from datetime import datetime
 from typing import Any, Dict, List
 
 from fastapi import Depends
@@ -13,13 +12,24 @@ from system.backend.agentic_workflow.app.prompts.code_generation_prompts.stage_i
 from system.backend.agentic_workflow.app.services.anthropic_services.llm_service import (
     AnthropicService,
 )
+from system.backend.agentic_workflow.app.utils.file_ownership import (
+    record_file_owners,
+)
 from system.backend.agentic_workflow.app.utils.file_structure import (
     generate_directory_structure,
     get_project_root,
 )
-from system.backend.agentic_workflow.app.utils.write_file import (
+from system.backend.agentic_workflow.app.utils.file_writer import (
     write_code_files,
 )
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    COMPONENT_API,
+    record_scratchpad_entries,
+    render_scratchpad,
+)
+from system.backend.agentic_workflow.app.utils.session_context import (
+    session_state,
+)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -138,7 +148,7 @@ class StageIIHelper:
 
     async def get_scratchpads_content(self, session_id: str) -> Dict[str, str]:
         """
-        Read scratchpads content from global_scratchpad.txt and file_structure.txt
+        Read the global scratchpad slice of stage II and file_structure.txt
 
         :param session_id: Session identifier
         :return: Dictionary with scratchpad contents
@@ -147,14 +157,10 @@ class StageIIHelper:
 
         scratchpads = {}
 
-        # Read global_scratchpad.txt
-        global_scratchpads_path = f"{base_path}/global_scratchpad.txt"
-        try:
-            scratchpads["global_scratchpad"] = await self.read_text_file(
-                global_scratchpads_path
-            )
-        except FileNotFoundError:
-            scratchpads["global_scratchpad"] = ""
+        # Render the design system and component registry entries
+        scratchpads["global_scratchpad"] = render_scratchpad(
+            session_id, "stage_ii"
+        )
 
         # Read file_structure.txt
         file_structure_path = f"{base_path}/file_structure.txt"
@@ -227,8 +233,29 @@ class StageIIHelper:
             prompt=user_prompt, system_prompt=system_prompt
         )
 
+        self.record_component_owners(response, cluster_data["cluster_name"])
         return response
 
+    def record_component_owners(self, llm_response: str, owner_name: str):
+        """
+        Record the cluster that generated each file of an LLM response, so
+        Stage V can repair the cluster when one of its files fails to build
+
+        :param llm_response: Raw LLM response containing XML
+        :param owner_name: Name of the component cluster
+        """
+        session_id = session_state.get()
+        record_file_owners(
+            session_id,
+            "cluster",
+            owner_name,
+            [
+                file_data["file_path"]
+                for file_data in parse_xml_to_dict(llm_response)
+            ],
+            base_dir=f"artifacts/{session_id}",
+        )
+
     async def generate_global_components_parallel(
         self, context_data: Dict[str, Any]
     ) -> List[str]:
@@ -302,59 +329,45 @@ class StageIIHelper:
             prompt=user_prompt, system_prompt=system_prompt
         )
 
+        self.record_component_owners(response, "global_components")
         return response
 
-    async def append_to_global_scratchpad(
-        self, session_id: str, content: str, is_parallel: bool = False
+    async def record_component_registries(
+        self, session_id: str, registries: List[str], default_name: str
     ) -> None:
         """
-        Append content to the global_scratchpad.txt file
+        Record the context registries of the generated components in the
+        scratchpad, one entry per cluster, replacing the cluster's previous
+        registry
 
         :param session_id: Session identifier
-        :param content: Content to append
-        :param is_parallel: Whether this is from parallel generation
+        :param registries: CONTEXT_REGISTRY contents, one per LLM response
+        :param default_name: Entry key for registries without a cluster name
         """
-        try:
-            scratchpad_path = (
-                f"artifacts/{session_id}/scratchpads/global_scratchpad.txt"
-            )
-
-            # Ensure the scratchpads directory exists
-            os.makedirs(os.path.dirname(scratchpad_path), exist_ok=True)
-
-            # Clean and validate content before writing
-            if not content or not content.strip():
+        entries = {}
+        for i, registry in enumerate(registries):
+            if not registry or not registry.strip():
                 print("Warning: Empty context registry content")
-                return
-
-            # Append content to the file
-            with open(scratchpad_path, "a", encoding="utf-8") as f:
-                f.write(f"\n\n<STAGE_II_CODE_GENERATION>\n")
-                f.write(
-                    f"<TIMESTAMP>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</TIMESTAMP>\n"
+                continue
+            try:
+                cluster_name = json.loads(registry).get("cluster_name")
+            except (json.JSONDecodeError, AttributeError):
+                cluster_name = None
+            if not cluster_name:
+                cluster_name = (
+                    default_name
+                    if len(registries) == 1
+                    else f"{default_name}_{i + 1}"
                 )
-                if is_parallel:
-                    f.write(
-                        f"<GENERATION_TYPE>PARALLEL_CLUSTERS</GENERATION_TYPE>\n"
-                    )
-                else:
-                    f.write(
-                        f"<GENERATION_TYPE>SINGLE_BATCH</GENERATION_TYPE>\n"
-                    )
-                f.write(f"<CONTEXT_REGISTRY>\n")
-                f.write(content)
-                f.write(f"\n</CONTEXT_REGISTRY>\n")
-                f.write(f"</STAGE_II_CODE_GENERATION>\n")
+            entries[cluster_name] = registry
 
+        try:
+            record_scratchpad_entries(session_id, COMPONENT_API, entries)
             print(
-                f"Successfully appended context registry to {scratchpad_path}"
+                f"Recorded {len(entries)} context registries in the scratchpad"
             )
-
         except Exception as e:
-            print(f"Error appending to global scratchpad: {str(e)}")
-            print(
-                f"Content that caused error: {repr(content[:200])}"
-            )  # Show first 200 chars
+            print(f"Error recording context registries: {str(e)}")
             raise
 
     async def update_file_structure(self, session_id: str) -> None:
@@ -410,12 +423,12 @@ class StageIIHelper:
 
         # Write regular files to the codebase
         if regular_files:
-            write_code_files(regular_files, base_dir)
+            await write_code_files(regular_files, base_dir)
 
-        # Append context registry to global_scratchpad.txt
+        # Record the context registry in the scratchpad
         if context_registry_content:
-            await self.append_to_global_scratchpad(
-                session_id, context_registry_content, is_parallel=False
+            await self.record_component_registries(
+                session_id, [context_registry_content], "global_components"
             )
 
     async def process_multiple_llm_responses_and_write_files(
@@ -455,20 +468,12 @@ class StageIIHelper:
 
         # Write all regular files to the codebase
         if all_regular_files:
-            write_code_files(all_regular_files, base_dir)
+            await write_code_files(all_regular_files, base_dir)
 
-        # Append all context registry content to global_scratchpad.txt
+        # Record the context registry of each cluster in the scratchpad
         if all_context_registry_content:
-            # Add cluster generation timestamp and summary
-            cluster_summary = f"PARALLEL_CLUSTER_GENERATION - {len(all_context_registry_content)} clusters processed"
-            combined_content = (
-                f"{cluster_summary}\n\n"
-                + "\n\n--- CLUSTER SEPARATOR ---\n\n".join(
-                    all_context_registry_content
-                )
-            )
-            await self.append_to_global_scratchpad(
-                session_id, combined_content, is_parallel=True
+            await self.record_component_registries(
+                session_id, all_context_registry_content, "cluster"
             )
 
     async def execute_stage_ii_pipeline(
@@ -5,6 +5,11 @@ from typing import Any, Dict
 from system.backend.agentic_workflow.app.utils.file_structure import (
     generate_directory_structure,
 )
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    ROUTES,
+    record_scratchpad_entry,
+    render_scratchpad,
+)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -41,9 +46,6 @@ class StageIVHelper:
         screen_scratchpads_dir = (
             f"artifacts/{session_id}/scratchpads/screen_scratchpads"
         )
-        global_scratchpad_path = (
-            f"artifacts/{session_id}/scratchpads/global_scratchpad.txt"
-        )
         file_structure_path = (
             f"artifacts/{session_id}/scratchpads/file_structure.txt"
         )
@@ -101,21 +103,11 @@ class StageIVHelper:
                     screen_name
                 ] = f"Error reading scratchpad for {screen_name}"
 
-        # Read global scratchpad
-        try:
-            with open(global_scratchpad_path, "r", encoding="utf-8") as f:
-                context_data["global_scratchpad"] = f.read()
-            self.logger.info("Successfully read global_scratchpad.txt")
-        except FileNotFoundError:
-            self.logger.warning(
-                f"global_scratchpad.txt not found at {global_scratchpad_path}"
-            )
-            context_data["global_scratchpad"] = "No global scratchpad available"
-        except Exception as e:
-            self.logger.error(f"Error reading global_scratchpad.txt: {e}")
-            context_data["global_scratchpad"] = (
-                "Error reading global scratchpad"
-            )
+        # Render the scratchpad entries routes generation needs
+        context_data["global_scratchpad"] = (
+            render_scratchpad(session_id, "stage_iv")
+            or "No global scratchpad available"
+        )
 
         # Read file structure
         try:
@@ -217,9 +209,6 @@ class StageIVHelper:
             llm_output: The raw LLM output containing XML
             codebase_path: Path to the codebase directory
         """
-        scratchpads_dir = f"artifacts/{session_id}/scratchpads"
-        os.makedirs(scratchpads_dir, exist_ok=True)
-
         # Parse XML response to get structured output
         try:
             file_data = parse_xml_to_dict(llm_output)
@@ -234,41 +223,18 @@ class StageIVHelper:
                 else:
                     actual_files.append(file_info)
 
-            # Format parsed output for scratchpad (only CONTEXT_REGISTRY, no actual code files)
-            formatted_output = f"""
-<STAGE_IV_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
-<ROUTES_CONTEXT_REGISTRY>
-{context_registry_content}
-</ROUTES_CONTEXT_REGISTRY>
-</STAGE_IV_CODE_GENERATION>
-
-"""
+            # Only the CONTEXT_REGISTRY goes to the scratchpad, no actual code files
+            routes_context = context_registry_content
 
         except Exception as e:
             # Fallback to raw output if parsing fails
             self.logger.warning(f"Failed to parse XML output: {e}")
-            formatted_output = f"""
-<STAGE_IV_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
-<RAW_LLM_OUTPUT>
-{llm_output}
-</RAW_LLM_OUTPUT>
-</STAGE_IV_CODE_GENERATION>
-
-"""
-
-        # Append to global scratchpad
-        global_scratchpad_path = os.path.join(
-            scratchpads_dir, "global_scratchpad.txt"
-        )
+            routes_context = (
+                f"<RAW_LLM_OUTPUT>\n{llm_output}\n</RAW_LLM_OUTPUT>"
+            )
 
-        with open(global_scratchpad_path, "a", encoding="utf-8") as f:
-            f.write(formatted_output)
-
-        self.logger.info(
-            f"Updated global_scratchpad.txt at {global_scratchpad_path}"
-        )
+        record_scratchpad_entry(session_id, ROUTES, "routes", routes_context)
+        self.logger.info("Recorded the routes context in the scratchpad")
 
     async def update_scratchpads_with_routes_generation(
         self,
@@ -289,10 +255,8 @@ class StageIVHelper:
         scratchpads_dir = f"artifacts/{session_id}/scratchpads"
         os.makedirs(scratchpads_dir, exist_ok=True)
 
-        # Format output for scratchpad with routes generation details
-        formatted_output = f"""
-<STAGE_IV_ROUTES_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
+        # Routes generation details for the scratchpad
+        routes_context = f"""
 <ROUTES_CONTEXT_REGISTRY>
 {context_registry_content}
 </ROUTES_CONTEXT_REGISTRY>
@@ -301,21 +265,10 @@ File: src/Routes.jsx
 Content Length: {len(routes_content)} characters
 Generated using heuristic analysis of pages directory structure
 </GENERATED_ROUTES_FILE>
-</STAGE_IV_ROUTES_GENERATION>
-
 """
 
-        # Append to global scratchpad
-        global_scratchpad_path = os.path.join(
-            scratchpads_dir, "global_scratchpad.txt"
-        )
-
-        with open(global_scratchpad_path, "a", encoding="utf-8") as f:
-            f.write(formatted_output)
-
-        self.logger.info(
-            f"Updated global_scratchpad.txt with routes generation summary at {global_scratchpad_path}"
-        )
+        record_scratchpad_entry(session_id, ROUTES, "routes", routes_context)
+        self.logger.info("Recorded the routes context in the scratchpad")
 
         # Also create a dedicated routes analysis file
         routes_analysis_path = os.path.join(
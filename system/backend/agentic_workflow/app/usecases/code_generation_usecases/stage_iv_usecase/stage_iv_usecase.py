@@ -19,15 +19,18 @@ from system.backend.agentic_workflow.app.repositories.error_repo import (
 from system.backend.agentic_workflow.app.services.anthropic_services.llm_service import (
     AnthropicService,
 )
+from system.backend.agentic_workflow.app.utils.file_writer import (
+    write_code_files,
+)
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    RouteManifest,
+)
 from system.backend.agentic_workflow.app.utils.routes_generator import (
     generate_routes_for_project,
 )
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
-from system.backend.agentic_workflow.app.utils.write_file import (
-    write_code_files,
-)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -103,7 +106,9 @@ class StageIVUsecase:
 
             # Generate routes using the heuristic generator
             routes_content, analysis = generate_routes_for_project(
-                src_path=src_path, output_path=routes_file_path
+                src_path=src_path,
+                output_path=routes_file_path,
+                manifest=RouteManifest(codebase_path),
             )
 
             # Create context registry content
@@ -177,7 +182,7 @@ class StageIVUsecase:
 
             # Write generated files to codebase (excluding CONTEXT_REGISTRY)
             codebase_path = f"artifacts/{session_id}/codebase"
-            write_code_files(actual_files, codebase_path)
+            await write_code_files(actual_files, codebase_path)
 
             # Update file structure to reflect newly generated files
             await self.helper.update_file_structure(session_id, codebase_path)
@@ -6,6 +6,59 @@ import re
 import time
 from typing import Any, Dict, List, Optional
 
+from system.backend.agentic_workflow.app.config.settings import settings
+from system.backend.agentic_workflow.app.utils.build_daemon import (
+    build_daemon_pool,
+)
+from system.backend.agentic_workflow.app.utils.diagnostics import (
+    extract_diagnostics,
+    get_diagnostic_extractor,
+)
+from system.backend.agentic_workflow.app.utils.import_graph import (
+    check_import_graph,
+)
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    VALIDATION,
+    record_scratchpad_entry,
+)
+from system.backend.agentic_workflow.app.utils.streaming_command import (
+    run_streaming_command,
+)
+from system.backend.agentic_workflow.app.utils.validation_cache import (
+    validation_cache,
+)
+
+# Import errors listed in the validation message; all of them are kept in
+# the parsed errors
+MAX_REPORTED_IMPORT_ERRORS = 50
+
+# Lines used for the error message when no parsed error is meaningful
+ERROR_MESSAGE_PATTERNS = (
+    r"Error: \[vite\].*",
+    r"Error: .*",
+    r"Failed to resolve.*",
+    r"Cannot resolve.*",
+    r"Module not found.*",
+    r"Compilation failed.*",
+    r"Build failed.*",
+    r"TypeError.*",
+    r"ReferenceError.*",
+    r"SyntaxError.*",
+    r"npm ERR!.*",
+)
+CONTEXT_KEYWORDS = (
+    "this is most likely",
+    "unintended",
+    "because",
+    "runtime",
+    "application",
+    "module",
+    "import",
+    "file",
+)
+SOURCE_FILE_LINE = re.compile(r".*\.(js|jsx|ts|tsx|dart).*")
+FLUTTER_ERROR_LOCATION = re.compile(r"lib/.*\.dart:\d+:\d+:")
+
 
 class StageVHelper:
     def __init__(self):
@@ -48,6 +101,11 @@ class StageVHelper:
                 "description": "Build the project",
                 "timeout": 300,
                 "required": True,
+                # Can be served by the session's warm build daemon
+                "daemon": True,
+                "version_command": "node --version",
+                # Installed packages change the build without touching src
+                "dependency_inputs": ["node_modules/.package-lock.json"],
                 "error_patterns": [
                     r"ERROR",
                     r"Build failed",
@@ -59,6 +117,14 @@ class StageVHelper:
                     r"Expected .* but got",
                     r"Unexpected token",
                 ],
+                # Errors after which the build cannot succeed
+                "fatal_patterns": [
+                    r"Could not resolve",
+                    r"[Ff]ailed to resolve import",
+                    r"is not exported by",
+                    r"Transform failed with",
+                    r"Unexpected token",
+                ],
             },
             # {
             #     "command": "npx eslint src --ext .js,.jsx,.ts,.tsx",
@@ -82,6 +148,11 @@ class StageVHelper:
                 "description": "Get Flutter dependencies",
                 "timeout": 180,
                 "required": True,
+                # Only rerun when the dependencies change
+                "cache_inputs": ["pubspec.yaml"],
+                "cache_outputs": [".dart_tool/package_config.json"],
+                "dependency_inputs": ["pubspec.lock"],
+                "version_command": "flutter --version",
                 "error_patterns": [
                     r"Error:",
                     r"Failed to",
@@ -89,12 +160,16 @@ class StageVHelper:
                     r"version solving failed",
                     r"pub get failed",
                 ],
+                "fatal_patterns": [r"version solving failed"],
             },
             {
                 "command": "flutter build web",
                 "description": "Build Flutter web app",
                 "timeout": 300,
                 "required": True,
+                "version_command": "flutter --version",
+                # Resolved packages are skipped by the source tree
+                "dependency_inputs": [".dart_tool/package_config.json"],
                 "error_patterns": [
                     r"Error:",
                     r"Failed to build",
@@ -111,11 +186,134 @@ class StageVHelper:
                     r"Couldn't find constructor",
                     r"ProcessException",
                 ],
+                "fatal_patterns": [
+                    r"lib/.*\.dart:\d+:\d+: Error:",
+                    r"Target dart2js failed",
+                    r"Compilation failed",
+                ],
             },
         ]
 
-    async def execute_validation_command(
+    async def check_imports(self, codebase_path: str) -> Dict[str, Any]:
+        """
+        Resolve the imports of a React codebase without running the bundler
+
+        Args:
+            codebase_path: Path to the codebase directory
+
+        Returns:
+            Dict shaped like a validation command result, with one parsed
+            error per unresolved import or missing export, and the unresolved
+            asset imports as warnings that do not count as errors
+        """
+        start_time = time.time()
+        command = "import graph check"
+        description = "Resolve imports and exports of the source files"
+
+        try:
+            import_errors = await asyncio.to_thread(
+                check_import_graph, codebase_path
+            )
+        except Exception as e:
+            return {
+                "command": command,
+                "description": description,
+                "status": "failed",
+                "has_errors": True,
+                "error_details": {
+                    "type": "execution_error",
+                    "message": str(e),
+                    "raw_output": "",
+                    "parsed_errors": [],
+                },
+                "execution_time": time.time() - start_time,
+            }
+
+        warning_lines = [
+            f"{error['file_path']}:{error['line_number']}: {error['message']}"
+            for error in import_errors
+            if error["severity"] == "warning"
+        ]
+        import_errors = [
+            error for error in import_errors if error["severity"] == "error"
+        ]
+        error_lines = [
+            f"{error['file_path']}:{error['line_number']}: {error['message']}"
+            for error in import_errors
+        ]
+        message = "\n".join(error_lines[:MAX_REPORTED_IMPORT_ERRORS])
+        if len(error_lines) > MAX_REPORTED_IMPORT_ERRORS:
+            message += f"\n... and {len(error_lines) - MAX_REPORTED_IMPORT_ERRORS} more"
+
+        has_errors = bool(import_errors)
+        self.logger.info(
+            f"Import graph check found {len(import_errors)} errors and "
+            f"{len(warning_lines)} warnings in "
+            f"{time.time() - start_time:.3f}s"
+        )
+        return {
+            "command": command,
+            "description": description,
+            "status": "error" if has_errors else "success",
+            "has_errors": has_errors,
+            "exit_code": 1 if has_errors else 0,
+            "error_details": {
+                "type": "import_errors" if has_errors else "none",
+                "message": message,
+                "raw_output": "\n".join(error_lines),
+                "parsed_errors": [
+                    {
+                        "pattern": "import_graph",
+                        "matched_text": error["import"],
+                        "line_number": error["line_number"],
+                        "error_line": error["message"],
+                        "file_path": error["file_path"],
+                        "column": None,
+                        "context": None,
+                    }
+                    for error in import_errors
+                ],
+            },
+            "warnings": warning_lines,
+            "execution_time": time.time() - start_time,
+        }
+
+    async def _run_command(
         self, command_info: Dict[str, Any], codebase_path: str
+    ) -> Dict[str, Any]:
+        """
+        Run a validation command in a fresh process, stopping it early once
+        it reports one of its fatal errors
+
+        Returns:
+            Dict with the exit code, combined output and whether the
+            command was aborted early
+
+        Raises:
+            asyncio.TimeoutError: If the command does not finish in time
+        """
+        fatal_patterns = None
+        if settings.STAGE_V_EARLY_ABORT_ENABLED:
+            fatal_patterns = command_info.get("fatal_patterns")
+        run_result = await run_streaming_command(
+            command_info["command"],
+            cwd=codebase_path,
+            timeout_seconds=command_info.get("timeout", 300),
+            fatal_patterns=fatal_patterns,
+            grace_seconds=settings.STAGE_V_EARLY_ABORT_GRACE_SECONDS,
+        )
+        if run_result["aborted"]:
+            self.logger.info(
+                f"Stopped {command_info['command']} early after: "
+                f"{run_result['abort_reason']}"
+            )
+        return run_result
+
+    async def execute_validation_command(
+        self,
+        command_info: Dict[str, Any],
+        codebase_path: str,
+        session_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Execute a validation command and parse its output
@@ -123,6 +321,7 @@ class StageVHelper:
         Args:
             command_info: Configuration for the command to run
             codebase_path: Path to the codebase directory
+            session_id: Session whose build daemon may run the command
 
         Returns:
             Dict containing execution results and parsed errors
@@ -130,24 +329,47 @@ class StageVHelper:
         start_time = time.time()
 
         try:
+            cache_key = None
+            if settings.STAGE_V_VALIDATION_CACHE_ENABLED:
+                cache_key = await validation_cache.compute_key(
+                    command_info, codebase_path
+                )
+            if cache_key:
+                cached_result = validation_cache.get(
+                    codebase_path, command_info["command"], cache_key
+                )
+                if cached_result is not None:
+                    self.logger.info(
+                        f"Reusing cached result of: {command_info['command']}"
+                    )
+                    cached_result["cached"] = True
+                    cached_result["execution_time"] = time.time() - start_time
+                    return cached_result
+
             self.logger.info(f"Executing command: {command_info['command']}")
 
-            # Run the command
-            process = await asyncio.create_subprocess_shell(
-                command_info["command"],
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=codebase_path,
-            )
+            run_result = None
+            if (
+                settings.STAGE_V_BUILD_DAEMON_ENABLED
+                and session_id
+                and command_info.get("daemon")
+            ):
+                run_result = await build_daemon_pool.build(
+                    session_id,
+                    codebase_path,
+                    command_info.get("timeout", 300),
+                )
+                if run_result is None:
+                    self.logger.info(
+                        "Build daemon unavailable, running a cold build"
+                    )
 
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=command_info.get("timeout", 300),
-                )
+                if run_result is None:
+                    run_result = await self._run_command(
+                        command_info, codebase_path
+                    )
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
                 return {
                     "command": command_info["command"],
                     "description": command_info["description"],
@@ -162,33 +384,36 @@ class StageVHelper:
                     "execution_time": time.time() - start_time,
                 }
 
-            # Decode output
-            stdout_text = stdout.decode("utf-8", errors="replace")
-            stderr_text = stderr.decode("utf-8", errors="replace")
-            combined_output = stdout_text + "\n" + stderr_text
+            combined_output = run_result["output"]
+            exit_code = run_result["exit_code"]
 
-            # Parse errors from output
-            parsed_errors = await self._parse_command_errors(
-                combined_output, command_info.get("error_patterns", [])
+            # Extract diagnostics from the output in a single pass
+            report = await asyncio.to_thread(
+                extract_diagnostics,
+                combined_output,
+                command_info.get("error_patterns", []),
+                command_info["command"],
             )
+            parsed_errors = report["diagnostics"]
 
             # Determine if command has errors
             has_errors = (
-                process.returncode != 0
+                exit_code != 0
                 or len(parsed_errors) > 0
-                or await self._has_critical_errors(
-                    combined_output, command_info["command"]
-                )
+                or report["has_critical_errors"]
             )
 
             execution_time = time.time() - start_time
 
-            return {
+            result = {
                 "command": command_info["command"],
                 "description": command_info["description"],
                 "status": "error" if has_errors else "success",
                 "has_errors": has_errors,
-                "exit_code": process.returncode,
+                "exit_code": exit_code,
+                # The diagnostics only cover the output before the abort
+                "aborted_early": run_result.get("aborted", False),
+                "build_daemon": run_result.get("build_daemon", False),
                 "error_details": {
                     "type": "command_errors" if has_errors else "none",
                     "message": self._extract_error_message(
@@ -199,6 +424,11 @@ class StageVHelper:
                 },
                 "execution_time": execution_time,
             }
+            if cache_key:
+                validation_cache.put(
+                    codebase_path, command_info["command"], cache_key, result
+                )
+            return result
 
         except Exception as e:
             execution_time = time.time() - start_time
@@ -216,139 +446,6 @@ class StageVHelper:
                 "execution_time": execution_time,
             }
 
-    async def _parse_command_errors(
-        self, output: str, error_patterns: List[str]
-    ) -> List[Dict[str, Any]]:
-        """
-        Parse errors from command output using regex patterns
-
-        Args:
-            output: Command output text
-            error_patterns: List of regex patterns to match errors
-
-        Returns:
-            List of parsed error objects
-        """
-        parsed_errors = []
-
-        for pattern in error_patterns:
-            matches = re.finditer(pattern, output, re.MULTILINE | re.IGNORECASE)
-
-            for match in matches:
-                # Find the line containing the error
-                lines = output.split("\n")
-                line_number = None
-                error_line = match.group(0)
-
-                # Try to find line number and context
-                for i, line in enumerate(lines):
-                    if match.group(0) in line:
-                        line_number = i + 1
-                        error_line = line.strip()
-                        break
-
-                # Extract additional context (file path, column, etc.)
-                file_path = self._extract_file_path(error_line)
-                column = self._extract_column_number(error_line)
-
-                parsed_errors.append(
-                    {
-                        "pattern": pattern,
-                        "matched_text": match.group(0),
-                        "line_number": line_number,
-                        "error_line": error_line,
-                        "file_path": file_path,
-                        "column": column,
-                        "context": (
-                            self._get_error_context(lines, line_number)
-                            if line_number
-                            else None
-                        ),
-                    }
-                )
-
-        return parsed_errors
-
-    def _extract_file_path(self, error_line: str) -> Optional[str]:
-        """Extract file path from error line"""
-        # Common patterns for file paths in error messages
-        patterns = [
-            r"([a-zA-Z0-9_\-./]+\.[a-zA-Z]{1,4}):?\d*:?\d*",
-            r"at ([a-zA-Z0-9_\-./]+\.[a-zA-Z]{1,4})",
-            r"in ([a-zA-Z0-9_\-./]+\.[a-zA-Z]{1,4})",
-            r"file://([a-zA-Z0-9_\-./]+\.[a-zA-Z]{1,4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, error_line)
-            if match:
-                return match.group(1)
-
-        return None
-
-    def _extract_column_number(self, error_line: str) -> Optional[int]:
-        """Extract column number from error line"""
-        # Look for patterns like ":line:column" or "line:column"
-        pattern = r":(\d+):(\d+)"
-        match = re.search(pattern, error_line)
-        if match:
-            return int(match.group(2))
-
-        return None
-
-    def _get_error_context(
-        self, lines: List[str], line_number: int
-    ) -> Optional[Dict[str, Any]]:
-        """Get context around error line"""
-        if not line_number or line_number < 1:
-            return None
-
-        start_line = max(0, line_number - 3)
-        end_line = min(len(lines), line_number + 2)
-
-        return {
-            "before": lines[start_line : line_number - 1],
-            "error_line": (
-                lines[line_number - 1] if line_number - 1 < len(lines) else ""
-            ),
-            "after": lines[line_number:end_line],
-        }
-
-    async def _has_critical_errors(self, output: str, command: str) -> bool:
-        """Check for critical errors that should fail validation"""
-        critical_patterns = [
-            r"Build failed",
-            r"Compilation failed",
-            r"Fatal error",
-            r"Cannot resolve module",
-            r"Module not found",
-            r"Syntax error",
-            r"Type error",
-            r"ReferenceError",
-            r"TypeError",
-            r"ERR_MODULE_NOT_FOUND",
-            r"Cannot find package",
-            r"Oops! Something went wrong",
-            r"Missing script:",
-            r"npm ERR!",
-            # Flutter-specific patterns
-            r"Target dart2js failed",
-            r"Error: Compilation failed",
-            r"ProcessException",
-            r"Error when reading",
-            r"No such file or directory",
-            r"Expected .* after",
-            r"missing implementations",
-            r"Couldn't find constructor",
-            r"lib/.*\.dart:\d+:\d+:.*Error:",
-        ]
-
-        for pattern in critical_patterns:
-            if re.search(pattern, output, re.IGNORECASE):
-                return True
-
-        return False
-
     def _extract_error_message(
         self, output: str, parsed_errors: List[Dict[str, Any]]
     ) -> str:
@@ -375,65 +472,35 @@ class StageVHelper:
         lines = output.split("\n")
         error_lines = []
 
-        # Look for specific error patterns with more context
-        error_patterns = [
-            r"Error: \[vite\].*",
-            r"Error: .*",
-            r"Failed to resolve.*",
-            r"Cannot resolve.*",
-            r"Module not found.*",
-            r"Compilation failed.*",
-            r"Build failed.*",
-            r"TypeError.*",
-            r"ReferenceError.*",
-            r"SyntaxError.*",
-            r"npm ERR!.*",
-        ]
-
-        # Find lines matching error patterns
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check for specific error patterns
-            for pattern in error_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    error_lines.append(line)
-                    # Include next few lines for context if they seem relevant
-                    for j in range(i + 1, min(i + 4, len(lines))):
-                        next_line = lines[j].strip()
-                        if (
-                            next_line
-                            and not next_line.startswith("at ")
-                            and len(next_line) < 200
-                        ):
-                            # Include lines that provide context but aren't stack traces
-                            if any(
-                                keyword in next_line.lower()
-                                for keyword in [
-                                    "this is most likely",
-                                    "unintended",
-                                    "because",
-                                    "runtime",
-                                    "application",
-                                    "module",
-                                    "import",
-                                    "file",
-                                ]
-                            ):
-                                error_lines.append(next_line)
-                            elif re.match(
-                                r".*\.(js|jsx|ts|tsx|dart).*", next_line
-                            ):
-                                error_lines.append(next_line)
-                    break
+        # Find lines matching the error message patterns in one pass
+        message_lines = get_diagnostic_extractor(
+            ERROR_MESSAGE_PATTERNS, ()
+        ).extract(output)["diagnostics"]
+        for diagnostic in message_lines:
+            i = diagnostic["line_number"] - 1
+            error_lines.append(diagnostic["error_line"])
+            # Include next few lines for context if they seem relevant
+            for j in range(i + 1, min(i + 4, len(lines))):
+                next_line = lines[j].strip()
+                if (
+                    next_line
+                    and not next_line.startswith("at ")
+                    and len(next_line) < 200
+                ):
+                    # Include lines that provide context but aren't stack traces
+                    if any(
+                        keyword in next_line.lower()
+                        for keyword in CONTEXT_KEYWORDS
+                    ):
+                        error_lines.append(next_line)
+                    elif SOURCE_FILE_LINE.match(next_line):
+                        error_lines.append(next_line)
 
         if error_lines:
             return "\n".join(error_lines)
 
         # Fallback: look for any line with error-related keywords
-        for line in lines:
+        for line_index, line in enumerate(lines):
             line = line.strip()
             if line and any(
                 keyword in line.lower()
@@ -441,7 +508,6 @@ class StageVHelper:
             ):
                 if len(line) > 10 and line != "error during build:":
                     # Get a few lines of context
-                    line_index = lines.index(line)
                     context_lines = [line]
                     for j in range(
                         line_index + 1, min(line_index + 3, len(lines))
@@ -464,7 +530,7 @@ class StageVHelper:
             line = line.strip()
 
             # Flutter errors typically start with a file path and line/column numbers
-            if re.match(r"lib/.*\.dart:\d+:\d+:", line):
+            if FLUTTER_ERROR_LOCATION.match(line):
                 # If we have a previous error, save it
                 if current_error:
                     compilation_errors.append("\n".join(current_error))
@@ -692,12 +758,10 @@ Total Execution Time: {summary['total_execution_time']}s
 
 """
 
-        # Append to global scratchpad
-        global_scratchpad_path = os.path.join(
-            scratchpads_dir, "global_scratchpad.txt"
+        # The latest report replaces the previous one in the scratchpad
+        record_scratchpad_entry(
+            session_id, VALIDATION, "latest", validation_report
         )
-        with open(global_scratchpad_path, "a", encoding="utf-8") as f:
-            f.write(validation_report)
 
         # Create dedicated validation results file
         validation_results_path = os.path.join(
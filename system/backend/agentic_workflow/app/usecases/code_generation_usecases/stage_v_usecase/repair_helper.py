@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List
+
+from fastapi import Depends
+
+from system.backend.agentic_workflow.app.config.settings import settings
+from system.backend.agentic_workflow.app.prompts.code_generation_prompts.stage_v_repair_prompt import (
+    SYSTEM_PROMPT,
+    USER_PROMPT,
+)
+from system.backend.agentic_workflow.app.services.anthropic_services.llm_service import (
+    AnthropicService,
+)
+from system.backend.agentic_workflow.app.utils.file_ownership import (
+    codebase_relative_path,
+)
+from system.backend.agentic_workflow.app.utils.file_writer import (
+    write_code_files,
+)
+from system.backend.agentic_workflow.app.utils.xml_parser import (
+    parse_xml_to_dict,
+)
+
+# Limits on the prompt of one repair call
+MAX_REPAIR_ERRORS = 50
+MAX_REPAIR_CONTEXT_CHARS = 120_000
+
+
+class StageVRepairHelper:
+    """
+    Fixes the screens and component clusters whose files failed to build,
+    with one LLM call per unit instead of regenerating the application.
+    """
+
+    def __init__(
+        self, anthropic_service: AnthropicService = Depends(AnthropicService)
+    ):
+        self.anthropic_service = anthropic_service
+        self.logger = logging.getLogger("code_generation_stage_v")
+
+    async def repair_units(
+        self,
+        units: Dict[str, Dict[str, Any]],
+        session_id: str,
+        codebase_path: str,
+        platform_type: str,
+    ) -> List[str]:
+        """
+        Repair the failing units in parallel
+
+        Args:
+            units: Failing units, as grouped by group_diagnostics_by_owner
+            session_id: Session identifier
+            codebase_path: Path to the codebase directory
+            platform_type: The platform type (web, mobile, etc.)
+
+        Returns:
+            Keys of the units whose files were rewritten
+        """
+        selected = list(units.items())[: settings.STAGE_V_AUTO_REPAIR_MAX_UNITS]
+        if len(units) > len(selected):
+            self.logger.info(
+                f"Repairing {len(selected)} of {len(units)} failing units"
+            )
+
+        file_structure = ""
+        structure_path = (
+            f"artifacts/{session_id}/scratchpads/file_structure.txt"
+        )
+        if os.path.exists(structure_path):
+            with open(structure_path, "r", encoding="utf-8") as f:
+                file_structure = f.read()
+
+        results = await asyncio.gather(
+            *[
+                self.repair_unit(
+                    unit, codebase_path, platform_type, file_structure
+                )
+                for _, unit in selected
+            ],
+            return_exceptions=True,
+        )
+
+        repaired = []
+        for (key, _), result in zip(selected, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to repair {key}: {result}")
+            elif result:
+                repaired.append(key)
+        return repaired
+
+    async def repair_unit(
+        self,
+        unit: Dict[str, Any],
+        codebase_path: str,
+        platform_type: str,
+        file_structure: str,
+    ) -> int:
+        """
+        Ask the LLM to fix one unit's build errors and write its fixes
+
+        Returns:
+            Number of files rewritten
+        """
+        owner_type = (
+            "component cluster"
+            if unit["owner_type"] == "cluster"
+            else unit["owner_type"]
+        )
+        error_lines = []
+        for diagnostic in unit["diagnostics"]:
+            location = diagnostic["file_path"]
+            if diagnostic["line"]:
+                location += f":{diagnostic['line']}"
+            line = f"{location}: {diagnostic['message']}"
+            if line not in error_lines:
+                error_lines.append(line)
+
+        files = []
+        context_chars = 0
+        for rel_path in unit["files"]:
+            path = os.path.join(codebase_path, rel_path)
+            if not os.path.isfile(path):
+                continue
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
+            # The files with errors come first and are always included
+            if (
+                files
+                and context_chars + len(content) > MAX_REPAIR_CONTEXT_CHARS
+            ):
+                break
+            context_chars += len(content)
+            files.append(
+                f"<FILE>\n<FILE_PATH>{rel_path}</FILE_PATH>\n"
+                f"<CODE_SNIPPET>\n{content}\n</CODE_SNIPPET>\n</FILE>"
+            )
+
+        system_prompt = SYSTEM_PROMPT.format(
+            platform=(
+                "Flutter" if platform_type.lower() == "mobile" else "React"
+            ),
+            owner_type=owner_type,
+        )
+        user_prompt = USER_PROMPT.format(
+            build_errors="\n".join(error_lines[:MAX_REPAIR_ERRORS]),
+            files="\n".join(files),
+            file_structure=file_structure,
+        )
+
+        self.logger.info(
+            f"Repairing {owner_type} {unit['owner_name']} with "
+            f"{len(error_lines)} errors in {len(files)} files"
+        )
+        response = await self.anthropic_service.anthropic_client_request(
+            prompt=user_prompt, system_prompt=system_prompt
+        )
+
+        # Only the unit's own files may be rewritten
+        fixed_files = []
+        for file_data in parse_xml_to_dict(response):
+            rel_path = codebase_relative_path(
+                file_data["file_path"], codebase_path
+            )
+            if rel_path in unit["files"]:
+                fixed_files.append({**file_data, "file_path": rel_path})
+            else:
+                self.logger.warning(
+                    f"Ignoring repair of {file_data['file_path']} outside "
+                    f"{owner_type} {unit['owner_name']}"
+                )
+
+        if fixed_files:
+            await write_code_files(fixed_files, base_dir=codebase_path)
+        return len(fixed_files)
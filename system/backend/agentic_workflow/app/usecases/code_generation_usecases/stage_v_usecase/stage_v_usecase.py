@@ -1,8 +1,9 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from fastapi import Depends, HTTPException
 
+from system.backend.agentic_workflow.app.config.settings import settings
 from system.backend.agentic_workflow.app.models.domain.error import Error
 from system.backend.agentic_workflow.app.models.schemas.code_generation_schema import (
     CodeGenerationRequest,
@@ -10,20 +11,26 @@ from system.backend.agentic_workflow.app.models.schemas.code_generation_schema i
 from system.backend.agentic_workflow.app.repositories.error_repo import (
     ErrorRepo,
 )
+from system.backend.agentic_workflow.app.utils.file_ownership import (
+    group_diagnostics_by_owner,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
 
 from .helper import StageVHelper
+from .repair_helper import StageVRepairHelper
 
 
 class StageVUsecase:
     def __init__(
         self,
         error_repo: ErrorRepo = Depends(),
+        repair_helper: StageVRepairHelper = Depends(),
     ):
         self.error_repo = error_repo
         self.helper = StageVHelper()
+        self.repair_helper = repair_helper
 
     def _create_simple_error_message(self, validation_results):
         """
@@ -121,6 +128,75 @@ class StageVUsecase:
             else "Validation errors detected"
         )
 
+    async def _run_validation(
+        self, platform_type: str, codebase_path: str, session_id: str
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Run the validation commands of the platform in order
+
+        Returns:
+            The result of each command and whether any of them had errors
+        """
+        # Get validation commands based on platform type
+        validation_commands = await self.helper.get_validation_commands(
+            platform_type
+        )
+
+        # Execute validation commands in chronological order
+        validation_results = []
+        has_errors = False
+
+        # Broken imports are found in milliseconds without the bundler, and
+        # the build would only report the first of them. The check is a
+        # heuristic, so its findings only count when the build fails too
+        import_result = None
+        if (
+            platform_type.lower() != "mobile"
+            and settings.STAGE_V_IMPORT_CHECK_ENABLED
+        ):
+            import_result = await self.helper.check_imports(codebase_path)
+            validation_results.append(import_result)
+
+        for command_info in validation_commands:
+            try:
+                result = await self.helper.execute_validation_command(
+                    command_info, codebase_path, session_id
+                )
+                validation_results.append(result)
+
+                # Check if this command had errors
+                if result["status"] == "error" or result["has_errors"]:
+                    has_errors = True
+
+            except Exception as e:
+                # Command execution failed
+                error_result = {
+                    "command": command_info["command"],
+                    "description": command_info["description"],
+                    "status": "failed",
+                    "has_errors": True,
+                    "error_details": {
+                        "type": "execution_error",
+                        "message": str(e),
+                        "raw_output": "",
+                        "parsed_errors": [],
+                    },
+                    "execution_time": 0,
+                }
+                validation_results.append(error_result)
+                has_errors = True
+
+        if (
+            import_result is not None
+            and import_result["has_errors"]
+            and not has_errors
+        ):
+            # The bundler accepted the imports the check flagged
+            import_result["has_errors"] = False
+            import_result["status"] = "warning"
+
+        return validation_results, has_errors
+
     async def execute(self, request: CodeGenerationRequest) -> Dict[str, Any]:
         """
         Execute Stage V processing for code generation validation
@@ -150,43 +226,39 @@ class StageVUsecase:
                     f"Codebase not found at {codebase_path}"
                 )
 
-            # Get validation commands based on platform type
-            validation_commands = await self.helper.get_validation_commands(
-                platform_type
+            validation_results, has_errors = await self._run_validation(
+                platform_type, codebase_path, session_id
             )
 
-            # Execute validation commands in chronological order
-            validation_results = []
-            has_errors = False
-
-            for command_info in validation_commands:
-                try:
-                    result = await self.helper.execute_validation_command(
-                        command_info, codebase_path
-                    )
-                    validation_results.append(result)
-
-                    # Check if this command had errors
-                    if result["status"] == "error" or result["has_errors"]:
-                        has_errors = True
-
-                except Exception as e:
-                    # Command execution failed
-                    error_result = {
-                        "command": command_info["command"],
-                        "description": command_info["description"],
-                        "status": "failed",
-                        "has_errors": True,
-                        "error_details": {
-                            "type": "execution_error",
-                            "message": str(e),
-                            "raw_output": "",
-                            "parsed_errors": [],
-                        },
-                        "execution_time": 0,
-                    }
-                    validation_results.append(error_result)
-                    has_errors = True
+            # Fix the screens and clusters that own the failing files and
+            # validate again, within the iteration budget
+            repair_iterations = 0
+            repaired_units = []
+            while (
+                has_errors
+                and settings.STAGE_V_AUTO_REPAIR_ENABLED
+                and repair_iterations
+                < settings.STAGE_V_AUTO_REPAIR_MAX_ITERATIONS
+            ):
+                units = group_diagnostics_by_owner(
+                    validation_results, session_id, codebase_path
+                )
+                if not units:
+                    break
+                repair_iterations += 1
+                repaired = await self.repair_helper.repair_units(
+                    units, session_id, codebase_path, platform_type
+                )
+                if not repaired:
+                    break
+                repaired_units.extend(repaired)
+                validation_results, has_errors = await self._run_validation(
+                    platform_type, codebase_path, session_id
+                )
+            repair_data = {
+                "repair_iterations": repair_iterations,
+                "repaired_units": repaired_units,
+            }
 
             # Create summary of results
             summary = await self.helper.create_validation_summary(
@@ -207,12 +279,14 @@ class StageVUsecase:
                     "success": False,
                     "message": "Code validation failed with errors",
                     "error": simple_error,
+                    "data": repair_data,
                 }
             else:
                 return {
                     "success": True,
                     "message": "Code validation completed successfully - no errors found",
                     "error": None,
+                    "data": repair_data,
                 }
 
         except HTTPException as e:
@@ -14,12 +14,12 @@ from system.backend.agentic_workflow.app.repositories.error_repo import (
 from system.backend.agentic_workflow.app.services.anthropic_services.llm_service import (
     AnthropicService,
 )
+from system.backend.agentic_workflow.app.utils.file_writer import (
+    write_code_files,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
-from system.backend.agentic_workflow.app.utils.write_file import (
-    write_code_files,
-)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -76,7 +76,7 @@ class FlutterStageIUsecase:
 
             # Write generated files to codebase
             codebase_path = f"artifacts/{session_id}/codebase"
-            write_code_files(file_data, codebase_path)
+            await write_code_files(file_data, codebase_path)
 
             # Update scratchpad files
             await self.helper.update_scratchpads(
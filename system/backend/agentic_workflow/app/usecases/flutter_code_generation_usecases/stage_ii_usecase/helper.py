@@ -4,6 +4,7 @@ import os
 
 from fastapi import Depends
 
+from system.backend.agentic_workflow.app.config.settings import settings
 from system.backend.agentic_workflow.app.models.schemas.code_generation_schema import (
     CodeGenerationRequest,
 )
@@ -14,6 +15,9 @@ from system.backend.agentic_workflow.app.prompts.flutter_code_generation_prompts
 from system.backend.agentic_workflow.app.services.anthropic_services.llm_service import (
     AnthropicService,
 )
+from system.backend.agentic_workflow.app.utils.file_ownership import (
+    record_file_owners,
+)
 from system.backend.agentic_workflow.app.utils.file_structure import (
     generate_directory_structure,
     get_project_root,
@@ -21,10 +25,22 @@ from system.backend.agentic_workflow.app.utils.file_structure import (
 from system.backend.agentic_workflow.app.utils.file_writer import (
     write_code_files,
 )
-from system.backend.agentic_workflow.app.utils.logger import loggers
+from system.backend.agentic_workflow.app.utils.logger import (
+    loggers,
+    set_log_context,
+)
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    record_screen_routes,
+)
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    render_scratchpad,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
+from system.backend.agentic_workflow.app.utils.syntax_check import (
+    check_files_syntax,
+)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -52,9 +68,10 @@ class Helper:
                 "navigation_structure", {}
             ).get("screen_navigation", {})
 
+        # Only the scratchpad entries screens need, within the prompt budget
+        global_scratchpad = render_scratchpad(session_state.get(), "stage_iii")
+
         scratchpad_path = f"artifacts/{session_state.get()}/scratchpads"
-        with open(f"{scratchpad_path}/global_scratchpad.txt", "r") as f:
-            global_scratchpad = f.read()
 
         with open(f"{scratchpad_path}/file_structure.txt", "r") as f:
             file_structure = f.read()
@@ -201,6 +218,10 @@ class Helper:
         """
         Process a single screen and save its code files immediately.
         """
+        # Each screen runs in its own task, so this only tags its records
+        set_log_context(
+            stage="flutter_code_generation_stage_ii", screen=screen_name
+        )
         loggers["screen_generation"].info(
             f"Processing single screen: {screen_name}"
         )
@@ -219,16 +240,44 @@ class Helper:
             file_structure=file_structure,
         )
 
-        response = await self.anthropic_service.anthropic_client_request(
-            system_prompt=system_prompt, prompt=user_prompt
-        )
+        # Truncated or malformed output is regenerated right away instead
+        # of failing the build in stage V
+        for attempt in range(settings.SYNTAX_CHECK_MAX_RETRIES + 1):
+            response = await self.anthropic_service.anthropic_client_request(
+                system_prompt=system_prompt, prompt=user_prompt
+            )
 
-        code_files = parse_xml_to_dict(response)
+            code_files = parse_xml_to_dict(response)
 
-        loggers["screen_generation"].info(
-            f"Writing {len(code_files)} code files for screen: {screen_name}"
-        )
-        write_code_files(code_files, base_dir="")
-        loggers["screen_generation"].info(
-            f"Successfully saved code files for screen: {screen_name}"
-        )
+            loggers["screen_generation"].info(
+                f"Writing {len(code_files)} code files for screen: {screen_name}"
+            )
+            await write_code_files(code_files, base_dir="")
+            record_file_owners(
+                session_state.get(),
+                "screen",
+                screen_name,
+                [file_data["file_path"] for file_data in code_files],
+            )
+            record_screen_routes(session_state.get(), code_files)
+            loggers["screen_generation"].info(
+                f"Successfully saved code files for screen: {screen_name}"
+            )
+
+            if not settings.SYNTAX_CHECK_ENABLED:
+                break
+            syntax_errors = await check_files_syntax(
+                [file_data["file_path"] for file_data in code_files],
+                f"{get_project_root()}/artifacts/{session_state.get()}/codebase",
+            )
+            if not syntax_errors:
+                break
+            for error in syntax_errors:
+                loggers["screen_generation"].warning(
+                    f"Syntax error in {error['file_path']}:{error['line']} "
+                    f"of screen {screen_name}: {error['message']}"
+                )
+            if attempt < settings.SYNTAX_CHECK_MAX_RETRIES:
+                loggers["screen_generation"].info(
+                    f"Regenerating screen: {screen_name}"
+                )
@@ -5,6 +5,10 @@ from typing import Any, Dict
 from system.backend.agentic_workflow.app.utils.file_structure import (
     generate_directory_structure,
 )
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    ROUTES,
+    record_scratchpad_entry,
+)
 from system.backend.agentic_workflow.app.utils.xml_parser import (
     parse_xml_to_dict,
 )
@@ -146,9 +150,6 @@ class FlutterStageIIIHelper:
             llm_output: The raw LLM output containing XML
             codebase_path: Path to the codebase directory
         """
-        scratchpads_dir = f"artifacts/{session_id}/scratchpads"
-        os.makedirs(scratchpads_dir, exist_ok=True)
-
         # Parse XML response to get structured output
         try:
             file_data = parse_xml_to_dict(llm_output)
@@ -163,41 +164,18 @@ class FlutterStageIIIHelper:
                 else:
                     actual_files.append(file_info)
 
-            # Format parsed output for scratchpad (only CONTEXT_REGISTRY, no actual code files)
-            formatted_output = f"""
-<FLUTTER_STAGE_III_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
-<ROUTES_CONTEXT_REGISTRY>
-{context_registry_content}
-</ROUTES_CONTEXT_REGISTRY>
-</FLUTTER_STAGE_III_CODE_GENERATION>
-
-"""
+            # Only the CONTEXT_REGISTRY goes to the scratchpad, no actual code files
+            routes_context = context_registry_content
 
         except Exception as e:
             # Fallback to raw output if parsing fails
             self.logger.warning(f"Failed to parse XML output: {e}")
-            formatted_output = f"""
-<FLUTTER_STAGE_III_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
-<RAW_LLM_OUTPUT>
-{llm_output}
-</RAW_LLM_OUTPUT>
-</FLUTTER_STAGE_III_CODE_GENERATION>
-
-"""
-
-        # Append to Flutter-specific scratchpad
-        flutter_scratchpad_path = os.path.join(
-            scratchpads_dir, "global_scratchpad.txt"
-        )
-
-        with open(flutter_scratchpad_path, "a", encoding="utf-8") as f:
-            f.write(formatted_output)
+            routes_context = (
+                f"<RAW_LLM_OUTPUT>\n{llm_output}\n</RAW_LLM_OUTPUT>"
+            )
 
-        self.logger.info(
-            f"Updated global_scratchpad.txt at {flutter_scratchpad_path}"
-        )
+        record_scratchpad_entry(session_id, ROUTES, "routes", routes_context)
+        self.logger.info("Recorded the routes context in the scratchpad")
 
     async def update_scratchpads_with_generated_content(
         self,
@@ -215,34 +193,18 @@ class FlutterStageIIIHelper:
             context_registry_content: The context registry content
             codebase_path: Path to the codebase directory
         """
-        scratchpads_dir = f"artifacts/{session_id}/scratchpads"
-        os.makedirs(scratchpads_dir, exist_ok=True)
-
-        # Format output for scratchpad
-        formatted_output = f"""
-<FLUTTER_STAGE_III_CODE_GENERATION>
-<TIMESTAMP>{self._get_timestamp()}</TIMESTAMP>
+        # Routes generation details for the scratchpad
+        routes_context = f"""
 <ROUTES_CONTEXT_REGISTRY>
 {context_registry_content}
 </ROUTES_CONTEXT_REGISTRY>
 <GENERATED_ROUTES_FILE>
 {routes_content}
 </GENERATED_ROUTES_FILE>
-</FLUTTER_STAGE_III_CODE_GENERATION>
-
 """
 
-        # Append to Flutter-specific scratchpad
-        flutter_scratchpad_path = os.path.join(
-            scratchpads_dir, "global_scratchpad.txt"
-        )
-
-        with open(flutter_scratchpad_path, "a", encoding="utf-8") as f:
-            f.write(formatted_output)
-
-        self.logger.info(
-            f"Updated global_scratchpad.txt with generated routes content at {flutter_scratchpad_path}"
-        )
+        record_scratchpad_entry(session_id, ROUTES, "routes", routes_context)
+        self.logger.info("Recorded the routes context in the scratchpad")
 
     def generate_context_registry(self, analysis: Dict) -> str:
         """
@@ -299,9 +261,3 @@ ANALYSIS DETAILS:
 • Route Paths: Generated from directory names (snake_case → kebab-case)
 • Route Constants: Generated from directory names (snake_case → camelCase)
 """
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp as string"""
-        from datetime import datetime
-
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
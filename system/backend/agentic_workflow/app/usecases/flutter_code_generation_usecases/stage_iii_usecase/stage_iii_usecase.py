@@ -13,6 +13,9 @@ from system.backend.agentic_workflow.app.repositories.error_repo import (
 from system.backend.agentic_workflow.app.utils.flutter_routes_generator import (
     generate_flutter_routes_for_project,
 )
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    RouteManifest,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
@@ -60,7 +63,9 @@ class FlutterStageIIIUsecase:
 
             # Generate routes using the heuristic generator
             routes_content, analysis = generate_flutter_routes_for_project(
-                lib_path=lib_path, output_path=routes_file_path
+                lib_path=lib_path,
+                output_path=routes_file_path,
+                manifest=RouteManifest(codebase_path),
             )
 
             # Create context registry content
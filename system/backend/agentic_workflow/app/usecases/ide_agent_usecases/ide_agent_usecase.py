@@ -21,7 +21,13 @@ from system.backend.agentic_workflow.app.services.anthropic_services.llm_service
 from system.backend.agentic_workflow.app.utils.ide_agent_tools import (
     IDEAgentTools,
 )
-from system.backend.agentic_workflow.app.utils.logger import loggers
+from system.backend.agentic_workflow.app.utils.logger import (
+    loggers,
+    set_log_context,
+)
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    render_scratchpad,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
@@ -64,17 +70,12 @@ class IDEAgentUsecase:
         return file_structure_content
 
     def _read_global_scratch_pad_content(self, session_id: str) -> str:
-        """Read and return global scratch pad content"""
-        global_scratch_pad_path = (
-            f"artifacts/{session_id}/scratchpads/global_scratchpad.txt"
-        )
-        global_scratch_pad_content = ""
-
+        """Render the global scratch pad slice of the IDE agent"""
         try:
-            if os.path.exists(global_scratch_pad_path):
-                with open(global_scratch_pad_path, "r", encoding="utf-8") as f:
-                    global_scratch_pad_content = f.read()
-            else:
+            global_scratch_pad_content = render_scratchpad(
+                session_id, "ide_agent"
+            )
+            if not global_scratch_pad_content:
                 global_scratch_pad_content = "Global scratch pad not available"
         except Exception as e:
             loggers["ide_agent"].warning(
@@ -190,10 +191,10 @@ class IDEAgentUsecase:
             if not session_id:
                 raise ValueError("No session_id available in context")
 
+            set_log_context(stage="ide_agent")
             loggers["ide_agent"].info(
                 f"Starting IDE agent for session: {session_id}"
             )
-            print(f"🤖 IDE Agent started for session: {session_id}")
 
             # Get the codebase path for the session
             codebase_path = f"artifacts/{session_id}/codebase"
@@ -213,15 +214,15 @@ class IDEAgentUsecase:
                 self._read_screen_scratch_pads_content(session_id)
             )
 
-            print(f"📁 Codebase found at: {codebase_path}")
-            print(
-                f"🗂️  File structure loaded: {len(file_structure_content)} characters"
+            loggers["ide_agent"].info(f"Codebase found at: {codebase_path}")
+            loggers["ide_agent"].debug(
+                f"File structure loaded: {len(file_structure_content)} characters"
             )
-            print(
-                f"📝 Global scratch pad content: {len(global_scratch_pad_content)} characters"
+            loggers["ide_agent"].debug(
+                f"Global scratch pad content: {len(global_scratch_pad_content)} characters"
             )
-            print(
-                f"📋 Screen scratch pads content: {len(screen_scratch_pads_content)} characters"
+            loggers["ide_agent"].debug(
+                f"Screen scratch pads content: {len(screen_scratch_pads_content)} characters"
             )
 
             # Initialize conversation tracking
@@ -237,7 +238,7 @@ class IDEAgentUsecase:
                 screen_scratch_pads_content=screen_scratch_pads_content,
             )
 
-            print(f"🛠️  Available tools: {len(tools)}")
+            loggers["ide_agent"].debug(f"Available tools: {len(tools)}")
 
             # Initialize messages list for the conversation with enhanced context
             user_prompt = USER_PROMPT.format(
@@ -260,8 +261,8 @@ class IDEAgentUsecase:
 
             # Tool calling loop
             while tool_call_count < self.max_tool_calls:
-                print(
-                    f"\n💭 Making request to LLM (iteration {tool_call_count + 1})..."
+                loggers["ide_agent"].debug(
+                    f"Making request to LLM (iteration {tool_call_count + 1})..."
                 )
 
                 # Make request to LLM with tools
@@ -276,27 +277,28 @@ class IDEAgentUsecase:
                 # Store the current response content as potential final message
                 if response["content"] and response["content"].strip():
                     final_message = response["content"]
-                    print(
-                        f"🤖 Agent says: {response['content'][:200]}{'...' if len(response['content']) > 200 else ''}"
+                    loggers["ide_agent"].debug(
+                        "Agent says: %.200s", response["content"]
                     )
 
                 # If no tool calls, we're done
                 if not response["tool_calls"]:
-                    print("✅ Agent completed - no more tool calls needed")
                     completion_reason = "natural_completion"
                     loggers["ide_agent"].info(
                         f"IDE agent completed without tool calls. Total tool calls used: {tool_call_count}"
                     )
                     break
 
-                print(
-                    f"🔧 Received {len(response['tool_calls'])} tool call(s) to execute"
+                loggers["ide_agent"].debug(
+                    f"Received {len(response['tool_calls'])} tool call(s) to execute"
                 )
 
                 # Execute tool calls
                 tool_results = []
                 exit_tool_called = False
 
+                # Calls past the limit or after exit_tool are not executed
+                calls_to_run = []
                 for tool_call in response["tool_calls"]:
                     if tool_call_count >= self.max_tool_calls:
                         loggers["ide_agent"].warning(
@@ -306,20 +308,34 @@ class IDEAgentUsecase:
                         break
 
                     tool_call_count += 1
-                    tool_name = tool_call["name"]
-                    tool_input = tool_call["input"]
-
-                    print(f"  ⚡ Executing: {tool_name} (#{tool_call_count})")
+                    calls_to_run.append(tool_call)
 
                     loggers["ide_agent"].info(
-                        f"Calling tool: {tool_name} (call #{tool_call_count})"
+                        f"Calling tool: {tool_call['name']} (call #{tool_call_count})"
+                    )
+
+                    if tool_call["name"] == "exit_tool":
+                        break
+
+                # All tool calls of the turn are sent in a single request
+                try:
+                    call_results = await self.ide_tools.call_tools(
+                        [
+                            (tool_call["name"], tool_call["input"])
+                            for tool_call in calls_to_run
+                        ]
                     )
+                except Exception as e:
+                    call_results = [e] * len(calls_to_run)
+
+                for tool_call, tool_result in zip(calls_to_run, call_results):
+                    tool_name = tool_call["name"]
+                    tool_input = tool_call["input"]
 
                     try:
-                        # Call the tool
-                        tool_result = await self.ide_tools.call_tool(
-                            tool_name, tool_input
-                        )
+                        if isinstance(tool_result, Exception):
+                            raise tool_result
+
                         formatted_result = self.ide_tools.format_tool_result(
                             tool_name, tool_result
                         )
@@ -333,19 +349,15 @@ class IDEAgentUsecase:
                                     tool_result, tool_input
                                 )
                             )
-                            print(f"🚪 Exit tool called - stopping execution")
                             loggers["ide_agent"].info(
                                 "Exit tool called - stopping agent loop"
                             )
 
-                        # Show tool result (truncated for readability)
-                        result_preview = (
-                            formatted_result[:300]
-                            if formatted_result
-                            else "No result"
-                        )
-                        print(
-                            f"    ✅ Result: {result_preview}{'...' if len(formatted_result) > 300 else ''}"
+                        # Log tool result (truncated for readability)
+                        loggers["ide_agent"].debug(
+                            "Tool %s result: %.300s",
+                            tool_name,
+                            formatted_result or "No result",
                         )
 
                         tool_results.append(
@@ -359,8 +371,6 @@ class IDEAgentUsecase:
                         error_msg = f"Error calling tool {tool_name}: {str(e)}"
                         loggers["ide_agent"].error(error_msg)
 
-                        print(f"    ❌ Tool failed: {error_msg}")
-
                         tool_results.append(
                             {
                                 "tool_call_id": tool_call["id"],
@@ -368,10 +378,6 @@ class IDEAgentUsecase:
                             }
                         )
 
-                    # Break if exit tool was called
-                    if exit_tool_called:
-                        break
-
                 # Add assistant message with tool calls to messages
                 assistant_message = {"role": "assistant", "content": []}
 
@@ -415,8 +421,8 @@ class IDEAgentUsecase:
                     break
 
                 if tool_call_count >= self.max_tool_calls:
-                    print(
-                        f"⚠️  Maximum tool calls ({self.max_tool_calls}) reached - stopping execution"
+                    loggers["ide_agent"].info(
+                        f"Maximum tool calls ({self.max_tool_calls}) reached - stopping execution"
                     )
                     completion_reason = "max_tool_calls"
                     loggers["ide_agent"].warning(
@@ -426,7 +432,9 @@ class IDEAgentUsecase:
 
             # Handle final response based on completion reason
             if completion_reason == "max_tool_calls":
-                print("📝 Generating final summary due to tool limit...")
+                loggers["ide_agent"].info(
+                    "Generating final summary due to tool limit..."
+                )
                 # Add a final message asking for summary
                 messages.append(
                     {
@@ -450,8 +458,8 @@ class IDEAgentUsecase:
 
                 if final_response["content"]:
                     final_message = final_response["content"]
-                    print(
-                        f"📋 Summary: {final_response['content'][:400]}{'...' if len(final_response['content']) > 400 else ''}"
+                    loggers["ide_agent"].debug(
+                        "Summary: %.400s", final_response["content"]
                     )
 
             elif completion_reason == "exit_tool":
@@ -467,8 +475,8 @@ class IDEAgentUsecase:
             if not final_message:
                 final_message = "IDE agent completed successfully."
 
-            print(
-                f"🎯 IDE Agent completed! Total tool calls: {tool_call_count}"
+            loggers["ide_agent"].info(
+                f"IDE Agent completed! Total tool calls: {tool_call_count}"
             )
 
             return {
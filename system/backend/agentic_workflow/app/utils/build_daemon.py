@@ -0,0 +1,358 @@
+import asyncio
+import hashlib
+import os
+import re
+import signal
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+from system.backend.agentic_workflow.app.config.settings import settings
+from system.backend.agentic_workflow.app.utils.logger import loggers
+
+BUILD_STARTED = re.compile(r"build started")
+BUILD_SUCCEEDED = re.compile(r"built in [\d.]+m?s")
+# Rollup and Vite errors start with the plugin name, e.g. "[vite:esbuild]"
+BUILD_ERROR = re.compile(
+    r"^\[[\w:@/-]+\]|^error\b|error:|failed to resolve|could not resolve"
+    r"|is not exported by",
+    re.IGNORECASE,
+)
+MAX_BUILD_OUTPUT_LINES = 2000
+# Vite prints a failed rebuild without a closing line, so it is presumed
+# failed once the output has been quiet for this long. The presumption is
+# never served as a result: callers run a cold build instead, and a closing
+# line printed later still records the build as succeeded
+ERROR_QUIET_SECONDS = 0.5
+# Vite prints these before phases that can stay quiet for a long time
+BUILD_PROGRESS = re.compile(
+    r"transforming|modules transformed|rendering chunks|computing gzip size",
+    re.IGNORECASE,
+)
+# A build that printed anything else and then stays quiet this long without
+# a closing line is presumed failed in a way BUILD_ERROR does not recognise
+BUILD_QUIET_SECONDS = 5
+# Time for the watcher to pick up the touched entry before falling back
+BUILD_START_TIMEOUT_SECONDS = 10
+ENTRY_FILES = ("index.html", "src/index.jsx", "src/main.jsx")
+SIGNATURE_EXCLUDED_DIRS = frozenset(["node_modules", "dist", ".git"])
+
+
+def source_signature(codebase_path: str) -> str:
+    """Hash of the path, size and mtime of every source file."""
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(codebase_path):
+        dirs[:] = sorted(d for d in dirs if d not in SIGNATURE_EXCLUDED_DIRS)
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            try:
+                stats = os.stat(path)
+            except OSError:
+                continue
+            digest.update(
+                f"{path}\0{stats.st_size}\0{stats.st_mtime_ns}\n".encode()
+            )
+    return digest.hexdigest()
+
+
+class BuildDaemon:
+    """
+    A `vite build --watch` process kept running for one session's codebase.
+
+    The watcher rebuilds incrementally whenever a source file changes. A
+    build request returns the result of the last build when no file changed
+    since it started; otherwise it touches the entry file so the watcher
+    rebuilds, and waits for that build. Only builds that printed their
+    closing line are returned; a build presumed failed because its output
+    went quiet makes the request fall back to a cold build.
+    """
+
+    def __init__(self, session_id: str, codebase_path: str, command: str):
+        self.session_id = session_id
+        self.codebase_path = codebase_path
+        self.command = command
+        self.last_used = time.monotonic()
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._closed = False
+        self._reader: Optional[asyncio.Task] = None
+        self._builds_started = 0
+        self._builds_finished = 0
+        self._building_signature: Optional[str] = None
+        self._output: "deque[str]" = deque(maxlen=MAX_BUILD_OUTPUT_LINES)
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._last_signature: Optional[str] = None
+        # Whether the last result was presumed from a quiet output
+        self._last_presumed = False
+        self._changed = asyncio.Condition()
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self._process is not None
+            and self._process.returncode is None
+            and not self._closed
+        )
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_shell(
+            self.command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=self.codebase_path,
+            start_new_session=True,
+            env={**os.environ, "NO_COLOR": "1", "FORCE_COLOR": "0"},
+        )
+        self._reader = asyncio.create_task(self._read_output())
+        loggers["build_daemon"].info(
+            "Started build daemon %s for session %s",
+            self._process.pid,
+            self.session_id,
+        )
+
+    async def stop(self) -> None:
+        if self._process is None:
+            return
+        if self._process.returncode is None:
+            try:
+                os.killpg(self._process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            try:
+                await asyncio.wait_for(self._process.wait(), 5)
+            except asyncio.TimeoutError:
+                try:
+                    os.killpg(self._process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await self._process.wait()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+        loggers["build_daemon"].info(
+            "Stopped build daemon for session %s", self.session_id
+        )
+
+    async def _read_output(self) -> None:
+        stream = self._process.stdout
+        building = False
+        failing = False
+        # Whether the last build line may be followed by a long quiet phase
+        in_progress = True
+        # Whether the build was presumed failed and no output followed
+        presumed = False
+        while True:
+            if not building or presumed:
+                quiet_seconds = None
+            elif failing:
+                quiet_seconds = ERROR_QUIET_SECONDS
+            elif not in_progress:
+                quiet_seconds = BUILD_QUIET_SECONDS
+            else:
+                quiet_seconds = None
+            try:
+                line = await asyncio.wait_for(stream.readline(), quiet_seconds)
+            except asyncio.TimeoutError:
+                # The build stays open: a closing line printed later still
+                # replaces this presumed failure
+                await self._finish(success=False, presumed=True)
+                presumed = True
+                continue
+            if not line:
+                break
+
+            text = line.decode("utf-8", errors="replace").rstrip()
+            if BUILD_STARTED.search(text):
+                # Files changed after this point trigger another build
+                self._building_signature = await asyncio.to_thread(
+                    source_signature, self.codebase_path
+                )
+                self._output.clear()
+                async with self._changed:
+                    self._builds_started += 1
+                    self._changed.notify_all()
+                building, failing, in_progress = True, False, True
+                presumed = False
+                continue
+            if not building:
+                continue
+
+            self._output.append(text)
+            presumed = False
+            in_progress = bool(BUILD_PROGRESS.search(text))
+            if BUILD_SUCCEEDED.search(text):
+                await self._finish(success=True)
+                building = failing = False
+            elif BUILD_ERROR.search(text):
+                failing = True
+
+        if building:
+            await self._finish(success=False, presumed=True)
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    async def _finish(self, success: bool, presumed: bool = False) -> None:
+        async with self._changed:
+            self._last_result = {
+                "exit_code": 0 if success else 1,
+                "output": "\n".join(self._output),
+            }
+            self._last_presumed = presumed
+            self._last_signature = self._building_signature
+            self._builds_finished = self._builds_started
+            self._changed.notify_all()
+
+    def _touch_entry(self) -> None:
+        for name in ENTRY_FILES:
+            path = os.path.join(self.codebase_path, name)
+            if os.path.exists(path):
+                os.utime(path)
+                return
+
+    async def build(self, timeout_seconds: float) -> Optional[Dict[str, Any]]:
+        """
+        Get the result of a build of the current source files.
+
+        Returns:
+            Dict with exit_code and the build output, or None when the
+            daemon stopped, did not rebuild in time or only presumed the
+            build failed, and the caller should run a cold build
+        """
+        self.last_used = time.monotonic()
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(
+                    self._build_current(), timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                return None
+
+    async def _build_current(self) -> Optional[Dict[str, Any]]:
+        while self.is_running:
+            signature = await asyncio.to_thread(
+                source_signature, self.codebase_path
+            )
+            async with self._changed:
+                if (
+                    self._last_result is not None
+                    and self._last_signature == signature
+                ):
+                    if self._last_presumed:
+                        return None
+                    return {**self._last_result, "build_daemon": True}
+
+                if not (
+                    self._builds_started > self._builds_finished
+                    and self._building_signature == signature
+                ):
+                    await asyncio.to_thread(self._touch_entry)
+                    started = self._builds_started
+                    try:
+                        await asyncio.wait_for(
+                            self._changed.wait_for(
+                                lambda: self._builds_started > started
+                                or not self.is_running
+                            ),
+                            BUILD_START_TIMEOUT_SECONDS,
+                        )
+                    except asyncio.TimeoutError:
+                        return None
+
+                building = self._builds_started
+                await self._changed.wait_for(
+                    lambda: self._builds_finished >= building
+                    or not self.is_running
+                )
+        return None
+
+
+class BuildDaemonPool:
+    """
+    Build daemons of the most recently validated sessions. The least
+    recently used daemon is stopped when the pool is full, and daemons idle
+    for longer than idle_seconds are stopped by the reaper.
+    """
+
+    def __init__(self, command: str, max_daemons: int, idle_seconds: int):
+        self.command = command
+        self.max_daemons = max_daemons
+        self.idle_seconds = idle_seconds
+        self._daemons: "OrderedDict[str, BuildDaemon]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def _get_daemon(
+        self, session_id: str, codebase_path: str
+    ) -> BuildDaemon:
+        evicted = []
+        async with self._lock:
+            daemon = self._daemons.get(session_id)
+            if daemon is not None and not daemon.is_running:
+                evicted.append(self._daemons.pop(session_id))
+                daemon = None
+
+            if daemon is None:
+                daemon = BuildDaemon(session_id, codebase_path, self.command)
+                await daemon.start()
+                self._daemons[session_id] = daemon
+                while len(self._daemons) > self.max_daemons:
+                    evicted.append(self._daemons.popitem(last=False)[1])
+            else:
+                self._daemons.move_to_end(session_id)
+
+        for old_daemon in evicted:
+            await old_daemon.stop()
+        return daemon
+
+    async def build(
+        self, session_id: str, codebase_path: str, timeout_seconds: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the session's codebase with its warm daemon, starting one if
+        needed.
+
+        Returns:
+            Dict with exit_code and the build output, or None if the daemon
+            could not build and the caller should run a cold build
+        """
+        try:
+            daemon = await self._get_daemon(session_id, codebase_path)
+        except Exception as e:
+            loggers["build_daemon"].error(
+                "Could not start build daemon for session %s: %s",
+                session_id,
+                e,
+            )
+            return None
+        return await daemon.build(timeout_seconds)
+
+    async def reap_idle(self) -> None:
+        now = time.monotonic()
+        async with self._lock:
+            idle = [
+                session_id
+                for session_id, daemon in self._daemons.items()
+                if now - daemon.last_used > self.idle_seconds
+            ]
+            daemons = [self._daemons.pop(session_id) for session_id in idle]
+        for daemon in daemons:
+            await daemon.stop()
+
+    async def run_reaper(self, interval_seconds: float = 60) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.reap_idle()
+
+    async def shutdown(self) -> None:
+        async with self._lock:
+            daemons = list(self._daemons.values())
+            self._daemons.clear()
+        for daemon in daemons:
+            await daemon.stop()
+
+
+build_daemon_pool = BuildDaemonPool(
+    command=settings.STAGE_V_BUILD_DAEMON_COMMAND,
+    max_daemons=settings.STAGE_V_BUILD_DAEMON_MAX,
+    idle_seconds=settings.STAGE_V_BUILD_DAEMON_IDLE_SECONDS,
+)
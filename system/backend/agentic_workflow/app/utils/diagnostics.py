@@ -0,0 +1,374 @@
+import bisect
+import re
+import time
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+# Errors that fail validation even when the command exits with status 0
+CRITICAL_PATTERNS = (
+    r"Build failed",
+    r"Compilation failed",
+    r"Fatal error",
+    r"Cannot resolve module",
+    r"Module not found",
+    r"Syntax error",
+    r"Type error",
+    r"ReferenceError",
+    r"TypeError",
+    r"ERR_MODULE_NOT_FOUND",
+    r"Cannot find package",
+    r"Oops! Something went wrong",
+    r"Missing script:",
+    r"npm ERR!",
+    # Flutter-specific patterns
+    r"Target dart2js failed",
+    r"Error: Compilation failed",
+    r"ProcessException",
+    r"Error when reading",
+    r"No such file or directory",
+    r"Expected .* after",
+    r"missing implementations",
+    r"Couldn't find constructor",
+    r"lib/.*\.dart:\d+:\d+:.*Error:",
+)
+
+# Source locations such as "src/pages/Home.jsx:12:5" or "lib/main.dart:3:1"
+LOCATION = re.compile(
+    r"(?P<file>(?:[A-Za-z]:)?[\w@~./\\-]*[\w-]\.(?:jsx?|tsx?|mjs|cjs|css|scss|json|html|dart|yaml))"
+    r"(?:[:(](?P<line>\d+)(?:[:,](?P<column>\d+))?\)?)?"
+)
+WARNING_LINE = re.compile(r"\bwarn(?:ing)?\b|^\(!\)", re.IGNORECASE)
+TOOL_MARKERS = (
+    (re.compile(r"\[vite[:\]]|\bvite\b", re.IGNORECASE), "vite"),
+    (re.compile(r"\brollup\b", re.IGNORECASE), "rollup"),
+    (re.compile(r"\besbuild\b", re.IGNORECASE), "esbuild"),
+    (re.compile(r"^npm (?:ERR!|error)"), "npm"),
+    (re.compile(r"dart2js", re.IGNORECASE), "dart2js"),
+    (re.compile(r"\.dart\b|\bflutter\b", re.IGNORECASE), "flutter"),
+)
+CONTEXT_LINES_BEFORE = 2
+CONTEXT_LINES_AFTER = 2
+MAX_DIAGNOSTICS = 500
+
+
+def _group_name(kind: str, index: int) -> str:
+    return f"{kind}{index}"
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest run of literal text every match of the pattern contains,
+    lowercased, or None if the pattern is too complex to tell.
+    """
+    if re.search(r"(?<!\\)[|()\[]", pattern):
+        return None
+
+    runs = [""]
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped.isalnum():
+                # Character class such as \d or an anchor such as \b
+                runs.append("")
+            else:
+                runs[-1] += escaped
+            i += 2
+            continue
+        if char in "?*{":
+            # The preceding character is optional
+            runs[-1] = runs[-1][:-1]
+            runs.append("")
+        elif char == "+":
+            runs.append("")
+        elif char in ".^$}":
+            runs.append("")
+        else:
+            runs[-1] += char
+        i += 1
+
+    literal = max(runs, key=len)
+    return literal.lower() if literal else None
+
+
+class DiagnosticExtractor:
+    """
+    Extracts structured diagnostics from build output in a single pass.
+
+    The error and critical patterns are compiled into one alternation with a
+    named group per pattern. Candidate lines are located through an index
+    of line offsets with one substring search per required literal, and
+    the alternation only runs on those lines. Every output line yields at
+    most one diagnostic, and diagnostics repeated at the same location are
+    dropped.
+    """
+
+    def __init__(
+        self,
+        error_patterns: Tuple[str, ...],
+        critical_patterns: Tuple[str, ...] = CRITICAL_PATTERNS,
+    ):
+        self.error_patterns = error_patterns
+        self.critical_patterns = critical_patterns
+        alternatives = [
+            f"(?P<{_group_name('e', i)}>{pattern})"
+            for i, pattern in enumerate(error_patterns)
+        ] + [
+            f"(?P<{_group_name('c', i)}>{pattern})"
+            for i, pattern in enumerate(critical_patterns)
+        ]
+        flags = re.MULTILINE | re.IGNORECASE
+        self._combined = re.compile("|".join(alternatives) or r"(?!)", flags)
+        # Only used on the lines the combined pattern already matched
+        self._errors = re.compile(
+            "|".join(alternatives[: len(error_patterns)]) or r"(?!)", flags
+        )
+        self._critical = re.compile(
+            "|".join(alternatives[len(error_patterns) :]) or r"(?!)", flags
+        )
+
+        # Python's re does not optimize alternations, so candidate lines
+        # are found with a plain substring search for a literal each
+        # pattern requires, and patterns without one are searched alone
+        self._literals = set()
+        self._unprefixed = []
+        for pattern in error_patterns + critical_patterns:
+            literal = _required_literal(pattern)
+            if literal:
+                self._literals.add(literal)
+            else:
+                self._unprefixed.append(re.compile(pattern, flags))
+        # Lines containing "syntax error" are already found through "error"
+        self._literals = {
+            literal
+            for literal in self._literals
+            if not any(
+                other != literal and other in literal
+                for other in self._literals
+            )
+        }
+
+    def extract(self, output: str, command: str = "") -> Dict[str, Any]:
+        """
+        Find the diagnostics in a command's output.
+
+        Args:
+            output: Combined stdout and stderr of the command
+            command: The command, used as the tool of diagnostics that do
+                not name one
+
+        Returns:
+            Dict with the diagnostics and whether a critical error was found
+        """
+        lines = output.split("\n")
+        # line_starts[i] is the offset of lines[i] in the output
+        line_starts = list(
+            accumulate(map((1).__add__, map(len, lines)), initial=0)
+        )
+        line_starts.pop()
+
+        default_tool = command.split()[0] if command.split() else ""
+        diagnostics: List[Dict[str, Any]] = []
+        seen = set()
+        has_critical = False
+
+        for index in self._candidate_lines(output, line_starts):
+            line = lines[index]
+            match = self._combined.search(line)
+            if match is None:
+                continue
+
+            error_match = match
+            if match.lastgroup.startswith("c"):
+                has_critical = True
+                error_match = self._errors.search(line)
+            elif not has_critical and self._critical.search(line):
+                has_critical = True
+            if error_match is None or len(diagnostics) >= MAX_DIAGNOSTICS:
+                continue
+
+            diagnostic = self._diagnostic(
+                lines, index, error_match, default_tool
+            )
+            key = (
+                diagnostic["file_path"],
+                diagnostic["file_line"],
+                diagnostic["column"],
+                diagnostic["error_line"],
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            diagnostics.append(diagnostic)
+
+        return {"diagnostics": diagnostics, "has_critical_errors": has_critical}
+
+    def _candidate_lines(
+        self, output: str, line_starts: List[int]
+    ) -> List[int]:
+        """Indexes of the lines that may match one of the patterns."""
+        lowered = output.lower()
+        if len(lowered) != len(output):
+            # Lowercasing changed the offsets; every line is a candidate
+            return list(range(len(line_starts)))
+
+        candidates = set()
+
+        def add_line(position: int) -> int:
+            index = bisect.bisect_right(line_starts, position) - 1
+            candidates.add(index)
+            # Continue after this line
+            return (
+                line_starts[index + 1]
+                if index + 1 < len(line_starts)
+                else len(output)
+            )
+
+        for literal in self._literals:
+            position = lowered.find(literal)
+            while position >= 0:
+                position = lowered.find(literal, add_line(position))
+        for pattern in self._unprefixed:
+            position = 0
+            while match := pattern.search(output, position):
+                position = add_line(match.start())
+        return sorted(candidates)
+
+    def _diagnostic(
+        self,
+        lines: List[str],
+        index: int,
+        match: re.Match,
+        default_tool: str,
+    ) -> Dict[str, Any]:
+        line = lines[index]
+        error_line = line.strip()
+        location = LOCATION.search(line)
+        pattern_index = int(match.lastgroup[1:])
+        patterns = (
+            self.error_patterns
+            if match.lastgroup.startswith("e")
+            else self.critical_patterns
+        )
+
+        tool = default_tool
+        for marker, name in TOOL_MARKERS:
+            if marker.search(line):
+                tool = name
+                break
+
+        return {
+            "pattern": patterns[pattern_index],
+            "matched_text": match.group(0),
+            # Line of the command output
+            "line_number": index + 1,
+            "error_line": error_line,
+            "file_path": location.group("file") if location else None,
+            # Line and column in the source file
+            "file_line": (
+                int(location.group("line"))
+                if location and location.group("line")
+                else None
+            ),
+            "column": (
+                int(location.group("column"))
+                if location and location.group("column")
+                else None
+            ),
+            "severity": (
+                "warning" if WARNING_LINE.search(error_line) else "error"
+            ),
+            "tool": tool,
+            "context": {
+                "before": lines[max(0, index - CONTEXT_LINES_BEFORE) : index],
+                "error_line": line,
+                "after": lines[index + 1 : index + 1 + CONTEXT_LINES_AFTER],
+            },
+        }
+
+
+@lru_cache(maxsize=32)
+def get_diagnostic_extractor(
+    error_patterns: Tuple[str, ...],
+    critical_patterns: Tuple[str, ...] = CRITICAL_PATTERNS,
+) -> DiagnosticExtractor:
+    """Return the compiled extractor for a set of patterns."""
+    return DiagnosticExtractor(error_patterns, critical_patterns)
+
+
+def extract_diagnostics(
+    output: str, error_patterns: List[str], command: str = ""
+) -> Dict[str, Any]:
+    """
+    Extract structured diagnostics from a command's output.
+
+    Args:
+        output: Combined stdout and stderr of the command
+        error_patterns: Regex patterns of the lines that report errors
+        command: The command that produced the output
+
+    Returns:
+        Dict with the diagnostics and whether a critical error was found
+    """
+    return get_diagnostic_extractor(tuple(error_patterns)).extract(
+        output, command
+    )
+
+
+def _synthetic_log(lines: int) -> str:
+    """Build output shaped like a failing dart2js run with many errors."""
+    chunks = []
+    for i in range(lines):
+        if i % 50 == 0:
+            chunks.append(
+                f"lib/screens/screen_{i % 40}.dart:{i % 300 + 1}:{i % 80 + 1}: "
+                f"Error: The getter 'value{i}' isn't defined for the class 'State'."
+            )
+        elif i % 50 == 1:
+            chunks.append(f"  return widget.value{i};")
+        else:
+            chunks.append(
+                f"[   +{i % 1000} ms] Compiling lib/main.dart module {i}"
+            )
+    chunks.append("Target dart2js failed: Exception: Compilation failed")
+    return "\n".join(chunks)
+
+
+if __name__ == "__main__":
+    # Benchmark: python -m system.backend.agentic_workflow.app.utils.diagnostics
+    # [captured_log ...] extracts the diagnostics of each captured log, or of
+    # a synthetic multi-MB Flutter log when none is given
+    import asyncio
+    import sys
+
+    from system.backend.agentic_workflow.app.usecases.code_generation_usecases.stage_v_usecase.helper import (
+        StageVHelper,
+    )
+
+    helper = StageVHelper()
+    logs = {}
+    for log_path in sys.argv[1:]:
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            logs[log_path] = f.read()
+    if not logs:
+        logs["synthetic"] = _synthetic_log(200_000)
+
+    commands = {
+        platform: asyncio.run(helper.get_validation_commands(platform))[-1]
+        for platform in ("web", "mobile")
+    }
+    for name, log in logs.items():
+        for platform, command_info in commands.items():
+            start = time.perf_counter()
+            report = extract_diagnostics(
+                log, command_info["error_patterns"], command_info["command"]
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name} ({len(log) / 1_000_000:.1f} MB, "
+                f"{log.count(chr(10)) + 1} lines) with {platform} patterns: "
+                f"{len(report['diagnostics'])} diagnostics, critical="
+                f"{report['has_critical_errors']} in {elapsed * 1000:.1f} ms"
+            )
@@ -0,0 +1,29 @@
+from typing import Iterable
+
+from system.backend.agentic_workflow.app.config.settings import settings
+from system.backend.tools.app.utils.file_change_journal import (
+    write_file_changes,
+)
+
+# The journal is rotated once it grows past this size; the tools server
+# notices the new generation and rescans its indexed codebases
+JOURNAL_MAX_BYTES = 4 * 1024 * 1024
+
+
+def record_file_changes(paths: Iterable[str]) -> None:
+    """
+    Append changed paths to the shared file change journal.
+
+    The tools server runs in a separate process and reads this journal to keep
+    its codebase search index in sync with files written by code generation.
+    Failures are ignored since the journal is only a hint.
+
+    Args:
+        paths: Paths of the files that were written or removed
+    """
+    try:
+        write_file_changes(
+            settings.FILE_CHANGE_JOURNAL_PATH, paths, JOURNAL_MAX_BYTES
+        )
+    except OSError:
+        pass
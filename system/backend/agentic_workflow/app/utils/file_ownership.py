@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+OWNERS_FILE_NAME = "file_owners.json"
+# Generated screens live in their own folder, so files of sessions created
+# before owners were recorded can still be attributed to their screen
+SCREEN_DIRS = ("src/pages/", "lib/screens/", "lib/presentation/")
+
+_owners_lock = threading.Lock()
+
+
+def _owners_path(session_id: str) -> str:
+    return f"artifacts/{session_id}/project_context/{OWNERS_FILE_NAME}"
+
+
+def _codebase_path(session_id: str) -> str:
+    return os.path.abspath(f"artifacts/{session_id}/codebase")
+
+
+def codebase_relative_path(file_path: str, codebase_path: str) -> Optional[str]:
+    """
+    Path of a file relative to the codebase, or None if it is outside it.
+
+    Accepts absolute paths, paths relative to the project root and paths
+    already relative to the codebase, as found in build output.
+    """
+    file_path = file_path.strip().replace("\\", "/")
+    codebase_path = os.path.abspath(codebase_path)
+    if os.path.isabs(file_path) or file_path.startswith("artifacts/"):
+        rel_path = os.path.relpath(os.path.abspath(file_path), codebase_path)
+    else:
+        rel_path = os.path.normpath(file_path)
+    rel_path = rel_path.replace(os.sep, "/")
+    if rel_path == "." or rel_path.startswith("../"):
+        return None
+    return rel_path
+
+
+def load_file_owners(session_id: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load the owner of each generated file of a session.
+
+    Returns:
+        Dict of codebase-relative path to {"owner_type", "owner_name"}
+    """
+    try:
+        with open(_owners_path(session_id), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def record_file_owners(
+    session_id: str,
+    owner_type: str,
+    owner_name: str,
+    file_paths: Iterable[str],
+    base_dir: str = "",
+) -> None:
+    """
+    Record which generation unit produced a set of files.
+
+    Args:
+        session_id: Session identifier
+        owner_type: Kind of unit, "screen" or "cluster"
+        owner_name: Name of the screen or component cluster
+        file_paths: FILE_PATH values of the generated files
+        base_dir: Directory the file paths are relative to
+    """
+    codebase_path = _codebase_path(session_id)
+    rel_paths = []
+    for file_path in file_paths:
+        rel_path = codebase_relative_path(
+            os.path.join(base_dir, file_path), codebase_path
+        )
+        if rel_path is not None:
+            rel_paths.append(rel_path)
+    if not rel_paths:
+        return
+
+    owners_path = _owners_path(session_id)
+    with _owners_lock:
+        owners = load_file_owners(session_id)
+        for rel_path in rel_paths:
+            owners[rel_path] = {
+                "owner_type": owner_type,
+                "owner_name": owner_name,
+            }
+        os.makedirs(os.path.dirname(owners_path), exist_ok=True)
+        temp_path = f"{owners_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(owners, f, indent=2)
+        os.replace(temp_path, owners_path)
+
+
+def find_owner(
+    rel_path: str, owners: Dict[str, Dict[str, str]]
+) -> Optional[Dict[str, str]]:
+    """Owner of a codebase-relative path, falling back to its screen folder."""
+    owner = owners.get(rel_path)
+    if owner is not None:
+        return owner
+    for screen_dir in SCREEN_DIRS:
+        if rel_path.startswith(screen_dir):
+            parts = rel_path[len(screen_dir) :].split("/")
+            if len(parts) > 1:
+                return {"owner_type": "screen", "owner_name": parts[0]}
+    return None
+
+
+def group_diagnostics_by_owner(
+    validation_results: List[Dict[str, Any]],
+    session_id: str,
+    codebase_path: str,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Group the parsed errors of failed validation commands by the screen or
+    component cluster that generated the file they point to.
+
+    Returns:
+        Dict of "owner_type:owner_name" to the unit's owner_type,
+        owner_name, files (all its files, those with errors first) and
+        diagnostics. Errors without an owned file are left out.
+    """
+    owners = load_file_owners(session_id)
+    units: Dict[str, Dict[str, Any]] = {}
+
+    for result in validation_results:
+        if not result.get("has_errors"):
+            continue
+        for diagnostic in result["error_details"].get("parsed_errors", []):
+            if not diagnostic.get("file_path"):
+                continue
+            rel_path = codebase_relative_path(
+                diagnostic["file_path"], codebase_path
+            )
+            if rel_path is None:
+                continue
+            owner = find_owner(rel_path, owners)
+            if owner is None:
+                continue
+
+            key = f"{owner['owner_type']}:{owner['owner_name']}"
+            unit = units.setdefault(
+                key,
+                {
+                    "owner_type": owner["owner_type"],
+                    "owner_name": owner["owner_name"],
+                    "files": [],
+                    "diagnostics": [],
+                },
+            )
+            if rel_path not in unit["files"]:
+                unit["files"].append(rel_path)
+            unit["diagnostics"].append(
+                {
+                    "command": result["command"],
+                    "file_path": rel_path,
+                    # Import check errors carry the source line directly
+                    "line": (
+                        diagnostic["file_line"]
+                        if "file_line" in diagnostic
+                        else diagnostic.get("line_number")
+                    ),
+                    "message": diagnostic.get("error_line", ""),
+                }
+            )
+
+    # The rest of each unit's files give the context of the fix
+    for rel_path, owner in owners.items():
+        unit = units.get(f"{owner['owner_type']}:{owner['owner_name']}")
+        if unit is not None and rel_path not in unit["files"]:
+            unit["files"].append(rel_path)
+    return units
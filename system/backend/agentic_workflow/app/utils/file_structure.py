@@ -1,40 +1,255 @@
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
 
-# Common directories to ignore in directory structure generation
-IGNORED_DIRS = {
-    "node_modules",
-    "dist",
-    "build",
-    "__pycache__",
-    ".git",
-    ".next",
-    "out",
-    "coverage",
-    "tmp",
-    "temp",
-    ".venv",
-    "venv",
-    "env",
-    "ios",
-    "android",
-    "web",
-    ".dart_tool",
-    ".flutter-plugins-dependencies",
-    ".flutter-plugins",
-    ".idea",
-    "linux",
-    "macos",
-    "windows",
-    "test",
-}
+from system.backend.tools.app.utils.path_validator import DEFAULT_EXCLUSIONS
+
+# Build, dependency and platform directories are skipped with the same
+# matcher the IDE tools use, plus a few names only hidden from the structure
+IGNORED_PATHS = DEFAULT_EXCLUSIONS.extend(["out", "tmp", "temp", "test"])
+
+
+MAX_CACHED_TREES = 16
+
+
+def _is_ignored(name: str, is_dir: bool) -> bool:
+    return name.startswith(".") or IGNORED_PATHS.matches_name(name, is_dir)
+
+
+class _Node:
+    __slots__ = ("children", "mtime_ns")
+
+    def __init__(self, is_dir: bool):
+        # None for files, name -> node for directories
+        self.children: Optional[Dict[str, "_Node"]] = {} if is_dir else None
+        self.mtime_ns: Optional[int] = None
+
+
+class ProjectTree:
+    """
+    In-memory model of a codebase's directory tree.
+
+    The tree is scanned once and then updated incrementally by the code file
+    writers. Directory mtimes are remembered so changes made by other
+    processes (e.g. the IDE tools server) are picked up by re-listing only
+    the directories whose mtime changed. Rendered output is cached until the
+    tree changes.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._tree: Optional[_Node] = None
+        self._version = 0
+        self._render_cache: Dict[int, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+
+    def render(self, display_root: str, max_depth: int = 5) -> str:
+        """
+        Render the tree in the file_structure.txt format.
+
+        Args:
+            display_root: Root path to show on the first line
+            max_depth: Number of directory levels to show
+
+        Returns:
+            String representation of the directory structure
+        """
+        with self._lock:
+            self._refresh()
+
+            cached = self._render_cache.get(max_depth)
+            if cached is None or cached[0] != self._version:
+                cached = (self._version, self._render_body(max_depth))
+                self._render_cache[max_depth] = cached
+
+        return f"{display_root}/\n{cached[1]}"
+
+    def record_change(self, abs_path: str) -> None:
+        """
+        Apply a file written, deleted or moved (call once for the source and
+        once for the destination) below the root.
+        """
+        rel_path = os.path.relpath(abs_path, self.root)
+        if rel_path == "." or rel_path.startswith(".."):
+            return
+
+        parts = rel_path.split(os.sep)
+        with self._lock:
+            if self._tree is None:
+                return
+
+            is_dir = os.path.isdir(abs_path)
+            exists = is_dir or os.path.exists(abs_path)
+            if any(_is_ignored(part, True) for part in parts[:-1]) or (
+                _is_ignored(parts[-1], is_dir)
+            ):
+                return
+
+            node = self._tree
+            node_path = self.root
+            for part in parts[:-1]:
+                child = node.children.get(part)
+                if child is None or child.children is None:
+                    if not exists:
+                        return
+                    child = _Node(is_dir=True)
+                    node.children[part] = child
+                    node.mtime_ns = self._mtime(node_path)
+                    self._version += 1
+                node = child
+                node_path = os.path.join(node_path, part)
+
+            if exists:
+                current = node.children.get(parts[-1])
+                if current is None or (current.children is not None) != is_dir:
+                    child = _Node(is_dir)
+                    if is_dir:
+                        self._scan(abs_path, child)
+                    node.children[parts[-1]] = child
+                    self._version += 1
+            elif node.children.pop(parts[-1], None) is not None:
+                self._version += 1
+            # Writes may go through a temporary file and rename, which also
+            # touches the directory, so its mtime is always re-read
+            node.mtime_ns = self._mtime(node_path)
+
+    def _mtime(self, path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan(self, path: str, node: _Node) -> None:
+        node.mtime_ns = self._mtime(path)
+        node.children = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if _is_ignored(entry.name, is_dir):
+                        continue
+                    child = _Node(is_dir)
+                    if is_dir:
+                        self._scan(entry.path, child)
+                    node.children[entry.name] = child
+        except OSError:
+            pass
+
+    def _refresh(self) -> None:
+        """Build the tree, or re-list the directories changed externally."""
+        if self._tree is None:
+            self._tree = _Node(is_dir=True)
+            self._scan(self.root, self._tree)
+            self._version += 1
+            return
+
+        stack = [(self.root, self._tree)]
+        while stack:
+            path, node = stack.pop()
+            if self._mtime(path) != node.mtime_ns:
+                previous = node.children
+                self._scan_shallow(path, node, previous)
+                self._version += 1
+            for name, child in node.children.items():
+                if child.children is not None:
+                    stack.append((os.path.join(path, name), child))
+
+    def _scan_shallow(
+        self, path: str, node: _Node, previous: Dict[str, _Node]
+    ) -> None:
+        """Re-list one directory, keeping the known subtrees that still exist."""
+        node.mtime_ns = self._mtime(path)
+        node.children = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if _is_ignored(entry.name, is_dir):
+                        continue
+                    known = previous.get(entry.name)
+                    if known is not None and (known.children is not None) == (
+                        is_dir
+                    ):
+                        node.children[entry.name] = known
+                        continue
+                    child = _Node(is_dir)
+                    if is_dir:
+                        self._scan(entry.path, child)
+                    node.children[entry.name] = child
+        except OSError:
+            pass
+
+    def _render_body(self, max_depth: int) -> str:
+        lines = []
+        # Frames of (sorted child names, index, node, prefix, depth)
+        stack = [(sorted(self._tree.children), 0, self._tree, "", 0)]
+        while stack:
+            names, index, node, prefix, depth = stack.pop()
+            if index >= len(names):
+                continue
+            stack.append((names, index + 1, node, prefix, depth))
+
+            name = names[index]
+            is_last = index == len(names) - 1
+            lines.append(f"{prefix}{'└── ' if is_last else '├── '}{name}\n")
+
+            child = node.children[name]
+            if child.children is not None and depth + 1 < max_depth:
+                stack.append(
+                    (
+                        sorted(child.children),
+                        0,
+                        child,
+                        prefix + ("    " if is_last else "│   "),
+                        depth + 1,
+                    )
+                )
+        return "".join(lines)
+
+
+_project_trees: "OrderedDict[str, ProjectTree]" = OrderedDict()
+_project_trees_lock = threading.Lock()
+
+
+def get_project_tree(directory_path: str) -> ProjectTree:
+    """Return the cached tree for a codebase, creating it on first use."""
+    root = os.path.abspath(directory_path)
+    with _project_trees_lock:
+        tree = _project_trees.get(root)
+        if tree is None:
+            tree = ProjectTree(root)
+            _project_trees[root] = tree
+            while len(_project_trees) > MAX_CACHED_TREES:
+                _project_trees.popitem(last=False)
+        _project_trees.move_to_end(root)
+        return tree
+
+
+def record_project_changes(paths: Iterable[str]) -> None:
+    """
+    Update the cached trees containing the given written, deleted or moved
+    paths. Trees that were never rendered are left alone.
+    """
+    with _project_trees_lock:
+        trees = list(_project_trees.values())
+
+    for path in paths:
+        abs_path = os.path.abspath(path)
+        for tree in trees:
+            if abs_path.startswith(tree.root + os.sep):
+                tree.record_change(abs_path)
 
 
 def generate_directory_structure(
-    directory_path: str,
-    prefix: str = "",
-    max_depth: int = 5,
-    current_depth: int = 0,
+    directory_path: str, max_depth: int = 5
 ) -> str:
     """
     Generate directory structure as a string with absolute path at root,
@@ -42,54 +257,15 @@ def generate_directory_structure(
 
     Args:
         directory_path: Path to the directory to analyze
-        prefix: Prefix for tree structure display
         max_depth: Maximum depth to traverse
-        current_depth: Current depth level
 
     Returns:
         String representation of directory structure with absolute root path
     """
-    if current_depth >= max_depth or not os.path.exists(directory_path):
+    if max_depth <= 0 or not os.path.isdir(directory_path):
         return ""
 
-    # For the root level, show the absolute path
-    if current_depth == 0:
-        structure = f"{directory_path}/\n"
-    else:
-        structure = ""
-
-    try:
-        items = sorted(os.listdir(directory_path))
-        for i, item in enumerate(items):
-            # Skip hidden files/directories and ignored directories
-            if item.startswith(".") or item in IGNORED_DIRS:
-                continue
-
-            item_path = os.path.join(directory_path, item)
-            is_last = (
-                i
-                == len(
-                    [
-                        x
-                        for x in items
-                        if not x.startswith(".") and x not in IGNORED_DIRS
-                    ]
-                )
-                - 1
-            )
-
-            current_prefix = "└── " if is_last else "├── "
-            structure += f"{prefix}{current_prefix}{item}\n"
-
-            if os.path.isdir(item_path):
-                next_prefix = prefix + ("    " if is_last else "│   ")
-                structure += generate_directory_structure(
-                    item_path, next_prefix, max_depth, current_depth + 1
-                )
-    except PermissionError:
-        pass
-
-    return structure
+    return get_project_tree(directory_path).render(directory_path, max_depth)
 
 
 def get_project_root():
@@ -1,19 +1,256 @@
+import asyncio
+import hashlib
 import os
-from typing import Any, Dict, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from system.backend.agentic_workflow.app.config.settings import settings
+from system.backend.agentic_workflow.app.utils.file_change_journal import (
+    record_file_changes,
+)
+from system.backend.agentic_workflow.app.utils.file_structure import (
+    record_project_changes,
+)
+from system.backend.agentic_workflow.app.utils.logger import loggers
+from system.backend.agentic_workflow.app.utils.source_hash import (
+    record_source_changes,
+)
 
-def write_code_files(file_data_list: List[Dict[str, Any]], base_dir: str = "."):
+MAX_CACHED_DIGESTS = 20_000
+
+# Called with the paths of every batch of written files, to keep the search
+# index of the tools server, the file tree and the source hashes in sync
+_change_listeners: List[Callable[[List[str]], None]] = [
+    record_file_changes,
+    record_project_changes,
+    record_source_changes,
+]
+
+# Directories known to exist, so makedirs runs once per directory
+_created_dirs: Set[str] = set()
+# Path -> ((mtime_ns, size), sha1) of the files written by this process, so
+# an unchanged file is recognised without reading it back
+_written_digests: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = (
+    OrderedDict()
+)
+_cache_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.FILE_WRITER_WORKERS,
+            thread_name_prefix="file_writer",
+        )
+    return _executor
+
+
+def shutdown_file_writer() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def add_change_listener(listener: Callable[[List[str]], None]) -> None:
     """
-    Writes each code snippet to its respective file path under the given base directory.
+    Subscribe to file changes.
+
+    Args:
+        listener: Called with the absolute paths of each batch of files that
+            were actually written
+    """
+    _change_listeners.append(listener)
+
+
+def _notify_changes(paths: List[str]) -> None:
+    if not paths:
+        return
+    for listener in list(_change_listeners):
+        try:
+            listener(paths)
+        except Exception as e:
+            name = getattr(listener, "__name__", repr(listener))
+            loggers["file_writer"].error(f"File listener {name} failed: {e}")
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _remember_digest(path: str, digest: str) -> None:
+    stat_key = _stat_key(path)
+    if stat_key is None:
+        return
+    with _cache_lock:
+        _written_digests[path] = (stat_key, digest)
+        _written_digests.move_to_end(path)
+        while len(_written_digests) > MAX_CACHED_DIGESTS:
+            _written_digests.popitem(last=False)
+
+
+def _has_content(path: str, data: bytes, digest: str) -> bool:
+    """Whether the file at path already holds exactly the given bytes."""
+    stat_key = _stat_key(path)
+    if stat_key is None or stat_key[1] != len(data):
+        return False
+
+    with _cache_lock:
+        cached = _written_digests.get(path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1] == digest
+
+    # Written by someone else since, or before this process started
+    try:
+        with open(path, "rb") as f:
+            existing = f.read()
+    except OSError:
+        return False
+    if existing != data:
+        return False
+    _remember_digest(path, digest)
+    return True
+
+
+def _ensure_directory(directory: str) -> None:
+    if not directory:
+        return
+    with _cache_lock:
+        if directory in _created_dirs:
+            return
+    os.makedirs(directory, exist_ok=True)
+    with _cache_lock:
+        _created_dirs.add(directory)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write through a temporary file so readers never see a partial file."""
+    directory, name = os.path.split(path)
+    temp_path = os.path.join(
+        directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_file(path: str, content: str) -> bool:
+    """
+    Write one file unless it already holds the same content.
+
+    Returns:
+        Whether the file was written
+    """
+    path = os.path.abspath(path)
+    data = content.encode("utf-8")
+    digest = hashlib.sha1(data).hexdigest()
+    if _has_content(path, data, digest):
+        return False
+
+    directory = os.path.dirname(path)
+    _ensure_directory(directory)
+    try:
+        _write_atomic(path, data)
+    except FileNotFoundError:
+        # The directory was removed since it was cached
+        with _cache_lock:
+            _created_dirs.discard(directory)
+        _ensure_directory(directory)
+        _write_atomic(path, data)
+    _remember_digest(path, digest)
+    return True
+
+
+def write_file_if_changed(path: str, content: str) -> bool:
+    """
+    Write a file and notify the change listeners, unless the file already
+    holds the same content, so an unchanged file does not trigger rebuilds,
+    watchers or cache invalidation.
+
+    Args:
+        path: Path of the file
+        content: Text content of the file
+
+    Returns:
+        Whether the file was written
+    """
+    written = _write_file(path, content)
+    if written:
+        _notify_changes([os.path.abspath(path)])
+    return written
+
+
+async def write_code_files(
+    file_data_list: List[Dict[str, Any]], base_dir: str = "."
+) -> List[str]:
+    """
+    Writes each code snippet to its respective file path under the given
+    base directory, in a thread pool so the event loop is not blocked.
+
+    Files whose content is unchanged are skipped; the others are written
+    atomically and reported to the change listeners in one batch.
 
     Args:
         file_data_list (list): List of dicts with 'file_path' and 'code_snippet'.
         base_dir (str): Base directory to write files into.
+
+    Returns:
+        Absolute paths of the files that were written
     """
+    if not file_data_list:
+        return []
 
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    # A file listed twice gets its last content, as when written in order
+    contents: Dict[str, str] = {}
     for item in file_data_list:
-        file_path = os.path.join(base_dir, item["file_path"])
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        path = os.path.abspath(os.path.join(base_dir, item["file_path"]))
+        contents.pop(path, None)
+        contents[path] = item["code_snippet"]
+    paths = list(contents)
+
+    results = await asyncio.gather(
+        *[
+            loop.run_in_executor(executor, _write_file, path, content)
+            for path, content in contents.items()
+        ],
+        return_exceptions=True,
+    )
+
+    written_paths = []
+    failure = None
+    for path, result in zip(paths, results):
+        if isinstance(result, BaseException):
+            loggers["file_writer"].error(f"Failed to write {path}: {result}")
+            failure = failure or result
+        elif result:
+            written_paths.append(path)
+
+    if written_paths:
+        await loop.run_in_executor(executor, _notify_changes, written_paths)
+    loggers["file_writer"].info(
+        f"Wrote {len(written_paths)} of {len(paths)} files, "
+        f"{len(paths) - len(written_paths)} unchanged or failed"
+    )
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(item["code_snippet"])
+    # The files written before the failure are kept and reported
+    if failure is not None:
+        raise failure
+    return written_paths
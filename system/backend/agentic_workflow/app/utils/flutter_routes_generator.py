@@ -7,19 +7,29 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from system.backend.agentic_workflow.app.utils.file_writer import (
+    write_file_if_changed,
+)
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    RouteManifest,
+)
+
 
 class FlutterRoutesGenerator:
     """Generates app_routes.dart files based on Flutter project structure analysis."""
 
-    def __init__(self, lib_path: str):
+    def __init__(self, lib_path: str, manifest: Optional[RouteManifest] = None):
         """
         Initialize the Flutter routes generator.
 
         Args:
             lib_path: Path to the lib directory of the Flutter project
+            manifest: Optional route manifest of the session, read instead of
+                scanning the presentation directory
         """
         self.lib_path = Path(lib_path)
         self.presentation_path = self.lib_path / "presentation"
+        self.manifest = manifest
 
     def analyze_presentation_structure(self) -> List[Dict]:
         """
@@ -28,7 +38,30 @@ class FlutterRoutesGenerator:
         Returns:
             List of screen dictionaries with name, path, and class info
         """
+        if self.manifest is not None:
+            entries = self.manifest.get_entries("screens", self._scan_screens)
+        else:
+            entries = self._scan_screens()
+
         screens = []
+        for screen_name, entry in entries.items():
+            screen_info = self._analyze_screen_directory(
+                self.presentation_path / screen_name, entry.get("class_name")
+            )
+            if screen_info:
+                screens.append(screen_info)
+
+        return screens
+
+    def _scan_screens(self) -> Dict[str, Dict]:
+        """
+        Scan the presentation directory for screen folders with a main dart
+        file.
+
+        Returns:
+            Dictionary of screen directory names to manifest entries
+        """
+        screens = {}
 
         if not self.presentation_path.exists():
             return screens
@@ -38,18 +71,23 @@ class FlutterRoutesGenerator:
                 # Check if main dart file exists (e.g., splash_screen.dart)
                 main_file = screen_dir / f"{screen_dir.name}.dart"
                 if main_file.exists():
-                    screen_info = self._analyze_screen_directory(screen_dir)
-                    if screen_info:
-                        screens.append(screen_info)
+                    screens[screen_dir.name] = {
+                        "class_name": self._extract_class_name_from_file(
+                            main_file
+                        )
+                    }
 
         return screens
 
-    def _analyze_screen_directory(self, screen_dir: Path) -> Optional[Dict]:
+    def _analyze_screen_directory(
+        self, screen_dir: Path, class_name: Optional[str] = None
+    ) -> Optional[Dict]:
         """
         Analyze a single screen directory.
 
         Args:
             screen_dir: Path to the screen directory
+            class_name: Class name of the screen, if already known
 
         Returns:
             Dictionary with screen information or None if invalid
@@ -58,7 +96,9 @@ class FlutterRoutesGenerator:
 
         # Read the actual class name from the file
         main_file = screen_dir / f"{screen_name}.dart"
-        actual_class_name = self._extract_class_name_from_file(main_file)
+        actual_class_name = class_name or self._extract_class_name_from_file(
+            main_file
+        )
 
         # Fallback to generated class name if extraction fails
         if not actual_class_name:
@@ -256,14 +296,24 @@ class FlutterRoutesGenerator:
 
         return fallback_screen
 
-    def generate_app_routes_dart(self) -> str:
+    def generate_app_routes_dart(
+        self, screens: Optional[List[Dict]] = None
+    ) -> str:
         """
         Generate the complete app_routes.dart file content.
 
+        Args:
+            screens: Screens found by analyze_presentation_structure,
+                analyzed again if not given
+
         Returns:
             Generated app_routes.dart file content as string
         """
-        screens = self.analyze_presentation_structure()
+        if screens is None:
+            screens = self.analyze_presentation_structure()
+        else:
+            # Initial screen selection marks the screens it picks
+            screens = [dict(screen) for screen in screens]
 
         # Robust initial screen selection with splash priority
         initial_screen = self._select_initial_screen_robust(screens)
@@ -347,26 +397,32 @@ class FlutterRoutesGenerator:
 
         return "\n".join(file_lines)
 
-    def save_routes_file(self, output_path: str) -> None:
+    def save_routes_file(self, output_path: str) -> bool:
         """
-        Generate and save the app_routes.dart file.
+        Generate and save the app_routes.dart file, unless it is unchanged.
 
         Args:
             output_path: Path where to save the app_routes.dart file
+
+        Returns:
+            Whether the file was written
         """
         content = self.generate_app_routes_dart()
+        return write_file_if_changed(output_path, content)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def get_routes_analysis(self) -> Dict:
+    def get_routes_analysis(self, screens: Optional[List[Dict]] = None) -> Dict:
         """
         Get detailed analysis of the project structure.
 
+        Args:
+            screens: Screens found by analyze_presentation_structure,
+                analyzed again if not given
+
         Returns:
             Dictionary with analysis results
         """
-        screens = self.analyze_presentation_structure()
+        if screens is None:
+            screens = self.analyze_presentation_structure()
 
         return {
             "screens_found": len(screens),
@@ -379,7 +435,9 @@ class FlutterRoutesGenerator:
 
 
 def generate_flutter_routes_for_project(
-    lib_path: str, output_path: str = None
+    lib_path: str,
+    output_path: str = None,
+    manifest: Optional[RouteManifest] = None,
 ) -> Tuple[str, Dict]:
     """
     Generate app_routes.dart file for a Flutter project.
@@ -387,21 +445,28 @@ def generate_flutter_routes_for_project(
     Args:
         lib_path: Path to the lib directory
         output_path: Optional path to save the file (if None, returns content only)
+        manifest: Optional route manifest of the session, read instead of
+            scanning the presentation directory
 
     Returns:
         Tuple of (generated_content, analysis_info)
     """
-    generator = FlutterRoutesGenerator(lib_path)
+    generator = FlutterRoutesGenerator(lib_path, manifest)
+
+    # Analyze the screens once for both the content and the analysis
+    screens = generator.analyze_presentation_structure()
 
     # Generate the content
-    content = generator.generate_app_routes_dart()
+    content = generator.generate_app_routes_dart(screens)
 
     # Get analysis info
-    analysis = generator.get_routes_analysis()
+    analysis = generator.get_routes_analysis(screens)
 
-    # Save if output path provided
+    # Save if output path provided and the content changed
     if output_path:
-        generator.save_routes_file(output_path)
+        analysis["routes_file_changed"] = write_file_if_changed(
+            output_path, content
+        )
 
     return content, analysis
 
@@ -1,14 +1,72 @@
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from system.backend.agentic_workflow.app.config.settings import settings
 from system.backend.agentic_workflow.app.utils.logger import loggers
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    invalidate_route_manifest,
+)
+from system.backend.agentic_workflow.app.utils.scratchpad_store import (
+    record_agent_summary,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
 
+TOOL_ENDPOINTS = {
+    "read_file": "/read-file",
+    "edit_file": "/edit-file",
+    "edit_files": "/edit-files",
+    "search_replace": "/search-replace",
+    "run_terminal_cmd": "/run-terminal-cmd",
+    "list_processes": "/list-processes",
+    "process_status": "/process-status",
+    "read_process_logs": "/process-logs",
+    "kill_process": "/kill-process",
+    "list_directory": "/list-directory",
+    "search_files": "/search-files",
+    "delete_file": "/delete-file",
+    "grep_search": "/grep-search",
+    "exit_tool": "/exit-tool",
+}
+
+
+# Endpoints that never modify files or processes, so calling them twice is
+# harmless
+READ_ONLY_ENDPOINTS = frozenset(
+    [
+        "/read-file",
+        "/list-directory",
+        "/search-files",
+        "/grep-search",
+        "/list-processes",
+        "/process-status",
+        "/process-logs",
+    ]
+)
+
+# Tools that may create or delete pages and screens, after which the
+# session's route manifest is scanned again
+FILE_WRITING_TOOLS = frozenset(
+    [
+        "edit_file",
+        "edit_files",
+        "search_replace",
+        "delete_file",
+        "run_terminal_cmd",
+    ]
+)
+
+# Tells the tools server which session a call belongs to, so any tool use
+# keeps the session's background processes alive
+SESSION_HEADER = "X-Session-Id"
+
+# Failures that happen before a request reaches the tools server, so none of
+# its calls ran
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
 
 class IDEAgentTools:
     def __init__(self):
@@ -78,6 +136,37 @@ class IDEAgentTools:
                     ],
                 },
             },
+            {
+                "name": "edit_files",
+                "description": "Apply edits to several different files in one call. Each entry follows exactly the same snippet formatting rules as edit_file (one entry per file, all changes to a file combined in its single snippet). The edits are applied concurrently and committed atomically: if any edit fails, no file is written and the per-file results explain which edit failed.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "edits": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "target_file_path": {
+                                        "type": "string",
+                                        "description": "The absolute path to the file to edit",
+                                    },
+                                    "code_snippet": {
+                                        "type": "string",
+                                        "description": "The new code content to write to the file",
+                                    },
+                                },
+                                "required": [
+                                    "target_file_path",
+                                    "code_snippet",
+                                ],
+                            },
+                            "description": "The file edits to apply, at most one per file",
+                        },
+                    },
+                    "required": ["edits"],
+                },
+            },
             {
                 "name": "search_replace",
                 "description": "A tool for searching pattern in files and replace it with new text. this tool allows you to perform search and replace operation across files in codebase.",
@@ -112,6 +201,10 @@ class IDEAgentTools:
                                     "items": {"type": "string"},
                                     "description": "Paths to search in",
                                 },
+                                "dry_run": {
+                                    "type": "boolean",
+                                    "description": "Preview the matches and replacements without modifying any file, default is false",
+                                },
                             },
                         },
                     },
@@ -130,12 +223,71 @@ class IDEAgentTools:
                         },
                         "is_background": {
                             "type": "boolean",
-                            "description": "Whether to run the command in the background",
+                            "description": "Whether to run the command in the background, e.g. for dev servers. The result contains the PID of the background process.",
+                        },
+                        "timeout_seconds": {
+                            "type": "integer",
+                            "description": "Time after which a foreground command is killed (default 110). Only the beginning and end of long output is returned.",
                         },
                     },
                     "required": ["cmd", "is_background"],
                 },
             },
+            {
+                "name": "list_processes",
+                "description": "List the background processes started with run_terminal_cmd in this session, with their PID, command, status and exit code.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {},
+                    "required": [],
+                },
+            },
+            {
+                "name": "process_status",
+                "description": "Check whether a background process started with run_terminal_cmd is still running, and its exit code if it exited.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "pid": {
+                            "type": "integer",
+                            "description": "The PID of the background process",
+                        },
+                    },
+                    "required": ["pid"],
+                },
+            },
+            {
+                "name": "read_process_logs",
+                "description": "Read the most recent output (stdout and stderr) of a background process started with run_terminal_cmd, along with its status. Use it to check whether a dev server started or failed.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "pid": {
+                            "type": "integer",
+                            "description": "The PID of the background process",
+                        },
+                        "lines": {
+                            "type": "integer",
+                            "description": "Number of lines to return from the end of the output (default 100)",
+                        },
+                    },
+                    "required": ["pid"],
+                },
+            },
+            {
+                "name": "kill_process",
+                "description": "Stop a background process started with run_terminal_cmd, together with the processes it started.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "pid": {
+                            "type": "integer",
+                            "description": "The PID of the background process",
+                        },
+                    },
+                    "required": ["pid"],
+                },
+            },
             {
                 "name": "list_directory",
                 "description": "List the contents of a directory. The quick tool to use for discovery, before using more targeted tools like semantic search or file reading. Useful to try to understand the file structure before diving deeper into specific files.",
@@ -150,6 +302,18 @@ class IDEAgentTools:
                             "type": "boolean",
                             "description": "Whether to list subdirectories recursively",
                         },
+                        "max_depth": {
+                            "type": "integer",
+                            "description": "Maximum depth to descend to when listing recursively",
+                        },
+                        "page_size": {
+                            "type": "integer",
+                            "description": "Maximum number of entries to return (default 200)",
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "The next_cursor value from a previous list_directory result, to get the next page",
+                        },
                     },
                     "required": [],
                 },
@@ -163,7 +327,11 @@ class IDEAgentTools:
                         "pattern": {
                             "type": "string",
                             "description": "The fuzzy filename pattern to search for in the current directory.",
-                        }
+                        },
+                        "max_results": {
+                            "type": "integer",
+                            "description": "Maximum number of matching files to return, best match first (default 20).",
+                        },
                     },
                     "required": ["pattern"],
                 },
@@ -204,6 +372,14 @@ class IDEAgentTools:
                             "type": "string",
                             "description": "The pattern to exclude in the search",
                         },
+                        "context_lines": {
+                            "type": "integer",
+                            "description": "Number of lines of context to show around each match (0-10, default 0)",
+                        },
+                        "max_matches_per_file": {
+                            "type": "integer",
+                            "description": "Maximum number of matches to report per file",
+                        },
                     },
                     "required": ["query", "case_sensitive"],
                 },
@@ -224,11 +400,21 @@ class IDEAgentTools:
             },
         ]
 
-    async def call_tool(
+    def _session_headers(self) -> Dict[str, str]:
+        session_id = session_state.get()
+        return {SESSION_HEADER: session_id} if session_id else {}
+
+    def _files_may_have_changed(self, tool_name: str) -> None:
+        """Rescan the session's routes if the tool may have written files."""
+        session_id = session_state.get()
+        if tool_name in FILE_WRITING_TOOLS and session_id:
+            invalidate_route_manifest(session_id)
+
+    def _prepare_tool_call(
         self, tool_name: str, tool_input: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Call a specific tool with the given input parameters
+        Resolve the endpoint of a tool and build its request payload
         """
         # Get the current session's codebase path from session context
         session_id = session_state.get()
@@ -246,102 +432,271 @@ class IDEAgentTools:
         }
 
         # For file-specific tools, IDE agent sends absolute paths directly
-        file_specific_tools = {"read_file", "edit_file", "delete_file"}
+        file_specific_tools = {
+            "read_file",
+            "edit_file",
+            "edit_files",
+            "delete_file",
+        }
+
+        # Background processes are owned by the session that started them
+        process_tools = {
+            "run_terminal_cmd",
+            "list_processes",
+            "process_status",
+            "read_process_logs",
+            "kill_process",
+        }
 
         if tool_name in directory_search_tools and codebase_path:
             # Set default working directory for directory/search operations
             tool_input["default_path"] = codebase_path
 
+        if tool_name in process_tools and session_id:
+            tool_input["session_id"] = session_id
+
         if tool_name == "exit_tool":
-            # Keep the original summary from the agent, just set the file path
             tool_input["file_path"] = (
-                f"artifacts/{session_id}/scratchpads/global_scratchpad.txt"
+                f"artifacts/{session_id}/scratchpads/agent_summaries.txt"
             )
 
-        try:
-            endpoint_map = {
-                "read_file": "/read-file",
-                "edit_file": "/edit-file",
-                "search_replace": "/search-replace",
-                "run_terminal_cmd": "/run-terminal-cmd",
-                "list_directory": "/list-directory",
-                "search_files": "/search-files",
-                "delete_file": "/delete-file",
-                "grep_search": "/grep-search",
-                "exit_tool": "/exit-tool",
-            }
+        if tool_name not in TOOL_ENDPOINTS:
+            raise ValueError(f"Unknown tool: {tool_name}")
 
-            if tool_name not in endpoint_map:
-                raise ValueError(f"Unknown tool: {tool_name}")
+        # Map tool input to the expected request format for each endpoint
+        request_payload = self._map_tool_input_to_request(tool_name, tool_input)
+        return TOOL_ENDPOINTS[tool_name], request_payload
 
-            endpoint = endpoint_map[tool_name]
-            url = f"{self.tools_base_url}{endpoint}"
+    def _on_tool_success(
+        self, tool_name: str, request_payload: Dict[str, Any]
+    ) -> None:
+        """Update the session's own state after a tool call succeeded."""
+        self._files_may_have_changed(tool_name)
+        if tool_name == "exit_tool":
+            # The summary becomes a scratchpad entry; the tools server keeps
+            # the full history of summaries in its own file
+            try:
+                record_agent_summary(
+                    session_state.get(), request_payload.get("summary") or ""
+                )
+            except OSError as e:
+                loggers["ide_agent"].warning(
+                    f"Failed to record the agent summary: {e}"
+                )
 
-            # Map tool input to the expected request format for each endpoint
-            request_payload = self._map_tool_input_to_request(
+    def _parse_tool_response(
+        self,
+        tool_name: str,
+        request_payload: Dict[str, Any],
+        result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Convert a successful tools server response into a tool result
+        """
+        # Extract data field from tools server response
+        # Tools server returns: {"data": {...}, "message": "...", "error": null}
+        if result.get("error") is None:
+            # Success - return the data field directly
+            data = result.get("data", {})
+            self._on_tool_success(tool_name, request_payload)
+            loggers["ide_agent"].debug(
+                "Tool %s called successfully. Returning data: %s",
+                tool_name,
+                data,
+            )
+            return {"success": True, "data": data}
+        else:
+            # Error case
+            error_msg = result.get("error", "Unknown error")
+            loggers["ide_agent"].error(f"Tool {tool_name} failed: {error_msg}")
+            return {"success": False, "error": error_msg}
+
+    async def call_tool(
+        self, tool_name: str, tool_input: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Call a specific tool with the given input parameters
+        """
+        try:
+            endpoint, request_payload = self._prepare_tool_call(
                 tool_name, tool_input
             )
+        except Exception as exc:
+            error_msg = f"Unexpected error calling tool {tool_name}: {str(exc)}"
+            loggers["ide_agent"].error(error_msg)
+            return {"success": False, "error": error_msg}
 
-            # Debug logging
-            print(f"🔧 DEBUG: Calling tool {tool_name}")
-            print(f"🔧 DEBUG: URL: {url}")
-            print(f"🔧 DEBUG: Original tool_input: {tool_input}")
-            print(f"🔧 DEBUG: Mapped request_payload: {request_payload}")
+        return await self._send_tool_call(tool_name, endpoint, request_payload)
 
-            loggers["ide_agent"].info(
-                f"Calling tool {tool_name} with payload: {request_payload}"
+    async def _send_tool_call(
+        self, tool_name: str, endpoint: str, request_payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Send a prepared tool call to its endpoint
+        """
+        try:
+            url = f"{self.tools_base_url}{endpoint}"
+
+            loggers["ide_agent"].info("Calling tool %s at %s", tool_name, url)
+            loggers["ide_agent"].debug(
+                "Tool %s payload: %s", tool_name, request_payload
             )
 
             async with httpx.AsyncClient(
                 timeout=self.timeout, verify=False
             ) as client:
-                response = await client.post(url, json=request_payload)
+                response = await client.post(
+                    url, json=request_payload, headers=self._session_headers()
+                )
 
                 response.raise_for_status()
 
-                result = response.json()
-
-                # Extract data field from tools server response
-                # Tools server returns: {"data": {...}, "message": "...", "error": null}
-                if result.get("error") is None:
-                    # Success - return the data field directly
-                    data = result.get("data", {})
-                    loggers["ide_agent"].info(
-                        f"Tool {tool_name} called successfully. Returning data: {data}"
-                    )
-                    return {"success": True, "data": data}
-                else:
-                    # Error case
-                    error_msg = result.get("error", "Unknown error")
-                    print(f"🔧 DEBUG: Tool returned error: {error_msg}")
-                    loggers["ide_agent"].error(
-                        f"Tool {tool_name} failed: {error_msg}"
-                    )
-                    return {"success": False, "error": error_msg}
+                return self._parse_tool_response(
+                    tool_name, request_payload, response.json()
+                )
 
         except httpx.RequestError as exc:
             error_msg = f"Error calling tool {tool_name}: {str(exc)}"
-            print(f"🔧 DEBUG: RequestError: {error_msg}")
             loggers["ide_agent"].error(error_msg)
             return {"success": False, "error": error_msg}
         except httpx.HTTPStatusError as exc:
             error_msg = f"HTTP error calling tool {tool_name}: {exc.response.status_code}"
-            print(f"🔧 DEBUG: HTTPStatusError: {error_msg}")
             try:
                 error_response = exc.response.json()
-                print(f"🔧 DEBUG: Error response body: {error_response}")
+                loggers["ide_agent"].debug(
+                    "Error response body: %s", error_response
+                )
                 if "detail" in error_response:
                     error_msg = error_response["detail"]
             except:
-                print(f"🔧 DEBUG: Error response text: {exc.response.text}")
+                loggers["ide_agent"].debug(
+                    "Error response text: %s", exc.response.text
+                )
             loggers["ide_agent"].error(error_msg)
             return {"success": False, "error": error_msg}
         except Exception as exc:
             error_msg = f"Unexpected error calling tool {tool_name}: {str(exc)}"
-            print(f"🔧 DEBUG: Unexpected error: {error_msg}")
             loggers["ide_agent"].error(error_msg)
             return {"success": False, "error": error_msg}
 
+    async def call_tools(
+        self, tool_calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Call several tools in one round trip through the tools server's batch
+        endpoint. The server keeps the calls in order and only runs
+        consecutive read-only calls concurrently. If the batch request itself
+        fails, the tools are called one by one when the request never reached
+        the server; otherwise only read-only tools are called again, and the
+        others report the failure, since they may already have run.
+
+        Args:
+            tool_calls: (tool name, tool input) pairs, in order
+
+        Returns:
+            One result per tool call, in the same format as call_tool
+        """
+        if len(tool_calls) == 1:
+            return [await self.call_tool(*tool_calls[0])]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        batch_calls = []
+        prepared_calls: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        for index, (tool_name, tool_input) in enumerate(tool_calls):
+            try:
+                endpoint, request_payload = self._prepare_tool_call(
+                    tool_name, tool_input
+                )
+            except Exception as exc:
+                error_msg = (
+                    f"Unexpected error calling tool {tool_name}: {str(exc)}"
+                )
+                loggers["ide_agent"].error(error_msg)
+                results[index] = {"success": False, "error": error_msg}
+                continue
+            prepared_calls[index] = (endpoint, request_payload)
+            batch_calls.append(
+                {
+                    "id": str(index),
+                    "endpoint": endpoint,
+                    "payload": request_payload,
+                }
+            )
+
+        if not batch_calls:
+            return results
+
+        loggers["ide_agent"].info(
+            "Calling %d tools in one batch", len(batch_calls)
+        )
+        loggers["ide_agent"].debug("Batch calls: %s", batch_calls)
+
+        # The batch may run the calls one after another
+        timeout = httpx.Timeout(
+            connect=self.timeout.connect,
+            read=self.timeout.read * len(batch_calls),
+            write=self.timeout.write,
+            pool=self.timeout.pool,
+        )
+        try:
+            async with httpx.AsyncClient(
+                timeout=timeout, verify=False
+            ) as client:
+                response = await client.post(
+                    f"{self.tools_base_url}/batch",
+                    json={"calls": batch_calls},
+                    headers=self._session_headers(),
+                )
+                response.raise_for_status()
+                batch_results = response.json()["data"]["results"]
+        except Exception as exc:
+            not_sent = isinstance(exc, NOT_SENT_ERRORS)
+            loggers["ide_agent"].warning(
+                f"Batch tool call failed, calling "
+                f"{'tools' if not_sent else 'read-only tools'} one by one: "
+                f"{str(exc)}"
+            )
+            for index, (endpoint, request_payload) in prepared_calls.items():
+                tool_name = tool_calls[index][0]
+                if not_sent or endpoint in READ_ONLY_ENDPOINTS:
+                    results[index] = await self._send_tool_call(
+                        tool_name, endpoint, request_payload
+                    )
+                else:
+                    self._files_may_have_changed(tool_name)
+                    error_msg = (
+                        f"Batch call failed and tool {tool_name} may or may "
+                        f"not have run, check its effect before calling it "
+                        f"again: {str(exc)}"
+                    )
+                    loggers["ide_agent"].error(error_msg)
+                    results[index] = {"success": False, "error": error_msg}
+            return results
+
+        for batch_result in batch_results:
+            index = int(batch_result["id"])
+            tool_name = tool_calls[index][0]
+            body = batch_result.get("body")
+            body = body if isinstance(body, dict) else {}
+            loggers["ide_agent"].info(
+                "Tool %s took %sms in batch",
+                tool_name,
+                batch_result.get("duration_ms"),
+            )
+
+            if batch_result["status_code"] >= 400:
+                error_msg = body.get("detail") or (
+                    f"HTTP error calling tool {tool_name}: {batch_result['status_code']}"
+                )
+                loggers["ide_agent"].error(error_msg)
+                results[index] = {"success": False, "error": error_msg}
+            else:
+                results[index] = self._parse_tool_response(
+                    tool_name, prepared_calls[index][1], body
+                )
+
+        return results
+
     def _map_tool_input_to_request(
         self, tool_name: str, tool_input: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -353,6 +708,8 @@ class IDEAgentTools:
                 "cmd": tool_input.get("cmd"),
                 "is_background": tool_input.get("is_background"),
                 "default_path": tool_input.get("default_path"),
+                "session_id": tool_input.get("session_id"),
+                "timeout_seconds": tool_input.get("timeout_seconds"),
             }
         elif tool_name == "web_search":
             return {
@@ -367,6 +724,19 @@ class IDEAgentTools:
                 "include_pattern": tool_input.get("include_pattern"),
                 "exclude_pattern": tool_input.get("exclude_pattern"),
                 "default_path": tool_input.get("default_path"),
+                "context_lines": tool_input.get("context_lines"),
+                "max_matches_per_file": tool_input.get("max_matches_per_file"),
+            }
+        elif tool_name == "list_directory":
+            # Keep pages small and skip stats to bound the agent's context
+            return {
+                "dir_path": tool_input.get("dir_path", ""),
+                "recursive": tool_input.get("recursive", True),
+                "default_path": tool_input.get("default_path"),
+                "max_depth": tool_input.get("max_depth"),
+                "page_size": tool_input.get("page_size") or 200,
+                "cursor": tool_input.get("cursor"),
+                "include_stats": False,
             }
         elif tool_name == "exit_tool":
             return {
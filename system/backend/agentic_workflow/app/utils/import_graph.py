@@ -0,0 +1,445 @@
+import bisect
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+SOURCE_EXTENSIONS = (".js", ".jsx", ".mjs", ".ts", ".tsx")
+# Same order as Vite's default resolve.extensions
+RESOLVE_EXTENSIONS = (".mjs", ".js", ".mts", ".ts", ".jsx", ".tsx", ".json")
+# Vite serves these files at the root of the site, so "/vite.svg" may be
+# either <codebase>/vite.svg or <codebase>/public/vite.svg
+PUBLIC_DIR = "public"
+VITE_CONFIG_FILES = (
+    "vite.config.js",
+    "vite.config.mjs",
+    "vite.config.ts",
+    "vite.config.mts",
+)
+MAX_WORKERS = 8
+
+NODE_BUILTINS = frozenset(
+    [
+        "assert",
+        "buffer",
+        "child_process",
+        "crypto",
+        "events",
+        "fs",
+        "http",
+        "https",
+        "os",
+        "path",
+        "process",
+        "stream",
+        "url",
+        "util",
+        "zlib",
+    ]
+)
+
+# Comments are blanked out (keeping newlines) so line numbers stay exact;
+# strings are matched only so that comment markers inside them are skipped
+COMMENT_OR_STRING = re.compile(
+    r"//[^\n]*"
+    r"|/\*[\s\S]*?\*/"
+    r"|\"(?:\\.|[^\"\\\n])*\""
+    r"|'(?:\\.|[^'\\\n])*'"
+    r"|`(?:\\.|[^`\\])*`"
+)
+IMPORT_FROM = re.compile(
+    r"^[ \t]*import\s+(?!type\s)([\w$*{}\s,]+?)\s+from\s*(['\"])([^'\"\n]+)\2",
+    re.MULTILINE,
+)
+IMPORT_SIDE_EFFECT = re.compile(
+    r"^[ \t]*import\s*(['\"])([^'\"\n]+)\1", re.MULTILINE
+)
+EXPORT_FROM = re.compile(
+    r"^[ \t]*export\s+(?:type\s+)?(\*(?:\s+as\s+[\w$]+)?|\{[^}]*\})\s*from\s*(['\"])([^'\"\n]+)\2",
+    re.MULTILINE,
+)
+DYNAMIC_IMPORT = re.compile(r"\bimport\(\s*(['\"])([^'\"\n]+)\1\s*\)")
+EXPORT_DEFAULT = re.compile(r"^[ \t]*export\s+default\b", re.MULTILINE)
+# Includes the TypeScript forms (declare, abstract, interface, type, enum,
+# namespace) and generator functions
+EXPORT_DECLARATION = re.compile(
+    r"^[ \t]*export\s+(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?"
+    r"(?:(?:const\s+enum|const|let|var|class|interface|type|enum|namespace"
+    r"|module)\s+|function(?:\s*\*\s*|\s+))([\w$]+)",
+    re.MULTILINE,
+)
+EXPORT_DESTRUCTURED = re.compile(
+    r"^[ \t]*export\s+(?:const|let|var)\s+[{\[]([^}\]]*)[}\]]", re.MULTILINE
+)
+EXPORT_LIST = re.compile(
+    r"^[ \t]*export\s*(?:type\s*)?\{([^}]*)\}(?!\s*from)", re.MULTILINE
+)
+VITE_ALIAS_ENTRY = re.compile(
+    r"['\"]?([@~\w$/.-]+)['\"]?\s*:\s*(?:path\.resolve\(\s*__dirname\s*,\s*|fileURLToPath\(\s*new\s+URL\(\s*)?['\"]([^'\"]+)['\"]"
+)
+
+
+class ModuleInfo:
+    """Imports and exports of one source file."""
+
+    __slots__ = ("path", "imports", "exports", "has_star_export", "error")
+
+    def __init__(self, path: str):
+        self.path = path
+        # (specifier, line, imported names or None when nothing is checked)
+        self.imports: List[Tuple[str, int, Optional[List[str]]]] = []
+        self.exports: Set[str] = set()
+        self.has_star_export = False
+        self.error: Optional[str] = None
+
+
+def _strip_comments(source: str) -> str:
+    def blank(match: re.Match) -> str:
+        text = match.group(0)
+        if text[0] == "/":
+            return re.sub(r"[^\n]", " ", text)
+        return text
+
+    return COMMENT_OR_STRING.sub(blank, source)
+
+
+def _binding_names(clause: str) -> List[str]:
+    """Names a module must export for an import or export clause."""
+    names = []
+    clause = clause.strip()
+    braces = re.search(r"\{([^}]*)\}", clause)
+    default = clause.split("{", 1)[0].strip().rstrip(",").strip()
+    if default and not default.startswith("*"):
+        names.append("default")
+    if braces:
+        for item in braces.group(1).split(","):
+            item = item.strip()
+            if not item or item.startswith("type "):
+                continue
+            names.append(re.split(r"\s+as\s+", item)[0].strip())
+    return names
+
+
+def parse_module(path: str) -> ModuleInfo:
+    """Collect the imports and exports of a source file."""
+    info = ModuleInfo(path)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            source = _strip_comments(file.read())
+    except (OSError, UnicodeDecodeError) as e:
+        info.error = str(e)
+        return info
+
+    line_starts = [0] + [m.end() for m in re.finditer("\n", source)]
+
+    def line_of(position: int) -> int:
+        return bisect.bisect_right(line_starts, position)
+
+    for match in IMPORT_FROM.finditer(source):
+        clause = match.group(1)
+        names = None if "*" in clause else _binding_names(clause)
+        info.imports.append((match.group(3), line_of(match.start()), names))
+    for match in IMPORT_SIDE_EFFECT.finditer(source):
+        info.imports.append((match.group(2), line_of(match.start()), None))
+    for match in EXPORT_FROM.finditer(source):
+        clause = match.group(1)
+        if clause.startswith("*"):
+            if " as " in clause:
+                info.exports.add(clause.split()[-1])
+            else:
+                info.has_star_export = True
+            names = None
+        else:
+            names = _binding_names(clause)
+            for item in clause.strip("{}").split(","):
+                item = item.strip()
+                if item:
+                    info.exports.add(re.split(r"\s+as\s+", item)[-1].strip())
+        info.imports.append((match.group(3), line_of(match.start()), names))
+    for match in DYNAMIC_IMPORT.finditer(source):
+        info.imports.append((match.group(2), line_of(match.start()), None))
+
+    info.imports.sort(key=lambda item: item[1])
+
+    if EXPORT_DEFAULT.search(source):
+        info.exports.add("default")
+    info.exports.update(EXPORT_DECLARATION.findall(source))
+    for match in EXPORT_DESTRUCTURED.finditer(source):
+        for item in match.group(1).split(","):
+            name = item.split(":")[-1].split("=")[0].strip(" .")
+            if name:
+                info.exports.add(name)
+    for match in EXPORT_LIST.finditer(source):
+        for item in match.group(1).split(","):
+            item = item.strip()
+            if item:
+                info.exports.add(re.split(r"\s+as\s+", item)[-1].strip())
+    return info
+
+
+class ImportGraphChecker:
+    """
+    Resolves the imports of a Vite React codebase against its file tree,
+    its Vite aliases and its installed packages, and checks that local
+    modules export the names imported from them.
+
+    Reports the "Failed to resolve import" and "is not exported by" errors
+    the bundler would fail on, with the file and line of the import.
+    """
+
+    def __init__(self, codebase_path: str):
+        self.codebase_path = os.path.abspath(codebase_path)
+        self.src_path = os.path.join(self.codebase_path, "src")
+        self.public_path = os.path.join(self.codebase_path, PUBLIC_DIR)
+        self.aliases, self.has_unknown_aliases = self._load_aliases()
+        self.packages = self._load_packages()
+        self.node_modules = os.path.join(self.codebase_path, "node_modules")
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def _load_aliases(self) -> Tuple[List[Tuple[str, str]], bool]:
+        """
+        Read the resolve.alias entries of the Vite config.
+
+        Returns:
+            The (prefix, target directory) pairs, longest prefix first, and
+            whether the config declares aliases that could not be read
+        """
+        for name in VITE_CONFIG_FILES:
+            config_path = os.path.join(self.codebase_path, name)
+            if not os.path.exists(config_path):
+                continue
+            with open(config_path, "r", encoding="utf-8") as file:
+                config = _strip_comments(file.read())
+
+            aliases = []
+            alias_block = re.search(r"alias\s*:\s*\{([^}]*)\}", config)
+            if alias_block:
+                for prefix, target in VITE_ALIAS_ENTRY.findall(
+                    alias_block.group(1)
+                ):
+                    target = os.path.join(
+                        self.codebase_path, target.lstrip("/")
+                    )
+                    aliases.append((prefix, os.path.normpath(target)))
+            # vite-tsconfig-paths or alias arrays and functions can map
+            # imports in ways this checker does not follow
+            unknown = (
+                "tsconfigPaths" in config or "alias" in config
+            ) and not aliases
+            aliases.sort(key=lambda alias: len(alias[0]), reverse=True)
+            return aliases, unknown
+        return [], False
+
+    def _load_packages(self) -> Set[str]:
+        try:
+            with open(
+                os.path.join(self.codebase_path, "package.json"),
+                "r",
+                encoding="utf-8",
+            ) as file:
+                package_data = json.load(file)
+        except (OSError, ValueError):
+            return set()
+        packages = set()
+        for key in ("dependencies", "devDependencies", "peerDependencies"):
+            packages.update(package_data.get(key) or {})
+        return packages
+
+    def _resolve_file(self, base: str) -> Optional[str]:
+        if base in self._resolved:
+            return self._resolved[base]
+        resolved = None
+        if os.path.isfile(base):
+            resolved = base
+        else:
+            for extension in RESOLVE_EXTENSIONS:
+                if os.path.isfile(base + extension):
+                    resolved = base + extension
+                    break
+            else:
+                if os.path.isdir(base):
+                    for extension in RESOLVE_EXTENSIONS:
+                        index = os.path.join(base, "index" + extension)
+                        if os.path.isfile(index):
+                            resolved = index
+                            break
+        self._resolved[base] = resolved
+        return resolved
+
+    def _is_known_package(self, specifier: str) -> bool:
+        parts = specifier.split("/")
+        package = "/".join(parts[:2]) if specifier.startswith("@") else parts[0]
+        if package in self.packages:
+            return True
+        if package.startswith("node:") or package in NODE_BUILTINS:
+            return True
+        # Transitive dependencies resolve too once they are installed
+        return os.path.isdir(os.path.join(self.node_modules, package))
+
+    def resolve(
+        self, specifier: str, importer: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Resolve an import specifier.
+
+        Returns:
+            Whether the import resolves, and the local file it resolves to
+            (None for packages and imports this checker does not follow)
+        """
+        specifier = specifier.split("?", 1)[0]
+        if re.match(r"^(https?:|data:|virtual:|/@)", specifier):
+            return True, None
+
+        if specifier.startswith("."):
+            base = os.path.join(os.path.dirname(importer), specifier)
+        elif specifier.startswith("/"):
+            public_file = os.path.join(self.public_path, specifier.lstrip("/"))
+            if os.path.isfile(public_file):
+                return True, None
+            base = os.path.join(self.codebase_path, specifier.lstrip("/"))
+        else:
+            for prefix, target in self.aliases:
+                if specifier == prefix or specifier.startswith(
+                    prefix.rstrip("/") + "/"
+                ):
+                    base = target + specifier[len(prefix.rstrip("/")) :]
+                    break
+            else:
+                if (
+                    self._is_known_package(specifier)
+                    or self.has_unknown_aliases
+                ):
+                    return True, None
+                return False, None
+
+        resolved = self._resolve_file(os.path.normpath(base))
+        return resolved is not None, resolved
+
+    def _is_bare(self, specifier: str) -> bool:
+        """Whether the specifier names a package rather than a path."""
+        if specifier.startswith((".", "/")):
+            return False
+        return not any(
+            specifier == prefix
+            or specifier.startswith(prefix.rstrip("/") + "/")
+            for prefix, _ in self.aliases
+        )
+
+    def _is_asset(self, specifier: str) -> bool:
+        """Whether the specifier names a file other than a module."""
+        extension = os.path.splitext(specifier.split("?", 1)[0])[1].lower()
+        return (
+            bool(extension)
+            and extension not in RESOLVE_EXTENSIONS
+            and not self._is_bare(specifier)
+        )
+
+    def _source_files(self) -> List[str]:
+        paths = []
+        for root, dirs, files in os.walk(self.src_path):
+            dirs[:] = [d for d in dirs if d != "node_modules"]
+            for name in files:
+                if name.endswith(SOURCE_EXTENSIONS):
+                    paths.append(os.path.join(root, name))
+        return sorted(paths)
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(path, self.codebase_path)
+
+    def check(self) -> List[Dict[str, object]]:
+        """
+        Check every source file under src/.
+
+        Returns:
+            List of errors with file_path, line_number, import specifier,
+            message and severity, in file order. Unresolved imports of assets
+            (images, styles...) are warnings: a plugin or the public directory
+            of another config may still serve them, so the build decides.
+        """
+        paths = self._source_files()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            modules = {
+                info.path: info for info in executor.map(parse_module, paths)
+            }
+
+        errors = []
+        for path in paths:
+            module = modules[path]
+            if module.error:
+                errors.append(self._error(path, None, None, module.error))
+                continue
+
+            for specifier, line, names in module.imports:
+                resolves, target = self.resolve(specifier, path)
+                if not resolves:
+                    hint = (
+                        "Is the package listed in package.json?"
+                        if self._is_bare(specifier)
+                        else "Does the file exist?"
+                    )
+                    errors.append(
+                        self._error(
+                            path,
+                            line,
+                            specifier,
+                            f'Failed to resolve import "{specifier}" from '
+                            f'"{self._relative(path)}". {hint}',
+                            "warning" if self._is_asset(specifier) else "error",
+                        )
+                    )
+                    continue
+                if not names or target is None or target not in modules:
+                    continue
+
+                missing = self._missing_exports(modules, target, names)
+                for name in missing:
+                    message = (
+                        f'"{self._relative(target)}" has no default export'
+                        if name == "default"
+                        else f'"{name}" is not exported by "{self._relative(target)}"'
+                    )
+                    errors.append(self._error(path, line, specifier, message))
+        return errors
+
+    def _missing_exports(
+        self,
+        modules: Dict[str, ModuleInfo],
+        target: str,
+        names: List[str],
+    ) -> List[str]:
+        exports = modules[target].exports
+        if modules[target].has_star_export:
+            # Names may come from a re-exported module; skip the check
+            return []
+        return [name for name in names if name not in exports]
+
+    def _error(
+        self,
+        path: str,
+        line: Optional[int],
+        specifier: Optional[str],
+        message: str,
+        severity: str = "error",
+    ) -> Dict[str, object]:
+        return {
+            "file_path": self._relative(path),
+            "line_number": line,
+            "import": specifier,
+            "message": message,
+            "severity": severity,
+        }
+
+
+def check_import_graph(codebase_path: str) -> List[Dict[str, object]]:
+    """
+    Check the imports of the React codebase at codebase_path.
+
+    Args:
+        codebase_path: Path of the codebase containing package.json and src/
+
+    Returns:
+        List of unresolved import and missing export errors, with severity
+        "warning" for unresolved asset imports
+    """
+    return ImportGraphChecker(codebase_path).check()
@@ -0,0 +1,155 @@
+import json
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, List
+
+from system.backend.agentic_workflow.app.utils.file_ownership import (
+    codebase_relative_path,
+)
+
+MANIFEST_FILE_NAME = "route_manifest.json"
+# Entry files that make a folder a routable React page or Flutter screen
+REACT_PAGE_ENTRY = re.compile(r"^src/pages/([^/]+)/index\.jsx$")
+FLUTTER_SCREEN_ENTRY = re.compile(r"^lib/presentation/([^/]+)/\1\.dart$")
+FLUTTER_SCREEN_CLASS = re.compile(
+    r"class\s+(\w+)\s+extends\s+(?:StatefulWidget|StatelessWidget)"
+)
+
+_manifest_lock = threading.Lock()
+# Manifests read in this process, by path, so a render reads no file
+_manifests: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+
+
+def manifest_path_for(codebase_path: str) -> str:
+    """The manifest lives in the session's project_context, beside the codebase."""
+    session_dir = os.path.dirname(os.path.abspath(codebase_path))
+    return os.path.join(session_dir, "project_context", MANIFEST_FILE_NAME)
+
+
+class RouteManifest:
+    """
+    Routable pages of a React codebase and screens of a Flutter codebase,
+    persisted per session so routes are rendered without rescanning the
+    pages directory.
+
+    A section is built by scanning the codebase the first time it is read,
+    and kept up to date afterwards as screen files are written. Writers
+    that do not record what they write (e.g. the IDE agent through the
+    tools server) invalidate the manifest instead, and the next read scans
+    again.
+    """
+
+    def __init__(self, codebase_path: str):
+        self.codebase_path = os.path.abspath(codebase_path)
+        self.path = manifest_path_for(codebase_path)
+
+    def _data(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """The manifest, read from its file once per process."""
+        data = _manifests.get(self.path)
+        if data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            _manifests[self.path] = data
+        return data
+
+    def _save(self, data: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+    def get_entries(
+        self, section: str, scan: Callable[[], Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the entries of a section, scanning the codebase with the
+        given function if the section was never built or was invalidated.
+
+        Args:
+            section: Name of the section, "pages" or "screens"
+            scan: Function returning the entries found in the codebase
+        """
+        with _manifest_lock:
+            data = self._data()
+            if section not in data:
+                data[section] = scan()
+                self._save(data)
+            return dict(data[section])
+
+    def add_entries(
+        self, section: str, entries: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Add or update entries. A section that was never built is left to
+        the first scan, which will find them too.
+        """
+        with _manifest_lock:
+            data = self._data()
+            if section not in data:
+                return
+            if all(
+                data[section].get(name) == entry
+                for name, entry in entries.items()
+            ):
+                return
+            data[section].update(entries)
+            self._save(data)
+
+    def invalidate(self) -> None:
+        """Forget every section, so the next read scans the codebase again."""
+        with _manifest_lock:
+            _manifests[self.path] = {}
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def record_screen_routes(
+    session_id: str, file_data_list: List[Dict[str, Any]]
+) -> None:
+    """
+    Add the pages or screens whose entry file was just written to the
+    session's route manifest.
+
+    Args:
+        session_id: Session identifier
+        file_data_list: Written files, with FILE_PATH and code snippet
+    """
+    codebase_path = f"artifacts/{session_id}/codebase"
+    pages: Dict[str, Dict[str, Any]] = {}
+    screens: Dict[str, Dict[str, Any]] = {}
+    for file_data in file_data_list:
+        rel_path = codebase_relative_path(file_data["file_path"], codebase_path)
+        if rel_path is None:
+            continue
+        match = REACT_PAGE_ENTRY.match(rel_path)
+        if match:
+            pages[match.group(1)] = {}
+            continue
+        match = FLUTTER_SCREEN_ENTRY.match(rel_path)
+        if match:
+            class_match = FLUTTER_SCREEN_CLASS.search(file_data["code_snippet"])
+            screens[match.group(1)] = {
+                "class_name": class_match.group(1) if class_match else None
+            }
+
+    manifest = RouteManifest(codebase_path)
+    manifest.add_entries("pages", pages)
+    manifest.add_entries("screens", screens)
+
+
+def invalidate_route_manifest(session_id: str) -> None:
+    """
+    Rescan the session's pages and screens on the next render, after files
+    were changed by a writer that does not record them.
+
+    Args:
+        session_id: Session identifier
+    """
+    RouteManifest(f"artifacts/{session_id}/codebase").invalidate()
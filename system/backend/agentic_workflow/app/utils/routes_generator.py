@@ -6,20 +6,30 @@ Generates Routes.jsx files heuristically by analyzing the src directory structur
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from system.backend.agentic_workflow.app.utils.file_writer import (
+    write_file_if_changed,
+)
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    RouteManifest,
+)
+
 
 class RoutesGenerator:
     """Generates Routes.jsx files based on project structure analysis."""
 
-    def __init__(self, src_path: str):
+    def __init__(self, src_path: str, manifest: Optional[RouteManifest] = None):
         """
         Initialize the routes generator.
 
         Args:
             src_path: Path to the src directory of the React project
+            manifest: Optional route manifest of the session, read instead of
+                scanning the pages directory
         """
         self.src_path = Path(src_path)
         self.pages_path = self.src_path / "pages"
         self.components_path = self.src_path / "components"
+        self.manifest = manifest
 
     def analyze_pages_structure(self) -> List[Dict]:
         """
@@ -28,7 +38,29 @@ class RoutesGenerator:
         Returns:
             List of page dictionaries with name, path, and component info
         """
+        if self.manifest is not None:
+            page_names = self.manifest.get_entries("pages", self._scan_pages)
+        else:
+            page_names = self._scan_pages()
+
         pages = []
+        for page_name in page_names:
+            page_info = self._analyze_page_directory(
+                self.pages_path / page_name
+            )
+            if page_info:
+                pages.append(page_info)
+
+        return pages
+
+    def _scan_pages(self) -> Dict[str, Dict]:
+        """
+        Scan the pages directory for page folders with an index.jsx.
+
+        Returns:
+            Dictionary of page directory names to manifest entries
+        """
+        pages = {}
 
         if not self.pages_path.exists():
             return pages
@@ -38,9 +70,7 @@ class RoutesGenerator:
                 # Check if index.jsx exists
                 index_file = page_dir / "index.jsx"
                 if index_file.exists():
-                    page_info = self._analyze_page_directory(page_dir)
-                    if page_info:
-                        pages.append(page_info)
+                    pages[page_dir.name] = {}
 
         return pages
 
@@ -209,14 +239,22 @@ class RoutesGenerator:
 
         return components
 
-    def generate_routes_jsx(self) -> str:
+    def generate_routes_jsx(self, pages: Optional[List[Dict]] = None) -> str:
         """
         Generate the complete Routes.jsx file content.
 
+        Args:
+            pages: Pages found by analyze_pages_structure, analyzed again if
+                not given
+
         Returns:
             Generated Routes.jsx file content as string
         """
-        pages = self.analyze_pages_structure()
+        if pages is None:
+            pages = self.analyze_pages_structure()
+        else:
+            # Home page selection marks the page it falls back to
+            pages = [dict(page) for page in pages]
         components = self.analyze_components_structure()
 
         # Sort pages to ensure consistent order
@@ -330,26 +368,32 @@ class RoutesGenerator:
 
         return "\n".join(file_lines)
 
-    def save_routes_file(self, output_path: str) -> None:
+    def save_routes_file(self, output_path: str) -> bool:
         """
-        Generate and save the Routes.jsx file.
+        Generate and save the Routes.jsx file, unless it is unchanged.
 
         Args:
             output_path: Path where to save the Routes.jsx file
+
+        Returns:
+            Whether the file was written
         """
         content = self.generate_routes_jsx()
+        return write_file_if_changed(output_path, content)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def get_route_analysis(self) -> Dict:
+    def get_route_analysis(self, pages: Optional[List[Dict]] = None) -> Dict:
         """
         Get detailed analysis of the project structure.
 
+        Args:
+            pages: Pages found by analyze_pages_structure, analyzed again if
+                not given
+
         Returns:
             Dictionary with analysis results
         """
-        pages = self.analyze_pages_structure()
+        if pages is None:
+            pages = self.analyze_pages_structure()
         components = self.analyze_components_structure()
 
         return {
@@ -361,7 +405,9 @@ class RoutesGenerator:
 
 
 def generate_routes_for_project(
-    src_path: str, output_path: str = None
+    src_path: str,
+    output_path: str = None,
+    manifest: Optional[RouteManifest] = None,
 ) -> Tuple[str, Dict]:
     """
     Generate Routes.jsx file for a React project.
@@ -369,21 +415,28 @@ def generate_routes_for_project(
     Args:
         src_path: Path to the src directory
         output_path: Optional path to save the file (if None, returns content only)
+        manifest: Optional route manifest of the session, read instead of
+            scanning the pages directory
 
     Returns:
         Tuple of (generated_content, analysis_info)
     """
-    generator = RoutesGenerator(src_path)
+    generator = RoutesGenerator(src_path, manifest)
+
+    # Analyze the pages once for both the content and the analysis
+    pages = generator.analyze_pages_structure()
 
     # Generate the content
-    content = generator.generate_routes_jsx()
+    content = generator.generate_routes_jsx(pages)
 
     # Get analysis info
-    analysis = generator.get_route_analysis()
+    analysis = generator.get_route_analysis(pages)
 
-    # Save if output path provided
+    # Save if output path provided and the content changed
     if output_path:
-        generator.save_routes_file(output_path)
+        analysis["routes_file_changed"] = write_file_if_changed(
+            output_path, content
+        )
 
     return content, analysis
 
@@ -0,0 +1,256 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from system.backend.agentic_workflow.app.config.settings import settings
+
+STORE_FILE_NAME = "global_scratchpad.json"
+# Rendered view of the whole store, kept for readers of the old text file
+RENDERED_FILE_NAME = "global_scratchpad.txt"
+# Rough size of a token, to fit rendered slices in a prompt budget
+CHARS_PER_TOKEN = 4
+
+# Entry kinds, each rendered in its own section
+THEME = "theme"
+COMPONENT_API = "component_api"
+ROUTES = "routes"
+VALIDATION = "validation"
+AGENT_SUMMARY = "agent_summary"
+# Content of a text scratchpad written before the store existed
+LEGACY = "legacy"
+
+KIND_SECTIONS = {
+    THEME: "DESIGN_SYSTEM",
+    COMPONENT_API: "COMPONENT_REGISTRY",
+    ROUTES: "ROUTES",
+    VALIDATION: "VALIDATION",
+    AGENT_SUMMARY: "AGENT_SUMMARIES",
+    LEGACY: "EARLIER_NOTES",
+}
+
+# Kinds each consumer sees, most important first. Lower priority kinds are
+# the first left out when a slice does not fit its budget.
+CONSUMER_KINDS = {
+    "stage_ii": (THEME, COMPONENT_API),
+    "stage_iii": (THEME, COMPONENT_API, ROUTES, AGENT_SUMMARY, LEGACY),
+    "stage_iv": (COMPONENT_API, ROUTES, THEME, AGENT_SUMMARY, LEGACY),
+    "ide_agent": (
+        AGENT_SUMMARY,
+        ROUTES,
+        COMPONENT_API,
+        THEME,
+        VALIDATION,
+        LEGACY,
+    ),
+}
+
+_store_lock = threading.Lock()
+
+
+def _scratchpads_dir(session_id: str) -> str:
+    return f"artifacts/{session_id}/scratchpads"
+
+
+def _save_atomic(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def _load_store(session_id: str) -> Dict[str, Any]:
+    """
+    Load the store of a session, importing its text scratchpad as a legacy
+    entry the first time.
+    """
+    scratchpads_dir = _scratchpads_dir(session_id)
+    try:
+        with open(
+            os.path.join(scratchpads_dir, STORE_FILE_NAME),
+            "r",
+            encoding="utf-8",
+        ) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    store = {"next_seq": 0, "entries": {}}
+    try:
+        with open(
+            os.path.join(scratchpads_dir, RENDERED_FILE_NAME),
+            "r",
+            encoding="utf-8",
+        ) as f:
+            legacy_content = f.read().strip()
+    except OSError:
+        legacy_content = ""
+    if legacy_content:
+        _put_entry(store, LEGACY, "global_scratchpad", legacy_content)
+    return store
+
+
+def _put_entry(
+    store: Dict[str, Any], kind: str, key: str, content: str
+) -> None:
+    store["entries"][f"{kind}:{key}"] = {
+        "kind": kind,
+        "key": key,
+        "content": content.strip(),
+        "seq": store["next_seq"],
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    store["next_seq"] += 1
+
+
+def _drop_old_summaries(store: Dict[str, Any]) -> None:
+    summaries = sorted(
+        (
+            entry
+            for entry in store["entries"].values()
+            if entry["kind"] == AGENT_SUMMARY
+        ),
+        key=lambda entry: entry["seq"],
+    )
+    excess = len(summaries) - settings.SCRATCHPAD_MAX_AGENT_SUMMARIES
+    for entry in summaries[: max(excess, 0)]:
+        del store["entries"][f"{AGENT_SUMMARY}:{entry['key']}"]
+
+
+def record_scratchpad_entries(
+    session_id: str, kind: str, entries: Dict[str, str]
+) -> None:
+    """
+    Add entries to a session's scratchpad, replacing the previous entries of
+    the same kind and key.
+
+    Args:
+        session_id: Session identifier
+        kind: Kind of the entries, one of KIND_SECTIONS
+        entries: Dict of entry key to content
+    """
+    entries = {key: content for key, content in entries.items() if content}
+    if not entries:
+        return
+
+    scratchpads_dir = _scratchpads_dir(session_id)
+    with _store_lock:
+        store = _load_store(session_id)
+        for key, content in entries.items():
+            _put_entry(store, kind, key, content)
+        if kind == AGENT_SUMMARY:
+            _drop_old_summaries(store)
+
+        _save_atomic(
+            os.path.join(scratchpads_dir, STORE_FILE_NAME),
+            json.dumps(store, indent=2),
+        )
+        _save_atomic(
+            os.path.join(scratchpads_dir, RENDERED_FILE_NAME),
+            _render(list(store["entries"].values()), tuple(KIND_SECTIONS)),
+        )
+
+
+def record_scratchpad_entry(
+    session_id: str, kind: str, key: str, content: str
+) -> None:
+    """Add one entry to a session's scratchpad, see record_scratchpad_entries."""
+    record_scratchpad_entries(session_id, kind, {key: content})
+
+
+def record_agent_summary(session_id: str, summary: str) -> None:
+    """Add the exit summary of an IDE agent run, keeping the latest few."""
+    record_scratchpad_entry(
+        session_id,
+        AGENT_SUMMARY,
+        datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%f"),
+        summary,
+    )
+
+
+def _render(entries: List[Dict[str, Any]], kinds: tuple) -> str:
+    sections = []
+    for kind in kinds:
+        kind_entries = sorted(
+            (entry for entry in entries if entry["kind"] == kind),
+            key=lambda entry: entry["seq"],
+        )
+        if not kind_entries:
+            continue
+        tag = KIND_SECTIONS[kind]
+        blocks = "\n\n".join(
+            f"<ENTRY key=\"{entry['key']}\" updated=\"{entry['timestamp']}\">\n"
+            f"{entry['content']}\n</ENTRY>"
+            for entry in kind_entries
+        )
+        sections.append(f"<{tag}>\n{blocks}\n</{tag}>")
+    return "\n\n".join(sections) + "\n" if sections else ""
+
+
+def render_scratchpad(
+    session_id: str, consumer: str, max_tokens: Optional[int] = None
+) -> str:
+    """
+    Render the part of a session's scratchpad a consumer needs, within a
+    token budget.
+
+    Entries are picked by the consumer's kind priority and, within a kind,
+    newest first; entries that do not fit are left out, except earlier notes
+    which are cut to their most recent part.
+
+    Args:
+        session_id: Session identifier
+        consumer: Key of CONSUMER_KINDS
+        max_tokens: Token budget, SCRATCHPAD_TOKEN_BUDGET if not given
+
+    Returns:
+        Rendered scratchpad, empty if there are no entries
+    """
+    kinds = CONSUMER_KINDS[consumer]
+    budget_chars = (
+        max_tokens or settings.SCRATCHPAD_TOKEN_BUDGET
+    ) * CHARS_PER_TOKEN
+
+    with _store_lock:
+        store = _load_store(session_id)
+
+    selected = []
+    omitted = 0
+    used_chars = 0
+    for kind in kinds:
+        kind_entries = sorted(
+            (
+                entry
+                for entry in store["entries"].values()
+                if entry["kind"] == kind
+            ),
+            key=lambda entry: entry["seq"],
+            reverse=True,
+        )
+        for entry in kind_entries:
+            size = len(entry["content"])
+            remaining = budget_chars - used_chars
+            if size <= remaining:
+                selected.append(entry)
+                used_chars += size
+            elif kind == LEGACY and remaining > 0:
+                selected.append(
+                    {
+                        **entry,
+                        "content": "... [earlier notes truncated] ...\n"
+                        + entry["content"][-remaining:],
+                    }
+                )
+                used_chars = budget_chars
+            else:
+                omitted += 1
+
+    rendered = _render(selected, kinds)
+    if omitted:
+        rendered += (
+            f"\n<OMITTED_ENTRIES>{omitted} older or lower priority entries "
+            f"left out to fit the prompt budget</OMITTED_ENTRIES>\n"
+        )
+    return rendered
@@ -0,0 +1,175 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+MAX_CACHED_TREES = 16
+READ_CHUNK_BYTES = 1024 * 1024
+# Directories holding installed packages, build outputs or version control
+# data rather than build inputs. Every other file counts, including the
+# generated sources (*.g.dart...) and web/ that the IDE tools skip
+EXCLUDED_DIRS = frozenset(
+    ["node_modules", "dist", "build", ".dart_tool", ".git"]
+)
+
+
+class _HashNode:
+    __slots__ = ("children", "stat_key", "digest")
+
+    def __init__(self, is_dir: bool):
+        # None for files, name -> node for directories
+        self.children: Optional[Dict[str, "_HashNode"]] = {} if is_dir else None
+        # (mtime_ns, size) the file digest was computed for
+        self.stat_key: Optional[Tuple[int, int]] = None
+        self.digest: Optional[str] = None
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        while chunk := file.read(READ_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SourceHashTree:
+    """
+    Merkle hash of the build inputs of a codebase, skipping EXCLUDED_DIRS.
+
+    A file is only re-read when its mtime or size changed or a writer
+    invalidated it, and a directory's hash is only recomputed when one of
+    its entries changed, so hashing an unchanged tree costs one stat per
+    file.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._tree = _HashNode(is_dir=True)
+        self._lock = threading.Lock()
+
+    def digest(self) -> str:
+        """Return the hash of the whole tree."""
+        with self._lock:
+            return self._digest_dir(self.root, self._tree)
+
+    def file_digest(self, rel_path: str) -> Optional[str]:
+        """Return the hash of one file, or None if it does not exist."""
+        path = os.path.join(self.root, rel_path)
+        try:
+            return _file_digest(path)
+        except OSError:
+            return None
+
+    def invalidate(self, abs_path: str) -> None:
+        """
+        Forget the hashes of a written or deleted path and of the
+        directories above it.
+        """
+        rel_path = os.path.relpath(abs_path, self.root)
+        if rel_path.startswith(".."):
+            return
+
+        with self._lock:
+            node = self._tree
+            node.digest = None
+            if rel_path == ".":
+                node.children = {}
+                return
+            parts = rel_path.split(os.sep)
+            for part in parts[:-1]:
+                node = node.children.get(part) if node.children else None
+                if node is None:
+                    return
+                node.digest = None
+            if node.children:
+                node.children.pop(parts[-1], None)
+
+    def _digest_dir(self, path: str, node: _HashNode) -> str:
+        changed = node.digest is None
+        children: Dict[str, _HashNode] = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir and entry.name in EXCLUDED_DIRS:
+                        continue
+
+                    child = node.children.get(entry.name)
+                    if child is None or (child.children is not None) != is_dir:
+                        child = _HashNode(is_dir)
+                        changed = True
+                    children[entry.name] = child
+
+                    if is_dir:
+                        previous = child.digest
+                        if self._digest_dir(entry.path, child) != previous:
+                            changed = True
+                    elif self._digest_file(entry, child):
+                        changed = True
+        except OSError:
+            pass
+
+        if len(children) != len(node.children):
+            changed = True
+        node.children = children
+        if changed or node.digest is None:
+            digest = hashlib.sha1()
+            for name in sorted(children):
+                child = children[name]
+                kind = "d" if child.children is not None else "f"
+                digest.update(f"{kind}\0{name}\0{child.digest}\n".encode())
+            node.digest = digest.hexdigest()
+        return node.digest
+
+    def _digest_file(self, entry: os.DirEntry, node: _HashNode) -> bool:
+        """Update a file's hash if it changed; return whether it did."""
+        try:
+            stats = entry.stat()
+        except OSError:
+            return False
+        stat_key = (stats.st_mtime_ns, stats.st_size)
+        if node.digest is not None and node.stat_key == stat_key:
+            return False
+
+        previous = node.digest
+        try:
+            node.digest = _file_digest(entry.path)
+        except OSError:
+            node.digest = None
+            return previous is not None
+        node.stat_key = stat_key
+        return node.digest != previous
+
+
+_source_trees: "OrderedDict[str, SourceHashTree]" = OrderedDict()
+_source_trees_lock = threading.Lock()
+
+
+def get_source_tree(directory_path: str) -> SourceHashTree:
+    """Return the cached hash tree for a codebase, creating it on first use."""
+    root = os.path.abspath(directory_path)
+    with _source_trees_lock:
+        tree = _source_trees.get(root)
+        if tree is None:
+            tree = SourceHashTree(root)
+            _source_trees[root] = tree
+            while len(_source_trees) > MAX_CACHED_TREES:
+                _source_trees.popitem(last=False)
+        _source_trees.move_to_end(root)
+        return tree
+
+
+def record_source_changes(paths: Iterable[str]) -> None:
+    """Invalidate the hashes of written or deleted paths."""
+    with _source_trees_lock:
+        trees = list(_source_trees.values())
+
+    for path in paths:
+        abs_path = os.path.abspath(path)
+        for tree in trees:
+            if abs_path.startswith(tree.root + os.sep):
+                tree.invalidate(abs_path)
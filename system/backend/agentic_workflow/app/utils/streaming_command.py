@@ -0,0 +1,142 @@
+import asyncio
+import os
+import re
+import signal
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Lines longer than this are replaced by a marker
+MAX_LINE_BYTES = 1024 * 1024
+KILL_GRACE_SECONDS = 5.0
+
+
+@lru_cache(maxsize=32)
+def _compile_fatal_patterns(
+    fatal_patterns: Tuple[str, ...],
+) -> Optional[re.Pattern]:
+    if not fatal_patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in fatal_patterns))
+
+
+def _kill_process_group(pid: int, sig: int) -> None:
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+async def _stop_process_group(process: asyncio.subprocess.Process) -> None:
+    """SIGTERM the process group, then SIGKILL it if it does not exit."""
+    if process.returncode is not None:
+        return
+    _kill_process_group(process.pid, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(process.wait(), KILL_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        _kill_process_group(process.pid, signal.SIGKILL)
+        await process.wait()
+
+
+async def run_streaming_command(
+    command: str,
+    cwd: str,
+    timeout_seconds: float,
+    fatal_patterns: Optional[List[str]] = None,
+    grace_seconds: float = 2.0,
+) -> Dict[str, Any]:
+    """
+    Run a validation command, reading its output line by line as it is
+    produced.
+
+    When a line matches one of the fatal patterns the build cannot succeed
+    any more, so the output is read for grace_seconds longer to collect the
+    related errors and the whole process group is then stopped.
+
+    Args:
+        command: The shell command to run
+        cwd: The working directory
+        timeout_seconds: Time after which the process group is killed
+        fatal_patterns: Regex patterns of definitive errors
+        grace_seconds: Time to keep reading after the first fatal line
+
+    Returns:
+        Dict with the exit code, the combined output, whether the command
+        was aborted early and the fatal line that aborted it
+
+    Raises:
+        asyncio.TimeoutError: If the command does not finish in time
+    """
+    fatal = _compile_fatal_patterns(tuple(fatal_patterns or ()))
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        start_new_session=True,
+        limit=MAX_LINE_BYTES,
+    )
+    lines: Dict[str, List[str]] = {"stdout": [], "stderr": []}
+    fatal_line: Optional[str] = None
+    fatal_seen = asyncio.Event()
+
+    async def read_lines(name: str, stream: asyncio.StreamReader) -> None:
+        nonlocal fatal_line
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # readline() dropped a line longer than the limit
+                line = b"... [line truncated] ...\n"
+            if not line:
+                break
+            text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            lines[name].append(text)
+            if fatal_line is None and fatal is not None and fatal.search(text):
+                fatal_line = text.strip()
+                fatal_seen.set()
+
+    readers = asyncio.gather(
+        read_lines("stdout", process.stdout),
+        read_lines("stderr", process.stderr),
+    )
+    finished = asyncio.ensure_future(asyncio.gather(readers, process.wait()))
+    fatal_wait = asyncio.ensure_future(fatal_seen.wait())
+    deadline = time.monotonic() + timeout_seconds
+
+    aborted = False
+    try:
+        await asyncio.wait(
+            [finished, fatal_wait],
+            timeout=timeout_seconds,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        if not finished.done() and fatal_seen.is_set():
+            # Collect the errors reported together with the fatal one
+            remaining = max(0.0, deadline - time.monotonic())
+            await asyncio.wait(
+                [finished], timeout=min(grace_seconds, remaining)
+            )
+            if not finished.done() and time.monotonic() < deadline:
+                aborted = True
+        if not finished.done():
+            await _stop_process_group(process)
+            await asyncio.wait([finished], timeout=KILL_GRACE_SECONDS)
+            if not aborted:
+                raise asyncio.TimeoutError()
+    finally:
+        fatal_wait.cancel()
+        if not finished.done():
+            finished.cancel()
+            _kill_process_group(process.pid, signal.SIGKILL)
+
+    return {
+        "exit_code": process.returncode,
+        "output": "\n".join(lines["stdout"])
+        + "\n"
+        + "\n".join(lines["stderr"]),
+        "aborted": aborted,
+        "abort_reason": fatal_line if aborted else None,
+    }
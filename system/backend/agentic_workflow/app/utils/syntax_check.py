@@ -0,0 +1,505 @@
+import asyncio
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from system.backend.agentic_workflow.app.config.settings import settings
+from system.backend.agentic_workflow.app.utils.file_ownership import (
+    codebase_relative_path,
+)
+
+JS_EXTENSIONS = (".js", ".jsx", ".mjs", ".cjs")
+DART_EXTENSIONS = (".dart",)
+ESBUILD_BIN = "node_modules/.bin/esbuild"
+ESBUILD_TIMEOUT_SECONDS = 30
+ESBUILD_ERROR = re.compile(
+    r"\[ERROR\] (?P<message>.+?)\n\s*\n\s*[^\n]*?:(?P<line>\d+):(?P<column>\d+):"
+)
+
+CLOSERS = {"(": ")", "[": "]", "{": "}", "${": "}"}
+# After these keywords an expression starts, so "/" begins a regex and "<"
+# a JSX element
+EXPRESSION_KEYWORDS = frozenset(
+    [
+        "return",
+        "typeof",
+        "instanceof",
+        "in",
+        "of",
+        "new",
+        "delete",
+        "void",
+        "throw",
+        "case",
+        "do",
+        "else",
+        "yield",
+        "await",
+        "default",
+    ]
+)
+WORD = re.compile(r"[\w$]+")
+JSX_NAME = re.compile(r"[\w$.:-]*")
+
+
+class SyntaxCheckError(Exception):
+    def __init__(self, position: int, message: str):
+        super().__init__(message)
+        self.position = position
+        self.message = message
+
+
+def _skip_comment(source: str, i: int, nested: bool = False) -> int:
+    """Return the index after the comment starting at i."""
+    if source.startswith("//", i):
+        end = source.find("\n", i)
+        return len(source) if end < 0 else end
+    depth = 0
+    j = i
+    while j < len(source):
+        if source.startswith("/*", j):
+            depth += 1
+            j += 2
+            if not nested and depth > 1:
+                depth = 1
+        elif source.startswith("*/", j):
+            depth -= 1
+            j += 2
+            if depth == 0:
+                return j
+        else:
+            j += 1
+    raise SyntaxCheckError(i, "Unterminated comment")
+
+
+def _skip_quoted(source: str, i: int) -> int:
+    """Return the index after the single-line string starting at i."""
+    quote = source[i]
+    j = i + 1
+    while j < len(source):
+        char = source[j]
+        if char == "\\":
+            j += 2
+            continue
+        if char == quote:
+            return j + 1
+        if char == "\n":
+            break
+        j += 1
+    raise SyntaxCheckError(i, "Unterminated string literal")
+
+
+def _skip_regex(source: str, i: int) -> int:
+    """Return the index after the regex literal starting at i."""
+    j = i + 1
+    in_class = False
+    while j < len(source):
+        char = source[j]
+        if char == "\\":
+            j += 2
+            continue
+        if char == "\n":
+            break
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            j += 1
+            while j < len(source) and source[j].isalpha():
+                j += 1
+            return j
+        j += 1
+    raise SyntaxCheckError(i, "Unterminated regular expression")
+
+
+def check_js_source(source: str) -> None:
+    """
+    Check that the strings, comments, brackets and JSX elements of a JS or
+    JSX source are balanced.
+
+    This is a tokenizer, not a parser: it catches the truncated or malformed
+    output an LLM produces, such as a missing closing brace or JSX tag.
+
+    Raises:
+        SyntaxCheckError: At the first unbalanced token
+    """
+    # Each frame is (kind, start, data): "code" frames hold the opening
+    # bracket, "template" frames a template literal, "tag" frames a JSX tag
+    # being opened and "children" frames the children of a JSX element
+    frames: List[Tuple[str, int, str]] = [("code", 0, "")]
+    expression_allowed = True
+    i = 0
+    length = len(source)
+
+    while i < length:
+        kind, start, data = frames[-1]
+        char = source[i]
+
+        if kind == "template":
+            if char == "\\":
+                i += 2
+            elif char == "`":
+                frames.pop()
+                expression_allowed = False
+                i += 1
+            elif source.startswith("${", i):
+                frames.append(("code", i, "${"))
+                expression_allowed = True
+                i += 2
+            else:
+                i += 1
+            continue
+
+        if kind == "children":
+            if char == "{":
+                frames.append(("code", i, "{"))
+                expression_allowed = True
+                i += 1
+            elif char == "<":
+                if source.startswith("</", i):
+                    end = source.find(">", i)
+                    if end < 0:
+                        raise SyntaxCheckError(i, "Unterminated closing tag")
+                    name = source[i + 2 : end].strip()
+                    if name != data:
+                        raise SyntaxCheckError(
+                            i,
+                            f"Expected closing tag </{data}> for the element "
+                            f"opened at line {source.count(chr(10), 0, start) + 1}",
+                        )
+                    frames.pop()
+                    expression_allowed = False
+                    i = end + 1
+                else:
+                    frames.append(("tag", i, ""))
+                    i += 1
+            else:
+                i += 1
+            continue
+
+        if kind == "tag":
+            if not data:
+                # Name of the element, empty for a fragment
+                match = JSX_NAME.match(source, i)
+                frames[-1] = ("tag", start, match.group(0) or "<>")
+                i = match.end()
+                continue
+            if char.isspace():
+                i += 1
+            elif source.startswith("/>", i):
+                frames.pop()
+                expression_allowed = False
+                i += 2
+            elif char == ">":
+                frames[-1] = ("children", start, "" if data == "<>" else data)
+                i += 1
+            elif char == "{":
+                frames.append(("code", i, "{"))
+                expression_allowed = True
+                i += 1
+            elif char in "\"'":
+                # JSX attribute strings have no escapes and may span lines
+                end = source.find(char, i + 1)
+                if end < 0:
+                    raise SyntaxCheckError(i, "Unterminated attribute value")
+                i = end + 1
+            elif char == "<":
+                frames.append(("tag", i, ""))
+                i += 1
+            else:
+                match = WORD.match(source, i)
+                i = match.end() if match else i + 1
+            continue
+
+        # Code
+        if char.isspace():
+            i += 1
+        elif source.startswith("//", i) or source.startswith("/*", i):
+            i = _skip_comment(source, i)
+        elif char in "\"'":
+            i = _skip_quoted(source, i)
+            expression_allowed = False
+        elif char == "`":
+            frames.append(("template", i, ""))
+            i += 1
+        elif char in "([{":
+            frames.append(("code", i, char))
+            expression_allowed = True
+            i += 1
+        elif char in ")]}":
+            if len(frames) == 1 or CLOSERS[data] != char:
+                raise SyntaxCheckError(i, f"Unexpected '{char}'")
+            frames.pop()
+            # A block may be followed by a statement starting with a regex
+            # or JSX, a call or index by an operator
+            expression_allowed = char == "}" and frames[-1][0] == "code"
+            i += 1
+        elif char == "/":
+            if expression_allowed:
+                i = _skip_regex(source, i)
+                expression_allowed = False
+            else:
+                expression_allowed = True
+                i += 1
+        elif (
+            char == "<"
+            and expression_allowed
+            and (source[i + 1 : i + 2].isalpha() or source.startswith("<>", i))
+        ):
+            frames.append(("tag", i, ""))
+            i += 1
+        elif char.isalnum() or char in "_$":
+            match = WORD.match(source, i)
+            expression_allowed = match.group(0) in EXPRESSION_KEYWORDS
+            i = match.end()
+        else:
+            expression_allowed = True
+            # The second "<" of a shift is not an element
+            i += 2 if source.startswith("<<", i) else 1
+
+    if len(frames) > 1:
+        kind, start, data = frames[-1]
+        if kind == "template":
+            message = "Unterminated template literal"
+        elif kind == "code":
+            message = f"'{data}' is never closed"
+        else:
+            message = f"JSX element <{data or ''}> is never closed"
+        raise SyntaxCheckError(start, message)
+
+
+def check_dart_source(source: str) -> None:
+    """
+    Check that the strings, comments and brackets of a Dart source are
+    balanced.
+
+    Raises:
+        SyntaxCheckError: At the first unbalanced token
+    """
+    # Frames are ("code", start, opening bracket) or ("string", start,
+    # delimiter) for strings with interpolation
+    frames: List[Tuple[str, int, str]] = [("code", 0, "")]
+    i = 0
+    length = len(source)
+
+    while i < length:
+        kind, start, data = frames[-1]
+        char = source[i]
+
+        if kind == "string":
+            if char == "\\":
+                i += 2
+            elif source.startswith(data, i):
+                frames.pop()
+                i += len(data)
+            elif source.startswith("${", i):
+                frames.append(("code", i, "${"))
+                i += 2
+            elif char == "\n" and len(data) == 1:
+                raise SyntaxCheckError(start, "Unterminated string literal")
+            else:
+                i += 1
+            continue
+
+        if char.isspace():
+            i += 1
+        elif source.startswith("//", i) or source.startswith("/*", i):
+            i = _skip_comment(source, i, nested=True)
+        elif char in "\"'" or (
+            char == "r"
+            and source[i + 1 : i + 2] in ("'", '"')
+            and not (i and (source[i - 1].isalnum() or source[i - 1] == "_"))
+        ):
+            raw = char == "r"
+            quote_start = i + 1 if raw else i
+            quote = source[quote_start]
+            delimiter = (
+                quote * 3
+                if source.startswith(quote * 3, quote_start)
+                else quote
+            )
+            if raw:
+                end = source.find(delimiter, quote_start + len(delimiter))
+                if end < 0 or (
+                    len(delimiter) == 1 and "\n" in source[quote_start:end]
+                ):
+                    raise SyntaxCheckError(i, "Unterminated string literal")
+                i = end + len(delimiter)
+            else:
+                frames.append(("string", i, delimiter))
+                i = quote_start + len(delimiter)
+        elif char in "([{":
+            frames.append(("code", i, char))
+            i += 1
+        elif char in ")]}":
+            if len(frames) == 1 or CLOSERS[data] != char:
+                raise SyntaxCheckError(i, f"Unexpected '{char}'")
+            frames.pop()
+            i += 1
+        else:
+            match = WORD.match(source, i)
+            i = match.end() if match else i + 1
+
+    if len(frames) > 1:
+        kind, start, data = frames[-1]
+        if kind == "string":
+            raise SyntaxCheckError(start, "Unterminated string literal")
+        raise SyntaxCheckError(start, f"'{data}' is never closed")
+
+
+def check_file_syntax(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Check the syntax of one file with the tokenizer for its language.
+
+    Returns:
+        Dict with the file path, line, column and message of the first
+        error, or None if the file looks well formed or is not checked
+    """
+    if path.endswith(JS_EXTENSIONS):
+        check = check_js_source
+    elif path.endswith(DART_EXTENSIONS):
+        check = check_dart_source
+    else:
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            source = f.read()
+    except OSError:
+        return None
+
+    try:
+        check(source)
+    except SyntaxCheckError as e:
+        line_start = source.rfind("\n", 0, e.position) + 1
+        return {
+            "file_path": path,
+            "line": source.count("\n", 0, e.position) + 1,
+            "column": e.position - line_start + 1,
+            "message": e.message,
+        }
+    return None
+
+
+async def _esbuild_check(
+    esbuild_path: str, path: str, codebase_path: str
+) -> Optional[Dict[str, Any]]:
+    """Transform one JS file with esbuild and return its first error."""
+    with open(path, "rb") as f:
+        source = f.read()
+    process = await asyncio.create_subprocess_exec(
+        esbuild_path,
+        "--loader=jsx",
+        "--log-level=error",
+        "--color=false",
+        f"--sourcefile={os.path.relpath(path, codebase_path)}",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await asyncio.wait_for(
+            process.communicate(source), ESBUILD_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return None
+    if process.returncode == 0:
+        return None
+
+    output = stderr.decode("utf-8", errors="replace")
+    match = ESBUILD_ERROR.search(output)
+    return {
+        "file_path": path,
+        "line": int(match.group("line")) if match else None,
+        "column": int(match.group("column")) if match else None,
+        "message": match.group("message") if match else output.strip(),
+    }
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.SYNTAX_CHECK_WORKERS
+        )
+    return _executor
+
+
+def shutdown_syntax_checker() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def check_files_syntax(
+    file_paths: List[str], codebase_path: str
+) -> List[Dict[str, Any]]:
+    """
+    Check the syntax of written files concurrently.
+
+    JS files are transformed by the codebase's esbuild when it is
+    installed; the other files are checked by the tokenizers in a process
+    pool.
+
+    Args:
+        file_paths: Paths of the written files
+        codebase_path: Path to the codebase directory
+
+    Returns:
+        One error per broken file, with its path relative to the codebase
+    """
+    file_paths = [
+        path
+        for path in file_paths
+        if path.endswith(JS_EXTENSIONS + DART_EXTENSIONS)
+    ]
+    if not file_paths:
+        return []
+
+    esbuild_path = os.path.join(codebase_path, ESBUILD_BIN)
+    use_esbuild = os.access(esbuild_path, os.X_OK)
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+
+    tasks = []
+    for path in file_paths:
+        if use_esbuild and path.endswith(JS_EXTENSIONS):
+            tasks.append(_esbuild_check(esbuild_path, path, codebase_path))
+        else:
+            tasks.append(
+                loop.run_in_executor(executor, check_file_syntax, path)
+            )
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = []
+    for result in results:
+        if isinstance(result, dict):
+            result["file_path"] = (
+                codebase_relative_path(result["file_path"], codebase_path)
+                or result["file_path"]
+            )
+            errors.append(result)
+    return errors
+
+
+if __name__ == "__main__":
+    # python -m system.backend.agentic_workflow.app.utils.syntax_check FILE...
+    import sys
+
+    for file_path in sys.argv[1:]:
+        error = check_file_syntax(file_path)
+        if error:
+            print(
+                f"{file_path}:{error['line']}:{error['column']}: "
+                f"{error['message']}"
+            )
+        else:
+            print(f"{file_path}: ok")
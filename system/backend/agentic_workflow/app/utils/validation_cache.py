@@ -0,0 +1,140 @@
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from system.backend.agentic_workflow.app.utils.source_hash import (
+    get_source_tree,
+)
+
+MAX_CACHED_RESULTS = 64
+# Only results that depend on the code alone are cached, not timeouts or
+# failures to run the command
+CACHEABLE_STATUSES = ("success", "error")
+
+_toolchain_versions: Dict[str, str] = {}
+
+
+async def get_toolchain_version(version_command: Optional[str]) -> str:
+    """Output of the toolchain's version command, run once per process."""
+    if not version_command:
+        return ""
+    version = _toolchain_versions.get(version_command)
+    if version is None:
+        try:
+            process = await asyncio.create_subprocess_shell(
+                version_command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await asyncio.wait_for(process.communicate(), 60)
+            version = stdout.decode("utf-8", errors="replace").strip()
+        except Exception:
+            # Unknown versions are not remembered, so they are retried
+            return "unknown"
+        _toolchain_versions[version_command] = version
+    return version
+
+
+def _input_digest(codebase_path: str, rel_path: str) -> Optional[str]:
+    """Hash of a file or directory of the codebase, None if it is missing."""
+    path = os.path.join(codebase_path, rel_path)
+    if os.path.isdir(path):
+        return get_source_tree(path).digest()
+    return get_source_tree(codebase_path).file_digest(rel_path)
+
+
+class ValidationCache:
+    """
+    Last result of each validation command per codebase, keyed by the hash
+    of the command's inputs: the whole source tree by default, or only the
+    files listed in the command's cache_inputs (e.g. pubspec.yaml for
+    flutter pub get), plus the files and directories listed in its
+    dependency_inputs (installed package state...), which the source tree
+    skips, and the command and toolchain version.
+
+    Failures that were not established by a complete run (a build stopped
+    early on its first fatal error, or served by the build daemon) are not
+    cached.
+    """
+
+    def __init__(self, max_results: int):
+        self.max_results = max_results
+        self._results: (
+            "OrderedDict[Tuple[str, str], Tuple[str, Dict[str, Any]]]"
+        ) = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def compute_key(
+        self, command_info: Dict[str, Any], codebase_path: str
+    ) -> Optional[str]:
+        """
+        Hash the inputs of a validation command.
+
+        Returns:
+            The cache key, or None if the command's outputs are missing and
+            it has to run anyway
+        """
+        for output in command_info.get("cache_outputs", []):
+            if not os.path.exists(os.path.join(codebase_path, output)):
+                return None
+
+        tree = get_source_tree(codebase_path)
+        inputs = command_info.get("cache_inputs")
+        if inputs:
+            digests = [
+                await asyncio.to_thread(tree.file_digest, path)
+                for path in inputs
+            ]
+        else:
+            digests = [await asyncio.to_thread(tree.digest)]
+        for path in command_info.get("dependency_inputs", []):
+            digests.append(
+                await asyncio.to_thread(_input_digest, codebase_path, path)
+            )
+
+        toolchain_version = await get_toolchain_version(
+            command_info.get("version_command")
+        )
+        key_data = json.dumps(
+            [command_info["command"], toolchain_version, digests]
+        )
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def get(
+        self, codebase_path: str, command: str, key: str
+    ) -> Optional[Dict[str, Any]]:
+        entry_key = (os.path.abspath(codebase_path), command)
+        with self._lock:
+            entry = self._results.get(entry_key)
+            if entry is None or entry[0] != key:
+                return None
+            self._results.move_to_end(entry_key)
+            return copy.deepcopy(entry[1])
+
+    def put(
+        self,
+        codebase_path: str,
+        command: str,
+        key: str,
+        result: Dict[str, Any],
+    ) -> None:
+        if result.get("status") not in CACHEABLE_STATUSES:
+            return
+        if result.get("has_errors") and (
+            result.get("aborted_early") or result.get("build_daemon")
+        ):
+            return
+        entry_key = (os.path.abspath(codebase_path), command)
+        with self._lock:
+            self._results[entry_key] = (key, copy.deepcopy(result))
+            self._results.move_to_end(entry_key)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+
+validation_cache = ValidationCache(max_results=MAX_CACHED_RESULTS)
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from contextlib import asynccontextmanager
 
@@ -17,16 +18,38 @@ from system.backend.agentic_workflow.app.apis.ide_agent_route import (
 from system.backend.agentic_workflow.app.apis.initial_processing_route import (
     router as initial_processing_router,
 )
-from system.backend.agentic_workflow.app.config.database import mongodb_database
+from system.backend.agentic_workflow.app.config.database import (
+    error_sink,
+    llm_usage_sink,
+    mongodb_database,
+)
+from system.backend.agentic_workflow.app.utils.build_daemon import (
+    build_daemon_pool,
+)
+from system.backend.agentic_workflow.app.utils.file_writer import (
+    shutdown_file_writer,
+)
 from system.backend.agentic_workflow.app.utils.session_context import (
     session_state,
 )
+from system.backend.agentic_workflow.app.utils.syntax_check import (
+    shutdown_syntax_checker,
+)
 
 
 @asynccontextmanager
 async def db_lifespan(app: FastAPI):
     mongodb_database.connect()
+    await error_sink.start()
+    await llm_usage_sink.start()
+    reaper = asyncio.create_task(build_daemon_pool.run_reaper())
     yield
+    reaper.cancel()
+    await build_daemon_pool.shutdown()
+    shutdown_syntax_checker()
+    shutdown_file_writer()
+    await error_sink.stop()
+    await llm_usage_sink.stop()
     mongodb_database.disconnect()
 
 
@@ -0,0 +1,40 @@
+import asyncio
+
+from system.backend.agentic_workflow.app.utils.build_daemon import BuildDaemon
+
+
+async def _build_with_watcher(codebase_path, script):
+    daemon = BuildDaemon("session", str(codebase_path), script)
+    await daemon.start()
+    try:
+        first = await daemon.build(timeout_seconds=10)
+        await asyncio.sleep(1.5)
+        second = await daemon.build(timeout_seconds=10)
+    finally:
+        await daemon.stop()
+    return first, second
+
+
+def test_warning_then_success_is_not_a_failure(tmp_path):
+    script = (
+        "echo 'build started...'; echo '[vite:css] unknown at rule'; "
+        "sleep 1; echo 'built in 1.20s'; sleep 30"
+    )
+
+    first, second = asyncio.run(_build_with_watcher(tmp_path, script))
+
+    # A quiet period alone never yields a failure: the caller builds cold
+    assert first is None or first["exit_code"] == 0
+    assert second["exit_code"] == 0
+
+
+def test_presumed_failure_falls_back_to_a_cold_build(tmp_path):
+    script = (
+        "echo 'build started...'; "
+        'echo \'Could not resolve "./X" from "src/App.jsx"\'; sleep 30'
+    )
+
+    first, second = asyncio.run(_build_with_watcher(tmp_path, script))
+
+    assert first is None
+    assert second is None
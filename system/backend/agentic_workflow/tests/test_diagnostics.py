@@ -0,0 +1,79 @@
+import re
+
+from system.backend.agentic_workflow.app.utils.diagnostics import (
+    _synthetic_log,
+    extract_diagnostics,
+)
+
+ERROR_PATTERNS = [r"error", r"\[ERROR\]", r"Failed to resolve import"]
+
+VITE_OUTPUT = """vite v5.0.0 building for production...
+transforming...
+[vite:esbuild] src/pages/Home.jsx:12:5: ERROR: Unexpected "}"
+    at transform (node_modules/vite/dist/node/chunks/dep.js:1:1)
+[vite:esbuild] src/pages/Home.jsx:12:5: ERROR: Unexpected "}"
+(!) Some chunks are larger than 500 kB: warning only
+Build failed in 1.20s
+"""
+
+
+def test_errors_carry_location_tool_and_context():
+    result = extract_diagnostics(VITE_OUTPUT, ERROR_PATTERNS, "npm run build")
+
+    assert result["has_critical_errors"]
+    first = result["diagnostics"][0]
+    assert first["file_path"] == "src/pages/Home.jsx"
+    assert (first["file_line"], first["column"]) == (12, 5)
+    assert first["line_number"] == 3
+    assert first["tool"] == "vite"
+    assert first["severity"] == "error"
+    assert first["context"]["before"] == [
+        "vite v5.0.0 building for production...",
+        "transforming...",
+    ]
+
+
+def test_repeated_errors_are_reported_once():
+    result = extract_diagnostics(VITE_OUTPUT, ERROR_PATTERNS, "npm run build")
+
+    lines = [diagnostic["line_number"] for diagnostic in result["diagnostics"]]
+    assert 5 not in lines
+    assert lines == sorted(lines)
+
+
+def test_critical_line_without_error_pattern_only_sets_the_flag():
+    result = extract_diagnostics(
+        "compiling\nModule not found: ./Missing\n", [r"\[ERROR\]"], "npm"
+    )
+
+    assert result == {"diagnostics": [], "has_critical_errors": True}
+
+
+def test_clean_output_has_no_diagnostics():
+    result = extract_diagnostics(
+        "vite v5.0.0 building for production...\nbuilt in 1.20s\n",
+        ERROR_PATTERNS,
+        "npm run build",
+    )
+
+    assert result == {"diagnostics": [], "has_critical_errors": False}
+
+
+def test_same_lines_as_a_per_line_scan():
+    output = _synthetic_log(2000)
+    error_patterns = [r"Error:", r"isn't defined"]
+
+    result = extract_diagnostics(output, error_patterns, "flutter build web")
+
+    compiled = [
+        re.compile(pattern, re.IGNORECASE) for pattern in error_patterns
+    ]
+    expected = [
+        index + 1
+        for index, line in enumerate(output.split("\n"))
+        if any(pattern.search(line) for pattern in compiled)
+    ]
+    assert [
+        diagnostic["line_number"] for diagnostic in result["diagnostics"]
+    ] == expected
+    assert result["has_critical_errors"]
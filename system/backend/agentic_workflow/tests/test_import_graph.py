@@ -0,0 +1,85 @@
+import json
+
+from system.backend.agentic_workflow.app.utils.import_graph import (
+    check_import_graph,
+)
+
+
+def _write_project(root, files):
+    (root / "package.json").write_text(
+        json.dumps({"dependencies": {"react": "^18.0.0"}})
+    )
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def test_typescript_and_generator_exports_are_recognised(tmp_path):
+    _write_project(
+        tmp_path,
+        {
+            "src/types.ts": (
+                "export interface User { id: string }\n"
+                "export type Id = string;\n"
+                "export enum Role { Admin, User }\n"
+                "export const enum Size { Small }\n"
+                "export declare const VERSION: string;\n"
+                "export abstract class Repository {}\n"
+                "export namespace Api {}\n"
+                "export function *ids() { yield 1; }\n"
+                "export async function load() {}\n"
+                "type Local = number;\n"
+                "export type { Local };\n"
+            ),
+            "src/main.tsx": (
+                "import React from 'react';\n"
+                "import { User, Id, Role, Size, VERSION } from './types';\n"
+                "import { Repository, Api, ids, load, Local } from './types';\n"
+            ),
+        },
+    )
+
+    assert check_import_graph(str(tmp_path)) == []
+
+
+def test_missing_exports_and_files_are_errors(tmp_path):
+    _write_project(
+        tmp_path,
+        {
+            "src/util.js": "export const used = 1;\n",
+            "src/main.jsx": (
+                "import { used, missing } from './util';\n"
+                "import Gone from './Gone';\n"
+                "import leftPad from 'left-pad';\n"
+            ),
+        },
+    )
+
+    errors = check_import_graph(str(tmp_path))
+
+    assert [(error["line_number"], error["severity"]) for error in errors] == [
+        (1, "error"),
+        (2, "error"),
+        (3, "error"),
+    ]
+    assert '"missing" is not exported by' in errors[0]["message"]
+
+
+def test_public_assets_resolve_and_missing_assets_are_warnings(tmp_path):
+    _write_project(
+        tmp_path,
+        {
+            "public/vite.svg": "<svg/>",
+            "src/main.jsx": (
+                "import viteLogo from '/vite.svg';\n"
+                "import logo from './logo.png';\n"
+            ),
+        },
+    )
+
+    errors = check_import_graph(str(tmp_path))
+
+    assert [(error["import"], error["severity"]) for error in errors] == [
+        ("./logo.png", "warning")
+    ]
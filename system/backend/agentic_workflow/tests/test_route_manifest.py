@@ -0,0 +1,45 @@
+from system.backend.agentic_workflow.app.utils.route_manifest import (
+    RouteManifest,
+)
+from system.backend.agentic_workflow.app.utils.routes_generator import (
+    RoutesGenerator,
+)
+
+
+def _add_page(codebase, name):
+    page_dir = codebase / "src" / "pages" / name
+    page_dir.mkdir(parents=True)
+    (page_dir / "index.jsx").write_text("export default () => null;\n")
+
+
+def _page_names(codebase, manifest):
+    pages = RoutesGenerator(str(codebase / "src"), manifest)
+    return sorted(page["name"] for page in pages.analyze_pages_structure())
+
+
+def test_pages_are_scanned_once_then_recorded(tmp_path):
+    codebase = tmp_path / "codebase"
+    _add_page(codebase, "home")
+    manifest = RouteManifest(str(codebase))
+
+    assert _page_names(codebase, manifest) == ["home"]
+
+    # Written without being recorded: not scanned again
+    _add_page(codebase, "cart")
+    assert _page_names(codebase, manifest) == ["home"]
+
+    manifest.add_entries("pages", {"cart": {}})
+    assert _page_names(codebase, manifest) == ["cart", "home"]
+
+
+def test_invalidation_rescans_the_pages(tmp_path):
+    codebase = tmp_path / "codebase"
+    _add_page(codebase, "home")
+    manifest = RouteManifest(str(codebase))
+    _page_names(codebase, manifest)
+
+    _add_page(codebase, "cart")
+    manifest.invalidate()
+
+    assert _page_names(codebase, manifest) == ["cart", "home"]
+    assert (tmp_path / "project_context" / "route_manifest.json").exists()
@@ -0,0 +1,109 @@
+import asyncio
+import re
+
+import pytest
+
+from system.backend.agentic_workflow.app.utils.syntax_check import (
+    SyntaxCheckError,
+    check_dart_source,
+    check_file_syntax,
+    check_files_syntax,
+    check_js_source,
+    shutdown_syntax_checker,
+)
+
+VALID_JSX = """import React from 'react';
+
+const pattern = /[}{]+/g;
+const label = `Total: ${items.map((item) => `${item.price}`).join(', ')}`;
+
+export default function Cart({ items }) {
+  // Braces in comments and strings are not code: { ( [
+  const empty = items.length === 0 ? '}' : "{";
+  return (
+    <div className="cart" data-title='a > b'>
+      {empty && <p>No items</p>}
+      <>
+        {items.map((item) => (
+          <Item key={item.id} {...item} />
+        ))}
+      </>
+    </div>
+  );
+}
+"""
+
+
+def test_valid_jsx_passes():
+    check_js_source(VALID_JSX)
+
+
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ("function App() {\n  return 1;\n", "'{' is never closed"),
+        ("const a = [1, 2);\n", "Unexpected ')'"),
+        ("const s = 'unterminated;\n", "Unterminated string literal"),
+        ("const t = `open ${value}", "Unterminated template literal"),
+        ("/* never closed\nconst a = 1;\n", "Unterminated comment"),
+        (
+            "const a = () => <div><span></div>;\n",
+            "Expected closing tag </span>",
+        ),
+        ("const a = () => <div>\n", "JSX element <div> is never closed"),
+    ],
+)
+def test_broken_js_is_reported(source, message):
+    with pytest.raises(SyntaxCheckError, match=re.escape(message)):
+        check_js_source(source)
+
+
+def test_division_and_comparisons_are_not_regexes_or_elements():
+    check_js_source("const a = b / c / d;\nconst e = f < g && h > i;\n")
+    check_js_source("const bits = 1 << 4;\n")
+
+
+def test_dart_strings_and_brackets():
+    check_dart_source(
+        "class A extends StatelessWidget {\n"
+        "  final s = 'it\\'s ${name.length} {';\n"
+        "  final r = r'C:\\path\\{';\n"
+        "  final m = '''\n  multi { line\n''';\n"
+        "  /* nested /* comment */ still comment */\n"
+        "}\n"
+    )
+    with pytest.raises(SyntaxCheckError, match="Unexpected '}'"):
+        check_dart_source("void main() {\n  print(1;\n}\n")
+
+
+def test_file_errors_have_line_and_column(tmp_path):
+    path = tmp_path / "App.jsx"
+    path.write_text("const a = 1;\nconst b = [1, 2);\n")
+
+    assert check_file_syntax(str(path)) == {
+        "file_path": str(path),
+        "line": 2,
+        "column": 16,
+        "message": "Unexpected ')'",
+    }
+    assert check_file_syntax(str(tmp_path / "notes.md")) is None
+
+
+def test_files_are_checked_in_the_pool(tmp_path):
+    good = tmp_path / "src" / "Good.jsx"
+    bad = tmp_path / "lib" / "bad.dart"
+    good.parent.mkdir()
+    bad.parent.mkdir()
+    good.write_text(VALID_JSX)
+    bad.write_text("void main() {\n")
+
+    try:
+        errors = asyncio.run(
+            check_files_syntax([str(good), str(bad)], str(tmp_path))
+        )
+    finally:
+        shutdown_syntax_checker()
+
+    assert [(error["file_path"], error["line"]) for error in errors] == [
+        ("lib/bad.dart", 1)
+    ]
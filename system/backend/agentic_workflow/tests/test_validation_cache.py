@@ -0,0 +1,72 @@
+import asyncio
+import os
+
+from system.backend.agentic_workflow.app.utils.source_hash import (
+    SourceHashTree,
+)
+from system.backend.agentic_workflow.app.utils.validation_cache import (
+    ValidationCache,
+)
+
+
+def _write(root, rel_path, content):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    # Same size, so only a newer mtime tells the rewrite apart
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_generated_sources_and_web_are_build_inputs(tmp_path):
+    _write(tmp_path, "lib/user.g.dart", "a")
+    _write(tmp_path, "web/index.html", "a")
+    _write(tmp_path, "pubspec.lock", "a")
+    tree = SourceHashTree(str(tmp_path))
+
+    digests = [tree.digest()]
+    for rel_path in ("lib/user.g.dart", "web/index.html", "pubspec.lock"):
+        _write(tmp_path, rel_path, "b")
+        digests.append(tree.digest())
+
+    assert len(set(digests)) == len(digests)
+
+
+def test_build_outputs_and_packages_are_not_build_inputs(tmp_path):
+    _write(tmp_path, "src/App.jsx", "a")
+    tree = SourceHashTree(str(tmp_path))
+    digest = tree.digest()
+
+    _write(tmp_path, "node_modules/react/index.js", "a")
+    _write(tmp_path, "dist/index.html", "a")
+    _write(tmp_path, ".dart_tool/package_config.json", "a")
+
+    assert tree.digest() == digest
+
+
+def test_key_covers_dependency_inputs(tmp_path):
+    _write(tmp_path, "src/App.jsx", "a")
+    cache = ValidationCache(max_results=4)
+    command_info = {
+        "command": "npm run build",
+        "dependency_inputs": ["node_modules/.package-lock.json"],
+    }
+
+    before = asyncio.run(cache.compute_key(command_info, str(tmp_path)))
+    _write(tmp_path, "node_modules/.package-lock.json", "{}")
+    after = asyncio.run(cache.compute_key(command_info, str(tmp_path)))
+
+    assert before != after
+
+
+def test_incomplete_failures_are_not_cached(tmp_path):
+    cache = ValidationCache(max_results=4)
+    failure = {"status": "error", "has_errors": True}
+
+    cache.put(str(tmp_path), "build", "key", {**failure, "build_daemon": True})
+    cache.put(str(tmp_path), "lint", "key", {**failure, "aborted_early": True})
+    cache.put(str(tmp_path), "test", "key", failure)
+
+    assert cache.get(str(tmp_path), "build", "key") is None
+    assert cache.get(str(tmp_path), "lint", "key") is None
+    assert cache.get(str(tmp_path), "test", "key") == failure
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from system.backend.tools.app.controllers.batch_tools.batch_controller import (
+    BatchController,
+)
+from system.backend.tools.app.models.schemas.batch_schemas import BatchRequest
+from system.backend.tools.app.utils.error_handler import handle_exceptions
+
+router = APIRouter()
+
+
+@router.post("/batch")
+@handle_exceptions
+async def batch(
+    request: BatchRequest,
+    batch_controller: BatchController = Depends(),
+):
+    return await batch_controller.execute(request)
@@ -3,11 +3,15 @@ from fastapi import APIRouter, Depends
 from system.backend.tools.app.controllers.modification_tools.edit_file_controller import (
     EditFileController,
 )
+from system.backend.tools.app.controllers.modification_tools.edit_files_controller import (
+    EditFilesController,
+)
 from system.backend.tools.app.controllers.modification_tools.search_replace_controller import (
     SearchReplaceController,
 )
 from system.backend.tools.app.models.schemas.modification_schemas import (
     EditFileRequest,
+    EditFilesRequest,
     SearchReplaceRequest,
 )
 from system.backend.tools.app.utils.error_handler import handle_exceptions
@@ -31,3 +35,12 @@ async def edit_file(
     edit_file_controller: EditFileController = Depends(),
 ):
     return await edit_file_controller.execute(request)
+
+
+@router.post("/edit-files")
+@handle_exceptions
+async def edit_files(
+    request: EditFilesRequest,
+    edit_files_controller: EditFilesController = Depends(),
+):
+    return await edit_files_controller.execute(request)
@@ -1,11 +1,18 @@
 from fastapi import APIRouter, Depends
 
+from system.backend.tools.app.controllers.environment_tools.background_process_controller import (
+    BackgroundProcessController,
+)
 from system.backend.tools.app.controllers.environment_tools.run_terminal_cmd_controller import (
     RunTerminalCmdController,
 )
 from system.backend.tools.app.models.schemas.run_terminal_command_schema import (
+    ListProcessesRequest,
+    ProcessLogsRequest,
+    ProcessRequest,
     RunTerminalCommandRequest,
 )
+from system.backend.tools.app.utils.error_handler import handle_exceptions
 
 router = APIRouter()
 
@@ -16,3 +23,39 @@ async def run_terminal_cmd(
     run_terminal_cmd_controller: RunTerminalCmdController = Depends(),
 ):
     return await run_terminal_cmd_controller.run_terminal_cmd(request)
+
+
+@router.post("/list-processes")
+@handle_exceptions
+async def list_processes(
+    request: ListProcessesRequest,
+    background_process_controller: BackgroundProcessController = Depends(),
+):
+    return await background_process_controller.list_processes(request)
+
+
+@router.post("/process-status")
+@handle_exceptions
+async def process_status(
+    request: ProcessRequest,
+    background_process_controller: BackgroundProcessController = Depends(),
+):
+    return await background_process_controller.process_status(request)
+
+
+@router.post("/process-logs")
+@handle_exceptions
+async def read_process_logs(
+    request: ProcessLogsRequest,
+    background_process_controller: BackgroundProcessController = Depends(),
+):
+    return await background_process_controller.read_process_logs(request)
+
+
+@router.post("/kill-process")
+@handle_exceptions
+async def kill_process(
+    request: ProcessRequest,
+    background_process_controller: BackgroundProcessController = Depends(),
+):
+    return await background_process_controller.kill_process(request)
@@ -2,6 +2,8 @@ from fastapi import HTTPException, status
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from system.backend.tools.app.config.settings import settings
+from system.backend.tools.app.utils.logger import loggers
+from system.backend.tools.app.utils.write_behind_sink import WriteBehindSink
 
 
 class MongoDB:
@@ -73,3 +75,21 @@ class MongoDB:
 
 # Instantiate the MongoDB class
 mongodb_database = MongoDB(settings.MONGODB_URL)
+
+# Errors and LLM usage are written in the background, in batches
+error_sink = WriteBehindSink(
+    "error",
+    mongodb_database.get_error_collection,
+    max_batch_size=settings.TELEMETRY_BATCH_SIZE,
+    flush_interval_seconds=settings.TELEMETRY_FLUSH_INTERVAL_SECONDS,
+    max_queue_size=settings.TELEMETRY_MAX_QUEUE_SIZE,
+    logger=loggers["telemetry"],
+)
+llm_usage_sink = WriteBehindSink(
+    "llm usage",
+    mongodb_database.get_llm_usage_collection,
+    max_batch_size=settings.TELEMETRY_BATCH_SIZE,
+    flush_interval_seconds=settings.TELEMETRY_FLUSH_INTERVAL_SECONDS,
+    max_queue_size=settings.TELEMETRY_MAX_QUEUE_SIZE,
+    logger=loggers["telemetry"],
+)
@@ -8,12 +8,55 @@ class Settings(BaseSettings):
     MONGODB_DB_NAME: str = "velocity_tools"
     ERROR_COLLECTION_NAME: str = "error_logs"
     LLM_USAGE_COLLECTION_NAME: str = "llm_usage_logs"
+    # Error and LLM usage documents are written in batches in the background
+    TELEMETRY_BATCH_SIZE: int = 100
+    TELEMETRY_FLUSH_INTERVAL_SECONDS: float = 2.0
+    TELEMETRY_MAX_QUEUE_SIZE: int = 10000
+
+    # Logging settings; with LOG_LEVEL=DEBUG only one in LOG_DEBUG_SAMPLE_RATE
+    # debug records is written
+    LOG_LEVEL: str = "INFO"
+    LOG_DEBUG_SAMPLE_RATE: int = 1
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
 
     # Relace API settings
     RELACE_API_KEY: str = "dummy_key"
     RELACE_API_URL: str = (
         "https://instantapply.endpoint.relace.run/v1/code/apply"
     )
+    # Merge edit snippets locally and only call Relace when anchoring is ambiguous
+    LOCAL_FAST_APPLY_ENABLED: bool = True
+
+    # Codebase search index settings
+    SEARCH_INDEX_ENABLED: bool = True
+    SEARCH_INDEX_MAX_CODEBASES: int = 8
+    SEARCH_INDEX_IDLE_SECONDS: int = 1800
+    # Shared with the agentic workflow, which records the files it generates
+    FILE_CHANGE_JOURNAL_PATH: str = "artifacts/.file_changes.log"
+
+    # File read cache settings
+    FILE_READ_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    FILE_READ_CACHE_MAX_FILE_BYTES: int = 8 * 1024 * 1024
+
+    # Foreground command settings; the timeout stays below the agent's read
+    # timeout so it receives the partial output instead of an HTTP error
+    TERMINAL_COMMAND_TIMEOUT_SECONDS: int = 110
+    TERMINAL_OUTPUT_MAX_BYTES: int = 64 * 1024
+    # Output chunks a streaming command buffers for a slow client
+    TERMINAL_STREAM_MAX_CHUNKS: int = 128
+
+    # Background process settings
+    BACKGROUND_PROCESS_LOG_DIR: str = "artifacts/.processes"
+    BACKGROUND_PROCESS_LOG_MAX_BYTES: int = 2 * 1024 * 1024
+    BACKGROUND_PROCESS_MAX_PER_SESSION: int = 3
+    # Processes of a session are killed after this long without tool use
+    BACKGROUND_PROCESS_SESSION_TTL_SECONDS: int = 3600
+    BACKGROUND_PROCESS_KILL_GRACE_SECONDS: float = 5.0
+    # Exited processes are forgotten this long after their final logs were
+    # read, or after the retention time at the latest
+    BACKGROUND_PROCESS_READ_GRACE_SECONDS: int = 120
+    BACKGROUND_PROCESS_EXITED_RETENTION_SECONDS: int = 600
 
     class Config:
         env_file = ".env"
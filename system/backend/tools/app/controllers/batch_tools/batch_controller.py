@@ -0,0 +1,228 @@
+from typing import Dict
+
+from fastapi import Depends, status
+from fastapi.responses import JSONResponse
+
+from system.backend.tools.app.controllers.environment_tools.background_process_controller import (
+    BackgroundProcessController,
+)
+from system.backend.tools.app.controllers.environment_tools.run_terminal_cmd_controller import (
+    RunTerminalCmdController,
+)
+from system.backend.tools.app.controllers.file_access_tools.directory_list_controller import (
+    DirectoryListController,
+)
+from system.backend.tools.app.controllers.file_access_tools.exit_tool_controller import (
+    ExitToolController,
+)
+from system.backend.tools.app.controllers.file_access_tools.file_deletion_controller import (
+    FileDeletionController,
+)
+from system.backend.tools.app.controllers.file_access_tools.file_read_controller import (
+    FileReadController,
+)
+from system.backend.tools.app.controllers.file_access_tools.file_search_controller import (
+    FileSearchController,
+)
+from system.backend.tools.app.controllers.modification_tools.edit_file_controller import (
+    EditFileController,
+)
+from system.backend.tools.app.controllers.modification_tools.edit_files_controller import (
+    EditFilesController,
+)
+from system.backend.tools.app.controllers.modification_tools.search_replace_controller import (
+    SearchReplaceController,
+)
+from system.backend.tools.app.controllers.search_tools.grep_search_controller import (
+    GrepSearchController,
+)
+from system.backend.tools.app.models.schemas.batch_schemas import BatchRequest
+from system.backend.tools.app.models.schemas.file_access_schemas import (
+    DirectoryListRequest,
+    ExitToolRequest,
+    FileReadRequest,
+    FilesDeleteRequest,
+    FileSearchRequest,
+)
+from system.backend.tools.app.models.schemas.grep_search_query_schema import (
+    GrepSearchQueryRequest,
+)
+from system.backend.tools.app.models.schemas.modification_schemas import (
+    EditFileRequest,
+    EditFilesRequest,
+    SearchReplaceRequest,
+)
+from system.backend.tools.app.models.schemas.run_terminal_command_schema import (
+    ListProcessesRequest,
+    ProcessLogsRequest,
+    ProcessRequest,
+    RunTerminalCommandRequest,
+)
+from system.backend.tools.app.repositories.error_repo import ErrorRepo
+from system.backend.tools.app.repositories.llm_usage_repo import (
+    LLMUsageRepository,
+)
+from system.backend.tools.app.services.file_access_tools.directory_list_service import (
+    DirectoryListService,
+)
+from system.backend.tools.app.services.file_access_tools.exit_tool_service import (
+    ExitToolService,
+)
+from system.backend.tools.app.services.file_access_tools.file_deletion_service import (
+    FileDeletionService,
+)
+from system.backend.tools.app.services.file_access_tools.file_read_service import (
+    FileReadService,
+)
+from system.backend.tools.app.services.file_access_tools.file_search_service import (
+    FileSearchService,
+)
+from system.backend.tools.app.services.modification_tools.edit_file_service import (
+    EditFileService,
+)
+from system.backend.tools.app.services.modification_tools.search_replace_service import (
+    SearchReplaceService,
+)
+from system.backend.tools.app.usecases.batch_tools.batch_usecase import (
+    BatchUsecase,
+    ToolHandler,
+)
+from system.backend.tools.app.usecases.environment_tools.background_process_usecase import (
+    BackgroundProcessUsecase,
+)
+from system.backend.tools.app.usecases.environment_tools.run_terminal_cmd_usecase import (
+    RunTerminalCmdUsecase,
+)
+from system.backend.tools.app.usecases.file_access_tools.directory_list_usecase import (
+    DirectoryListUseCase,
+)
+from system.backend.tools.app.usecases.file_access_tools.exit_tool_usecase import (
+    ExitToolUseCase,
+)
+from system.backend.tools.app.usecases.file_access_tools.file_deletion_usecase import (
+    FileDeletionUseCase,
+)
+from system.backend.tools.app.usecases.file_access_tools.file_read_usecase import (
+    FileReadUseCase,
+)
+from system.backend.tools.app.usecases.file_access_tools.file_search_usecase import (
+    FileSearchUseCase,
+)
+from system.backend.tools.app.usecases.modification_tools.edit_file_usecase import (
+    EditFileUsecase,
+)
+from system.backend.tools.app.usecases.modification_tools.edit_files_usecase import (
+    EditFilesUsecase,
+)
+from system.backend.tools.app.usecases.modification_tools.search_replace_usecase import (
+    SearchReplaceUseCase,
+)
+from system.backend.tools.app.usecases.search_tools.grep_search_usecase import (
+    GrepSearchUsecase,
+)
+
+
+class BatchController:
+    def __init__(
+        self,
+        batch_usecase: BatchUsecase = Depends(BatchUsecase),
+        error_repo: ErrorRepo = Depends(),
+        llm_usage_repo: LLMUsageRepository = Depends(),
+    ):
+        self.batch_usecase = batch_usecase
+        # The calls of a batch run through the same controllers as their
+        # endpoints, sharing the repositories of the batch request
+        background_process_controller = BackgroundProcessController(
+            BackgroundProcessUsecase()
+        )
+        self.handlers: Dict[str, ToolHandler] = {
+            "/read-file": (
+                FileReadRequest,
+                FileReadController(
+                    FileReadUseCase(FileReadService(error_repo))
+                ).execute,
+            ),
+            "/delete-file": (
+                FilesDeleteRequest,
+                FileDeletionController(
+                    FileDeletionUseCase(FileDeletionService(error_repo))
+                ).execute,
+            ),
+            "/list-directory": (
+                DirectoryListRequest,
+                DirectoryListController(
+                    DirectoryListUseCase(DirectoryListService(error_repo))
+                ).execute,
+            ),
+            "/search-files": (
+                FileSearchRequest,
+                FileSearchController(
+                    FileSearchUseCase(FileSearchService(error_repo))
+                ).execute,
+            ),
+            "/exit-tool": (
+                ExitToolRequest,
+                ExitToolController(
+                    ExitToolUseCase(ExitToolService(error_repo))
+                ).execute,
+            ),
+            "/edit-file": (
+                EditFileRequest,
+                EditFileController(
+                    EditFileUsecase(EditFileService(error_repo, llm_usage_repo))
+                ).execute,
+            ),
+            "/edit-files": (
+                EditFilesRequest,
+                EditFilesController(
+                    EditFilesUsecase(
+                        EditFileService(error_repo, llm_usage_repo)
+                    )
+                ).execute,
+            ),
+            "/search-replace": (
+                SearchReplaceRequest,
+                SearchReplaceController(
+                    SearchReplaceUseCase(SearchReplaceService(error_repo))
+                ).execute,
+            ),
+            "/grep-search": (
+                GrepSearchQueryRequest,
+                GrepSearchController(
+                    GrepSearchUsecase(error_repo)
+                ).process_grep_query,
+            ),
+            "/run-terminal-cmd": (
+                RunTerminalCommandRequest,
+                RunTerminalCmdController(
+                    RunTerminalCmdUsecase()
+                ).run_terminal_cmd,
+            ),
+            "/list-processes": (
+                ListProcessesRequest,
+                background_process_controller.list_processes,
+            ),
+            "/process-status": (
+                ProcessRequest,
+                background_process_controller.process_status,
+            ),
+            "/process-logs": (
+                ProcessLogsRequest,
+                background_process_controller.read_process_logs,
+            ),
+            "/kill-process": (
+                ProcessRequest,
+                background_process_controller.kill_process,
+            ),
+        }
+
+    async def execute(self, request: BatchRequest):
+        result = await self.batch_usecase.execute(request.calls, self.handlers)
+        return JSONResponse(
+            content={
+                "data": result,
+                "message": "Batch executed successfully",
+                "error": None,
+            },
+            status_code=status.HTTP_200_OK,
+        )
@@ -0,0 +1,73 @@
+from fastapi import Depends, status
+from fastapi.responses import JSONResponse
+
+from system.backend.tools.app.models.schemas.run_terminal_command_schema import (
+    ListProcessesRequest,
+    ProcessLogsRequest,
+    ProcessRequest,
+)
+from system.backend.tools.app.usecases.environment_tools.background_process_usecase import (
+    BackgroundProcessUsecase,
+)
+
+
+class BackgroundProcessController:
+    def __init__(
+        self,
+        background_process_usecase: BackgroundProcessUsecase = Depends(
+            BackgroundProcessUsecase
+        ),
+    ):
+        self.background_process_usecase = background_process_usecase
+
+    async def list_processes(self, request: ListProcessesRequest):
+        result = await self.background_process_usecase.list_processes(
+            request.session_id
+        )
+        return JSONResponse(
+            content={
+                "data": result,
+                "message": "Background processes listed successfully",
+                "error": None,
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+    async def process_status(self, request: ProcessRequest):
+        result = await self.background_process_usecase.process_status(
+            request.pid, request.session_id
+        )
+        return JSONResponse(
+            content={
+                "data": result,
+                "message": "Background process status retrieved successfully",
+                "error": None,
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+    async def read_process_logs(self, request: ProcessLogsRequest):
+        result = await self.background_process_usecase.read_process_logs(
+            request.pid, request.session_id, request.lines
+        )
+        return JSONResponse(
+            content={
+                "data": result,
+                "message": "Background process logs read successfully",
+                "error": None,
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+    async def kill_process(self, request: ProcessRequest):
+        result = await self.background_process_usecase.kill_process(
+            request.pid, request.session_id
+        )
+        return JSONResponse(
+            content={
+                "data": result,
+                "message": "Background process killed successfully",
+                "error": None,
+            },
+            status_code=status.HTTP_200_OK,
+        )
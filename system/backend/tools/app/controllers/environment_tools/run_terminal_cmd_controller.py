@@ -1,5 +1,5 @@
 from fastapi import Depends, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from system.backend.tools.app.models.schemas.run_terminal_command_schema import (
     RunTerminalCommandRequest,
@@ -19,10 +19,18 @@ class RunTerminalCmdController:
         self.run_terminal_cmd_usecase = run_terminal_cmd_usecase
 
     async def run_terminal_cmd(self, request: RunTerminalCommandRequest):
+        if request.stream and not request.is_background:
+            lines = self.run_terminal_cmd_usecase.stream_terminal_command(
+                request.cmd, request.default_path, request.timeout_seconds
+            )
+            return StreamingResponse(lines, media_type="application/x-ndjson")
+
         result = await self.run_terminal_cmd_usecase.run_terminal_command(
             request.cmd,
             request.is_background,
             request.default_path,
+            request.session_id,
+            request.timeout_seconds,
         )
         return JSONResponse(
             content={
@@ -1,5 +1,5 @@
 from fastapi import Depends, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from system.backend.tools.app.models.schemas.file_access_schemas import (
     DirectoryListRequest,
@@ -16,10 +16,22 @@ class DirectoryListController:
         self.directory_list_usecase = directory_list_usecase
 
     async def execute(self, request: DirectoryListRequest):
-        response = await self.directory_list_usecase.execute(
-            request.dir_path, request.recursive, request.default_path
+        arguments = (
+            request.dir_path,
+            request.recursive,
+            request.default_path,
+            request.max_depth,
+            request.page_size,
+            request.cursor,
+            request.include_stats,
         )
 
+        if request.stream:
+            lines = await self.directory_list_usecase.execute_stream(*arguments)
+            return StreamingResponse(lines, media_type="application/x-ndjson")
+
+        response = await self.directory_list_usecase.execute(*arguments)
+
         return JSONResponse(
             content={
                 "data": response,
@@ -7,6 +7,7 @@ from system.backend.tools.app.models.schemas.modification_schemas import (
 from system.backend.tools.app.usecases.modification_tools.edit_file_usecase import (
     EditFileUsecase,
 )
+from system.backend.tools.app.utils.logger import loggers
 
 
 class EditFileController:
@@ -19,7 +20,7 @@ class EditFileController:
         response = await self.edit_file_usecase.execute(
             request.target_file_path, request.code_snippet
         )
-        print(response)
+        loggers["file_tools"].debug("Edit file response: %s", response)
 
         status_code = status.HTTP_200_OK
         if not response.get("success", True):
@@ -0,0 +1,39 @@
+from fastapi import Depends, status
+from fastapi.responses import JSONResponse
+
+from system.backend.tools.app.models.schemas.modification_schemas import (
+    EditFilesRequest,
+)
+from system.backend.tools.app.usecases.modification_tools.edit_files_usecase import (
+    EditFilesUsecase,
+)
+
+
+class EditFilesController:
+    def __init__(
+        self, edit_files_usecase: EditFilesUsecase = Depends(EditFilesUsecase)
+    ):
+        self.edit_files_usecase = edit_files_usecase
+
+    async def execute(self, request: EditFilesRequest):
+        edits = [edit.model_dump() for edit in request.edits]
+        response = await self.edit_files_usecase.execute(
+            edits, request.max_concurrency
+        )
+
+        status_code = status.HTTP_200_OK
+        if not response.get("success", True):
+            status_code = status.HTTP_400_BAD_REQUEST
+
+        message = "Files edited successfully"
+        if response.get("error"):
+            message = response["error"]
+
+        return JSONResponse(
+            content={
+                "data": response,
+                "message": message,
+                "error": response.get("error"),
+            },
+            status_code=status_code,
+        )
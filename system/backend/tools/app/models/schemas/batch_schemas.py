@@ -0,0 +1,29 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchCall(BaseModel):
+    id: Optional[str] = Field(
+        default=None,
+        description="Identifier other calls can depend on, defaults to the call's index",
+    )
+    endpoint: str = Field(
+        ..., description="The tool endpoint to call, e.g. /read-file"
+    )
+    payload: Dict[str, Any] = Field(
+        default={}, description="The request body for the endpoint"
+    )
+    depends_on: List[str] = Field(
+        default=[],
+        description="Ids of earlier calls that must succeed before this call runs",
+    )
+
+
+class BatchRequest(BaseModel):
+    calls: List[BatchCall] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="The tool calls to run, in order",
+    )
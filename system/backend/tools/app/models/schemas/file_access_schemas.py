@@ -33,6 +33,29 @@ class DirectoryListRequest(BaseModel):
         default=None,
         description="The default base path to use if dir_path is relative",
     )
+    max_depth: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum depth to descend to when listing recursively",
+    )
+    page_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Maximum number of entries to return",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor returned by the previous page to continue listing",
+    )
+    include_stats: bool = Field(
+        default=True,
+        description="Whether to include file size and modification time",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream the entries as newline-delimited JSON",
+    )
 
 
 class FileSearchRequest(BaseModel):
@@ -42,6 +65,12 @@ class FileSearchRequest(BaseModel):
     default_path: str = Field(
         ..., description="The default base path to search in"
     )
+    max_results: int = Field(
+        20,
+        ge=1,
+        le=100,
+        description="Maximum number of matching files to return",
+    )
 
 
 class ExitToolRequest(BaseModel):
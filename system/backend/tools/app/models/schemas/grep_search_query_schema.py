@@ -15,3 +15,20 @@ class GrepSearchQueryRequest(BaseModel):
     default_path: str = Field(
         ..., description="The default base path to search in"
     )
+    context_lines: int | None = Field(
+        default=0,
+        ge=0,
+        le=10,
+        description="Number of context lines to show around each match",
+    )
+    max_matches_per_file: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of matches to report per file",
+    )
+    max_results: int | None = Field(
+        default=50,
+        ge=1,
+        le=200,
+        description="Maximum number of matches to return",
+    )
@@ -16,6 +16,10 @@ class SearchReplaceOptions(BaseModel):
     search_paths: List[str] = Field(
         default=[], description="Paths to search in"
     )
+    dry_run: bool = Field(
+        default=False,
+        description="Preview the changes without writing any file",
+    )
 
 
 class SearchReplaceRequest(BaseModel):
@@ -38,3 +42,15 @@ class EditFileRequest(BaseModel):
         ..., description="The absolute path to the file to edit"
     )
     code_snippet: str = Field(..., description="The code snippet to edit")
+
+
+class EditFilesRequest(BaseModel):
+    edits: List[EditFileRequest] = Field(
+        ..., min_length=1, description="The file edits to apply as one batch"
+    )
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Maximum number of edits merged concurrently",
+    )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -11,3 +13,41 @@ class RunTerminalCommandRequest(BaseModel):
         ...,
         description="The default working directory for the command",
     )
+    session_id: Optional[str] = Field(
+        default=None,
+        description="The session that owns background processes started by the command",
+    )
+    timeout_seconds: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=3600,
+        description="Time after which a foreground command is killed",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream the output of a foreground command as NDJSON",
+    )
+
+
+class ListProcessesRequest(BaseModel):
+    session_id: Optional[str] = Field(
+        default=None,
+        description="The session whose background processes to list",
+    )
+
+
+class ProcessRequest(BaseModel):
+    pid: int = Field(..., description="The PID of the background process")
+    session_id: Optional[str] = Field(
+        default=None,
+        description="The session that owns the background process",
+    )
+
+
+class ProcessLogsRequest(ProcessRequest):
+    lines: int = Field(
+        default=100,
+        ge=1,
+        le=2000,
+        description="Number of lines to return from the end of the output",
+    )
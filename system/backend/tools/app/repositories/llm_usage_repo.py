@@ -1,6 +1,9 @@
 from fastapi import Depends
 
-from system.backend.tools.app.config.database import mongodb_database
+from system.backend.tools.app.config.database import (
+    llm_usage_sink,
+    mongodb_database,
+)
 
 
 class LLMUsageRepository:
@@ -11,6 +14,14 @@ class LLMUsageRepository:
 
     async def add_llm_usage(self, llm_usage: dict):
         try:
+            # Usage objects from the SDKs are stored as plain documents
+            if hasattr(llm_usage, "model_dump"):
+                llm_usage = llm_usage.model_dump()
+
+            # Written in the background; directly if the sink is not running
+            if llm_usage_sink.submit(llm_usage):
+                return
+
             await self.collection.insert_one(llm_usage)
         except Exception as e:
             print(f"Error while inserting llm usage: {str(e)}")
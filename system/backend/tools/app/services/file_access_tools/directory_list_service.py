@@ -1,17 +1,39 @@
+import asyncio
+import base64
+import binascii
+import json
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 
 from system.backend.tools.app.models.domain.error import Error
 from system.backend.tools.app.repositories.error_repo import ErrorRepo
 from system.backend.tools.app.utils.path_validator import (
-    get_directory_exclusion_patterns,
+    DEFAULT_EXCLUSIONS,
     is_safe_path,
 )
 
 
+def encode_cursor(rel_path: str) -> str:
+    return base64.urlsafe_b64encode(rel_path.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> List[str]:
+    """Decode a pagination cursor into the path components it points at."""
+    try:
+        rel_path = base64.urlsafe_b64decode(cursor.encode("ascii")).decode(
+            "utf-8"
+        )
+    except (binascii.Error, UnicodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return rel_path.split("/") if rel_path else []
+
+
 class DirectoryListService:
     def __init__(self, error_repo: ErrorRepo = Depends()):
         self.error_repo = error_repo
@@ -21,159 +43,293 @@ class DirectoryListService:
         dir_path: str,
         recursive: bool,
         default_path: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        try:
-            # Determine the actual directory path to list
-            if dir_path in ["", ".", "./"]:
-                # Use default_path if dir_path is empty or current directory
-                if default_path:
-                    actual_path = default_path
-                else:
-                    actual_path = os.getcwd()
-            elif os.path.isabs(dir_path):
-                # If dir_path is absolute, use it directly
-                actual_path = dir_path
-            else:
-                # If dir_path is relative, combine with default_path or current directory
-                base_path = default_path if default_path else os.getcwd()
-                actual_path = os.path.join(base_path, dir_path)
+        max_depth: Optional[int] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None,
+        include_stats: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        List one page of a directory tree.
+
+        Entries are returned in a stable depth-first order (sorted by name),
+        so the returned cursor can be passed back to get the next page.
+
+        Args:
+            dir_path: Directory to list, relative to default_path if provided
+            recursive: Whether to list subdirectories recursively
+            default_path: Default base path to use if dir_path is relative
+            max_depth: Maximum depth to descend to when recursive
+            page_size: Maximum number of entries to return
+            cursor: Cursor returned by the previous page
+            include_stats: Whether to include size and modification time
 
-            # Normalize the path
-            actual_path = os.path.abspath(actual_path)
+        Returns:
+            Dictionary with the entries, the next cursor and whether more
+            entries are available
+        """
+        actual_path = await self.resolve_directory(dir_path, default_path)
+        after = decode_cursor(cursor) if cursor else []
+
+        try:
+            page = await asyncio.to_thread(
+                self._collect_page,
+                actual_path,
+                self._depth_limit(recursive, max_depth),
+                page_size,
+                after,
+                include_stats,
+            )
+        except Exception as e:
+            await self.error_repo.insert_error(
+                Error(
+                    tool_name="DirectoryListService",
+                    error_message=f"Error listing directory {actual_path}: {str(e)}",
+                    timestamp=datetime.now().isoformat(),
+                )
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error listing directory {actual_path}: {str(e)}",
+            )
 
-            # Check if path is safe
-            is_safe, error_msg = is_safe_path(actual_path)
-            if not is_safe:
+        for entry in page["entries"]:
+            if entry.get("error"):
                 await self.error_repo.insert_error(
                     Error(
                         tool_name="DirectoryListService",
-                        error_message=f"Access denied: {error_msg}",
+                        error_message=f"Permission denied for directory: {entry['path']}",
                         timestamp=datetime.now().isoformat(),
                     )
                 )
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Access denied: {error_msg}",
-                )
 
-            # Verify that the directory exists
-            if not os.path.exists(actual_path):
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Directory not found: {actual_path}",
-                )
+        return page
 
-            if not os.path.isdir(actual_path):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Path is not a directory: {actual_path}",
-                )
+    async def stream_directory(
+        self,
+        dir_path: str,
+        recursive: bool,
+        default_path: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None,
+        include_stats: bool = True,
+    ) -> Iterator[str]:
+        """
+        Same as list_directory, but returns an iterator of NDJSON lines: one
+        line per entry followed by a final line with "next_cursor" and
+        "has_more". The path is validated before the iterator is returned.
+        """
+        actual_path = await self.resolve_directory(dir_path, default_path)
+        after = decode_cursor(cursor) if cursor else []
+        depth_limit = self._depth_limit(recursive, max_depth)
 
-            # Get comprehensive list of directories to exclude from listing
-            excluded_dirs = get_directory_exclusion_patterns()
+        def lines() -> Iterator[str]:
+            for entry in self._iter_page(
+                actual_path, depth_limit, page_size, after, include_stats
+            ):
+                yield json.dumps(entry) + "\n"
 
-            async def process_directory(
-                current_path: str,
-            ) -> List[Dict[str, Any]]:
-                items = []
+        return lines()
 
-                try:
-                    for item in os.listdir(current_path):
-                        # Skip items that should be excluded
-                        if self._should_exclude_item(item, excluded_dirs):
-                            continue
-
-                        full_path = os.path.join(current_path, item)
-
-                        if os.path.isdir(full_path):
-                            items.append(
-                                {
-                                    "path": full_path,
-                                    "type": "directory",
-                                    "size_bytes": None,
-                                    "last_modified": None,
-                                }
-                            )
-
-                            if recursive:
-                                items.extend(await process_directory(full_path))
-
-                        else:
-                            stats = os.stat(full_path)
-                            items.append(
-                                {
-                                    "path": full_path,
-                                    "type": "file",
-                                    "size_bytes": stats.st_size,
-                                    "last_modified": datetime.fromtimestamp(
-                                        stats.st_mtime
-                                    ).isoformat(),
-                                }
-                            )
-
-                except PermissionError:
-
-                    await self.error_repo.insert_error(
-                        Error(
-                            tool_name="DirectoryListService",
-                            error_message=f"Permission denied for directory: {current_path}",
-                            timestamp=datetime.now().isoformat(),
-                        )
-                    )
-                    return [
-                        {
-                            "path": current_path,
-                            "type": "directory",
-                            "size_bytes": 0,
-                            "last_modified": datetime.now().isoformat(),
-                            "error": "Permission denied",
-                        }
-                    ]
-
-                return items
-
-            return await process_directory(actual_path)
-
-        except HTTPException:
-            # Re-raise HTTP exceptions to preserve their status codes
-            raise
-        except Exception as e:
+    async def resolve_directory(
+        self, dir_path: str, default_path: Optional[str]
+    ) -> str:
+        """Resolve and validate the directory to list."""
+        # Determine the actual directory path to list
+        if dir_path in ["", ".", "./"]:
+            # Use default_path if dir_path is empty or current directory
+            actual_path = default_path if default_path else os.getcwd()
+        elif os.path.isabs(dir_path):
+            # If dir_path is absolute, use it directly
+            actual_path = dir_path
+        else:
+            # If dir_path is relative, combine with default_path or current directory
+            base_path = default_path if default_path else os.getcwd()
+            actual_path = os.path.join(base_path, dir_path)
+
+        # Normalize the path
+        actual_path = os.path.abspath(actual_path)
+
+        # Check if path is safe
+        is_safe, error_msg = is_safe_path(actual_path)
+        if not is_safe:
             await self.error_repo.insert_error(
                 Error(
                     tool_name="DirectoryListService",
-                    error_message=f"Error listing directory {actual_path}: {str(e)}",
+                    error_message=f"Access denied: {error_msg}",
                     timestamp=datetime.now().isoformat(),
                 )
             )
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error listing directory {actual_path}: {str(e)}",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied: {error_msg}",
             )
 
-    def _should_exclude_item(
-        self, item_name: str, excluded_patterns: List[str]
-    ) -> bool:
+        # Verify that the directory exists
+        if not os.path.exists(actual_path):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Directory not found: {actual_path}",
+            )
+
+        if not os.path.isdir(actual_path):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Path is not a directory: {actual_path}",
+            )
+
+        return actual_path
+
+    def _depth_limit(self, recursive: bool, max_depth: Optional[int]) -> int:
+        if not recursive:
+            return 1
+        return max_depth if max_depth else -1
+
+    def _collect_page(
+        self,
+        actual_path: str,
+        depth_limit: int,
+        page_size: int,
+        after: List[str],
+        include_stats: bool,
+    ) -> Dict[str, Any]:
+        entries = list(
+            self._iter_page(
+                actual_path, depth_limit, page_size, after, include_stats
+            )
+        )
+        page = entries.pop()
+        return {"entries": entries, **page}
+
+    def _iter_page(
+        self,
+        actual_path: str,
+        depth_limit: int,
+        page_size: int,
+        after: List[str],
+        include_stats: bool,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield up to page_size entries, then a final dict with "next_cursor"
+        and "has_more".
         """
-        Check if an item (file or directory) should be excluded.
+        count = 0
+        last_rel = None
+        has_more = False
 
-        Args:
-            item_name: The name of the file or directory
-            excluded_patterns: List of patterns to exclude
+        for rel_path, entry in self._walk(
+            actual_path, depth_limit, after, include_stats
+        ):
+            if count == page_size:
+                has_more = True
+                break
+            yield entry
+            count += 1
+            last_rel = rel_path
 
-        Returns:
-            True if the item should be excluded, False otherwise
+        yield {
+            "next_cursor": (
+                encode_cursor(last_rel) if has_more and last_rel else None
+            ),
+            "has_more": has_more,
+        }
+
+    def _walk(
+        self,
+        actual_path: str,
+        depth_limit: int,
+        after: List[str],
+        include_stats: bool,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Walk the tree depth-first in name order with os.scandir, yielding
+        (relative path, entry) pairs. Entries up to and including the cursor
+        path are skipped without descending into subtrees that precede it.
         """
-        # Check if item name matches any exclusion pattern
-        for pattern in excluded_patterns:
-            # Exact match
-            if item_name == pattern:
-                return True
-            # Remove trailing slash and check again
-            if item_name == pattern.rstrip("/"):
-                return True
-            # Check if it's a hidden file starting with dot
-            if item_name.startswith(".") and pattern.startswith("."):
-                if item_name == pattern:
-                    return True
-
-        return False
+        # Frames of (sorted entries iterator, relative path parts, remaining
+        # cursor parts at that level)
+        stack = []
+
+        def open_directory(
+            path: str, rel_parts: List[str], skip: List[str]
+        ) -> Optional[Dict[str, Any]]:
+            try:
+                with os.scandir(path) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except PermissionError:
+                return {
+                    "path": path,
+                    "type": "directory",
+                    "error": "Permission denied",
+                }
+            except OSError:
+                return None
+            stack.append([iter(entries), rel_parts, skip])
+            return None
+
+        error_entry = open_directory(actual_path, [], after)
+        if error_entry is not None:
+            yield "", error_entry
+
+        while stack:
+            frame = stack[-1]
+            iterator, rel_parts, skip = frame
+            entry = next(iterator, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            if skip and entry.name < skip[0]:
+                continue
+
+            try:
+                # A symlink to a directory is listed but never followed, so a
+                # link to an ancestor cannot loop
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            rel_path = "/".join(rel_parts + [entry.name])
+            if DEFAULT_EXCLUSIONS.matches(rel_path, is_dir):
+                continue
+
+            # Entries on the cursor path were already returned; descend into
+            # them with the rest of the cursor
+            on_cursor_path = bool(skip) and entry.name == skip[0]
+            child_skip = skip[1:] if on_cursor_path else []
+            frame[2] = []
+
+            if not on_cursor_path:
+                yield rel_path, self._describe(entry, is_dir, include_stats)
+
+            depth = len(rel_parts) + 1
+            if is_dir and (depth_limit < 0 or depth < depth_limit):
+                error_entry = open_directory(
+                    entry.path, rel_parts + [entry.name], child_skip
+                )
+                if error_entry is not None and not on_cursor_path:
+                    yield rel_path, error_entry
+
+    def _describe(
+        self, entry: os.DirEntry, is_dir: bool, include_stats: bool
+    ) -> Dict[str, Any]:
+        """Build a listing entry, reusing the DirEntry's cached stat."""
+        item = {
+            "path": entry.path,
+            "type": "directory" if is_dir else "file",
+        }
+        if include_stats:
+            if is_dir:
+                item["size_bytes"] = None
+                item["last_modified"] = None
+            else:
+                try:
+                    stats = entry.stat()
+                    item["size_bytes"] = stats.st_size
+                    item["last_modified"] = datetime.fromtimestamp(
+                        stats.st_mtime
+                    ).isoformat()
+                except OSError:
+                    item["size_bytes"] = None
+                    item["last_modified"] = None
+        return item
@@ -7,6 +7,7 @@ from fastapi import Depends, HTTPException, status
 
 from system.backend.tools.app.models.domain.error import Error
 from system.backend.tools.app.repositories.error_repo import ErrorRepo
+from system.backend.tools.app.utils.logger import loggers
 from system.backend.tools.app.utils.path_validator import is_safe_path
 
 
@@ -59,7 +60,9 @@ class ExitToolService:
                 try:
                     Path(parent_dir).mkdir(parents=True, exist_ok=True)
                     directories_created = True
-                    print(f"Created parent directories: {parent_dir}")
+                    loggers["file_tools"].debug(
+                        f"Created parent directories: {parent_dir}"
+                    )
                 except Exception as e:
                     await self.error_repo.insert_error(
                         Error(
@@ -114,7 +117,9 @@ class ExitToolService:
 
                     file.write(content_to_append)
 
-                print(f"Successfully appended summary to file: {abs_file_path}")
+                loggers["file_tools"].debug(
+                    f"Appended summary to file: {abs_file_path}"
+                )
 
             except Exception as e:
                 await self.error_repo.insert_error(
@@ -8,6 +8,7 @@ from fastapi import Depends, HTTPException, status
 
 from system.backend.tools.app.models.domain.error import Error
 from system.backend.tools.app.repositories.error_repo import ErrorRepo
+from system.backend.tools.app.utils.file_changes import notify_file_changed
 from system.backend.tools.app.utils.path_validator import is_safe_path
 
 
@@ -110,6 +111,7 @@ class FileDeletionService:
                 shutil.rmtree(abs_path)
             else:
                 os.remove(abs_path)
+            notify_file_changed(abs_path)
 
             return {"deleted": path, "error": None}
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime
 
@@ -5,6 +6,7 @@ from fastapi import Depends, HTTPException, status
 
 from system.backend.tools.app.models.domain.error import Error
 from system.backend.tools.app.repositories.error_repo import ErrorRepo
+from system.backend.tools.app.utils.file_read_cache import file_read_cache
 from system.backend.tools.app.utils.path_validator import is_safe_path
 
 
@@ -35,69 +37,60 @@ class FileReadService:
                     detail=f"Access denied: {error_msg}",
                 )
 
-            # Use the absolute file path directly
-            if not os.path.exists(file_path):
+            # A single stat validates the cached copy; the file is only read
+            # again when its mtime or size changed
+            try:
+                cached = await asyncio.to_thread(file_read_cache.get, file_path)
+            except FileNotFoundError:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"File not found: {file_path}",
                 )
 
-            stats = os.stat(file_path)
-            file_extension = os.path.splitext(file_path)[1].lower()
+            last_modified = datetime.fromtimestamp(cached.mtime).isoformat()
 
-            # Basic check for binary files
-            if self._is_likely_binary(file_path):
+            if cached.is_binary:
                 return {
                     "content": "[This appears to be a binary file that cannot be displayed]",
-                    "size_bytes": stats.st_size,
-                    "last_modified": datetime.fromtimestamp(
-                        stats.st_mtime
-                    ).isoformat(),
+                    "size_bytes": cached.size,
+                    "last_modified": last_modified,
                     "is_binary": True,
                 }
 
-            with open(file_path, "r", encoding="utf-8") as file:
-                try:
-                    lines = file.readlines()
-                except UnicodeDecodeError:
-                    return {
-                        "content": "[This file contains characters that cannot be decoded as UTF-8]",
-                        "size_bytes": stats.st_size,
-                        "last_modified": datetime.fromtimestamp(
-                            stats.st_mtime
-                        ).isoformat(),
-                        "is_binary": True,
-                    }
-
-                total_lines = len(lines)
-
-                start = max(0, start_line)
-                end = min(total_lines, end_line)
-
-                # Check if we need to truncate
-                is_truncated = total_lines > end
-                remaining_lines = total_lines - end if is_truncated else 0
-
-                # Get the slice of lines we need
-                selected_lines = lines[start:end]
-                content = "".join(selected_lines)
-
-                # Generate LLM-friendly summary for context
-                file_info = self._generate_file_info(
-                    file_path,
-                    total_lines,
-                    start,
-                    end,
-                    remaining_lines,
-                    is_truncated,
-                )
+            if cached.is_undecodable:
+                return {
+                    "content": "[This file contains characters that cannot be decoded as UTF-8]",
+                    "size_bytes": cached.size,
+                    "last_modified": last_modified,
+                    "is_binary": True,
+                }
+
+            total_lines = cached.total_lines
+
+            start = max(0, start_line)
+            end = min(total_lines, end_line)
+
+            # Check if we need to truncate
+            is_truncated = total_lines > end
+            remaining_lines = total_lines - end if is_truncated else 0
+
+            # Slice the requested lines out of the indexed content
+            content = cached.read_lines(start, end) if start < end else ""
+
+            # Generate LLM-friendly summary for context
+            file_info = self._generate_file_info(
+                file_path,
+                total_lines,
+                start,
+                end,
+                remaining_lines,
+                is_truncated,
+            )
 
             return {
                 "content": content,
-                "size_bytes": stats.st_size,
-                "last_modified": datetime.fromtimestamp(
-                    stats.st_mtime
-                ).isoformat(),
+                "size_bytes": cached.size,
+                "last_modified": last_modified,
                 "total_lines": total_lines,
                 "start_line": start,
                 "end_line": end,
@@ -133,38 +126,3 @@ class FileReadService:
         # React-specific context for JSX/TSX files
 
         return info
-
-    def _is_likely_binary(self, file_path):
-        """Basic check if a file is likely binary"""
-        # Common binary extensions
-        binary_extensions = [
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".pdf",
-            ".zip",
-            ".tar",
-            ".gz",
-            ".exe",
-            ".dll",
-            ".bin",
-            ".o",
-        ]
-
-        file_extension = os.path.splitext(file_path)[1].lower()
-        if file_extension in binary_extensions:
-            return True
-
-        # Check first few bytes for common binary signatures
-        try:
-            with open(file_path, "rb") as f:
-                chunk = f.read(1024)
-                # High ratio of null bytes or control characters suggests binary
-                text_chars = bytearray(
-                    {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F}
-                )
-                return bool(chunk.translate(None, text_chars))
-        except Exception:
-            # If we can't read the file, we'll assume it's not binary
-            return False
@@ -1,7 +1,11 @@
+import asyncio
 import os
+import shutil
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
 
 import httpx
 from fastapi import Depends, HTTPException, status
@@ -12,6 +16,9 @@ from system.backend.tools.app.repositories.error_repo import ErrorRepo
 from system.backend.tools.app.repositories.llm_usage_repo import (
     LLMUsageRepository,
 )
+from system.backend.tools.app.utils.fast_apply import apply_edit_locally
+from system.backend.tools.app.utils.file_changes import notify_file_changed
+from system.backend.tools.app.utils.logger import loggers
 from system.backend.tools.app.utils.path_validator import is_safe_path
 
 
@@ -25,6 +32,7 @@ class EditFileService:
         self.llm_usage_repo = llm_usage_repo
         self.relace_api_key = settings.RELACE_API_KEY
         self.relace_api_url = settings.RELACE_API_URL
+        self.local_fast_apply_enabled = settings.LOCAL_FAST_APPLY_ENABLED
         self.timeout = httpx.Timeout(
             connect=30.0,
             read=120.0,
@@ -34,7 +42,8 @@ class EditFileService:
 
     async def edit_file(self, target_file_path: str, code_snippet: str):
         """
-        Edit a file by applying code changes using the Relace API.
+        Edit a file by applying code changes with the local merge engine,
+        falling back to the Relace API when the snippet cannot be anchored.
         Creates the file and parent directories if they don't exist.
 
         Args:
@@ -103,53 +112,37 @@ class EditFileService:
                         detail=f"Failed to read existing file: {str(e)}",
                     )
             else:
-                print(
+                loggers["file_tools"].debug(
                     f"File does not exist, will create new file: {target_file_path}"
                 )
 
-            # Apply code changes using Relace API
-            try:
-                merged_code, usage_data = await self._apply_code_changes_relace(
-                    original_content, code_snippet
-                )
-
-                if merged_code is None:
-                    raise ValueError(
-                        "Failed to apply code changes - no merged code returned"
-                    )
-
-                # Log LLM usage
-                await self._log_llm_usage(
-                    tool_name="EditFileService",
-                    file_path=target_file_path,
-                    usage_data=usage_data,
-                    file_existed=file_existed,
-                    directories_created=directories_created,
-                )
-
-            except Exception as api_error:
-                await self.error_repo.insert_error(
-                    Error(
-                        tool_name="EditFileService",
-                        error_message=f"Relace API error: {str(api_error)}",
-                        timestamp=datetime.now().isoformat(),
-                    )
-                )
+            merge_result = await self._merge_code_snippet(
+                target_file_path,
+                original_content,
+                code_snippet,
+                file_existed,
+                directories_created,
+            )
+            if merge_result["error"]:
                 return {
                     "success": False,
-                    "error": f"Relace API error: {str(api_error)}",
+                    "error": merge_result["error"],
                     "details": {
                         "file_path": target_file_path,
                         "file_existed": file_existed,
                         "directories_created": directories_created,
+                        "apply_method": merge_result["apply_method"],
+                        "fallback_reason": merge_result["fallback_reason"],
                         "timestamp": datetime.now().isoformat(),
                     },
                 }
+            merged_code = merge_result["merged_code"]
 
             # Write the merged content to file
             try:
                 with open(target_file_path, "w", encoding="utf-8") as file:
                     file.write(merged_code)
+                notify_file_changed(target_file_path)
             except Exception as e:
                 await self.error_repo.insert_error(
                     Error(
@@ -171,6 +164,8 @@ class EditFileService:
                     "original_size": len(original_content),
                     "new_size": len(merged_code),
                     "directories_created": directories_created,
+                    "apply_method": merge_result["apply_method"],
+                    "fallback_reason": merge_result["fallback_reason"],
                     "parent_directory": (
                         parent_dir if directories_created else None
                     ),
@@ -198,6 +193,284 @@ class EditFileService:
                 },
             }
 
+    async def edit_files(
+        self, edits: List[Dict[str, str]], max_concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Apply several file edits concurrently and commit them atomically.
+        Every snippet is merged in memory first; files are only written when
+        all merges succeed, by staging each result in a temporary file next to
+        its target and renaming it into place.
+
+        Args:
+            edits: List of dicts with 'target_file_path' and 'code_snippet'
+            max_concurrency: Maximum number of edits merged at the same time
+
+        Returns:
+            Dictionary with batch status and per-file outcomes
+        """
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        seen_paths = set()
+
+        async def prepare(edit: Dict[str, str]) -> Dict[str, Any]:
+            target_file_path = os.path.abspath(edit["target_file_path"])
+            if target_file_path in seen_paths:
+                return {
+                    "file_path": target_file_path,
+                    "success": False,
+                    "error": "Duplicate target_file_path in batch, combine the edits into one snippet",
+                }
+            seen_paths.add(target_file_path)
+
+            async with semaphore:
+                return await self._prepare_staged_edit(
+                    target_file_path, edit["code_snippet"]
+                )
+
+        outcomes = await asyncio.gather(*(prepare(edit) for edit in edits))
+        failed = [outcome for outcome in outcomes if not outcome["success"]]
+
+        committed = False
+        error = None
+        if failed:
+            error = f"{len(failed)} of {len(outcomes)} edits failed, no files were written"
+        else:
+            try:
+                await asyncio.to_thread(self._commit_staged_edits, outcomes)
+                committed = True
+                for outcome in outcomes:
+                    notify_file_changed(outcome["file_path"])
+            except Exception as e:
+                error = (
+                    f"Failed to commit edits, all files were restored: {str(e)}"
+                )
+                await self.error_repo.insert_error(
+                    Error(
+                        tool_name="EditFileService",
+                        error_message=error,
+                        timestamp=datetime.now().isoformat(),
+                    )
+                )
+
+        files = []
+        for outcome in outcomes:
+            files.append(
+                {
+                    "file_path": outcome["file_path"],
+                    "success": outcome["success"] and committed,
+                    "error": outcome.get("error"),
+                    "file_existed": outcome.get("file_existed"),
+                    "original_size": len(outcome.get("original_content") or ""),
+                    "new_size": len(outcome.get("merged_code") or ""),
+                    "directories_created": outcome.get(
+                        "directories_created", False
+                    ),
+                    "apply_method": outcome.get("apply_method"),
+                    "fallback_reason": outcome.get("fallback_reason"),
+                }
+            )
+
+        return {
+            "success": committed,
+            "committed": committed,
+            "error": error,
+            "files": files,
+            "summary": {
+                "total": len(outcomes),
+                "merged": len(outcomes) - len(failed),
+                "failed": len(failed),
+            },
+            "execution_time": round(time.perf_counter() - start_time, 3),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def _prepare_staged_edit(
+        self, target_file_path: str, code_snippet: str
+    ) -> Dict[str, Any]:
+        """Validate, read and merge a single batch edit without writing it."""
+        outcome = {"file_path": target_file_path, "success": False}
+
+        is_safe, error_msg = is_safe_path(target_file_path)
+        if not is_safe:
+            await self.error_repo.insert_error(
+                Error(
+                    tool_name="EditFileService",
+                    error_message=f"Access denied: {error_msg}",
+                    timestamp=datetime.now().isoformat(),
+                )
+            )
+            outcome["error"] = f"Access denied: {error_msg}"
+            return outcome
+
+        original_content = ""
+        file_existed = os.path.exists(target_file_path)
+        if file_existed:
+            try:
+                with open(target_file_path, "r", encoding="utf-8") as file:
+                    original_content = file.read()
+            except Exception as e:
+                outcome["error"] = f"Failed to read existing file: {str(e)}"
+                return outcome
+
+        merge_result = await self._merge_code_snippet(
+            target_file_path,
+            original_content,
+            code_snippet,
+            file_existed,
+            directories_created=False,
+        )
+        outcome.update(
+            {
+                "file_existed": file_existed,
+                "original_content": original_content,
+                "merged_code": merge_result["merged_code"],
+                "apply_method": merge_result["apply_method"],
+                "fallback_reason": merge_result["fallback_reason"],
+                "error": merge_result["error"],
+                "success": merge_result["error"] is None,
+            }
+        )
+        return outcome
+
+    def _commit_staged_edits(self, outcomes: List[Dict[str, Any]]) -> None:
+        """
+        Write merged contents to temporary files and rename them into place.
+        If anything fails, already replaced files are restored, new files and
+        created directories are removed, and the exception is re-raised.
+        """
+        created_dirs = []
+        temp_paths = {}
+        replaced = []
+
+        try:
+            for outcome in outcomes:
+                target_file_path = outcome["file_path"]
+                parent_dir = os.path.dirname(target_file_path)
+
+                if parent_dir and not os.path.exists(parent_dir):
+                    top_missing_dir = parent_dir
+                    while not os.path.exists(os.path.dirname(top_missing_dir)):
+                        top_missing_dir = os.path.dirname(top_missing_dir)
+                    Path(parent_dir).mkdir(parents=True, exist_ok=True)
+                    created_dirs.append(top_missing_dir)
+                    outcome["directories_created"] = True
+
+                fd, temp_path = tempfile.mkstemp(
+                    dir=parent_dir or None, prefix=".edit-", suffix=".tmp"
+                )
+                temp_paths[target_file_path] = temp_path
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    file.write(outcome["merged_code"])
+
+                if outcome["file_existed"]:
+                    shutil.copymode(target_file_path, temp_path)
+                else:
+                    os.chmod(temp_path, 0o644)
+
+            for outcome in outcomes:
+                target_file_path = outcome["file_path"]
+                os.replace(temp_paths.pop(target_file_path), target_file_path)
+                replaced.append(outcome)
+
+        except Exception:
+            for temp_path in temp_paths.values():
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+            for outcome in reversed(replaced):
+                try:
+                    if outcome["file_existed"]:
+                        with open(
+                            outcome["file_path"], "w", encoding="utf-8"
+                        ) as file:
+                            file.write(outcome["original_content"])
+                    else:
+                        os.remove(outcome["file_path"])
+                except OSError:
+                    pass
+
+            for created_dir in reversed(created_dirs):
+                shutil.rmtree(created_dir, ignore_errors=True)
+
+            raise
+
+    async def _merge_code_snippet(
+        self,
+        target_file_path: str,
+        original_content: str,
+        code_snippet: str,
+        file_existed: bool,
+        directories_created: bool,
+    ) -> Dict[str, Any]:
+        """
+        Merge a code snippet into the original content without writing it.
+
+        The local merge engine is tried first; only snippets that cannot be
+        anchored unambiguously are sent to the Relace API.
+
+        Args:
+            target_file_path: Absolute path to the target file
+            original_content: Current file content (empty string for new files)
+            code_snippet: The code changes to apply
+            file_existed: Whether the file existed before editing
+            directories_created: Whether parent directories were created
+
+        Returns:
+            Dictionary with merged_code, apply_method, fallback_reason and error
+        """
+        result = {
+            "merged_code": None,
+            "apply_method": "relace",
+            "fallback_reason": None,
+            "error": None,
+        }
+
+        if self.local_fast_apply_enabled:
+            merged_code, local_result = apply_edit_locally(
+                original_content, code_snippet
+            )
+            if merged_code is not None:
+                result["merged_code"] = merged_code
+                result["apply_method"] = local_result
+                return result
+            result["fallback_reason"] = local_result
+
+        # Apply code changes using Relace API
+        try:
+            merged_code, usage_data = await self._apply_code_changes_relace(
+                original_content, code_snippet
+            )
+
+            if merged_code is None:
+                raise ValueError(
+                    "Failed to apply code changes - no merged code returned"
+                )
+
+            # Log LLM usage
+            await self._log_llm_usage(
+                tool_name="EditFileService",
+                file_path=target_file_path,
+                usage_data=usage_data,
+                file_existed=file_existed,
+                directories_created=directories_created,
+            )
+            result["merged_code"] = merged_code
+
+        except Exception as api_error:
+            await self.error_repo.insert_error(
+                Error(
+                    tool_name="EditFileService",
+                    error_message=f"Relace API error: {str(api_error)}",
+                    timestamp=datetime.now().isoformat(),
+                )
+            )
+            result["error"] = f"Relace API error: {str(api_error)}"
+
+        return result
+
     async def _apply_code_changes_relace(
         self, initial_code: str, edit_snippet: str
     ) -> Tuple[str, dict]:
@@ -1,19 +1,27 @@
 import asyncio
-import glob
 import os
 import re
+import shutil
+import tempfile
+from bisect import bisect_right
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from fastapi import Depends, HTTPException, status
 
 from system.backend.tools.app.models.domain.error import Error
 from system.backend.tools.app.repositories.error_repo import ErrorRepo
+from system.backend.tools.app.utils.file_changes import notify_file_changed
+from system.backend.tools.app.utils.path_matcher import PathMatcher
 from system.backend.tools.app.utils.path_validator import (
-    get_common_exclusion_patterns,
+    DEFAULT_EXCLUSIONS,
     is_safe_path,
 )
 
+FILE_IO_CONCURRENCY = 16
+BINARY_SNIFF_BYTES = 8192
+NEWLINE = re.compile(r"\n")
+
 
 class SearchReplaceService:
     def __init__(self, error_repo: ErrorRepo = Depends()):
@@ -32,7 +40,8 @@ class SearchReplaceService:
         Args:
             query: The text or regex pattern to search for
             replacement: The text to replace the matched content with
-            options: Dictionary containing search options
+            options: Dictionary containing search options; with "dry_run"
+                the changes are only previewed and no file is written
             default_path: Default base path to search in
 
         Returns:
@@ -46,6 +55,7 @@ class SearchReplaceService:
         include_pattern = options.get("include_pattern", "*")
         exclude_pattern = options.get("exclude_pattern", "")
         search_paths = options.get("search_paths", [])
+        dry_run = options.get("dry_run", False)
 
         # Use default_path if no search_paths specified
         if not search_paths and default_path:
@@ -86,6 +96,7 @@ class SearchReplaceService:
                 "error": f"Invalid regex pattern: {str(e)}",
                 "files_affected": 0,
                 "matches": 0,
+                "dry_run": dry_run,
             }
 
         results = {
@@ -93,23 +104,67 @@ class SearchReplaceService:
             "files_affected": 0,
             "matches": 0,
             "changes": [],
+            "dry_run": dry_run,
         }
 
         try:
-            # Process paths concurrently
-            tasks = []
+            file_filter = FileFilter(include_pattern, exclude_pattern)
+            file_paths = []
             for path in safe_search_paths:
-                task = self._process_path(
-                    path,
-                    pattern,
-                    replacement,
-                    include_pattern,
-                    exclude_pattern,
-                    results,
+                file_paths.extend(
+                    await asyncio.to_thread(
+                        self._collect_files, path, file_filter
+                    )
                 )
-                tasks.append(task)
+            # Paths may overlap; each file must be processed once
+            file_paths = list(dict.fromkeys(file_paths))
+
+            semaphore = asyncio.Semaphore(FILE_IO_CONCURRENCY)
+
+            async def process(file_path: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        self._process_file, file_path, pattern, replacement
+                    )
+
+            outcomes = await asyncio.gather(
+                *(process(file_path) for file_path in file_paths)
+            )
+
+            changed = []
+            for outcome in outcomes:
+                if outcome.get("error"):
+                    results["success"] = False
+                    results["error"] = outcome["error"]
+                    await self.error_repo.insert_error(
+                        Error(
+                            tool_name="SearchReplaceService",
+                            error_message=outcome["error"],
+                            timestamp=datetime.now().isoformat(),
+                        )
+                    )
+                elif outcome.get("new_content") is not None:
+                    changed.append(outcome)
+
+            if not results["success"]:
+                # Leave every file untouched if any of them failed
+                return results
 
-            await asyncio.gather(*tasks)
+            if changed and not dry_run:
+                await asyncio.to_thread(self._commit_changes, changed)
+                for outcome in changed:
+                    notify_file_changed(outcome["file"])
+
+            for outcome in changed:
+                results["files_affected"] += 1
+                results["matches"] += len(outcome["changes"])
+                results["changes"].append(
+                    {
+                        "file": outcome["file"],
+                        "matches": len(outcome["changes"]),
+                        "changes": outcome["changes"],
+                    }
+                )
 
             return results
 
@@ -126,188 +181,197 @@ class SearchReplaceService:
                 detail=f"Error in search and replace: {str(e)}",
             )
 
-    async def _process_path(
-        self,
-        path: str,
-        pattern: re.Pattern,
-        replacement: str,
-        include_pattern: str,
-        exclude_pattern: str,
-        results: Dict[str, Any],
-    ) -> None:
-        """Process a single search path asynchronously."""
-
-        # Get default exclusion patterns and combine with user patterns
-        default_exclusions = get_common_exclusion_patterns()
-        combined_exclude_patterns = default_exclusions.copy()
-
-        if exclude_pattern:
-            # Add user-specified exclusion patterns
-            user_patterns = [p.strip() for p in exclude_pattern.split(",")]
-            combined_exclude_patterns.extend(user_patterns)
-
-        if os.path.isdir(path):
-            include_paths = []
-            for root, dirs, files in os.walk(path):
-                # Filter out excluded directories during walk to avoid traversing them
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self._should_exclude_directory(
-                        os.path.join(root, d), combined_exclude_patterns
-                    )
-                ]
-
-                for inc_pattern in include_pattern.split(","):
-                    inc_pattern = inc_pattern.strip()
-                    glob_pattern = os.path.join(root, inc_pattern)
-                    matched_files = glob.glob(glob_pattern)
-
-                    # Filter out excluded files
-                    for file_path in matched_files:
-                        if not self._should_exclude_file(
-                            file_path, combined_exclude_patterns
-                        ):
-                            include_paths.append(file_path)
-        else:
-            # Single file: check if it matches include pattern and is not excluded
-            if self._matches_pattern(
-                path, include_pattern
-            ) and not self._should_exclude_file(
-                path, combined_exclude_patterns
+    def _collect_files(self, path: str, file_filter: "FileFilter") -> List[str]:
+        """Enumerate the files under a path in a single scandir pass."""
+        if not os.path.isdir(path):
+            if os.path.isfile(path) and file_filter.includes_file(
+                os.path.basename(path)
             ):
-                include_paths = [path]
-            else:
-                include_paths = []
-
-        file_tasks = []
-        for file_path in include_paths:
-            if os.path.isfile(file_path):
-                task = self._process_file(
-                    file_path, pattern, replacement, results
+                return [path]
+            return []
+
+        file_paths = []
+        stack = [(path, "")]
+        while stack:
+            current_dir, current_rel = stack.pop()
+            try:
+                entries = list(os.scandir(current_dir))
+            except OSError:
+                continue
+
+            for entry in entries:
+                entry_rel = (
+                    f"{current_rel}/{entry.name}" if current_rel else entry.name
                 )
-                file_tasks.append(task)
-
-        await asyncio.gather(*file_tasks)
-
-    def _should_exclude_directory(
-        self, dir_path: str, exclude_patterns: list
-    ) -> bool:
-        """Check if a directory should be excluded based on patterns."""
-        dir_name = os.path.basename(dir_path)
-        dir_path_relative = os.path.relpath(dir_path)
-
-        for pattern in exclude_patterns:
-            # Check exact directory name match
-            if dir_name == pattern or dir_name == pattern.rstrip("/"):
-                return True
-            # Check if pattern matches the relative path
-            if self._matches_pattern(dir_path_relative, pattern):
-                return True
-            # Check if it's a dotfile/hidden directory and pattern matches hidden files
-            if dir_name.startswith(".") and pattern.startswith("."):
-                if self._matches_pattern(dir_name, pattern):
-                    return True
-        return False
-
-    def _should_exclude_file(
-        self, file_path: str, exclude_patterns: list
-    ) -> bool:
-        """Check if a file should be excluded based on patterns."""
-        file_name = os.path.basename(file_path)
-        file_path_relative = os.path.relpath(file_path)
-
-        for pattern in exclude_patterns:
-            # Check exact file name match
-            if file_name == pattern:
-                return True
-            # Check if pattern matches the relative path
-            if self._matches_pattern(file_path_relative, pattern):
-                return True
-            # Check if pattern matches the file name with glob
-            if self._matches_pattern(file_name, pattern):
-                return True
-        return False
-
-    def _matches_pattern(self, path: str, pattern: str) -> bool:
-        """Check if a path matches a glob pattern."""
-        for single_pattern in pattern.split(","):
-            single_pattern = single_pattern.strip()
-            if glob.fnmatch.fnmatch(os.path.basename(path), single_pattern):
-                return True
-            # Also check full path for patterns with slashes
-            if "/" in single_pattern or "\\" in single_pattern:
-                if glob.fnmatch.fnmatch(path, single_pattern):
-                    return True
-        return False
-
-    async def _process_file(
-        self,
-        file_path: str,
-        pattern: re.Pattern,
-        replacement: str,
-        results: Dict[str, Any],
-    ) -> None:
-        """Process a single file for search and replace asynchronously."""
-        try:
-            # Read file content using standard open
-            with open(
-                file_path, "r", encoding="utf-8", errors="ignore"
-            ) as file:
-                original_content = file.read()
-
-            matches = list(pattern.finditer(original_content))
-            if not matches:
-                return
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not file_filter.excludes_directory(entry_rel):
+                            stack.append((entry.path, entry_rel))
+                    elif entry.is_file() and file_filter.includes_file(
+                        entry_rel
+                    ):
+                        file_paths.append(entry.path)
+                except OSError:
+                    continue
+
+        file_paths.sort()
+        return file_paths
+
+    def _process_file(
+        self, file_path: str, pattern: re.Pattern, replacement: str
+    ) -> Dict[str, Any]:
+        """
+        Compute the replacement for a single file without writing it.
 
-            new_content = pattern.sub(replacement, original_content)
-            file_changes = []
+        Returns:
+            Dictionary with the file path and, if the file matched, its new
+            content and the per-match changes, or an "error" key
+        """
+        outcome = {"file": file_path, "new_content": None, "changes": []}
+        try:
+            with open(file_path, "rb") as file:
+                data = file.read()
+            if b"\0" in data[:BINARY_SNIFF_BYTES]:
+                return outcome
+            try:
+                original_content = data.decode("utf-8")
+            except UnicodeDecodeError:
+                # Not a text file we can rewrite without corrupting it
+                return outcome
+
+            line_starts = None
+            pieces = []
+            position = 0
+            for match in pattern.finditer(original_content):
+                if line_starts is None:
+                    line_starts = [0] + [
+                        newline.end()
+                        for newline in NEWLINE.finditer(original_content)
+                    ]
 
-            for match in matches:
                 start, end = match.span()
-                before_ctx = original_content[max(0, start - 20) : start]
                 matched_text = original_content[start:end]
-                after_ctx = original_content[
-                    end : min(len(original_content), end + 20)
-                ]
-
-                replaced_text = pattern.sub(replacement, matched_text)
+                replaced_text = match.expand(replacement)
+                pieces.append(original_content[position:start])
+                pieces.append(replaced_text)
+                position = end
 
-                file_changes.append(
+                before_ctx = original_content[max(0, start - 20) : start]
+                after_ctx = original_content[end : end + 20]
+                outcome["changes"].append(
                     {
-                        "line_number": original_content[:start].count("\n") + 1,
+                        "line_number": bisect_right(line_starts, start),
                         "context": f"{before_ctx}[{matched_text}]{after_ctx}",
                         "replacement": replaced_text,
                     }
                 )
 
-            # Apply changes if not preview mode
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write(new_content)
-
-            # Update results with a lock to avoid race conditions
-            async with asyncio.Lock():
-                results["files_affected"] += 1
-                results["matches"] += len(matches)
-                results["changes"].append(
-                    {
-                        "file": file_path,
-                        "matches": len(matches),
-                        "changes": file_changes,
-                    }
-                )
+            if outcome["changes"]:
+                pieces.append(original_content[position:])
+                outcome["new_content"] = "".join(pieces)
 
         except Exception as e:
-            async with asyncio.Lock():
-                results["success"] = False
-                results["error"] = (
-                    f"Error processing file {file_path}: {str(e)}"
-                )
+            outcome["error"] = f"Error processing file {file_path}: {str(e)}"
 
-            await self.error_repo.insert_error(
-                Error(
-                    tool_name="SearchReplaceService",
-                    error_message=f"Error processing file {file_path}: {str(e)}",
-                    timestamp=datetime.now().isoformat(),
-                )
+        return outcome
+
+    def _commit_changes(self, changed: List[Dict[str, Any]]) -> None:
+        """
+        Write every changed file to a temporary file next to it, keep a
+        backup of each original, then rename all of them into place.
+
+        Nothing is replaced if staging fails. If a rename fails partway, the
+        files already replaced are restored from their backups, and the
+        error names any file that could not be restored.
+        """
+        temp_paths = {}
+        backup_paths = {}
+        try:
+            for outcome in changed:
+                file_path = outcome["file"]
+                temp_paths[file_path] = self._temp_path(file_path, ".replace-")
+                with open(
+                    temp_paths[file_path], "w", encoding="utf-8", newline=""
+                ) as file:
+                    file.write(outcome["new_content"])
+                shutil.copymode(file_path, temp_paths[file_path])
+                backup_paths[file_path] = self._backup(file_path)
+        except Exception:
+            self._remove_files([*temp_paths.values(), *backup_paths.values()])
+            raise
+
+        replaced = []
+        try:
+            for file_path, temp_path in temp_paths.items():
+                os.replace(temp_path, file_path)
+                replaced.append(file_path)
+        except Exception as e:
+            still_changed = []
+            for file_path in replaced:
+                try:
+                    os.replace(backup_paths.pop(file_path), file_path)
+                except OSError:
+                    still_changed.append(file_path)
+            self._remove_files([*temp_paths.values(), *backup_paths.values()])
+            if still_changed:
+                raise RuntimeError(
+                    f"{e}; these files were changed and could not be "
+                    f"restored: {', '.join(still_changed)}"
+                ) from e
+            raise RuntimeError(f"{e}; no file was changed") from e
+
+        self._remove_files(backup_paths.values())
+
+    @staticmethod
+    def _temp_path(file_path: str, prefix: str) -> str:
+        """Create an empty hidden file next to file_path and return its path."""
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path), prefix=prefix, suffix=".tmp"
+        )
+        os.close(fd)
+        return temp_path
+
+    def _backup(self, file_path: str) -> str:
+        """
+        Keep the original file under a hidden name, as a hard link where the
+        filesystem allows it so that nothing is copied.
+        """
+        backup_path = self._temp_path(file_path, ".replace-backup-")
+        os.remove(backup_path)
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            shutil.copy2(file_path, backup_path)
+        return backup_path
+
+    @staticmethod
+    def _remove_files(paths: Iterable[str]) -> None:
+        """Remove the given files, ignoring those already gone."""
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class FileFilter:
+    """
+    Include/exclude globs compiled once per request, on top of the shared
+    default exclusions.
+    """
+
+    def __init__(self, include_pattern: str, exclude_pattern: str):
+        self.exclusions = DEFAULT_EXCLUSIONS
+        if exclude_pattern:
+            self.exclusions = DEFAULT_EXCLUSIONS.extend(
+                exclude_pattern.split(",")
             )
+        self.inclusions = PathMatcher((include_pattern or "*").split(","))
+
+    def excludes_directory(self, rel_path: str) -> bool:
+        return self.exclusions.matches(rel_path, True)
+
+    def includes_file(self, rel_path: str) -> bool:
+        return not self.exclusions.matches(
+            rel_path, False
+        ) and self.inclusions.matches(rel_path, False)
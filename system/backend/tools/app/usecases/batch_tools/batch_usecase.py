@@ -0,0 +1,168 @@
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
+
+from system.backend.tools.app.models.schemas.batch_schemas import BatchCall
+
+# Calls to these endpoints never modify files or processes, so consecutive
+# read-only calls can run concurrently
+READ_ONLY_ENDPOINTS = frozenset(
+    [
+        "/read-file",
+        "/list-directory",
+        "/search-files",
+        "/grep-search",
+        "/list-processes",
+        "/process-status",
+        "/process-logs",
+    ]
+)
+
+# Status FastAPI answers an invalid request body with
+VALIDATION_ERROR_STATUS = 422
+
+# Request model and controller method serving a tool endpoint
+ToolHandler = Tuple[Type[BaseModel], Callable[[Any], Awaitable[Any]]]
+
+
+class BatchUsecase:
+    async def execute(
+        self, calls: List[BatchCall], handlers: Dict[str, ToolHandler]
+    ) -> Dict[str, Any]:
+        """
+        Run several tool calls against this server in one request.
+
+        Calls keep their order: a call that may modify anything starts after
+        every earlier call finished, and later calls wait for it. Read-only
+        calls between those run concurrently, unless they depend on another
+        call through depends_on. A call whose dependency failed is skipped.
+
+        Args:
+            calls: The tool calls to run, in order
+            handlers: Request model and controller method of each endpoint
+
+        Returns:
+            Dictionary with one result per call, in order, and the total time
+        """
+        ids = [call.id or str(index) for index, call in enumerate(calls)]
+        if len(set(ids)) != len(ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Batch call ids must be unique",
+            )
+        for index, call in enumerate(calls):
+            if call.endpoint not in handlers:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Call {ids[index]} has an unknown endpoint: {call.endpoint}",
+                )
+            unknown = set(call.depends_on) - set(ids[:index])
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Call {ids[index]} depends on unknown or later calls: {sorted(unknown)}",
+                )
+
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        previous: List[asyncio.Task] = []
+        last_write: Optional[asyncio.Task] = None
+
+        for call_id, call in zip(ids, calls):
+            read_only = call.endpoint in READ_ONLY_ENDPOINTS
+            waits_for = [] if last_write is None else [last_write]
+            if not read_only:
+                waits_for = list(previous)
+            dependencies = [tasks[dependency] for dependency in call.depends_on]
+
+            task = asyncio.create_task(
+                self._run_call(
+                    handlers[call.endpoint],
+                    call_id,
+                    call,
+                    waits_for,
+                    dependencies,
+                    started,
+                )
+            )
+            tasks[call_id] = task
+            previous.append(task)
+            if not read_only:
+                last_write = task
+
+        results = await asyncio.gather(*previous)
+
+        return {
+            "results": results,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    async def _run_call(
+        self,
+        handler: ToolHandler,
+        call_id: str,
+        call: BatchCall,
+        waits_for: List[asyncio.Task],
+        dependencies: List[asyncio.Task],
+        batch_started: float,
+    ) -> Dict[str, Any]:
+        if waits_for:
+            await asyncio.wait(waits_for)
+
+        result = {"id": call_id, "endpoint": call.endpoint}
+        for dependency in dependencies:
+            outcome = await dependency
+            if outcome["status_code"] >= 400:
+                return {
+                    **result,
+                    "status_code": status.HTTP_424_FAILED_DEPENDENCY,
+                    "body": {
+                        "detail": f"Skipped because call {outcome['id']} failed"
+                    },
+                    "started_ms": None,
+                    "duration_ms": 0,
+                }
+
+        # Streaming responses cannot be embedded in the batch response
+        payload = {**call.payload, "stream": False}
+        call_started = time.perf_counter()
+        status_code, body = await self._dispatch(
+            handler, call.endpoint, payload
+        )
+
+        return {
+            **result,
+            "status_code": status_code,
+            "body": body,
+            "started_ms": round((call_started - batch_started) * 1000, 2),
+            "duration_ms": round(
+                (time.perf_counter() - call_started) * 1000, 2
+            ),
+        }
+
+    async def _dispatch(
+        self, handler: ToolHandler, endpoint: str, payload: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        """
+        Run one call through its controller, with the status code and body
+        its endpoint would have answered.
+        """
+        request_model, execute = handler
+        try:
+            response = await execute(request_model(**payload))
+            return response.status_code, json.loads(response.body)
+        except ValidationError as e:
+            return VALIDATION_ERROR_STATUS, {
+                "detail": jsonable_encoder(e.errors())
+            }
+        except HTTPException as e:
+            return e.status_code, {"detail": e.detail}
+        except Exception as e:
+            return status.HTTP_500_INTERNAL_SERVER_ERROR, {
+                "detail": f"Error calling {endpoint}: {str(e)}"
+            }
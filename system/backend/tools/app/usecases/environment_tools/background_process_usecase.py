@@ -0,0 +1,86 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from system.backend.tools.app.utils.process_manager import (
+    BackgroundProcess,
+    process_manager,
+)
+
+
+class BackgroundProcessUsecase:
+    def _get_process(
+        self, pid: int, session_id: Optional[str]
+    ) -> BackgroundProcess:
+        try:
+            return process_manager.get(pid, session_id)
+        except KeyError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No background process with PID {pid} in this session",
+            )
+
+    async def list_processes(self, session_id: Optional[str]) -> Dict[str, Any]:
+        """
+        List the background processes started by the session.
+
+        Args:
+            session_id: The session whose processes to list
+
+        Returns:
+            Dictionary with the status of each process
+        """
+        return {"processes": process_manager.list(session_id)}
+
+    async def process_status(
+        self, pid: int, session_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Get the status of a background process.
+
+        Args:
+            pid: The PID of the process
+            session_id: The session that owns the process
+
+        Returns:
+            Dictionary with the process status and exit code
+        """
+        return self._get_process(pid, session_id).describe()
+
+    async def read_process_logs(
+        self, pid: int, session_id: Optional[str], lines: int
+    ) -> Dict[str, Any]:
+        """
+        Read the most recent output of a background process.
+
+        Args:
+            pid: The PID of the process
+            session_id: The session that owns the process
+            lines: Number of lines to return from the end of the output
+
+        Returns:
+            Dictionary with the process status and its last output lines
+        """
+        process = self._get_process(pid, session_id)
+        output = await asyncio.to_thread(process.read_logs, lines)
+        return {**process.describe(), "output": output}
+
+    async def kill_process(
+        self, pid: int, session_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Stop a background process and the processes it started.
+
+        Args:
+            pid: The PID of the process
+            session_id: The session that owns the process
+
+        Returns:
+            Dictionary with the final process status
+        """
+        process = self._get_process(pid, session_id)
+        await asyncio.to_thread(
+            process.kill, process_manager.kill_grace_seconds
+        )
+        return process.describe()
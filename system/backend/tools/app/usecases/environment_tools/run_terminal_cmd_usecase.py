@@ -1,7 +1,20 @@
 import asyncio
+import json
 import os
 import re
-from typing import Any, Dict, List, Pattern, Set, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Pattern, Set, Tuple
+
+from system.backend.tools.app.config.settings import settings
+from system.backend.tools.app.utils.command_runner import (
+    OutputCallback,
+    run_command,
+)
+from system.backend.tools.app.utils.file_changes import notify_file_changed
+from system.backend.tools.app.utils.logger import loggers
+from system.backend.tools.app.utils.process_manager import (
+    ProcessLimitError,
+    process_manager,
+)
 
 
 class RunTerminalCmdUsecase:
@@ -188,6 +201,9 @@ class RunTerminalCmdUsecase:
         command: str,
         is_background: bool,
         default_path: str,
+        session_id: Optional[str] = None,
+        timeout_seconds: Optional[int] = None,
+        on_output: Optional[OutputCallback] = None,
     ) -> Dict[str, Any]:
         """
         Run a terminal command on the user's system with safety checks and node_modules exclusion.
@@ -196,19 +212,23 @@ class RunTerminalCmdUsecase:
             command: The terminal command to execute
             is_background: Whether the command should be run in the background
             default_path: The default working directory for the command
+            session_id: The session that owns background processes
+            timeout_seconds: Time after which a foreground command is killed
+            on_output: Optional callback receiving foreground output as it is
+                produced
 
         Returns:
             A dictionary with the command output and execution status
         """
-        import subprocess
-
         try:
             # Modify command to exclude node_modules if applicable
             original_command = command
             command = self._modify_command_for_node_modules_exclusion(command)
 
             if command != original_command:
-                print(f"Modified command to exclude node_modules: {command}")
+                loggers["terminal"].info(
+                    "Modified command to exclude node_modules: %s", command
+                )
 
             # Security check for dangerous commands
             security_check = self._check_command_safety(command)
@@ -220,56 +240,71 @@ class RunTerminalCmdUsecase:
                     "status": "blocked_dangerous_command",
                 }
 
-            print(f"Executing command: {command}")
-            print(f"Run in background: {is_background}")
+            loggers["terminal"].info(
+                "Executing command: %s (background: %s)",
+                command,
+                is_background,
+            )
 
             # Determine working directory
             working_dir = default_path if default_path else os.getcwd()
 
             if is_background:
-                # For background processes, use Popen and don't wait
-                process = subprocess.Popen(
-                    command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    start_new_session=True,
-                    cwd=working_dir,
-                    shell=True,  # Use shell to expand wildcards, variables, etc.
-                )
+                # Background processes are tracked by the process manager,
+                # which drains their output into a bounded log file
+                try:
+                    process = await asyncio.to_thread(
+                        process_manager.start, command, working_dir, session_id
+                    )
+                except ProcessLimitError as e:
+                    return {
+                        "output": "",
+                        "error": str(e),
+                        "exit_code": None,
+                        "status": "process_limit_reached",
+                    }
                 return {
-                    "output": f"Command started in background with PID {process.pid}",
+                    "output": f"Command started in background with PID {process.pid}. Use list_processes, read_process_logs and kill_process to manage it.",
+                    "pid": process.pid,
                     "exit_code": None,
                     "status": "running_in_background",
                 }
             else:
-                # For foreground processes, capture output
-                process = await asyncio.create_subprocess_shell(
+                # Foreground processes run with a wall-clock timeout and a
+                # bounded head and tail capture of their output
+                timeout = (
+                    timeout_seconds or settings.TERMINAL_COMMAND_TIMEOUT_SECONDS
+                )
+                result = await run_command(
                     command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    cwd=working_dir,
+                    working_dir,
+                    timeout,
+                    settings.TERMINAL_OUTPUT_MAX_BYTES,
+                    on_output,
                 )
-
-                stdout, stderr = await process.communicate()
-                stdout_str = stdout.decode("utf-8")
-                stderr_str = stderr.decode("utf-8")
+                # Commands may create, move or delete files anywhere under
+                # the working directory
+                notify_file_changed(working_dir)
+
+                if result["timed_out"]:
+                    status = "timeout"
+                    result["stderr"] += (
+                        f"\nCommand timed out after {timeout} seconds and was "
+                        "killed. Run long-lived commands in the background."
+                    )
+                elif result["exit_code"] == 0:
+                    status = "completed"
+                else:
+                    status = "error"
 
                 return {
-                    "output": stdout_str,
-                    "error": stderr_str,
-                    "exit_code": process.returncode,
-                    "status": (
-                        "completed" if process.returncode == 0 else "error"
-                    ),
+                    "output": result["stdout"],
+                    "error": result["stderr"],
+                    "exit_code": result["exit_code"],
+                    "status": status,
+                    "is_truncated": result["truncated"],
                 }
 
-        except subprocess.TimeoutExpired:
-            return {
-                "output": "Command timed out after 60 seconds",
-                "exit_code": None,
-                "status": "timeout",
-            }
         except Exception as e:
             error_msg = f"Error executing command: {str(e)}"
             return {
@@ -279,6 +314,63 @@ class RunTerminalCmdUsecase:
                 "status": "error",
             }
 
+    async def stream_terminal_command(
+        self,
+        command: str,
+        default_path: str,
+        timeout_seconds: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Run a foreground command and stream its output as NDJSON lines: one
+        {"stream", "data"} line per output chunk, then a final {"result"} line
+        with the same content run_terminal_command returns.
+
+        At most TERMINAL_STREAM_MAX_CHUNKS chunks wait for a slow client;
+        later chunks are dropped until it catches up, and replaced by a note
+        of the dropped size. The final result still holds the head and tail
+        of the output.
+        """
+        # Unbounded so the result and the end marker never wait; output
+        # chunks are bounded by on_output
+        queue: asyncio.Queue = asyncio.Queue()
+        dropped = {"stdout": 0, "stderr": 0}
+
+        async def on_output(stream: str, data: str) -> None:
+            if queue.qsize() >= settings.TERMINAL_STREAM_MAX_CHUNKS:
+                dropped[stream] += len(data)
+                return
+            if dropped[stream]:
+                data = (
+                    f"\n... [{dropped[stream]} characters dropped, the client "
+                    f"read the output too slowly] ...\n{data}"
+                )
+                dropped[stream] = 0
+            queue.put_nowait(json.dumps({"stream": stream, "data": data}))
+
+        async def run() -> None:
+            try:
+                result = await self.run_terminal_command(
+                    command,
+                    False,
+                    default_path,
+                    timeout_seconds=timeout_seconds,
+                    on_output=on_output,
+                )
+                await queue.put(json.dumps({"result": result}))
+            finally:
+                await queue.put(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    break
+                yield line + "\n"
+        finally:
+            # Kills the command if the client disconnects
+            task.cancel()
+
     def _check_command_safety(
         self, command: str, _recursion_depth: int = 0
     ) -> Dict[str, Any]:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from fastapi import Depends
 
@@ -18,8 +18,39 @@ class DirectoryListUseCase:
         dir_path: str,
         recursive: bool,
         default_path: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        max_depth: Optional[int] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None,
+        include_stats: bool = True,
+    ) -> Dict[str, Any]:
 
         return await self.directory_list_service.list_directory(
-            dir_path, recursive, default_path
+            dir_path,
+            recursive,
+            default_path,
+            max_depth,
+            page_size,
+            cursor,
+            include_stats,
+        )
+
+    async def execute_stream(
+        self,
+        dir_path: str,
+        recursive: bool,
+        default_path: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        page_size: int = 500,
+        cursor: Optional[str] = None,
+        include_stats: bool = True,
+    ) -> Iterator[str]:
+
+        return await self.directory_list_service.stream_directory(
+            dir_path,
+            recursive,
+            default_path,
+            max_depth,
+            page_size,
+            cursor,
+            include_stats,
         )
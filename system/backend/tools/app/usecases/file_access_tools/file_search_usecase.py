@@ -12,9 +12,9 @@ class FileSearchUseCase:
         self.file_search_service = file_search_service
 
     async def execute(
-        self, pattern: str, default_path: str
+        self, pattern: str, default_path: str, max_results: int = 20
     ) -> List[Dict[str, Any]]:
 
         return await self.file_search_service.search_files(
-            pattern, default_path
+            pattern, default_path, max_results
         )
@@ -0,0 +1,18 @@
+from typing import Any, Dict, List
+
+from fastapi import Depends
+
+from system.backend.tools.app.services.modification_tools.edit_file_service import (
+    EditFileService,
+)
+
+
+class EditFilesUsecase:
+    def __init__(self, edit_file_service: EditFileService = Depends()):
+        self.edit_file_service = edit_file_service
+
+    async def execute(
+        self, edits: List[Dict[str, str]], max_concurrency: int
+    ) -> Dict[str, Any]:
+
+        return await self.edit_file_service.edit_files(edits, max_concurrency)
@@ -1,10 +1,11 @@
+import asyncio
 import json
 import os
-import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from fastapi import Depends
 
+from system.backend.tools.app.config.settings import settings
 from system.backend.tools.app.models.domain.error import Error
 from system.backend.tools.app.models.schemas.grep_search_query_schema import (
     GrepSearchQueryRequest,
@@ -13,6 +14,21 @@ from system.backend.tools.app.repositories.error_repo import ErrorRepo
 from system.backend.tools.app.utils.path_validator import (
     get_ripgrep_exclusion_patterns,
 )
+from system.backend.tools.app.utils.search_index import search_index_registry
+
+SEARCH_TIMEOUT_SECONDS = 30
+DEFAULT_MAX_RESULTS = 50
+
+# Upper bound for a single line of ripgrep JSON output (minified files can
+# produce very long match lines)
+RIPGREP_LINE_LIMIT = 8 * 1024 * 1024
+
+# The default exclusions never change, so the -g flags are built once
+RIPGREP_EXCLUSION_ARGS = [
+    arg
+    for exclusion in get_ripgrep_exclusion_patterns()
+    for arg in ("-g", exclusion)
+]
 
 
 class GrepSearchUsecase:
@@ -23,7 +39,12 @@ class GrepSearchUsecase:
         self, request: GrepSearchQueryRequest
     ) -> Dict[str, Any]:
         """
-        Execute a grep search using ripgrep.
+        Execute a grep search, through the codebase's trigram index when
+        possible and with ripgrep otherwise.
+
+        ripgrep's JSON output is streamed line by line and the process is
+        killed as soon as the match limit is reached, so the event loop is
+        never blocked and large result sets are never buffered.
 
         Args:
             request: The grep search request containing query, options, and default_path
@@ -31,85 +52,58 @@ class GrepSearchUsecase:
         Returns:
             A dictionary with the search results and metadata
         """
-        query = request.query
-        case_sensitive = request.case_sensitive
-        include_pattern = request.include_pattern
-        exclude_pattern = request.exclude_pattern
-        default_path = request.default_path
-
-        # Build the ripgrep command
-        cmd = ["rg", "--json"]
-
-        if not case_sensitive:
-            cmd.append("-i")
-
-        # Add default exclusion patterns to ignore common development directories and files
-        default_exclusions = get_ripgrep_exclusion_patterns()
-        for exclusion in default_exclusions:
-            cmd.extend(["-g", exclusion])
-
-        # Add user-specified include/exclude patterns
-        if include_pattern:
-            cmd.extend(["-g", include_pattern])
+        max_results = request.max_results or DEFAULT_MAX_RESULTS
+
+        if settings.SEARCH_INDEX_ENABLED:
+            try:
+                indexed_result = await asyncio.wait_for(
+                    search_index_registry.search(
+                        query=request.query,
+                        search_path=self._get_search_path(request),
+                        case_sensitive=request.case_sensitive,
+                        include_pattern=request.include_pattern,
+                        exclude_pattern=request.exclude_pattern,
+                        context_lines=request.context_lines or 0,
+                        max_matches_per_file=request.max_matches_per_file,
+                        max_results=max_results,
+                    ),
+                    timeout=SEARCH_TIMEOUT_SECONDS,
+                )
+            except Exception as e:
+                indexed_result = None
+                await self.error_repo.insert_error(
+                    Error(
+                        tool_name="grep_search",
+                        error_message=f"Indexed search failed, falling back to ripgrep: {str(e)}",
+                    )
+                )
 
-        if exclude_pattern:
-            # Add user exclude pattern in addition to defaults
-            cmd.extend(["-g", f"!{exclude_pattern}"])
+            if indexed_result is not None:
+                matches, match_count = indexed_result
+                return {
+                    "results": (
+                        "\n".join(matches) if matches else "No matches found"
+                    ),
+                    "count": str(match_count),
+                    "status": "success",
+                }
 
-        # Use default_path if provided, otherwise use current working directory
-        search_path = default_path if default_path else os.getcwd()
-        cmd.extend([query, search_path])
+        cmd = self._build_command(request)
 
+        process = None
         try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=RIPGREP_LINE_LIMIT,
+            )
 
-            # Execute the command and capture output
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30
+            matches, match_count = await asyncio.wait_for(
+                self._collect_matches(process.stdout, max_results),
+                timeout=SEARCH_TIMEOUT_SECONDS,
             )
-            output_lines = result.stdout.strip().split("\n")
-
-            # Process the output (limit to max 50 matches)
-            matches = []
-            match_count = 0
-
-            for line in output_lines:
-                if not line:
-                    continue
-
-                try:
-                    match_data = json.loads(line)
-                    if "data" in match_data and match_data["type"] == "match":
-                        file_path = (
-                            match_data["data"].get("path", {}).get("text", "")
-                        )
-                        line_number = match_data["data"].get("line_number", 0)
-                        match_content = (
-                            match_data["data"]
-                            .get("lines", {})
-                            .get("text", "")
-                            .strip()
-                        )
-
-                        matches.append(
-                            f"{file_path}:{line_number}: {match_content}"
-                        )
-                        match_count += 1
-
-                        if match_count >= 50:
-                            matches.append(
-                                "... (output truncated at 50 matches)"
-                            )
-                            break
-                except json.JSONDecodeError:
-                    continue
-
-            ans = {
-                "results": (
-                    "\n".join(matches) if matches else "No matches found"
-                ),
-                "count": str(match_count),
-                "status": "success",
-            }
+
             return {
                 "results": (
                     "\n".join(matches) if matches else "No matches found"
@@ -118,9 +112,9 @@ class GrepSearchUsecase:
                 "status": "success",
             }
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
-                "results": "Search timed out after 30 seconds",
+                "results": f"Search timed out after {SEARCH_TIMEOUT_SECONDS} seconds",
                 "count": 0,
                 "status": "timeout",
             }
@@ -131,13 +125,95 @@ class GrepSearchUsecase:
                     error_message=f"Error executing search: {str(e)}",
                 )
             )
-            error = {
-                "results": f"Error executing search: {str(e)}",
-                "count": 0,
-                "status": "error",
-            }
             return {
                 "results": f"Error executing search: {str(e)}",
                 "count": 0,
                 "status": "error",
             }
+        finally:
+            if process is not None:
+                if process.returncode is None:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                await process.wait()
+
+    def _build_command(self, request: GrepSearchQueryRequest) -> List[str]:
+        """Build the ripgrep command line for a search request."""
+        cmd = ["rg", "--json"]
+
+        if not request.case_sensitive:
+            cmd.append("-i")
+
+        if request.context_lines:
+            cmd.extend(["-C", str(request.context_lines)])
+
+        if request.max_matches_per_file:
+            cmd.extend(["--max-count", str(request.max_matches_per_file)])
+
+        # Add default exclusion patterns to ignore common development directories and files
+        cmd.extend(RIPGREP_EXCLUSION_ARGS)
+
+        # Add user-specified include/exclude patterns
+        if request.include_pattern:
+            cmd.extend(["-g", request.include_pattern])
+
+        if request.exclude_pattern:
+            # Add user exclude pattern in addition to defaults
+            cmd.extend(["-g", f"!{request.exclude_pattern}"])
+
+        cmd.extend(["-e", request.query, self._get_search_path(request)])
+
+        return cmd
+
+    def _get_search_path(self, request: GrepSearchQueryRequest) -> str:
+        # Use default_path if provided, otherwise use current working directory
+        return request.default_path if request.default_path else os.getcwd()
+
+    async def _collect_matches(
+        self, stdout: asyncio.StreamReader, max_results: int
+    ) -> Tuple[List[str], int]:
+        """
+        Read ripgrep JSON messages until the output ends or the match limit
+        is reached. Context lines are kept but do not count toward the limit.
+
+        Returns:
+            Tuple of (formatted result lines, number of matches)
+        """
+        results = []
+        match_count = 0
+
+        while True:
+            line = await stdout.readline()
+            if not line:
+                break
+
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            message_type = message.get("type")
+            if message_type not in ("match", "context"):
+                continue
+
+            data = message.get("data", {})
+            file_path = data.get("path", {}).get("text", "")
+            line_number = data.get("line_number", 0)
+            content = data.get("lines", {}).get("text", "").strip()
+
+            if message_type == "context":
+                results.append(f"{file_path}-{line_number}- {content}")
+                continue
+
+            results.append(f"{file_path}:{line_number}: {content}")
+            match_count += 1
+
+            if match_count >= max_results:
+                results.append(
+                    f"... (output truncated at {max_results} matches)"
+                )
+                break
+
+        return results, match_count
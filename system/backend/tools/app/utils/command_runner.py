@@ -0,0 +1,156 @@
+import asyncio
+import codecs
+import os
+import signal
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional
+
+READ_CHUNK_BYTES = 64 * 1024
+
+# Called with the stream name ("stdout" or "stderr") and each decoded chunk
+OutputCallback = Callable[[str, str], Awaitable[None]]
+
+
+class HeadTailBuffer:
+    """
+    Output capture bounded to max_bytes: keeps the first quarter and the last
+    three quarters of the output, and counts what was dropped in between.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.head_limit = max_bytes // 4
+        self.tail_limit = max_bytes - self.head_limit
+        self.head = bytearray()
+        self.tail: "deque[bytes]" = deque()
+        self.tail_size = 0
+        self.dropped = 0
+
+    def write(self, data: bytes) -> None:
+        if len(self.head) < self.head_limit:
+            room = self.head_limit - len(self.head)
+            self.head += data[:room]
+            data = data[room:]
+        if not data:
+            return
+
+        self.tail.append(data)
+        self.tail_size += len(data)
+        while self.tail_size > self.tail_limit:
+            excess = self.tail_size - self.tail_limit
+            oldest = self.tail[0]
+            if len(oldest) <= excess:
+                self.tail.popleft()
+                self.tail_size -= len(oldest)
+                self.dropped += len(oldest)
+            else:
+                self.tail[0] = oldest[excess:]
+                self.tail_size -= excess
+                self.dropped += excess
+
+    @property
+    def truncated(self) -> bool:
+        return self.dropped > 0
+
+    def getvalue(self) -> str:
+        """Decode the captured output, replacing invalid bytes."""
+        head = bytes(self.head).decode("utf-8", errors="replace")
+        tail = b"".join(self.tail).decode("utf-8", errors="replace")
+        if not self.dropped:
+            return head + tail
+        return f"{head}\n\n... [{self.dropped} bytes truncated] ...\n\n{tail}"
+
+
+def _kill_process_group(pid: int, sig: int) -> None:
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+async def run_command(
+    command: str,
+    cwd: str,
+    timeout_seconds: float,
+    max_output_bytes: int,
+    on_output: Optional[OutputCallback] = None,
+    kill_grace_seconds: float = 5.0,
+) -> Dict[str, object]:
+    """
+    Run a shell command in its own process group with a wall-clock timeout,
+    capturing a bounded head and tail of stdout and stderr.
+
+    Args:
+        command: The shell command to run
+        cwd: The working directory
+        timeout_seconds: Time after which the whole process group is killed
+        max_output_bytes: Maximum number of bytes captured per stream
+        on_output: Optional callback receiving the output as it is produced
+        kill_grace_seconds: Time between SIGTERM and SIGKILL on timeout
+
+    Returns:
+        Dictionary with stdout, stderr, the exit code, whether the command
+        timed out and whether the captured output was truncated
+    """
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        start_new_session=True,
+    )
+    buffers = {
+        "stdout": HeadTailBuffer(max_output_bytes),
+        "stderr": HeadTailBuffer(max_output_bytes),
+    }
+
+    async def drain(name: str, stream: asyncio.StreamReader) -> None:
+        buffer = buffers[name]
+        # Keeps multi-byte characters split across chunks intact
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            chunk = await stream.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            buffer.write(chunk)
+            if on_output is not None:
+                text = decoder.decode(chunk)
+                if text:
+                    await on_output(name, text)
+
+    readers = asyncio.gather(
+        drain("stdout", process.stdout), drain("stderr", process.stderr)
+    )
+
+    timed_out = False
+    try:
+        # Wait for the output to close as well as the exit, but never longer
+        # than the timeout; children that keep the pipes open are killed too
+        await asyncio.wait_for(
+            asyncio.gather(readers, process.wait()), timeout_seconds
+        )
+    except asyncio.TimeoutError:
+        timed_out = True
+        _kill_process_group(process.pid, signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), kill_grace_seconds)
+        except asyncio.TimeoutError:
+            pass
+        _kill_process_group(process.pid, signal.SIGKILL)
+        await process.wait()
+        readers.cancel()
+        try:
+            await readers
+        except asyncio.CancelledError:
+            pass
+    except asyncio.CancelledError:
+        _kill_process_group(process.pid, signal.SIGKILL)
+        raise
+
+    return {
+        "stdout": buffers["stdout"].getvalue(),
+        "stderr": buffers["stderr"].getvalue(),
+        "exit_code": process.returncode,
+        "timed_out": timed_out,
+        "truncated": buffers["stdout"].truncated or buffers["stderr"].truncated,
+    }
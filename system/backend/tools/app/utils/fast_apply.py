@@ -0,0 +1,362 @@
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+# Lines such as "// ... existing code ...", "{/* ... existing code ... */}",
+# "# ... rest of the file ..." or "<!-- ... unchanged ... -->" that stand in
+# for untouched code in lazy edit snippets
+EXISTING_CODE_MARKER = re.compile(
+    r"^\s*(?://|#|/\*|\{\s*/\*|<!--)\s*\.{3}\s*"
+    r"(?:existing|rest|remaining|unchanged|keep|other|previous|more)?"
+    r"[^\n]*$",
+    re.IGNORECASE,
+)
+
+# Anchors made only of these characters (closing braces, blank lines...) occur
+# everywhere in a file and can never identify a location on their own
+TRIVIAL_LINE = re.compile(r"^[\s{}()\[\];,<>/]*$")
+
+# Identifiers and string literals of a line, to tell a new declaration
+# ("function C") from an edited statement ("let x = 2" for "const x = 1")
+IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+STRING_LITERAL = re.compile(r"'[^']*'|\"[^\"]*\"|`[^`]*`")
+
+# Words shared by unrelated lines, which say nothing about a rewrite
+KEYWORDS = frozenset("""
+    as async await break case class const def default else export extends
+    false final for from function if implements import in let new null of
+    private public return self static super this true type undefined var
+    void while
+    """.split())
+
+
+def _normalize(line: str) -> str:
+    return " ".join(line.split())
+
+
+def _is_marker(line: str) -> bool:
+    return bool(EXISTING_CODE_MARKER.match(line))
+
+
+def _split_snippet(
+    snippet_lines: List[str],
+) -> List[Tuple[List[str], bool, bool]]:
+    """
+    Split a lazy edit snippet into the chunks between existing-code markers.
+
+    Returns:
+        List of (chunk lines, preceded by a marker, followed by a marker)
+    """
+    parts = [[]]
+    for line in snippet_lines:
+        if _is_marker(line):
+            parts.append([])
+        else:
+            parts[-1].append(line)
+
+    chunks = []
+    for i, part in enumerate(parts):
+        start, end = 0, len(part)
+        while start < end and not part[start].strip():
+            start += 1
+        while end > start and not part[end - 1].strip():
+            end -= 1
+        if start < end:
+            chunks.append((part[start:end], i > 0, i < len(parts) - 1))
+
+    return chunks
+
+
+def _is_distinctive(normalized_lines: List[str]) -> bool:
+    return any(not TRIVIAL_LINE.match(line) for line in normalized_lines)
+
+
+def _occurrences(
+    original: List[str], lines: List[str], index: Dict[str, List[int]]
+) -> int:
+    """Number of places in the whole original where the lines occur in order."""
+    return sum(
+        1
+        for pos in index.get(lines[0], [])
+        if original[pos : pos + len(lines)] == lines
+    )
+
+
+def _find_head(
+    original: List[str],
+    chunk: List[str],
+    cursor: int,
+    index: Dict[str, List[int]],
+) -> Tuple[Optional[int], int, str]:
+    """
+    Find the unique place where the leading context lines of a chunk occur.
+
+    Returns:
+        Tuple of (start line in original or None, number of matched lines, reason)
+    """
+    candidates = [pos for pos in index.get(chunk[0], []) if pos >= cursor]
+    if not candidates:
+        return None, 0, "leading context not found in original file"
+
+    best_length = 0
+    best_positions = []
+    for pos in candidates:
+        length = 0
+        while (
+            length < len(chunk)
+            and pos + length < len(original)
+            and original[pos + length] == chunk[length]
+        ):
+            length += 1
+
+        if length > best_length:
+            best_length = length
+            best_positions = [pos]
+        elif length == best_length:
+            best_positions.append(pos)
+
+    # Blank lines at the edge of the context stay with the code that follows
+    while best_length and not chunk[best_length - 1]:
+        best_length -= 1
+
+    # Unique after the cursor is not enough: context repeated elsewhere in
+    # the file may belong to another block of the same shape
+    if (
+        len(best_positions) != 1
+        or _occurrences(original, chunk[:best_length], index) != 1
+    ):
+        return None, 0, "leading context matches several locations"
+
+    if not _is_distinctive(chunk[:best_length]):
+        return None, 0, "leading context is too generic to anchor"
+
+    return best_positions[0], best_length, ""
+
+
+def _find_tail(
+    original: List[str],
+    chunk: List[str],
+    lower_bound: int,
+    max_length: int,
+    index: Dict[str, List[int]],
+) -> Tuple[Optional[int], int, str]:
+    """
+    Find the unique place where the trailing context lines of a chunk end.
+
+    Returns:
+        Tuple of (last line in original covered by the chunk or None, number
+        of matched lines, reason)
+    """
+    candidates = [pos for pos in index.get(chunk[-1], []) if pos >= lower_bound]
+    if not candidates:
+        return None, 0, "trailing context not found in original file"
+
+    best_length = 0
+    best_positions = []
+    for pos in candidates:
+        length = 0
+        while (
+            length < max_length
+            and pos - length >= lower_bound
+            and original[pos - length] == chunk[-1 - length]
+        ):
+            length += 1
+
+        if length > best_length:
+            best_length = length
+            best_positions = [pos]
+        elif length == best_length:
+            best_positions.append(pos)
+
+    while best_length and not chunk[len(chunk) - best_length]:
+        best_length -= 1
+
+    if (
+        len(best_positions) != 1
+        or _occurrences(original, chunk[len(chunk) - best_length :], index) != 1
+    ):
+        return None, 0, "trailing context matches several locations"
+
+    if not _is_distinctive(chunk[len(chunk) - best_length :]):
+        return None, 0, "trailing context is too generic to anchor"
+
+    return best_positions[0], best_length, ""
+
+
+def _bracket_delta(lines: List[str]) -> int:
+    return sum(
+        line.count("{")
+        + line.count("(")
+        + line.count("[")
+        - line.count("}")
+        - line.count(")")
+        - line.count("]")
+        for line in lines
+    )
+
+
+def _neighbour(original: List[str], pos: int, step: int) -> Optional[str]:
+    """The nearest non-blank original line from pos in the given direction."""
+    while 0 <= pos < len(original):
+        if original[pos]:
+            return original[pos]
+        pos += step
+    return None
+
+
+def _is_insertion(new_lines: List[str], neighbour: Optional[str]) -> bool:
+    """
+    Whether lines anchored on one side only can be inserted as they are.
+
+    They must form a balanced block, and must not resemble the original
+    line they would be placed next to at all: sharing a name with it
+    suggests they rewrite it, which only the remote apply can merge.
+    """
+    new_lines = [line for line in new_lines if line]
+    if not new_lines or _bracket_delta(new_lines) != 0:
+        return False
+    if neighbour is None:
+        return True
+    neighbour_names = _names(neighbour)
+    return not any(
+        _normalize(line) == _normalize(neighbour)
+        or _names(line) & neighbour_names
+        for line in new_lines
+    )
+
+
+def _names(line: str) -> Set[str]:
+    """Identifiers of a line outside string literals, without keywords."""
+    code = STRING_LITERAL.sub("", line)
+    return set(IDENTIFIER.findall(code)) - KEYWORDS
+
+
+def strip_existing_code_markers(code_snippet: str) -> str:
+    """Drop lazy-edit marker lines from a snippet that is written as a whole file."""
+    lines = code_snippet.splitlines(keepends=True)
+    return "".join(line for line in lines if not _is_marker(line))
+
+
+def apply_edit_locally(
+    initial_code: str, edit_snippet: str
+) -> Tuple[Optional[str], str]:
+    """
+    Merge a lazy edit snippet into the original code without calling a model.
+
+    Each chunk of the snippet (the text between "... existing code ..." markers)
+    is anchored on its unchanged leading and trailing context lines, and the
+    original lines between those anchors are replaced by the chunk. Lines are
+    only compared up to whitespace, and each anchor must match exactly one
+    location in the file and contain more than braces. A chunk anchored on one side only
+    is inserted next to its anchor when a marker stands for the code on the
+    other side and its new lines form a balanced block. Otherwise the merge is
+    abandoned so the caller can fall back to the remote apply model.
+
+    Args:
+        initial_code: The original file content (empty string for new files)
+        edit_snippet: The edit snippet produced by the agent
+
+    Returns:
+        Tuple containing:
+            - The merged code, or None if the snippet could not be anchored
+            - The strategy used when merged, otherwise the reason for giving up
+    """
+    if not initial_code.strip():
+        return strip_existing_code_markers(edit_snippet), "new_file"
+
+    newline = "\r\n" if "\r\n" in initial_code else "\n"
+    original_lines = initial_code.splitlines()
+    normalized_original = [_normalize(line) for line in original_lines]
+
+    chunks = _split_snippet(edit_snippet.splitlines())
+    if not chunks:
+        return None, "edit snippet contains no code"
+
+    index: Dict[str, List[int]] = {}
+    for pos, line in enumerate(normalized_original):
+        index.setdefault(line, []).append(pos)
+
+    # (first original line replaced, last original line replaced, new lines);
+    # an insertion replaces the empty span before its first line
+    replacements = []
+    cursor = 0
+    strategy = "local_merge"
+
+    for chunk, marker_before, marker_after in chunks:
+        normalized_chunk = [_normalize(line) for line in chunk]
+
+        start, head_length, reason = _find_head(
+            normalized_original, normalized_chunk, cursor, index
+        )
+        if start is None:
+            # New lines before existing code: anchor on the trailing context
+            if not marker_before or any(
+                pos >= cursor for pos in index.get(normalized_chunk[0], [])
+            ):
+                return None, reason
+            end, tail_length, tail_reason = _find_tail(
+                normalized_original,
+                normalized_chunk,
+                cursor,
+                len(chunk),
+                index,
+            )
+            if end is None:
+                return None, tail_reason
+            insert_at = end - tail_length + 1
+            new_lines = normalized_chunk[: len(chunk) - tail_length]
+            if not _is_insertion(
+                new_lines[::-1],
+                _neighbour(normalized_original, insert_at - 1, -1),
+            ):
+                return (
+                    None,
+                    "new lines before the trailing context may rewrite it",
+                )
+            replacements.append((insert_at, end, chunk))
+            strategy = "local_insert"
+            cursor = end + 1
+            continue
+
+        if head_length == len(chunk):
+            # The chunk is unchanged context only
+            end = start + head_length - 1
+        else:
+            end, _, reason = _find_tail(
+                normalized_original,
+                normalized_chunk,
+                start + head_length,
+                len(chunk) - head_length,
+                index,
+            )
+            if end is None:
+                # New lines after existing code: keep what follows the head
+                if not marker_after:
+                    return None, reason
+                head_end = start + head_length - 1
+                if not _is_insertion(
+                    normalized_chunk[head_length:],
+                    _neighbour(normalized_original, head_end + 1, 1),
+                ):
+                    return (
+                        None,
+                        "new lines after the leading context may rewrite it",
+                    )
+                end = head_end
+                strategy = "local_insert"
+
+        replacements.append((start, end, chunk))
+        cursor = end + 1
+
+    merged_lines = []
+    position = 0
+    for start, end, chunk in replacements:
+        merged_lines.extend(original_lines[position:start])
+        merged_lines.extend(chunk)
+        position = end + 1
+    merged_lines.extend(original_lines[position:])
+
+    merged_code = newline.join(merged_lines)
+    if initial_code.endswith(("\n", "\r")):
+        merged_code += newline
+
+    return merged_code, strategy
@@ -0,0 +1,112 @@
+import os
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from system.backend.tools.app.config.settings import settings
+
+# Every journal starts with a line naming its generation. A rotated journal
+# gets a new generation, so readers notice the rotation even if the new
+# journal already grew past their offset
+GENERATION_PREFIX = "#generation "
+
+
+def write_file_changes(
+    journal_path: str, paths: Iterable[str], max_bytes: int
+) -> None:
+    """
+    Append changed paths to a file change journal, starting a new
+    generation once it grew past max_bytes.
+
+    A new generation is written to a temporary file and renamed over the
+    journal, so readers never see a journal without its header.
+
+    Args:
+        journal_path: Path of the journal
+        paths: Paths of the files that were written or removed
+        max_bytes: Size past which the journal is rotated
+    """
+    lines = "".join(f"{os.path.abspath(path)}\n" for path in paths)
+    if not lines:
+        return
+
+    os.makedirs(os.path.dirname(journal_path) or ".", exist_ok=True)
+    try:
+        if os.path.getsize(journal_path) <= max_bytes:
+            with open(journal_path, "a", encoding="utf-8") as journal:
+                journal.write(lines)
+            return
+    except FileNotFoundError:
+        pass
+
+    header = f"{GENERATION_PREFIX}{time.time_ns()}-{os.getpid()}\n"
+    temp_path = f"{journal_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as journal:
+        journal.write(header + lines)
+    os.replace(temp_path, journal_path)
+
+
+def _read_generation(journal) -> Tuple[str, int]:
+    """
+    Read the generation header of an open journal.
+
+    Returns:
+        The generation and the offset of the first entry; a journal written
+        before generations existed has an empty generation
+    """
+    first_line = journal.readline()
+    if not first_line.startswith(GENERATION_PREFIX.encode()):
+        return "", 0
+    generation = first_line[len(GENERATION_PREFIX) :].decode().strip()
+    return generation, len(first_line)
+
+
+def read_file_changes(
+    generation: Optional[str], offset: int
+) -> Tuple[List[str], Optional[str], int, bool]:
+    """
+    Read the journal entries appended after the given position.
+
+    Args:
+        generation: Generation of the journal the caller has read from, or
+            None if the journal did not exist yet
+        offset: Byte offset up to which the caller has already consumed
+
+    Returns:
+        Tuple containing:
+            - The changed absolute paths
+            - The generation and the offset to pass on the next call
+            - Whether the journal was rotated or removed since the last read,
+              in which case entries may have been lost and the caller should
+              rescan
+    """
+    journal_path = settings.FILE_CHANGE_JOURNAL_PATH
+    try:
+        with open(journal_path, "rb") as journal:
+            current, start = _read_generation(journal)
+            rotated = current != generation
+            if rotated:
+                offset = start
+            journal.seek(offset)
+            data = journal.read()
+    except OSError:
+        return [], None, 0, generation is not None
+
+    # Only consume complete lines; a writer may be in the middle of a line
+    end = data.rfind(b"\n") + 1
+    paths = [
+        line
+        for line in data[:end].decode("utf-8", errors="replace").split("\n")
+        if line
+    ]
+    # The first journal to appear is not a rotation: nothing was missed
+    return paths, current, offset + end, rotated and generation is not None
+
+
+def current_journal_position() -> Tuple[Optional[str], int]:
+    """Return the generation and the current end of the journal."""
+    try:
+        with open(settings.FILE_CHANGE_JOURNAL_PATH, "rb") as journal:
+            generation, _ = _read_generation(journal)
+            return generation, journal.seek(0, os.SEEK_END)
+    except OSError:
+        return None, 0
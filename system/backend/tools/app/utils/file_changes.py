@@ -0,0 +1,49 @@
+import os
+from typing import Callable, List, Optional
+
+from system.backend.tools.app.utils.file_change_journal import (
+    current_journal_position,
+    read_file_changes,
+)
+
+# Listeners receive the absolute path of a changed file or directory, or None
+# when changes may have been missed and every cached codebase must be rescanned
+FileChangeListener = Callable[[Optional[str]], None]
+
+_listeners: List[FileChangeListener] = []
+_journal_generation, _journal_offset = current_journal_position()
+
+
+def add_file_change_listener(listener: FileChangeListener) -> None:
+    """Register a cache to be notified of file changes."""
+    _listeners.append(listener)
+
+
+def notify_file_changed(path: str) -> None:
+    """
+    Notify the registered caches that a file or directory was written, created
+    or removed by a tool.
+
+    Args:
+        path: Path of the changed file or directory
+    """
+    abs_path = os.path.abspath(path)
+    for listener in _listeners:
+        listener(abs_path)
+
+
+def consume_file_change_journal() -> None:
+    """
+    Forward the changes other processes recorded in the shared journal to the
+    registered caches. Called before a cache is queried.
+    """
+    global _journal_generation, _journal_offset
+
+    paths, _journal_generation, _journal_offset, rotated = read_file_changes(
+        _journal_generation, _journal_offset
+    )
+    if rotated:
+        for listener in _listeners:
+            listener(None)
+    for path in paths:
+        notify_file_changed(path)
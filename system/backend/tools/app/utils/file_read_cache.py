@@ -0,0 +1,198 @@
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+from system.backend.tools.app.config.settings import settings
+from system.backend.tools.app.utils.file_changes import (
+    add_file_change_listener,
+    consume_file_change_journal,
+)
+
+BINARY_EXTENSIONS = frozenset(
+    [
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".exe",
+        ".dll",
+        ".bin",
+        ".o",
+    ]
+)
+BINARY_SNIFF_BYTES = 1024
+TEXT_CHARACTERS = bytearray(
+    {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F}
+)
+
+
+class CachedFile:
+    """
+    Decoded content of a file with the offset of every line start, so a
+    range of lines is a single slice of the content.
+    """
+
+    __slots__ = (
+        "mtime_ns",
+        "size",
+        "mtime",
+        "content",
+        "line_offsets",
+        "is_binary",
+        "is_undecodable",
+        "cost",
+    )
+
+    def __init__(self, stats: os.stat_result):
+        self.mtime_ns = stats.st_mtime_ns
+        self.size = stats.st_size
+        self.mtime = stats.st_mtime
+        self.content = ""
+        # line_offsets[i] is where line i starts; the last item is the end
+        self.line_offsets = array("q", [0])
+        self.is_binary = False
+        self.is_undecodable = False
+        self.cost = 0
+
+    @property
+    def total_lines(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def matches(self, stats: os.stat_result) -> bool:
+        return self.mtime_ns == stats.st_mtime_ns and self.size == stats.st_size
+
+    def read_lines(self, start: int, end: int) -> str:
+        """Return lines [start, end) exactly as readlines() would join them."""
+        return self.content[self.line_offsets[start] : self.line_offsets[end]]
+
+
+def _is_binary(head: bytes) -> bool:
+    # High ratio of null bytes or control characters suggests binary
+    return bool(head[:BINARY_SNIFF_BYTES].translate(None, TEXT_CHARACTERS))
+
+
+def load_file(file_path: str) -> CachedFile:
+    """
+    Read and index a file with a single open and read.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    with open(file_path, "rb") as file:
+        entry = CachedFile(os.fstat(file.fileno()))
+        if os.path.splitext(file_path)[1].lower() in BINARY_EXTENSIONS:
+            entry.is_binary = True
+            return entry
+        data = file.read()
+
+    if _is_binary(data):
+        entry.is_binary = True
+        return entry
+
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        entry.is_undecodable = True
+        return entry
+
+    # Same newline translation as opening the file in text mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    offsets = array("q", [0])
+    position = content.find("\n")
+    while position >= 0:
+        offsets.append(position + 1)
+        position = content.find("\n", position + 1)
+    if offsets[-1] != len(content):
+        offsets.append(len(content))
+
+    entry.content = content
+    entry.line_offsets = offsets
+    entry.cost = len(data) + offsets.itemsize * len(offsets)
+    return entry
+
+
+class FileReadCache:
+    """
+    LRU cache of indexed file contents keyed by path and validated against
+    the file's mtime and size on every lookup. Bounded by the total size of
+    the cached files; entries are dropped when a tool changes the file.
+    """
+
+    def __init__(self, max_bytes: int, max_file_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self._entries: "OrderedDict[str, CachedFile]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, abs_path: Optional[str]) -> None:
+        with self._lock:
+            if abs_path is None:
+                self._entries.clear()
+                self._total_bytes = 0
+                return
+
+            self._pop(abs_path)
+            prefix = abs_path + os.sep
+            for path in [
+                path for path in self._entries if path.startswith(prefix)
+            ]:
+                self._pop(path)
+
+    def _pop(self, abs_path: str) -> None:
+        entry = self._entries.pop(abs_path, None)
+        if entry is not None:
+            self._total_bytes -= entry.cost
+
+    def get(self, file_path: str) -> CachedFile:
+        """
+        Return the indexed content of a file, reading it only if it is not
+        cached or changed on disk since it was cached.
+
+        Args:
+            file_path: Path of the file to read
+
+        Returns:
+            The cached file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        consume_file_change_journal()
+
+        abs_path = os.path.abspath(file_path)
+        stats = os.stat(abs_path)
+
+        with self._lock:
+            entry = self._entries.get(abs_path)
+            if entry is not None and entry.matches(stats):
+                self._entries.move_to_end(abs_path)
+                return entry
+
+        entry = load_file(abs_path)
+        if entry.cost > self.max_file_bytes:
+            return entry
+
+        with self._lock:
+            self._pop(abs_path)
+            self._entries[abs_path] = entry
+            self._total_bytes += entry.cost
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.cost
+        return entry
+
+
+file_read_cache = FileReadCache(
+    max_bytes=settings.FILE_READ_CACHE_MAX_BYTES,
+    max_file_bytes=settings.FILE_READ_CACHE_MAX_FILE_BYTES,
+)
+add_file_change_listener(file_read_cache.invalidate)
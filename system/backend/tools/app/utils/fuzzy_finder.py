@@ -0,0 +1,322 @@
+import asyncio
+import heapq
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from system.backend.tools.app.config.settings import settings
+from system.backend.tools.app.utils.file_changes import (
+    add_file_change_listener,
+    consume_file_change_journal,
+)
+from system.backend.tools.app.utils.path_validator import DEFAULT_EXCLUSIONS
+
+# Scoring constants, loosely modelled on fzf's algorithm: every matched
+# character scores, matches at word/path-segment boundaries and runs of
+# consecutive matches earn bonuses, gaps between matches are penalized.
+# A consecutive run outweighs boundaries, so "button" prefers Button.jsx
+# over b/u/t/t/o/n.js, and the characters of a file name left unmatched
+# are penalized, so it prefers Button.jsx over ButtonGroup.jsx
+SCORE_MATCH = 16
+BONUS_SEGMENT_START = 10
+BONUS_BOUNDARY = 8
+BONUS_CAMEL_CASE = 7
+BONUS_CONSECUTIVE = 12
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+BONUS_BASENAME = 12
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+PENALTY_UNMATCHED_BASENAME = 2
+
+MAX_CHAR_SCORE = SCORE_MATCH + BONUS_SEGMENT_START + BONUS_CONSECUTIVE
+BOUNDARY_CHARACTERS = frozenset("_-. ")
+
+
+def _char_bonuses(path: str) -> List[int]:
+    """Compute the boundary bonus for a match at each position of a path."""
+    bonuses = []
+    previous = "/"
+    for char in path:
+        if previous == "/":
+            bonus = BONUS_SEGMENT_START
+        elif previous in BOUNDARY_CHARACTERS:
+            bonus = BONUS_BOUNDARY
+        elif previous.islower() and char.isupper():
+            bonus = BONUS_CAMEL_CASE
+        elif previous.isalpha() != char.isalpha() and char.isalnum():
+            bonus = BONUS_CAMEL_CASE
+        else:
+            bonus = 0
+        bonuses.append(bonus)
+        previous = char
+    return bonuses
+
+
+def _is_subsequence(query: str, text: str) -> bool:
+    position = 0
+    for char in query:
+        position = text.find(char, position)
+        if position < 0:
+            return False
+        position += 1
+    return True
+
+
+def _align(query: str, text: str, bonuses: List[int]) -> Optional[int]:
+    """
+    Score the best alignment of a query as a subsequence of a text.
+
+    Returns:
+        The alignment score, or None if the query is not a subsequence
+    """
+    length = len(text)
+    unmatched = float("-inf")
+    previous_row = None
+
+    for query_index, query_char in enumerate(query):
+        row = [unmatched] * length
+        gap_best = unmatched
+
+        for position in range(length):
+            if previous_row is not None and position >= 2:
+                gap_best = max(
+                    gap_best - PENALTY_GAP_EXTENSION,
+                    previous_row[position - 2] - PENALTY_GAP_START,
+                )
+
+            if text[position] != query_char:
+                continue
+
+            bonus = bonuses[position]
+            if previous_row is None:
+                row[position] = (
+                    SCORE_MATCH + bonus * BONUS_FIRST_CHAR_MULTIPLIER
+                )
+                continue
+
+            best = gap_best
+            if position >= 1 and previous_row[position - 1] > unmatched:
+                best = max(
+                    best,
+                    previous_row[position - 1] + BONUS_CONSECUTIVE,
+                )
+            if best > unmatched:
+                row[position] = best + SCORE_MATCH + bonus
+
+        if query_index and all(score == unmatched for score in row):
+            return None
+        previous_row = row
+
+    best_score = max(previous_row) if previous_row else unmatched
+    return None if best_score == unmatched else int(best_score)
+
+
+def fuzzy_score(query: str, rel_path: str) -> Optional[float]:
+    """
+    Score how well a fuzzy query matches a relative file path.
+
+    Space separated terms must all match. Each term is aligned against the
+    whole path and against the file name; matches inside the file name are
+    preferred.
+
+    Returns:
+        A score between 0 and 1, or None if the path does not match
+    """
+    lowered = rel_path.lower()
+    basename_start = rel_path.rfind("/") + 1
+    basename = lowered[basename_start:]
+    bonuses = _char_bonuses(rel_path)
+    # The file name without its extension, e.g. "button" for Button.jsx
+    stem_length = len(os.path.splitext(basename)[0]) or len(basename)
+
+    total = 0.0
+    terms = query.lower().split()
+    for term in terms:
+        if not _is_subsequence(term, lowered):
+            return None
+
+        best = _align(term, lowered, bonuses)
+        if _is_subsequence(term, basename):
+            basename_score = _align(term, basename, bonuses[basename_start:])
+            if basename_score is not None:
+                best = max(best, basename_score + BONUS_BASENAME)
+            # Of the files the term names, the closest names rank first
+            best -= PENALTY_UNMATCHED_BASENAME * max(0, stem_length - len(term))
+        if best is None:
+            return None
+
+        max_score = (
+            len(term) * MAX_CHAR_SCORE
+            + BONUS_SEGMENT_START * (BONUS_FIRST_CHAR_MULTIPLIER - 1)
+            + BONUS_BASENAME
+        )
+        total += max(0.0, min(1.0, best / max_score))
+
+    return round(total / len(terms), 4) if terms else None
+
+
+class FileListCache:
+    """
+    Cached list of the files under one codebase. The list is only rebuilt
+    after a file or directory is created or removed below the root, as
+    reported by the tools or seen in the mtime of a listed directory when
+    another writer changed it.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files: List[str] = []
+        self.known: Set[str] = set()
+        # Absolute directory -> mtime_ns when it was listed
+        self.directories: Dict[str, int] = {}
+        self.dirty = True
+        self.last_used = time.monotonic()
+
+    def mark_changed(self, abs_path: Optional[str]) -> None:
+        if abs_path is None or self.root.startswith(abs_path + os.sep):
+            self.dirty = True
+            return
+        if abs_path != self.root and not abs_path.startswith(
+            self.root + os.sep
+        ):
+            return
+
+        rel_path = os.path.relpath(abs_path, self.root).replace(os.sep, "/")
+        if rel_path == "." or os.path.isdir(abs_path):
+            self.dirty = True
+        elif os.path.exists(abs_path) != (rel_path in self.known):
+            # A file was created or removed, not just rewritten
+            self.dirty = True
+
+    def _directories_changed(self) -> bool:
+        for abs_dir, mtime_ns in self.directories.items():
+            try:
+                if os.stat(abs_dir).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def refresh(self) -> None:
+        if not self.dirty and not self._directories_changed():
+            return
+        self.dirty = False
+
+        files = []
+        directories = {}
+        stack = [(self.root, "")]
+        while stack:
+            current_abs, current_rel = stack.pop()
+            try:
+                mtime_ns = os.stat(current_abs).st_mtime_ns
+                entries = list(os.scandir(current_abs))
+            except OSError:
+                continue
+            directories[current_abs] = mtime_ns
+
+            for entry in entries:
+                entry_rel = (
+                    f"{current_rel}/{entry.name}" if current_rel else entry.name
+                )
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if DEFAULT_EXCLUSIONS.matches(entry_rel, is_dir):
+                        continue
+                    if is_dir:
+                        stack.append((entry.path, entry_rel))
+                    else:
+                        files.append(entry_rel)
+                except OSError:
+                    continue
+
+        files.sort()
+        self.files = files
+        self.known = set(files)
+        self.directories = directories
+
+
+class FuzzyFinder:
+    """
+    Fuzzy file finder over cached per-codebase file lists, evicting the least
+    recently used lists and those idle for longer than the configured time.
+    """
+
+    def __init__(self, max_codebases: int, idle_seconds: int):
+        self.max_codebases = max_codebases
+        self.idle_seconds = idle_seconds
+        self._caches: "OrderedDict[str, FileListCache]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def mark_changed(self, abs_path: Optional[str]) -> None:
+        for cache in self._caches.values():
+            cache.mark_changed(abs_path)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for root in [
+            root
+            for root, cache in self._caches.items()
+            if now - cache.last_used > self.idle_seconds
+        ]:
+            self._drop(root)
+        while len(self._caches) > self.max_codebases:
+            self._drop(next(iter(self._caches)))
+
+    def _drop(self, root: str) -> None:
+        self._caches.pop(root, None)
+        self._locks.pop(root, None)
+
+    async def search(
+        self, pattern: str, search_dir: str, max_results: int = 20
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the files whose path best matches a fuzzy pattern.
+
+        Args:
+            pattern: Fuzzy pattern to match against paths
+            search_dir: Absolute path of the directory to search in
+            max_results: Number of results to return
+
+        Returns:
+            List of (absolute file path, score) tuples, best match first
+        """
+        consume_file_change_journal()
+
+        cache = self._caches.get(search_dir)
+        if cache is None:
+            cache = FileListCache(search_dir)
+            self._caches[search_dir] = cache
+            self._locks[search_dir] = asyncio.Lock()
+        self._caches.move_to_end(search_dir)
+        cache.last_used = time.monotonic()
+        self._evict()
+
+        lock = self._locks.setdefault(search_dir, asyncio.Lock())
+        async with lock:
+            return await asyncio.to_thread(
+                self._search_cache, cache, pattern, max_results
+            )
+
+    def _search_cache(
+        self, cache: FileListCache, pattern: str, max_results: int
+    ) -> List[Tuple[str, float]]:
+        cache.refresh()
+
+        scored = []
+        for rel_path in cache.files:
+            score = fuzzy_score(pattern, rel_path)
+            if score is not None:
+                scored.append((score, -len(rel_path), rel_path))
+
+        return [
+            (os.path.join(cache.root, rel_path), score)
+            for score, _, rel_path in heapq.nlargest(max_results, scored)
+        ]
+
+
+fuzzy_finder = FuzzyFinder(
+    max_codebases=settings.SEARCH_INDEX_MAX_CODEBASES,
+    idle_seconds=settings.SEARCH_INDEX_IDLE_SECONDS,
+)
+add_file_change_listener(fuzzy_finder.mark_changed)
@@ -1,37 +1,139 @@
+import atexit
+import copy
+import itertools
 import json
 import logging
 import os
+import queue
+from contextvars import ContextVar
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
+
+from system.backend.tools.app.config.settings import settings
+
+# Structured fields (e.g. session_id) attached to every record logged in the
+# current context
+log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+
+STRUCTURED_FIELDS = ("stage", "screen")
+
+
+def set_log_context(**fields: Any) -> None:
+    """
+    Attach structured fields (e.g. stage, screen) to the records logged by
+    the current task and the tasks it starts.
+    """
+    log_context.set({**log_context.get(), **fields})
 
 
 class JSONFormatter(logging.Formatter):
+    """Formats records as compact single-line JSON."""
 
     def format(self, record):
         log_entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": datetime.fromtimestamp(record.created).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
             "levelname": record.levelname,
             "module": record.module,
             "funcName": record.funcName,
             "lineno": record.lineno,
         }
 
-        message = record.getMessage()
-        try:
-            parsed_message = json.loads(message)
-            log_entry["message"] = json.dumps(
-                parsed_message, indent=4, ensure_ascii=False
+        session_id = getattr(record, "session_id", None)
+        if session_id:
+            log_entry["session_id"] = session_id
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                log_entry[field] = value
+
+        log_entry["message"] = record.getMessage()
+        if record.exc_info:
+            log_entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exc_info"] = record.exc_text
+
+        return json.dumps(log_entry, ensure_ascii=False, default=str)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Samples debug records and copies the context fields onto each record,
+    since records are formatted on the listener thread.
+    """
+
+    def __init__(self, debug_sample_rate: int):
+        super().__init__()
+        self.debug_sample_rate = max(1, debug_sample_rate)
+        self._debug_counter = itertools.count()
+
+    def filter(self, record):
+        if (
+            record.levelno == logging.DEBUG
+            and next(self._debug_counter) % self.debug_sample_rate
+        ):
+            return False
+
+        for field, value in log_context.get().items():
+            if not hasattr(record, field):
+                setattr(record, field, value)
+        return True
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """
+    Queues records with their message merged but the traceback kept apart,
+    so that JSONFormatter writes it to its own exc_info field. The stock
+    prepare() appends it to the message instead.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
             )
-        except json.JSONDecodeError:
-            log_entry["message"] = message
+        record.exc_info = None
+        return record
+
+
+class _RoutingHandler(logging.Handler):
+    """Writes each record to the file handler of the logger it came from."""
+
+    def __init__(self):
+        super().__init__()
+        self.handlers: Dict[str, logging.Handler] = {}
+
+    def emit(self, record):
+        handler = self.handlers.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+    def close(self):
+        for handler in self.handlers.values():
+            handler.close()
+        super().close()
 
-        if record.args:
-            log_entry["extra"] = record.args
 
-        return json.dumps(log_entry, ensure_ascii=False, indent=4)
+# Records are put on a queue on the calling thread and written to the log
+# files by a single listener thread, so logging never blocks the event loop
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_routing_handler = _RoutingHandler()
+_listener = QueueListener(_log_queue, _routing_handler)
+_listener.start()
+atexit.register(_listener.stop)
 
 
 def setup_logger(
-    name: str, log_file: str, log_dir: str = "struct_logs", level=logging.INFO
+    name: str,
+    log_file: str,
+    log_dir: str = "struct_logs",
+    level: Optional[int] = None,
 ) -> logging.Logger:
     """
     Sets up a logger with a specified name and log file.
@@ -40,7 +142,7 @@ def setup_logger(
         name (str): The name of the logger.
         log_file (str): The name of the log file.
         log_dir (str): Directory where logs will be stored.
-        level (int): Logging level (default: logging.INFO).
+        level (int): Logging level (default: settings.LOG_LEVEL).
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -49,22 +151,34 @@ def setup_logger(
     log_path = os.path.join(log_dir, log_file)
 
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    logger.setLevel(level or settings.LOG_LEVEL)
+    logger.propagate = False
 
-    handler = logging.FileHandler(log_path)
-    handler.setFormatter(JSONFormatter())
+    file_handler = RotatingFileHandler(
+        log_path,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JSONFormatter())
+    _routing_handler.handlers[name] = file_handler
 
-    logger.addHandler(handler)
+    queue_handler = _StructuredQueueHandler(_log_queue)
+    queue_handler.addFilter(ContextFilter(settings.LOG_DEBUG_SAMPLE_RATE))
+    logger.addHandler(queue_handler)
     return logger
 
 
 loggers = {
+    "telemetry": setup_logger("telemetry", "telemetry.log"),
     "pinecone": setup_logger("pinecone_service", "pinecone_service.log"),
     "voyageai": setup_logger("voyageai_service", "voyageai_service.log"),
     "screen_generation": setup_logger(
         "screen_generation", "screen_generation.log"
     ),
     "anthropic": setup_logger("anthropic", "anthropic.log"),
+    "terminal": setup_logger("terminal", "terminal.log"),
+    "file_tools": setup_logger("file_tools", "file_tools.log"),
     "design_theme": setup_logger("design_theme", "design_theme.log"),
     "navigation_context": setup_logger(
         "navigation_context", "navigation_context.log"
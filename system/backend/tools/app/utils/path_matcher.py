@@ -0,0 +1,157 @@
+import fnmatch
+import re
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate a glob into a regex where "*" does not cross "/" but "**" does.
+    Like gitignore, "a/**/b" and "**/b" also match zero directories.
+    """
+    segments = pattern.split("**")
+    joins = []
+    for index in range(1, len(segments)):
+        previous, segment = segments[index - 1], segments[index]
+        if segment.startswith("/") and previous.endswith("/"):
+            segments[index - 1] = previous[:-1]
+            segments[index] = segment[1:]
+            joins.append("(?:/|/.*/)")
+        elif segment.startswith("/") and index == 1 and not previous:
+            segments[index] = segment[1:]
+            joins.append("(?:.*/)?")
+        else:
+            joins.append(".*")
+
+    parts = []
+    for index, segment in enumerate(segments):
+        if index:
+            parts.append(joins[index - 1])
+        translated = fnmatch.translate(segment)
+        # fnmatch.translate wraps the pattern as (?s:...)\Z
+        translated = translated[4:-3]
+        parts.append(translated.replace(".*", "[^/]*"))
+    return "".join(parts)
+
+
+def _compile(patterns: List[str]) -> Optional[re.Pattern]:
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{_translate(pattern)})" for pattern in patterns) + r"\Z",
+        re.DOTALL,
+    )
+
+
+class PathMatcher:
+    """
+    Path matcher with gitignore semantics, compiled once.
+
+    - "name" matches files and directories with that name at any depth
+    - "name/" matches only directories with that name
+    - "dir/name" (any pattern containing "/") is anchored to the search root
+    - "*", "?" and "[...]" glob within a path segment, "**" across segments
+    - "!pattern" re-includes paths matched by another pattern
+
+    Literal names are checked with set lookups; glob patterns are folded into
+    one regex per kind, so each path costs at most a few lookups and regex
+    matches regardless of the number of patterns.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(
+            pattern.strip() for pattern in patterns if pattern.strip()
+        )
+
+        names, dir_names = set(), set()
+        name_globs, dir_name_globs, path_globs, dir_path_globs = [], [], [], []
+        negated = []
+
+        for pattern in self.patterns:
+            if pattern.startswith("!"):
+                negated.append(pattern[1:])
+                continue
+
+            directory_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+
+            if "/" in pattern:
+                target = dir_path_globs if directory_only else path_globs
+                target.append(pattern.lstrip("/"))
+            elif GLOB_CHARACTERS.isdisjoint(pattern):
+                (dir_names if directory_only else names).add(pattern)
+            else:
+                (dir_name_globs if directory_only else name_globs).append(
+                    pattern
+                )
+
+        self.names: FrozenSet[str] = frozenset(names)
+        self.dir_names: FrozenSet[str] = frozenset(names | dir_names)
+        self._name_regex = _compile(name_globs)
+        self._dir_name_regex = _compile(name_globs + dir_name_globs)
+        self._path_regex = _compile(path_globs)
+        self._dir_path_regex = _compile(path_globs + dir_path_globs)
+        self._negated = PathMatcher(negated) if negated else None
+
+    def extend(self, patterns: Iterable[str]) -> "PathMatcher":
+        """Return a new matcher with additional patterns."""
+        return PathMatcher(self.patterns + tuple(patterns))
+
+    def matches_name(self, name: str, is_dir: bool) -> bool:
+        """
+        Check a file or directory name against the unanchored patterns only.
+        This is the fast path for walkers that do not track relative paths.
+        """
+        if is_dir:
+            matched = name in self.dir_names or bool(
+                self._dir_name_regex and self._dir_name_regex.match(name)
+            )
+        else:
+            matched = name in self.names or bool(
+                self._name_regex and self._name_regex.match(name)
+            )
+        if matched and self._negated is not None:
+            return not self._negated.matches_name(name, is_dir)
+        return matched
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """
+        Check whether a path matches the patterns (i.e. is ignored).
+
+        Args:
+            rel_path: Path relative to the search root, using "/" separators
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path matches the patterns
+        """
+        name = rel_path.rsplit("/", 1)[-1]
+        if is_dir:
+            path_regex = self._dir_path_regex
+            matched = name in self.dir_names or bool(
+                self._dir_name_regex and self._dir_name_regex.match(name)
+            )
+        else:
+            path_regex = self._path_regex
+            matched = name in self.names or bool(
+                self._name_regex and self._name_regex.match(name)
+            )
+        if not matched and path_regex is not None:
+            matched = bool(path_regex.match(rel_path))
+
+        if matched and self._negated is not None:
+            return not self._negated.matches(rel_path, is_dir)
+        return matched
+
+    def ripgrep_globs(self) -> List[str]:
+        """Return the patterns as ripgrep exclusion globs (-g flags)."""
+        globs = []
+        for pattern in self.patterns:
+            if pattern.startswith("!"):
+                globs.append(pattern[1:])
+            else:
+                globs.append(f"!{pattern}")
+        return globs
@@ -1,6 +1,8 @@
 import os
 from typing import List, Tuple
 
+from system.backend.tools.app.utils.path_matcher import PathMatcher
+
 # Define system directories that are off-limits (only critical system paths)
 SYSTEM_DIRECTORIES = [
     os.path.abspath("system"),
@@ -24,6 +26,141 @@ PROTECTED_ROOT_PATHS = [
 ]
 
 
+COMMON_EXCLUSION_PATTERNS = (
+    # Python virtual environments
+    ".venv",
+    "venv",
+    ".env",
+    "env",
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    "*.pyd",
+    # Node.js/JavaScript
+    "node_modules",
+    "package-lock.json",
+    "yarn.lock",
+    "npm-debug.log*",
+    "yarn-debug.log*",
+    "yarn-error.log*",
+    ".npm",
+    ".yarn",
+    # React/Next.js
+    ".next",
+    "dist",
+    "build",
+    ".nuxt",
+    ".output",
+    ".cache",
+    # Flutter/Dart
+    ".dart_tool",
+    ".flutter-plugins",
+    ".flutter-plugins-dependencies",
+    ".packages",
+    "pubspec.lock",
+    ".fvm",
+    ".idea",
+    ".vscode",
+    "android",
+    "ios",
+    "windows",
+    "macos",
+    "linux",
+    "web",
+    "build",
+    ".flutter",
+    ".metadata",
+    "*.g.dart",
+    "*.freezed.dart",
+    "*.mocks.dart",
+    "*.config.dart",
+    # Version control
+    ".git",
+    ".gitignore",
+    ".gitmodules",
+    ".svn",
+    ".hg",
+    # IDEs and editors
+    ".idea",
+    ".vscode",
+    ".vs",
+    "*.swp",
+    "*.swo",
+    "*~",
+    # OS specific
+    ".DS_Store",
+    "Thumbs.db",
+    "desktop.ini",
+    # Build artifacts
+    "*.log",
+    "coverage",
+    ".nyc_output",
+    "*.tmp",
+    "*.temp",
+)
+
+DIRECTORY_EXCLUSION_PATTERNS = (
+    # Python virtual environments
+    ".venv",
+    "venv",
+    ".env",
+    "env",
+    "__pycache__",
+    # Node.js/JavaScript
+    "node_modules",
+    ".npm",
+    ".yarn",
+    # React/Next.js
+    ".next",
+    "dist",
+    "build",
+    ".nuxt",
+    ".output",
+    ".cache",
+    # Flutter/Dart
+    ".dart_tool",
+    ".fvm",
+    ".idea",
+    ".vscode",
+    "android",
+    "ios",
+    "windows",
+    "macos",
+    "linux",
+    "web",
+    "build",
+    ".flutter",
+    # Version control
+    ".git",
+    ".svn",
+    ".hg",
+    # IDEs and editors
+    ".idea",
+    ".vscode",
+    ".vs",
+    # Build artifacts
+    "coverage",
+    ".nyc_output",
+)
+
+# Names from the directory list that are excluded as files too: a ".env"
+# file holds secrets
+FILE_AND_DIRECTORY_EXCLUSION_PATTERNS = (".env",)
+
+# Shared exclusion matcher used by every tool that walks the file system.
+# Names from the directory list only exclude directories, like "name/" in a
+# .gitignore file
+DEFAULT_EXCLUSIONS = PathMatcher(
+    (
+        f"{pattern}/"
+        if pattern in DIRECTORY_EXCLUSION_PATTERNS
+        and pattern not in FILE_AND_DIRECTORY_EXCLUSION_PATTERNS
+        else pattern
+    )
+    for pattern in COMMON_EXCLUSION_PATTERNS
+)
+
+
 def get_common_exclusion_patterns() -> List[str]:
     """
     Returns a list of common directories and files that should be excluded
@@ -32,78 +169,7 @@ def get_common_exclusion_patterns() -> List[str]:
     Returns:
         List of glob patterns to exclude
     """
-    return [
-        # Python virtual environments
-        ".venv",
-        "venv",
-        ".env",
-        "env",
-        "__pycache__",
-        "*.pyc",
-        "*.pyo",
-        "*.pyd",
-        # Node.js/JavaScript
-        "node_modules",
-        "package-lock.json",
-        "yarn.lock",
-        "npm-debug.log*",
-        "yarn-debug.log*",
-        "yarn-error.log*",
-        ".npm",
-        ".yarn",
-        # React/Next.js
-        ".next",
-        "dist",
-        "build",
-        ".nuxt",
-        ".output",
-        ".cache",
-        # Flutter/Dart
-        ".dart_tool",
-        ".flutter-plugins",
-        ".flutter-plugins-dependencies",
-        ".packages",
-        "pubspec.lock",
-        ".fvm",
-        ".idea",
-        ".vscode",
-        "android",
-        "ios",
-        "windows",
-        "macos",
-        "linux",
-        "web",
-        "build",
-        ".flutter",
-        ".metadata",
-        "*.g.dart",
-        "*.freezed.dart",
-        "*.mocks.dart",
-        "*.config.dart",
-        # Version control
-        ".git",
-        ".gitignore",
-        ".gitmodules",
-        ".svn",
-        ".hg",
-        # IDEs and editors
-        ".idea",
-        ".vscode",
-        ".vs",
-        "*.swp",
-        "*.swo",
-        "*~",
-        # OS specific
-        ".DS_Store",
-        "Thumbs.db",
-        "desktop.ini",
-        # Build artifacts
-        "*.log",
-        "coverage",
-        ".nyc_output",
-        "*.tmp",
-        "*.temp",
-    ]
+    return list(COMMON_EXCLUSION_PATTERNS)
 
 
 def get_directory_exclusion_patterns() -> List[str]:
@@ -114,51 +180,7 @@ def get_directory_exclusion_patterns() -> List[str]:
     Returns:
         List of directory names to exclude
     """
-    return [
-        # Python virtual environments
-        ".venv",
-        "venv",
-        ".env",
-        "env",
-        "__pycache__",
-        # Node.js/JavaScript
-        "node_modules",
-        ".npm",
-        ".yarn",
-        # React/Next.js
-        ".next",
-        "dist",
-        "build",
-        ".nuxt",
-        ".output",
-        ".cache",
-        # Flutter/Dart
-        ".dart_tool",
-        ".fvm",
-        ".idea",
-        ".vscode",
-        "android",
-        "ios",
-        "windows",
-        "macos",
-        "linux",
-        "web",
-        "build",
-        ".flutter",
-        # Version control
-        ".git",
-        ".svn",
-        ".hg",
-        # IDEs and editors
-        ".idea",
-        ".vscode",
-        ".vs",
-        # OS specific
-        ".DS_Store",
-        # Build artifacts
-        "coverage",
-        ".nyc_output",
-    ]
+    return list(DIRECTORY_EXCLUSION_PATTERNS)
 
 
 def get_ripgrep_exclusion_patterns() -> List[str]:
@@ -168,78 +190,7 @@ def get_ripgrep_exclusion_patterns() -> List[str]:
     Returns:
         List of patterns to exclude for ripgrep
     """
-    return [
-        # Python virtual environments
-        "!.venv/",
-        "!venv/",
-        "!.env/",
-        "!env/",
-        "!__pycache__/",
-        "!*.pyc",
-        "!*.pyo",
-        "!*.pyd",
-        # Node.js/JavaScript
-        "!node_modules/",
-        "!package-lock.json",
-        "!yarn.lock",
-        "!npm-debug.log*",
-        "!yarn-debug.log*",
-        "!yarn-error.log*",
-        "!.npm/",
-        "!.yarn/",
-        # React/Next.js
-        "!.next/",
-        "!dist/",
-        "!build/",
-        "!.nuxt/",
-        "!.output/",
-        "!.cache/",
-        # Flutter/Dart
-        "!.dart_tool/",
-        "!.flutter-plugins",
-        "!.flutter-plugins-dependencies",
-        "!.packages",
-        "!pubspec.lock",
-        "!.fvm/",
-        "!.idea/",
-        "!.vscode/",
-        "!android/",
-        "!ios/",
-        "!windows/",
-        "!macos/",
-        "!linux/",
-        "!web/",
-        "!build/",
-        "!.flutter/",
-        "!.metadata",
-        "!*.g.dart",
-        "!*.freezed.dart",
-        "!*.mocks.dart",
-        "!*.config.dart",
-        # Version control
-        "!.git/",
-        "!.gitignore",
-        "!.gitmodules",
-        "!.svn/",
-        "!.hg/",
-        # IDEs and editors
-        "!.idea/",
-        "!.vscode/",
-        "!.vs/",
-        "!*.swp",
-        "!*.swo",
-        "!*~",
-        # OS specific
-        "!.DS_Store",
-        "!Thumbs.db",
-        "!desktop.ini",
-        # Build artifacts
-        "!*.log",
-        "!coverage/",
-        "!.nyc_output/",
-        "!*.tmp",
-        "!*.temp",
-    ]
+    return DEFAULT_EXCLUSIONS.ripgrep_globs()
 
 
 def is_safe_path(path: str) -> Tuple[bool, str]:
@@ -0,0 +1,366 @@
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from system.backend.tools.app.config.settings import settings
+
+READ_CHUNK_BYTES = 64 * 1024
+DEFAULT_SESSION = "default"
+# Header the IDE agent sends with every tool call, so any tool use keeps the
+# session's processes alive
+SESSION_HEADER = "X-Session-Id"
+
+
+class ProcessLimitError(Exception):
+    """Raised when a session already runs the maximum number of processes."""
+
+
+class RingLog:
+    """
+    Bounded log file made of two segments. When the current segment is full
+    it replaces the previous one, so the log always holds between half and
+    all of max_bytes of the most recent output.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.previous_path = f"{path}.1"
+        self.segment_bytes = max(1, max_bytes // 2)
+        self._file = open(path, "wb")
+        self._written = 0
+        self._lock = threading.Lock()
+
+    def write(self, data: bytes) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            if len(data) > self.segment_bytes:
+                data = data[-self.segment_bytes :]
+            if self._written + len(data) > self.segment_bytes and self._written:
+                self._file.close()
+                os.replace(self.path, self.previous_path)
+                self._file = open(self.path, "wb")
+                self._written = 0
+            self._file.write(data)
+            self._file.flush()
+            self._written += len(data)
+
+    def tail(self, lines: int) -> str:
+        """Return the last lines of output, decoded leniently."""
+        data = b""
+        with self._lock:
+            for path in (self.previous_path, self.path):
+                try:
+                    with open(path, "rb") as file:
+                        data += file.read()
+                except FileNotFoundError:
+                    continue
+
+        text = data.decode("utf-8", errors="replace")
+        return "".join(text.splitlines(keepends=True)[-lines:])
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def remove(self) -> None:
+        self.close()
+        for path in (self.path, self.previous_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class BackgroundProcess:
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        command: str,
+        cwd: str,
+        session_id: str,
+        log: RingLog,
+    ):
+        self.process = process
+        self.pid = process.pid
+        self.command = command
+        self.cwd = cwd
+        self.session_id = session_id
+        self.log = log
+        self.started_at = datetime.now()
+        # Monotonic time the process exited and its output was drained
+        self.exited_at: Optional[float] = None
+        # Monotonic time logs were last read after the process exited, so
+        # the caller has seen all of its output
+        self.final_logs_read_at: Optional[float] = None
+
+        # Drain stdout and stderr so a chatty process never blocks on a full
+        # pipe
+        self._reader = threading.Thread(
+            target=self._drain, name=f"process-log-{self.pid}", daemon=True
+        )
+        self._reader.start()
+
+    def _drain(self) -> None:
+        stream = self.process.stdout
+        while True:
+            chunk = stream.read1(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            self.log.write(chunk)
+        stream.close()
+        self.process.wait()
+        self.log.close()
+        self.exited_at = time.monotonic()
+
+    @property
+    def is_running(self) -> bool:
+        return self.process.poll() is None
+
+    def read_logs(self, lines: int) -> str:
+        """Return the last lines of output, see RingLog.tail."""
+        exited = self.exited_at is not None
+        output = self.log.tail(lines)
+        if exited:
+            self.final_logs_read_at = time.monotonic()
+        return output
+
+    def describe(self) -> Dict[str, Any]:
+        exit_code = self.process.poll()
+        return {
+            "pid": self.pid,
+            "command": self.command,
+            "cwd": self.cwd,
+            "status": "running" if exit_code is None else "exited",
+            "exit_code": exit_code,
+            "started_at": self.started_at.isoformat(),
+        }
+
+    def kill(self, grace_seconds: float) -> None:
+        """
+        Terminate the process group, then kill whatever is left of it, such
+        as children that outlived the shell.
+        """
+        try:
+            os.killpg(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        try:
+            self.process.wait(timeout=grace_seconds)
+        except subprocess.TimeoutExpired:
+            pass
+        try:
+            os.killpg(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.process.wait()
+
+
+class ProcessManager:
+    """
+    Registry of the background processes started by run_terminal_cmd.
+
+    Output is spilled to a ring-buffered log file per process. Each session
+    may run a limited number of processes at a time, and the processes of a
+    session that has not used any tool for the configured time are killed by
+    the reaper. The reaper also forgets exited processes a grace period after
+    their final logs were read, so follow-up status or kill calls still find
+    them, or once their retention time passed.
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        log_max_bytes: int,
+        max_per_session: int,
+        session_ttl_seconds: int,
+        kill_grace_seconds: float,
+        exited_retention_seconds: int,
+        read_grace_seconds: int,
+    ):
+        self.log_dir = log_dir
+        self.log_max_bytes = log_max_bytes
+        self.max_per_session = max_per_session
+        self.session_ttl_seconds = session_ttl_seconds
+        self.kill_grace_seconds = kill_grace_seconds
+        self.exited_retention_seconds = exited_retention_seconds
+        self.read_grace_seconds = read_grace_seconds
+        self._processes: Dict[int, BackgroundProcess] = {}
+        self._last_activity: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _touch(self, session_id: str) -> None:
+        self._last_activity[session_id] = time.monotonic()
+
+    def touch(self, session_id: str) -> None:
+        """Record tool use by a session that has background processes."""
+        with self._lock:
+            if session_id in self._last_activity:
+                self._touch(session_id)
+
+    def start(
+        self, command: str, cwd: str, session_id: Optional[str]
+    ) -> BackgroundProcess:
+        """
+        Start a shell command in its own process group.
+
+        Raises:
+            ProcessLimitError: If the session runs too many processes
+        """
+        session_id = session_id or DEFAULT_SESSION
+        with self._lock:
+            self._touch(session_id)
+            running = [
+                process
+                for process in self._processes.values()
+                if process.session_id == session_id and process.is_running
+            ]
+            if len(running) >= self.max_per_session:
+                raise ProcessLimitError(
+                    f"Session already runs {len(running)} background "
+                    f"processes (PIDs {', '.join(str(p.pid) for p in running)}). "
+                    "Kill one before starting another."
+                )
+
+            os.makedirs(self.log_dir, exist_ok=True)
+            log_path = os.path.join(
+                self.log_dir, f"process-{time.time_ns()}.log"
+            )
+            log = RingLog(log_path, self.log_max_bytes)
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                    cwd=cwd,
+                    shell=True,  # Use shell to expand wildcards, variables, etc.
+                )
+            except Exception:
+                log.remove()
+                raise
+
+            background = BackgroundProcess(
+                process, command, cwd, session_id, log
+            )
+            self._processes[background.pid] = background
+            return background
+
+    def get(self, pid: int, session_id: Optional[str]) -> BackgroundProcess:
+        """
+        Look up a process of the session.
+
+        Raises:
+            KeyError: If the session has no process with this PID
+        """
+        session_id = session_id or DEFAULT_SESSION
+        with self._lock:
+            self._touch(session_id)
+            process = self._processes.get(pid)
+            if process is None or process.session_id != session_id:
+                raise KeyError(pid)
+            return process
+
+    def list(self, session_id: Optional[str]) -> List[Dict[str, Any]]:
+        session_id = session_id or DEFAULT_SESSION
+        with self._lock:
+            self._touch(session_id)
+            return [
+                process.describe()
+                for process in self._processes.values()
+                if process.session_id == session_id
+            ]
+
+    def kill(self, pid: int, session_id: Optional[str]) -> Dict[str, Any]:
+        process = self.get(pid, session_id)
+        process.kill(self.kill_grace_seconds)
+        return process.describe()
+
+    def _remove_session(self, session_id: str) -> List[int]:
+        with self._lock:
+            self._last_activity.pop(session_id, None)
+            processes = [
+                process
+                for process in self._processes.values()
+                if process.session_id == session_id
+            ]
+            for process in processes:
+                self._processes.pop(process.pid, None)
+
+        for process in processes:
+            process.kill(self.kill_grace_seconds)
+            process.log.remove()
+        return [process.pid for process in processes]
+
+    def _prune_exited(self, now: float) -> List[int]:
+        with self._lock:
+            exited = [
+                process
+                for process in self._processes.values()
+                if process.exited_at is not None
+                and (
+                    now - process.exited_at > self.exited_retention_seconds
+                    or (
+                        process.final_logs_read_at is not None
+                        and now - process.final_logs_read_at
+                        > self.read_grace_seconds
+                    )
+                )
+            ]
+            for process in exited:
+                self._processes.pop(process.pid, None)
+
+        for process in exited:
+            process.log.remove()
+        return [process.pid for process in exited]
+
+    def reap_expired(self) -> List[int]:
+        """
+        Kill and forget the processes of the expired sessions, and forget
+        the exited processes that are no longer needed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                session_id
+                for session_id, last_activity in self._last_activity.items()
+                if now - last_activity > self.session_ttl_seconds
+            ]
+
+        reaped = self._prune_exited(now)
+        for session_id in expired:
+            reaped.extend(self._remove_session(session_id))
+        return reaped
+
+    async def run_reaper(self, interval_seconds: float = 60) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await asyncio.to_thread(self.reap_expired)
+
+    def shutdown(self) -> None:
+        """Kill every background process, e.g. when the server stops."""
+        with self._lock:
+            sessions = {
+                process.session_id for process in self._processes.values()
+            }
+        for session_id in sessions:
+            self._remove_session(session_id)
+
+
+process_manager = ProcessManager(
+    log_dir=settings.BACKGROUND_PROCESS_LOG_DIR,
+    log_max_bytes=settings.BACKGROUND_PROCESS_LOG_MAX_BYTES,
+    max_per_session=settings.BACKGROUND_PROCESS_MAX_PER_SESSION,
+    session_ttl_seconds=settings.BACKGROUND_PROCESS_SESSION_TTL_SECONDS,
+    kill_grace_seconds=settings.BACKGROUND_PROCESS_KILL_GRACE_SECONDS,
+    exited_retention_seconds=(
+        settings.BACKGROUND_PROCESS_EXITED_RETENTION_SECONDS
+    ),
+    read_grace_seconds=settings.BACKGROUND_PROCESS_READ_GRACE_SECONDS,
+)
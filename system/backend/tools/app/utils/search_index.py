@@ -0,0 +1,548 @@
+import asyncio
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from system.backend.tools.app.config.settings import settings
+from system.backend.tools.app.utils.file_changes import (
+    add_file_change_listener,
+    consume_file_change_journal,
+)
+from system.backend.tools.app.utils.path_matcher import PathMatcher
+from system.backend.tools.app.utils.path_validator import DEFAULT_EXCLUSIONS
+
+# Files larger than this are not kept in memory; they are always treated as
+# candidates and read from disk when a query needs them
+MAX_INDEXED_FILE_BYTES = 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _is_excluded_directory(name: str) -> bool:
+    return name.startswith(".") or DEFAULT_EXCLUSIONS.matches_name(name, True)
+
+
+def _is_excluded_file(name: str) -> bool:
+    return name.startswith(".") or DEFAULT_EXCLUSIONS.matches_name(name, False)
+
+
+def _sequence_literals(items) -> List[List[str]]:
+    """
+    Collect the literal strings every match of a parsed regex sequence must
+    contain.
+
+    Returns:
+        Alternatives (OR) of literal lists (AND); an alternative with no
+        literals means the sequence can match without any known text
+    """
+    literals = []
+    alternatives = None
+    run = []
+
+    def flush():
+        if len(run) >= 3:
+            literals.append("".join(run))
+        run.clear()
+
+    for op, value in items:
+        if op == sre_parse.LITERAL:
+            run.append(chr(value))
+            continue
+
+        flush()
+        if op == sre_parse.SUBPATTERN:
+            inner = _sequence_literals(value[-1])
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and value[0]:
+            inner = _sequence_literals(value[2])
+        elif op == sre_parse.BRANCH:
+            inner = [
+                alternative
+                for branch in value[1]
+                for alternative in _sequence_literals(branch)
+            ]
+        else:
+            continue
+
+        if len(inner) == 1:
+            literals.extend(inner[0])
+        elif alternatives is None and all(inner):
+            alternatives = inner
+    flush()
+
+    if alternatives is None:
+        return [literals]
+    return [alternative + literals for alternative in alternatives]
+
+
+def required_trigram_sets(pattern: str) -> Optional[List[Set[str]]]:
+    """
+    Derive the trigram sets a file must contain to possibly match a regex.
+
+    Returns:
+        One trigram set per alternative (a file must contain every trigram of
+        at least one set), or None if the regex cannot be narrowed down
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+    required = []
+    for alternative in _sequence_literals(list(parsed)):
+        trigrams = set()
+        for literal in alternative:
+            trigrams |= _trigrams(literal.lower())
+        if not trigrams:
+            return None
+        required.append(trigrams)
+    return required
+
+
+def _glob_matches(rel_path: str, matcher: PathMatcher) -> bool:
+    """Match a file, or any of its parent directories, like ripgrep globs."""
+    if matcher.matches(rel_path, False):
+        return True
+    parts = rel_path.split("/")
+    return any(
+        matcher.matches("/".join(parts[:depth]), True)
+        for depth in range(1, len(parts))
+    )
+
+
+class IndexedFile:
+    __slots__ = ("stamp", "content", "trigrams")
+
+    def __init__(
+        self,
+        stamp: Tuple[int, int],
+        content: Optional[str],
+        trigrams: Optional[Set[str]],
+    ):
+        self.stamp = stamp
+        self.content = content
+        self.trigrams = trigrams
+
+
+class TrigramIndex:
+    """
+    In-memory trigram index over the text files of one codebase.
+
+    The index is built lazily on the first search and kept up to date by
+    re-reading only the files reported as changed, by the tools or through
+    the file change journal. Before each search the indexed directories are
+    also checked against their mtime, so files created or removed by other
+    writers are picked up as well.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files: Dict[str, IndexedFile] = {}
+        # Relative directory -> mtime_ns when it was last scanned; a file
+        # created, removed or renamed in it changes its mtime
+        self.directories: Dict[str, int] = {}
+        self.postings: Dict[str, Set[str]] = {}
+        self.unindexed: Set[str] = set()
+        self.last_used = time.monotonic()
+        self._pending: Set[str] = {root}
+        self._pending_lock = threading.Lock()
+
+    def mark_changed(self, abs_path: str) -> None:
+        """Queue a path (file or directory) for refresh on the next search."""
+        if abs_path == self.root or abs_path.startswith(self.root + os.sep):
+            changed = abs_path
+        elif self.root.startswith(abs_path + os.sep):
+            changed = self.root
+        else:
+            return
+        with self._pending_lock:
+            self._pending.add(changed)
+
+    def _stale_paths(self) -> Set[str]:
+        """
+        Find the indexed directories whose entries changed on disk since they
+        were scanned, whoever changed them. Files rewritten in place are
+        reported by the tools and the file change journal instead, so the
+        check stays proportional to the number of directories.
+        """
+        stale = set()
+        for rel_dir, mtime_ns in self.directories.items():
+            abs_dir = os.path.join(self.root, rel_dir) if rel_dir else self.root
+            try:
+                if os.stat(abs_dir).st_mtime_ns == mtime_ns:
+                    continue
+            except OSError:
+                pass
+            stale.add(abs_dir)
+        return stale
+
+    def refresh(self) -> None:
+        """Apply all queued changes and changes found on disk to the index."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, set()
+
+        if self.root in pending:
+            pending = {self.root}
+        else:
+            pending |= self._stale_paths()
+
+        for abs_path in pending:
+            rel_path = os.path.relpath(abs_path, self.root).replace(os.sep, "/")
+            if rel_path == ".":
+                rel_path = ""
+            if not self._is_indexable_path(rel_path):
+                continue
+
+            if os.path.isdir(abs_path):
+                if rel_path and _is_excluded_directory(
+                    os.path.basename(rel_path)
+                ):
+                    continue
+                self._refresh_directory(abs_path, rel_path)
+            else:
+                self._remove_prefix(rel_path)
+                self._refresh_file(abs_path, rel_path)
+                self.directories.pop(rel_path, None)
+
+    def _is_indexable_path(self, rel_path: str) -> bool:
+        if not rel_path:
+            return True
+        parts = rel_path.split("/")
+        return not any(_is_excluded_directory(part) for part in parts[:-1])
+
+    def _refresh_directory(self, abs_dir: str, rel_dir: str) -> None:
+        seen = set()
+        stack = [(abs_dir, rel_dir)]
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        for path in [
+            path
+            for path in self.directories
+            if path == rel_dir or path.startswith(prefix)
+        ]:
+            del self.directories[path]
+
+        while stack:
+            current_abs, current_rel = stack.pop()
+            try:
+                # Taken before listing, so a change during the scan is seen
+                # by the next check
+                mtime_ns = os.stat(current_abs).st_mtime_ns
+                entries = list(os.scandir(current_abs))
+            except OSError:
+                continue
+            self.directories[current_rel] = mtime_ns
+
+            for entry in entries:
+                entry_rel = (
+                    f"{current_rel}/{entry.name}" if current_rel else entry.name
+                )
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_excluded_directory(entry.name):
+                            stack.append((entry.path, entry_rel))
+                    elif entry.is_file() and not _is_excluded_file(entry.name):
+                        seen.add(entry_rel)
+                        stat = entry.stat()
+                        indexed = self.files.get(entry_rel)
+                        stamp = (stat.st_mtime_ns, stat.st_size)
+                        if indexed is None or indexed.stamp != stamp:
+                            self._refresh_file(entry.path, entry_rel)
+                except OSError:
+                    continue
+
+        for rel_path in [
+            path
+            for path in self.files
+            if path.startswith(prefix) and path not in seen
+        ]:
+            self._remove_file(rel_path)
+
+    def _refresh_file(self, abs_path: str, rel_path: str) -> None:
+        self._remove_file(rel_path)
+        if _is_excluded_file(os.path.basename(rel_path)):
+            return
+
+        try:
+            stat = os.stat(abs_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stat.st_size > MAX_INDEXED_FILE_BYTES:
+                self.files[rel_path] = IndexedFile(stamp, None, None)
+                self.unindexed.add(rel_path)
+                return
+
+            with open(abs_path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return
+
+        if b"\0" in data[:BINARY_SNIFF_BYTES]:
+            return
+
+        content = data.decode("utf-8", errors="replace")
+        trigrams = _trigrams(content.lower())
+        self.files[rel_path] = IndexedFile(stamp, content, trigrams)
+        for trigram in trigrams:
+            self.postings.setdefault(trigram, set()).add(rel_path)
+
+    def _remove_file(self, rel_path: str) -> None:
+        indexed = self.files.pop(rel_path, None)
+        if indexed is None:
+            return
+        self.unindexed.discard(rel_path)
+        for trigram in indexed.trigrams or ():
+            paths = self.postings.get(trigram)
+            if paths is not None:
+                paths.discard(rel_path)
+                if not paths:
+                    del self.postings[trigram]
+
+    def _remove_prefix(self, rel_path: str) -> None:
+        prefix = f"{rel_path}/"
+        for path in [path for path in self.files if path.startswith(prefix)]:
+            self._remove_file(path)
+        for path in [
+            path for path in self.directories if path.startswith(prefix)
+        ]:
+            del self.directories[path]
+
+    def candidates(self, required: Optional[List[Set[str]]]) -> List[str]:
+        """Return the files that may contain a match, in path order."""
+        if required is None:
+            return sorted(self.files)
+
+        matched = set(self.unindexed)
+        for trigrams in required:
+            posting_lists = sorted(
+                (self.postings.get(trigram, set()) for trigram in trigrams),
+                key=len,
+            )
+            found = set(posting_lists[0])
+            for paths in posting_lists[1:]:
+                found &= paths
+                if not found:
+                    break
+            matched |= found
+        return sorted(matched)
+
+    def read_lines(self, rel_path: str) -> List[str]:
+        indexed = self.files[rel_path]
+        if indexed.content is not None:
+            return indexed.content.splitlines()
+        try:
+            with open(
+                os.path.join(self.root, rel_path),
+                "r",
+                encoding="utf-8",
+                errors="replace",
+            ) as file:
+                return file.read().splitlines()
+        except OSError:
+            return []
+
+
+class SearchIndexRegistry:
+    """
+    Keeps one TrigramIndex per searched codebase, evicting the least recently
+    used ones and those idle for longer than the configured time.
+    """
+
+    def __init__(self, max_indexes: int, idle_seconds: int):
+        self.max_indexes = max_indexes
+        self.idle_seconds = idle_seconds
+        self._indexes: "OrderedDict[str, TrigramIndex]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def mark_changed(self, abs_path: Optional[str]) -> None:
+        """
+        Queue a changed path for every index covering it.
+
+        Args:
+            abs_path: Absolute path of the changed file or directory, or None
+                to rescan every index
+        """
+        for index in self._indexes.values():
+            index.mark_changed(abs_path or index.root)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for root in [
+            root
+            for root, index in self._indexes.items()
+            if now - index.last_used > self.idle_seconds
+        ]:
+            self._drop(root)
+        while len(self._indexes) > self.max_indexes:
+            self._drop(next(iter(self._indexes)))
+
+    def _drop(self, root: str) -> None:
+        self._indexes.pop(root, None)
+        self._locks.pop(root, None)
+
+    def _get_index(self, search_root: str) -> Tuple[TrigramIndex, str]:
+        """Find an index covering the search root, creating one if needed."""
+        for root, index in self._indexes.items():
+            if search_root.startswith(root + os.sep):
+                rel_prefix = os.path.relpath(search_root, root).replace(
+                    os.sep, "/"
+                )
+                if index._is_indexable_path(rel_prefix + "/"):
+                    return index, rel_prefix
+
+        index = self._indexes.get(search_root)
+        if index is None:
+            index = TrigramIndex(search_root)
+            self._indexes[search_root] = index
+            self._locks[search_root] = asyncio.Lock()
+        return index, ""
+
+    async def search(
+        self,
+        query: str,
+        search_path: str,
+        case_sensitive: bool = True,
+        include_pattern: Optional[str] = None,
+        exclude_pattern: Optional[str] = None,
+        context_lines: int = 0,
+        max_matches_per_file: Optional[int] = None,
+        max_results: int = 50,
+    ) -> Optional[Tuple[List[str], int]]:
+        """
+        Search a codebase through its trigram index.
+
+        The index narrows the search down to the files that contain the
+        literal parts of the query; only those are matched line by line.
+
+        Args:
+            query: Regex pattern to search for
+            search_path: Directory to search in, as given by the caller
+            case_sensitive: Whether the search is case sensitive
+            include_pattern: Glob of files to include
+            exclude_pattern: Glob of files to exclude
+            context_lines: Lines of context to show around each match
+            max_matches_per_file: Maximum matches reported per file
+            max_results: Maximum matches reported in total
+
+        Returns:
+            Tuple of (formatted result lines, number of matches) in the same
+            format as the ripgrep search, or None if the query has to be run
+            by ripgrep instead
+        """
+        search_root = os.path.abspath(search_path)
+        if not os.path.isdir(search_root):
+            return None
+
+        try:
+            pattern = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+        except re.error:
+            return None
+
+        consume_file_change_journal()
+        index, rel_prefix = self._get_index(search_root)
+        self._indexes.move_to_end(index.root)
+        index.last_used = time.monotonic()
+        self._evict()
+
+        lock = self._locks.setdefault(index.root, asyncio.Lock())
+        async with lock:
+            return await asyncio.to_thread(
+                self._search_index,
+                index,
+                rel_prefix,
+                pattern,
+                search_path,
+                PathMatcher([include_pattern]) if include_pattern else None,
+                PathMatcher([exclude_pattern]) if exclude_pattern else None,
+                context_lines or 0,
+                max_matches_per_file,
+                max_results,
+            )
+
+    def _search_index(
+        self,
+        index: TrigramIndex,
+        rel_prefix: str,
+        pattern: re.Pattern,
+        search_path: str,
+        include_matcher: Optional[PathMatcher],
+        exclude_matcher: Optional[PathMatcher],
+        context_lines: int,
+        max_matches_per_file: Optional[int],
+        max_results: int,
+    ) -> Tuple[List[str], int]:
+        index.refresh()
+
+        prefix = f"{rel_prefix}/" if rel_prefix else ""
+        results = []
+        match_count = 0
+
+        for rel_path in index.candidates(
+            required_trigram_sets(pattern.pattern)
+        ):
+            if not rel_path.startswith(prefix):
+                continue
+            search_rel = rel_path[len(prefix) :]
+            if include_matcher and not _glob_matches(
+                search_rel, include_matcher
+            ):
+                continue
+            if exclude_matcher and _glob_matches(search_rel, exclude_matcher):
+                continue
+
+            display_path = os.path.join(search_path, search_rel)
+            lines = index.read_lines(rel_path)
+            file_matches = 0
+            last_emitted = -1
+            context_until = -1
+
+            for number, line in enumerate(lines):
+                capped = (
+                    max_matches_per_file is not None
+                    and file_matches >= max_matches_per_file
+                )
+                if not capped and pattern.search(line):
+                    for before in range(
+                        max(last_emitted + 1, number - context_lines), number
+                    ):
+                        results.append(
+                            f"{display_path}-{before + 1}- {lines[before].strip()}"
+                        )
+                    results.append(
+                        f"{display_path}:{number + 1}: {line.strip()}"
+                    )
+                    match_count += 1
+                    file_matches += 1
+                    last_emitted = number
+                    context_until = number + context_lines
+
+                    if match_count >= max_results:
+                        results.append(
+                            f"... (output truncated at {max_results} matches)"
+                        )
+                        return results, match_count
+                elif number <= context_until:
+                    results.append(
+                        f"{display_path}-{number + 1}- {line.strip()}"
+                    )
+                    last_emitted = number
+                elif capped:
+                    break
+
+        return results, match_count
+
+
+search_index_registry = SearchIndexRegistry(
+    max_indexes=settings.SEARCH_INDEX_MAX_CODEBASES,
+    idle_seconds=settings.SEARCH_INDEX_IDLE_SECONDS,
+)
+add_file_change_listener(search_index_registry.mark_changed)
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Queued by stop() after the last document
+_STOP = object()
+
+
+class WriteBehindSink:
+    """
+    Buffers documents for one collection and writes them in the background
+    with insert_many, once max_batch_size documents are queued or
+    flush_interval_seconds after the first queued document.
+
+    submit() never waits: when the queue is full because Mongo is slow or
+    down, the oldest queued document is dropped to make room.
+
+    Shared by the tools server and the agentic workflow, which each create
+    their sinks with their own collections and logger.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        get_collection: Callable[[], Any],
+        max_batch_size: int,
+        flush_interval_seconds: float,
+        max_queue_size: int,
+        logger: logging.Logger,
+    ):
+        self.name = name
+        self.get_collection = get_collection
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+        self.logger = logger
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._collection = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self._task is not None
+            and not self._task.done()
+            and not self._stopping
+        )
+
+    def submit(self, document: Dict[str, Any]) -> bool:
+        """
+        Queue a document for writing.
+
+        Returns:
+            False if the sink is not running and the caller should write the
+            document itself
+        """
+        if not self.is_running:
+            return False
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(document)
+        return True
+
+    async def start(self) -> None:
+        self._collection = self.get_collection()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout_seconds: float = 10.0) -> None:
+        """Stop accepting documents and flush the queued ones."""
+        if not self.is_running:
+            return
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._flush_and_stop(), timeout_seconds)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "Timed out flushing %s documents on shutdown", self.name
+            )
+            self._task.cancel()
+
+    async def _flush_and_stop(self) -> None:
+        await self._queue.put(_STOP)
+        await self._task
+
+    async def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            document = await self._queue.get()
+            if document is _STOP:
+                return
+
+            batch = [document]
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    document = await asyncio.wait_for(
+                        self._queue.get(), remaining
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if document is _STOP:
+                    stopped = True
+                    break
+                batch.append(document)
+            await self._write(batch)
+
+    async def _write(self, documents: List[Dict[str, Any]]) -> None:
+        if self.dropped:
+            self.logger.warning(
+                "Dropped %d %s documents while the queue was full",
+                self.dropped,
+                self.name,
+            )
+            self.dropped = 0
+        try:
+            await self._collection.insert_many(documents, ordered=False)
+        except Exception as e:
+            self.logger.error(
+                "Error while inserting %s documents: %s", self.name, e
+            )
@@ -1,24 +1,41 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from system.backend.tools.app.apis import (
+    batch_routes,
     code_base_search_routes,
     file_access_routes,
     modification_routes,
     run_terminal_cmd_routes,
 )
-from system.backend.tools.app.config.database import mongodb_database
+from system.backend.tools.app.config.database import (
+    error_sink,
+    llm_usage_sink,
+    mongodb_database,
+)
+from system.backend.tools.app.utils.process_manager import (
+    SESSION_HEADER,
+    process_manager,
+)
 
 
 @asynccontextmanager
 async def db_lifespan(app: FastAPI):
     mongodb_database.connect()
+    await error_sink.start()
+    await llm_usage_sink.start()
+    reaper = asyncio.create_task(process_manager.run_reaper())
 
     yield
 
+    reaper.cancel()
+    await asyncio.to_thread(process_manager.shutdown)
+    await error_sink.stop()
+    await llm_usage_sink.stop()
     mongodb_database.disconnect()
 
 
@@ -35,6 +52,18 @@ app.include_router(
 app.include_router(
     file_access_routes.router, prefix="/api/v1", tags=["file access tools"]
 )
+app.include_router(batch_routes.router, prefix="/api/v1", tags=["batch"])
+
+
+@app.middleware("http")
+async def refresh_session_activity(request: Request, call_next):
+    # Any tool call keeps the session's background processes alive
+    session_id = request.headers.get(SESSION_HEADER)
+    if session_id:
+        process_manager.touch(session_id)
+    return await call_next(request)
+
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
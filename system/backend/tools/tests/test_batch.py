@@ -0,0 +1,64 @@
+import asyncio
+
+from system.backend.tools.app.controllers.batch_tools.batch_controller import (
+    BatchController,
+)
+from system.backend.tools.app.models.schemas.batch_schemas import BatchCall
+from system.backend.tools.app.usecases.batch_tools.batch_usecase import (
+    BatchUsecase,
+)
+
+
+class _ErrorRepo:
+    async def insert_error(self, error):
+        pass
+
+
+def _run(calls):
+    controller = BatchController(BatchUsecase(), _ErrorRepo(), None)
+    batch = controller.batch_usecase.execute(
+        [BatchCall(**call) for call in calls], controller.handlers
+    )
+    return asyncio.run(batch)["results"]
+
+
+def test_calls_run_through_their_controllers_in_order(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("old\n")
+
+    results = _run(
+        [
+            {
+                "id": "replace",
+                "endpoint": "/search-replace",
+                "payload": {
+                    "query": "old",
+                    "replacement": "new",
+                    "default_path": str(tmp_path),
+                },
+            },
+            {
+                "endpoint": "/read-file",
+                "payload": {"file_path": str(path)},
+                "depends_on": ["replace"],
+            },
+        ]
+    )
+
+    assert [result["status_code"] for result in results] == [200, 200]
+    assert "new" in str(results[1]["body"]["data"])
+
+
+def test_invalid_payload_fails_its_call_and_skips_dependents(tmp_path):
+    results = _run(
+        [
+            {"id": "read", "endpoint": "/read-file", "payload": {}},
+            {
+                "endpoint": "/list-directory",
+                "payload": {"dir_path": str(tmp_path)},
+                "depends_on": ["read"],
+            },
+        ]
+    )
+
+    assert [result["status_code"] for result in results] == [422, 424]
@@ -0,0 +1,28 @@
+import asyncio
+import os
+
+from system.backend.tools.app.services.file_access_tools.directory_list_service import (
+    DirectoryListService,
+)
+
+
+def test_symlinked_directories_are_listed_but_not_followed(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "App.jsx").write_text("")
+    os.symlink(tmp_path, tmp_path / "src" / "loop")
+
+    page = asyncio.run(
+        DirectoryListService(error_repo=None).list_directory(
+            str(tmp_path), recursive=True, include_stats=False
+        )
+    )
+
+    entries = {
+        os.path.relpath(entry["path"], tmp_path): entry["type"]
+        for entry in page["entries"]
+    }
+    assert entries == {
+        "src": "directory",
+        os.path.join("src", "App.jsx"): "file",
+        os.path.join("src", "loop"): "file",
+    }
@@ -0,0 +1,119 @@
+from system.backend.tools.app.utils.fast_apply import apply_edit_locally
+
+ORIGINAL = """import React from 'react';
+
+function A() {
+  const value = computeA();
+  return value;
+}
+
+function B() {
+  const value = computeB();
+  return value;
+}
+
+export default A;
+"""
+
+
+def test_insertion_between_markers_keeps_following_function():
+    snippet = """// ... existing code ...
+function A() {
+  const value = computeA();
+  return value;
+}
+
+function C() {
+  const value = computeC();
+  return value;
+}
+// ... existing code ...
+"""
+    merged, strategy = apply_edit_locally(ORIGINAL, snippet)
+
+    assert strategy == "local_insert"
+    assert merged == ORIGINAL.replace(
+        "function B() {",
+        "function C() {\n  const value = computeC();\n  return value;\n}\n"
+        "\nfunction B() {",
+    )
+    assert "computeB()" in merged
+
+
+def test_similar_lines_are_not_anchors():
+    snippet = """// ... existing code ...
+function C() {
+  const value = computeC();
+  return value;
+}
+// ... existing code ...
+"""
+    merged, _ = apply_edit_locally(ORIGINAL, snippet)
+
+    assert merged is None
+
+
+def test_plain_insertion_after_context():
+    snippet = """import React from 'react';
+import { useState } from 'react';
+// ... existing code ...
+"""
+    merged, strategy = apply_edit_locally(ORIGINAL, snippet)
+
+    assert strategy == "local_insert"
+    assert merged == ORIGINAL.replace(
+        "import React from 'react';\n",
+        "import React from 'react';\nimport { useState } from 'react';\n",
+    )
+
+
+def test_edit_anchored_only_by_braces_falls_back():
+    snippet = """// ... existing code ...
+  const value = computeB();
+  return value * 2;
+}
+// ... existing code ...
+"""
+    merged, _ = apply_edit_locally(ORIGINAL, snippet)
+
+    assert merged is None
+
+
+def test_rewrite_without_trailing_context_falls_back():
+    snippet = """// ... existing code ...
+  const value = computeB();
+  return value * 2;
+// ... existing code ...
+"""
+    merged, _ = apply_edit_locally(ORIGINAL, snippet)
+
+    assert merged is None
+
+
+def test_edit_between_exact_anchors_tolerates_whitespace():
+    snippet = """// ... existing code ...
+function B() {
+    const value = computeB();
+  return value * 2;
+}
+
+export default A;
+"""
+    merged, strategy = apply_edit_locally(ORIGINAL, snippet)
+
+    assert strategy == "local_merge"
+    assert merged == ORIGINAL.replace(
+        "  const value = computeB();\n  return value;",
+        "    const value = computeB();\n  return value * 2;",
+    )
+
+
+def test_rewritten_declaration_after_context_falls_back():
+    original = "import React from 'react';\nconst x = 1;\n\nexport default x;\n"
+    snippet = """import React from 'react';
+let x = 2;
+// ... existing code ...
+"""
+    merged, _ = apply_edit_locally(original, snippet)
+
+    assert merged is None
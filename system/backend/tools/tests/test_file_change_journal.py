@@ -0,0 +1,43 @@
+from system.backend.tools.app.config.settings import settings
+from system.backend.tools.app.utils.file_change_journal import (
+    current_journal_position,
+    read_file_changes,
+    write_file_changes,
+)
+
+
+def test_rotation_is_seen_even_after_the_journal_grew_back(
+    tmp_path, monkeypatch
+):
+    journal_path = str(tmp_path / "changes.log")
+    monkeypatch.setattr(settings, "FILE_CHANGE_JOURNAL_PATH", journal_path)
+
+    write_file_changes(journal_path, ["/a/one.js"], max_bytes=1024)
+    generation, offset = current_journal_position()
+    # Past max_bytes: the next write starts a new generation, which grows
+    # past the reader's offset
+    write_file_changes(journal_path, ["/a/" + "x" * 80], max_bytes=16)
+    write_file_changes(journal_path, ["/a/two.js", "/a/three.js"], 1024)
+
+    paths, _, _, rotated = read_file_changes(generation, offset)
+
+    assert rotated
+    assert paths == ["/a/" + "x" * 80, "/a/two.js", "/a/three.js"]
+
+
+def test_entries_are_read_once_and_the_first_journal_is_not_a_rotation(
+    tmp_path, monkeypatch
+):
+    journal_path = str(tmp_path / "changes.log")
+    monkeypatch.setattr(settings, "FILE_CHANGE_JOURNAL_PATH", journal_path)
+    generation, offset = current_journal_position()
+
+    write_file_changes(journal_path, ["/a/one.js"], max_bytes=1024)
+    paths, generation, offset, rotated = read_file_changes(generation, offset)
+    assert (paths, rotated) == (["/a/one.js"], False)
+
+    write_file_changes(journal_path, ["/a/two.js"], max_bytes=1024)
+    paths, generation, offset, rotated = read_file_changes(generation, offset)
+    assert (paths, rotated) == (["/a/two.js"], False)
+
+    assert read_file_changes(generation, offset)[0] == []
@@ -0,0 +1,56 @@
+import asyncio
+
+from system.backend.tools.app.utils.fuzzy_finder import FuzzyFinder, fuzzy_score
+
+
+def _search(root, pattern, rel_paths):
+    for rel_path in rel_paths:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    finder = FuzzyFinder(max_codebases=2, idle_seconds=60)
+    results = asyncio.run(finder.search(pattern, str(root)))
+    return [
+        str(path)[len(str(root)) + 1 :].replace("\\", "/")
+        for path, _ in results
+    ]
+
+
+def test_exact_file_name_ranks_above_longer_names(tmp_path):
+    ranked = _search(
+        tmp_path,
+        "button",
+        [
+            "src/b/u/t/t/o/n.js",
+            "src/ButtonGroup.jsx",
+            "src/ui/Button.jsx",
+            "src/Button.jsx",
+            "src/pages/button_page/index.jsx",
+        ],
+    )
+
+    assert ranked[:3] == [
+        "src/Button.jsx",
+        "src/ui/Button.jsx",
+        "src/ButtonGroup.jsx",
+    ]
+    assert ranked[-1] == "src/b/u/t/t/o/n.js"
+
+
+def test_consecutive_run_beats_scattered_segment_starts():
+    assert fuzzy_score("button", "Button.jsx") > fuzzy_score(
+        "button", "src/b/u/t/t/o/n.js"
+    )
+
+
+def test_unmatched_file_name_characters_lower_the_score():
+    assert (
+        fuzzy_score("app", "src/App.jsx")
+        > fuzzy_score("app", "src/AppShell.jsx")
+        > fuzzy_score("app", "src/ApplicationSettings.jsx")
+    )
+
+
+def test_every_term_must_match():
+    assert fuzzy_score("pages home", "src/pages/home/index.jsx") is not None
+    assert fuzzy_score("pages cart", "src/pages/home/index.jsx") is None
@@ -0,0 +1,24 @@
+import json
+import logging
+import sys
+
+from system.backend.tools.app.utils.logger import (
+    JSONFormatter,
+    _StructuredQueueHandler,
+)
+
+
+def test_queued_exception_keeps_its_own_field():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.ERROR, __file__, 1, "failed %s", ("once",), None
+        )
+        record.exc_info = sys.exc_info()
+
+    queued = _StructuredQueueHandler(None).prepare(record)
+    entry = json.loads(JSONFormatter().format(queued))
+
+    assert entry["message"] == "failed once"
+    assert entry["exc_info"].endswith("ZeroDivisionError: division by zero")
@@ -0,0 +1,49 @@
+from system.backend.tools.app.utils.path_matcher import PathMatcher
+from system.backend.tools.app.utils.path_validator import DEFAULT_EXCLUSIONS
+
+
+def test_double_star_matches_zero_or_more_directories():
+    matcher = PathMatcher(["src/**/*.js"])
+
+    assert matcher.matches("src/b.js", False)
+    assert matcher.matches("src/a/b.js", False)
+    assert matcher.matches("src/a/c/b.js", False)
+    assert not matcher.matches("lib/b.js", False)
+    assert not matcher.matches("src/b.jsx", False)
+
+
+def test_leading_and_trailing_double_star():
+    leading = PathMatcher(["**/test/*.py"])
+    trailing = PathMatcher(["build/**"])
+
+    assert leading.matches("test/a.py", False)
+    assert leading.matches("pkg/test/a.py", False)
+    assert not leading.matches("pkg/tests/a.py", False)
+    assert trailing.matches("build/a/b.txt", False)
+    assert not trailing.matches("src/build.txt", False)
+
+
+def test_single_star_stays_within_a_segment():
+    matcher = PathMatcher(["src/*.js"])
+
+    assert matcher.matches("src/b.js", False)
+    assert not matcher.matches("src/a/b.js", False)
+
+
+def test_name_patterns_and_directory_only_patterns():
+    matcher = PathMatcher(["*.log", "build/", "!keep.log"])
+
+    assert matcher.matches("logs/app.log", False)
+    assert not matcher.matches("logs/keep.log", False)
+    assert matcher.matches("app/build", True)
+    assert not matcher.matches("app/build", False)
+
+
+def test_default_exclusions():
+    assert DEFAULT_EXCLUSIONS.matches(".env", False)
+    assert DEFAULT_EXCLUSIONS.matches("app/.env", False)
+    assert DEFAULT_EXCLUSIONS.matches("node_modules", True)
+    assert DEFAULT_EXCLUSIONS.matches("web", True)
+    # Directory names only exclude directories
+    assert not DEFAULT_EXCLUSIONS.matches("src/build", False)
+    assert not DEFAULT_EXCLUSIONS.matches("src/App.jsx", False)
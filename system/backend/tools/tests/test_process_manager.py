@@ -0,0 +1,54 @@
+import time
+
+from system.backend.tools.app.utils.process_manager import ProcessManager
+
+
+def _manager(tmp_path, read_grace_seconds):
+    return ProcessManager(
+        log_dir=str(tmp_path),
+        log_max_bytes=1024,
+        max_per_session=3,
+        session_ttl_seconds=3600,
+        kill_grace_seconds=1,
+        exited_retention_seconds=3600,
+        read_grace_seconds=read_grace_seconds,
+    )
+
+
+def _wait_for_exit(process):
+    deadline = time.monotonic() + 5
+    while process.exited_at is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_exited_process_is_kept_for_calls_after_its_logs_are_read(tmp_path):
+    manager = _manager(tmp_path, read_grace_seconds=60)
+    process = manager.start("echo done", str(tmp_path), "session")
+    _wait_for_exit(process)
+
+    assert process.read_logs(10) == "done\n"
+    assert manager.reap_expired() == []
+    assert manager.get(process.pid, "session").describe()["exit_code"] == 0
+
+
+def test_exited_process_is_forgotten_after_the_read_grace(tmp_path):
+    manager = _manager(tmp_path, read_grace_seconds=0)
+    process = manager.start("echo done", str(tmp_path), "session")
+    _wait_for_exit(process)
+
+    assert manager.reap_expired() == []
+    process.read_logs(10)
+    time.sleep(0.01)
+
+    assert manager.reap_expired() == [process.pid]
+    assert manager.list("session") == []
+
+
+def test_any_tool_call_refreshes_only_known_sessions(tmp_path):
+    manager = _manager(tmp_path, read_grace_seconds=60)
+    manager.start("true", str(tmp_path), "session")
+
+    manager.touch("session")
+    manager.touch("unknown")
+
+    assert sorted(manager._last_activity) == ["session"]
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from system.backend.tools.app.services.modification_tools.search_replace_service import (
+    SearchReplaceService,
+)
+
+
+def _changes(tmp_path):
+    changed = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        path = tmp_path / name
+        path.write_text("old")
+        changed.append({"file": str(path), "new_content": "new"})
+    return changed
+
+
+def test_all_files_are_replaced_without_leftovers(tmp_path):
+    SearchReplaceService(error_repo=None)._commit_changes(_changes(tmp_path))
+
+    assert sorted(os.listdir(tmp_path)) == ["a.txt", "b.txt", "c.txt"]
+    assert {path.read_text() for path in tmp_path.iterdir()} == {"new"}
+
+
+def test_failed_rename_restores_replaced_files(tmp_path, monkeypatch):
+    replace = os.replace
+
+    def failing_replace(source, destination):
+        if str(destination).endswith("c.txt") and ".replace-backup-" not in (
+            str(source)
+        ):
+            raise OSError("disk full")
+        replace(source, destination)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+
+    with pytest.raises(RuntimeError, match="no file was changed"):
+        SearchReplaceService(error_repo=None)._commit_changes(
+            _changes(tmp_path)
+        )
+
+    assert sorted(os.listdir(tmp_path)) == ["a.txt", "b.txt", "c.txt"]
+    assert {path.read_text() for path in tmp_path.iterdir()} == {"old"}
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+from system.backend.tools.app.utils.write_behind_sink import WriteBehindSink
+
+
+class _Collection:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def insert_many(self, documents, ordered):
+        if self.fail:
+            raise RuntimeError("mongo is down")
+        self.batches.append(documents)
+
+
+def _sink(collection, logger=logging.getLogger("test_sink")):
+    return WriteBehindSink(
+        "test",
+        lambda: collection,
+        max_batch_size=2,
+        flush_interval_seconds=0.05,
+        max_queue_size=10,
+        logger=logger,
+    )
+
+
+def test_documents_are_written_in_batches_and_flushed_on_stop():
+    collection = _Collection()
+    sink = _sink(collection)
+
+    async def run():
+        assert not sink.submit({"n": 0})
+        await sink.start()
+        for n in range(3):
+            assert sink.submit({"n": n})
+        await sink.stop()
+
+    asyncio.run(run())
+
+    assert collection.batches == [[{"n": 0}, {"n": 1}], [{"n": 2}]]
+
+
+def test_insert_errors_are_logged(caplog):
+    sink = _sink(_Collection(fail=True))
+
+    async def run():
+        await sink.start()
+        sink.submit({"n": 0})
+        await sink.stop()
+
+    with caplog.at_level(logging.ERROR, logger="test_sink"):
+        asyncio.run(run())
+
+    assert "mongo is down" in caplog.text